@@ -1,5 +1,6 @@
 import logging
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -69,8 +70,20 @@ class Settings(BaseSettings):
     IMAGE_UPLOAD_DIR: str = "assets/posts"
     PROFILE_IMAGE_UPLOAD_DIR: str = "assets/profiles"
 
+    # 응답 압축 (Accept-Encoding 협상, brotli는 k8s extra 설치 시). 최소 크기 미만 응답과 이미지 등은 그대로 전송
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    # 정적 파일(/assets, /uploads) Cache-Control max-age (초, 0이면 생략). 업로드 파일명은 UUID라 immutable
+    STATIC_CACHE_MAX_AGE_SECONDS: int = 31536000
+
     RATE_LIMIT_BACKEND: str = "memory"
     RATE_LIMIT_MAX_IPS: int = 10000
+    # Redis 백엔드: 한 번에 미리 가져와 파드 로컬에서 소비할 토큰 수 (0이면 요청마다 Redis 호출).
+    # max_requests가 RATE_LIMIT_PREFETCH_MIN_LIMIT 이상인 넉넉한 한도에만 적용
+    RATE_LIMIT_PREFETCH_TOKENS: int = 0
+    RATE_LIMIT_PREFETCH_MIN_LIMIT: int = 100
     TRUSTED_PROXIES: set[str] = set()
 
     REDIS_URL: str = ""
@@ -93,6 +106,83 @@ class Settings(BaseSettings):
 
     INTERNAL_API_KEY: str = ""
 
+    # 목록 total_count 계산 전략 (exact | cached | has_more) — core/utils/count_strategy.py 참고
+    COUNT_STRATEGY_POSTS: Literal["exact", "cached", "has_more"] = "exact"
+    COUNT_STRATEGY_NOTIFICATIONS: Literal["exact", "cached", "has_more"] = "exact"
+    COUNT_STRATEGY_DM: Literal["exact", "cached", "has_more"] = "exact"
+    COUNT_CACHE_TTL_SECONDS: int = 30
+    COUNT_CACHE_MAX_ENTRIES: int = 10000
+
+    # 인증 사용자 조회 캐시 — core/utils/principal_cache.py 참고 (TTL 0이면 비활성화)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 5
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    PRINCIPAL_CACHE_INVALIDATION: Literal["local", "redis"] = "local"
+
+    # 비로그인 게시글 목록/상세 응답 캐시 (off | local | redis) — core/utils/response_cache.py 참고
+    RESPONSE_CACHE_BACKEND: Literal["off", "local", "redis"] = "local"
+    RESPONSE_CACHE_TTL_SECONDS: int = 30
+    RESPONSE_CACHE_L1_TTL_SECONDS: int = 2
+    RESPONSE_CACHE_MAX_ENTRIES: int = 5000
+
+    # 조건부 GET (ETag/304) — core/utils/conditional_get.py 참고 (응답 캐시 공유 버전 사용, redis 모드에서만 활성화)
+    ETAG_ENABLED: bool = True
+    ETAG_MAX_STALE_SECONDS: int = 60
+
+    # 사용자별 차단 ID 집합 캐시 (off | local | redis) — core/utils/block_cache.py 참고
+    BLOCK_CACHE_BACKEND: Literal["off", "local", "redis"] = "local"
+    BLOCK_CACHE_TTL_SECONDS: int = 60
+    BLOCK_CACHE_L1_TTL_SECONDS: int = 5
+    BLOCK_CACHE_MAX_ENTRIES: int = 10000
+
+    # 게시글 상세의 독립 조회를 동시에 실행할 때 요청당 최대 연결 수 (1이면 순차 실행)
+    POST_DETAIL_QUERY_CONCURRENCY: int = 4
+
+    # 댓글 스레드 페이지네이션 — 게시글 상세/댓글 목록의 루트 댓글 페이지 크기, 루트 댓글별 대댓글 미리보기 수
+    COMMENT_PAGE_SIZE: int = 30
+    COMMENT_REPLY_PREVIEW_SIZE: int = 3
+
+    # 조회수 write-behind (direct | memory | redis) — core/utils/view_counter.py 참고
+    VIEW_COUNTER_BACKEND: Literal["direct", "memory", "redis"] = "memory"
+    VIEW_COUNTER_FLUSH_SECONDS: float = 5.0
+    VIEW_COUNTER_MAX_PENDING: int = 10000
+
+    # 게시글 읽음 상태 저장소 (db | memory | redis) — core/utils/read_state.py 참고
+    READ_STATE_BACKEND: Literal["db", "memory", "redis"] = "memory"
+    READ_STATE_TTL_SECONDS: int = 300
+    READ_STATE_MAX_USERS: int = 10000
+
+    # 투표 결과 스냅샷 캐시와 WebSocket 결과 푸시 간격 — modules/post/poll_tally.py 참고 (TTL 0이면 캐시 비활성화)
+    POLL_SNAPSHOT_TTL_SECONDS: float = 2.0
+    POLL_SNAPSHOT_MAX_ENTRIES: int = 10000
+    POLL_PUSH_INTERVAL_SECONDS: float = 1.0
+
+    # 전문 검색 (mysql: 기존 MATCH ... AGAINST | sqlite: 로컬 FTS5 색인) — core/search 참고
+    SEARCH_BACKEND: Literal["mysql", "sqlite"] = "sqlite"
+    SEARCH_INDEX_PATH: str = "data/search_index.sqlite3"
+    SEARCH_SYNC_SECONDS: float = 2.0
+    SEARCH_MAX_RESULTS: int = 1000
+    SEARCH_OUTBOX_RETENTION_HOURS: int = 72
+
+    # 저장된 post.hot_score를 배치로 재계산하는 시간 감쇠 구간 (일)
+    HOT_SCORE_WINDOW_DAYS: int = 14
+
+    # 연관 게시글 색인 — modules/post/related_service.py 참고
+    RELATED_POSTS_INDEX_SIZE: int = 20
+    RELATED_POSTS_CANDIDATES_PER_TAG: int = 200
+
+    # 추천 피드 재계산 점수 계산 프로세스 수 (0이면 스레드 1개, numpy/scipy 설치 시에만 적용)
+    FEED_RECOMPUTE_PROCESSES: int = 0
+
+    # 추천 피드 친화도 가중치 반감기 (일) — 이벤트로 쌓인 관심도가 이 기간마다 절반으로 감쇠
+    AFFINITY_HALF_LIFE_DAYS: float = 14.0
+
+    # 비동기 잡 큐 (알림/평판/구독 후속 처리) — core/jobs 참고
+    JOB_QUEUE_BACKEND: Literal["memory", "redis"] = "memory"
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: float = 2.0
+    JOB_VISIBILITY_TIMEOUT_SECONDS: int = 60
+    JOB_WORKER_CONCURRENCY: int = 4
+
     WS_BACKEND: str = "redis"
 
     model_config = SettingsConfigDict(env_file=str(_ENV_FILE), env_file_encoding="utf-8", extra="ignore")
@@ -3,10 +3,12 @@
 aiomysql을 사용하여 비동기 MySQL 연결 풀을 관리합니다.
 """
 
+import asyncio
 import logging
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable
 from contextlib import asynccontextmanager
+from typing import Any
 
 import aiomysql
 
@@ -157,6 +159,63 @@ async def transactional() -> AsyncGenerator[aiomysql.DictCursor]:
             raise
 
 
+@asynccontextmanager
+async def advisory_lock(name: str) -> AsyncGenerator[bool]:
+    """MySQL GET_LOCK 기반 분산 리스를 컨텍스트 매니저로 제공합니다.
+
+    여러 Pod/프로세스가 같은 배치 작업을 동시에 실행하지 않도록 할 때 사용합니다.
+    대기하지 않고(timeout 0) 획득 여부만 반환하며, 락은 전용 연결의 세션에 묶이므로
+    프로세스가 죽어 연결이 끊기면 서버가 자동으로 해제합니다.
+
+    Args:
+        name: 락 이름. 같은 MySQL 서버의 다른 DB와 충돌하지 않도록 DB 이름을 접두사로 붙입니다.
+
+    Yields:
+        락 획득 여부.
+    """
+    lock_name = f"{settings.DB_NAME}:{name}"[:64]  # GET_LOCK 이름 최대 64자
+    pool = get_pool()
+    async with pool.acquire() as conn, conn.cursor() as cur:
+        await cur.execute("SELECT GET_LOCK(%s, 0)", (lock_name,))
+        row = await cur.fetchone()
+        acquired = bool(row and row[0] == 1)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await cur.execute("SELECT RELEASE_LOCK(%s)", (lock_name,))
+                await cur.fetchone()
+
+
+async def gather_limited(*aws: Awaitable[Any], limit: int) -> list[Any]:
+    """독립적인 조회들을 동시에 실행하되, 동시에 빌리는 풀 연결 수를 limit 이하로 제한합니다.
+
+    각 조회가 get_cursor()/transactional()로 자기 연결을 빌리므로 요청 하나가 풀(최대 50)을
+    독점하지 않도록 요청 단위 동시성 예산을 둡니다. limit 1이면 순차 실행과 같습니다.
+    하나가 실패하면 나머지를 취소하고 첫 예외를 그대로 전파합니다.
+
+    Args:
+        aws: 실행할 코루틴들 (아직 await하지 않은 상태).
+        limit: 동시에 실행할 최대 개수.
+
+    Returns:
+        aws 순서대로의 결과 목록.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    tasks = [asyncio.ensure_future(run(aw)) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
 async def test_connection() -> bool:
     """데이터베이스 연결을 테스트합니다."""
     try:
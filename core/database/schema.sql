@@ -69,6 +69,12 @@ CREATE TABLE IF NOT EXISTS post (
     category_id INT UNSIGNED NULL,
     is_pinned TINYINT(1) NOT NULL DEFAULT 0,
     views INT UNSIGNED DEFAULT 0,
+    -- 비정규화 카운터 (쓰기 시 증감, reconcile 배치로 드리프트 복구)
+    likes_count INT UNSIGNED NOT NULL DEFAULT 0,
+    comments_count INT UNSIGNED NOT NULL DEFAULT 0,
+    bookmarks_count INT UNSIGNED NOT NULL DEFAULT 0,
+    -- 인기도 (쓰기 시 갱신, 배치로 시간 감쇠 반영) — modules/post/hot_score.py
+    hot_score DOUBLE NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NULL,
     deleted_at TIMESTAMP NULL,
@@ -84,6 +90,8 @@ CREATE TABLE IF NOT EXISTS comment (
     author_id INT UNSIGNED NULL,
     post_id INT UNSIGNED NOT NULL,
     parent_id INT UNSIGNED NULL,
+    likes_count INT UNSIGNED NOT NULL DEFAULT 0,
+    replies_count INT UNSIGNED NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NULL ON UPDATE CURRENT_TIMESTAMP,
     deleted_at TIMESTAMP NULL,
@@ -281,6 +289,7 @@ CREATE TABLE IF NOT EXISTS poll_option (
     poll_id INT UNSIGNED NOT NULL,
     option_text VARCHAR(100) NOT NULL,
     sort_order TINYINT UNSIGNED DEFAULT 0,
+    vote_count INT UNSIGNED NOT NULL DEFAULT 0,
     FOREIGN KEY (poll_id) REFERENCES poll(id) ON DELETE CASCADE
 );
 
@@ -403,6 +412,20 @@ CREATE TABLE IF NOT EXISTS post_tag (
     -- 이메일 다이제스트 비활성 사용자 스캔용
     CREATE INDEX idx_pvl_user_date ON post_view_log (user_id, created_at);
 
+    -- 키셋(커서) 페이지네이션용 — InnoDB 보조 인덱스는 PK(id)를 암묵적으로 포함하므로 (정렬 키, id) 범위 스캔 가능
+    CREATE INDEX idx_post_feed_keyset ON post (deleted_at, is_pinned, created_at);
+    CREATE INDEX idx_notification_user_created ON notification (user_id, created_at);
+    CREATE INDEX idx_user_follow_follower_created ON user_follow (follower_id, created_at);
+    CREATE INDEX idx_user_follow_following_created ON user_follow (following_id, created_at);
+    CREATE INDEX idx_post_author_created ON post (author_id, deleted_at, created_at);
+
+    -- sort=hot 목록 (ORDER BY is_pinned DESC, hot_score DESC, created_at DESC, id DESC 역방향 범위 스캔)
+    CREATE INDEX idx_post_hot ON post (deleted_at, is_pinned, hot_score, created_at);
+
+    -- 댓글 스레드 키셋 페이지네이션 (루트: parent_id IS NULL, 대댓글: parent_id = ?)
+    CREATE INDEX idx_comment_thread_created ON comment (post_id, parent_id, created_at);
+    CREATE INDEX idx_comment_thread_likes ON comment (post_id, parent_id, likes_count, created_at);
+
 -- DM 대화 테이블
 CREATE TABLE IF NOT EXISTS dm_conversation (
     id INT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
@@ -525,6 +548,59 @@ CREATE TABLE IF NOT EXISTS user_post_score (
     FOREIGN KEY (post_id) REFERENCES post(id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
+-- 추천 피드 사용자 친화도 가중치 (이벤트 증분 갱신, 반감기 감쇠)
+CREATE TABLE IF NOT EXISTS user_affinity_weight (
+    user_id     INT UNSIGNED NOT NULL,
+    kind        ENUM('tag', 'category', 'author') NOT NULL,
+    key_id      INT UNSIGNED NOT NULL,
+    weight      DOUBLE NOT NULL,
+    decayed_at  DATETIME NOT NULL,
+    PRIMARY KEY (user_id, kind, key_id),
+    FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 친화도 이벤트 적용 기록 (잡 재전달 시 가중치 중복 반영 방지, 배치가 오래된 행 정리)
+CREATE TABLE IF NOT EXISTS affinity_event_applied (
+    event_id    CHAR(32) NOT NULL PRIMARY KEY,
+    user_id     INT UNSIGNED NOT NULL,
+    applied_at  DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_affinity_event_applied_at (applied_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 추천 피드 재계산 샤드별 체크포인트 (중단된 실행 재개용)
+CREATE TABLE IF NOT EXISTS feed_recompute_checkpoint (
+    shard_count     INT NOT NULL,
+    shard_index     INT NOT NULL,
+    run_started_at  DATETIME NOT NULL,
+    last_user_id    INT UNSIGNED NOT NULL DEFAULT 0,
+    users_processed INT NOT NULL DEFAULT 0,
+    completed_at    DATETIME NULL,
+    updated_at      TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (shard_count, shard_index)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 검색 색인 변경 로그 (파드별 로컬 전문 검색 색인이 워터마크 이후 변경을 따라가 갱신)
+CREATE TABLE IF NOT EXISTS search_outbox (
+    id          BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    kind        ENUM('post', 'wiki', 'tag', 'package') NOT NULL,
+    entity_id   INT UNSIGNED NOT NULL,
+    created_at  DATETIME(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+    INDEX idx_search_outbox_created (created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 연관 게시글 색인 (게시글별 미리 계산한 상위 K개, position 순)
+CREATE TABLE IF NOT EXISTS post_related (
+    post_id          INT UNSIGNED NOT NULL,
+    position         TINYINT UNSIGNED NOT NULL,
+    related_post_id  INT UNSIGNED NOT NULL,
+    similarity       FLOAT NOT NULL DEFAULT 0,
+    computed_at      TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (post_id, position),
+    INDEX idx_post_related_related (related_post_id),
+    FOREIGN KEY (post_id) REFERENCES post(id) ON DELETE CASCADE,
+    FOREIGN KEY (related_post_id) REFERENCES post(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
 -- ===== Reputation System =====
 
 CREATE TABLE IF NOT EXISTS reputation_event (
@@ -580,6 +656,28 @@ CREATE TABLE IF NOT EXISTS user_daily_visit (
     FOREIGN KEY (user_id) REFERENCES user(id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
+-- 배지 트리거 증분 카운터 (post_count 등). 행이 없으면 첫 이벤트 시 원본 테이블 집계로 시드
+CREATE TABLE IF NOT EXISTS user_badge_progress (
+    user_id       INT UNSIGNED NOT NULL,
+    trigger_type  VARCHAR(30) NOT NULL,
+    value         INT NOT NULL DEFAULT 0,
+    updated_at    DATETIME NOT NULL DEFAULT NOW() ON UPDATE NOW(),
+    PRIMARY KEY (user_id, trigger_type),
+    FOREIGN KEY (user_id) REFERENCES user(id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 비동기 잡 dead-letter (최대 재시도 초과 잡 보관, 운영자 수동 재처리)
+CREATE TABLE IF NOT EXISTS job_dead_letter (
+    id          BIGINT AUTO_INCREMENT PRIMARY KEY,
+    job_id      CHAR(32) NOT NULL,
+    name        VARCHAR(100) NOT NULL,
+    payload     JSON NOT NULL,
+    attempts    INT NOT NULL,
+    last_error  TEXT NULL,
+    created_at  DATETIME NOT NULL DEFAULT NOW(),
+    INDEX idx_created (created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
 -- user 테이블 평판 컬럼 (신규 환경에서만 실행 — 기존 환경은 Alembic 마이그레이션 사용)
 ALTER TABLE user ADD COLUMN reputation_score INT NOT NULL DEFAULT 0;
 ALTER TABLE user ADD COLUMN trust_level TINYINT NOT NULL DEFAULT 0;
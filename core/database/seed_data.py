@@ -31,8 +31,12 @@ from faker import Faker
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from core.config import settings
 from core.database.connection import close_db, init_db, transactional
 from core.utils.password import hash_password
+from modules.post.comment_models import reconcile_comment_counters
+from modules.post.poll_models import reconcile_poll_counters
+from modules.post.post_models import recompute_hot_scores, reconcile_post_counters
 
 fake = Faker("ko_KR")
 Faker.seed(42)  # 재현 가능한 데이터
@@ -1652,6 +1656,12 @@ async def main():
         await seed_view_logs(cfg)
         await seed_dms(cfg)
 
+        # 직접 INSERT한 좋아요/댓글/북마크/투표를 비정규화 카운터에 반영
+        await reconcile_post_counters()
+        await reconcile_comment_counters()
+        await reconcile_poll_counters()
+        await recompute_hot_scores(settings.HOT_SCORE_WINDOW_DAYS)
+
         elapsed = datetime.now() - start
         print("=" * 50)
         print(f"✓ 시드 완료! 소요 시간: {elapsed.total_seconds():.1f}초")
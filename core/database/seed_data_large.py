@@ -35,6 +35,7 @@ import aiomysql
 from faker import Faker
 
 from core.utils.password import hash_password
+from modules.post.hot_score import HOT_SCORE_ASSIGNMENT
 
 fake = Faker("ko_KR")
 Faker.seed(42)  # 재현 가능한 데이터
@@ -1774,6 +1775,39 @@ async def verify_data(pool: aiomysql.Pool) -> None:
             print("  ✓ 대댓글 1단계만 존재")
 
 
+async def sync_post_counters(pool: aiomysql.Pool) -> None:
+    """직접 INSERT한 좋아요/댓글/북마크 수를 post/comment 비정규화 카운터 컬럼과 hot_score에 반영."""
+    print("  게시글 카운터 동기화 (likes_count, comments_count, bookmarks_count, hot_score, 댓글 카운터)")
+    async with pool.acquire() as conn, conn.cursor() as cur:
+        await cur.execute("""
+                UPDATE post p
+                LEFT JOIN (SELECT post_id, COUNT(*) AS cnt FROM post_like GROUP BY post_id) lk
+                    ON p.id = lk.post_id
+                LEFT JOIN (
+                    SELECT post_id, COUNT(*) AS cnt FROM comment
+                    WHERE deleted_at IS NULL GROUP BY post_id
+                ) cm ON p.id = cm.post_id
+                LEFT JOIN (SELECT post_id, COUNT(*) AS cnt FROM post_bookmark GROUP BY post_id) bk
+                    ON p.id = bk.post_id
+                SET p.likes_count = COALESCE(lk.cnt, 0),
+                    p.comments_count = COALESCE(cm.cnt, 0),
+                    p.bookmarks_count = COALESCE(bk.cnt, 0)
+            """)
+        await cur.execute(f"UPDATE post SET {HOT_SCORE_ASSIGNMENT} WHERE deleted_at IS NULL")
+        await cur.execute("""
+                UPDATE comment c
+                LEFT JOIN (SELECT comment_id, COUNT(*) AS cnt FROM comment_like GROUP BY comment_id) lk
+                    ON c.id = lk.comment_id
+                LEFT JOIN (
+                    SELECT parent_id, COUNT(*) AS cnt FROM comment
+                    WHERE parent_id IS NOT NULL AND deleted_at IS NULL GROUP BY parent_id
+                ) rp ON c.id = rp.parent_id
+                SET c.likes_count = COALESCE(lk.cnt, 0),
+                    c.replies_count = COALESCE(rp.cnt, 0)
+            """)
+    print("  ✓ 게시글 카운터 동기화 완료")
+
+
 async def trigger_recompute(url: str) -> None:
     """추천 피드 점수 재계산 API 호출."""
     print(f"\n  추천 피드 재계산: {url}/v1/admin/feed/recompute")
@@ -1906,6 +1940,7 @@ async def main() -> None:
         # Phase 5: 검증 + 추천 피드 재계산
         print("\n[Phase 5] 검증 및 후처리")
         await verify_data(pool)
+        await sync_post_counters(pool)
 
         if args.recompute_url:
             await trigger_recompute(args.recompute_url)
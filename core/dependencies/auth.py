@@ -11,6 +11,7 @@ from fastapi import Depends, HTTPException, Request, status
 from core.config import settings
 from core.dependencies.request_context import get_request_timestamp
 from core.utils.jwt_utils import decode_access_token
+from core.utils.principal_cache import get_cached_user
 from modules.user import models as user_models
 from modules.user.models import User
 
@@ -40,11 +41,16 @@ async def _validate_token(request: Request) -> User | None:
     if not raw_token:
         return None
 
-    # decode_access_token은 만료/위조 시 HTTPException 401을 raise함
-    payload = decode_access_token(raw_token)
+    # 같은 요청에서 이미 검증된 토큰이면 재사용 (인증 의존성이 여러 번 해석되는 라우트)
+    memo = getattr(request.state, "principal", None)
+    if memo is not None and memo[0] == raw_token:
+        user = memo[1]
+    else:
+        # decode_access_token은 만료/위조 시 HTTPException 401을 raise함
+        payload = decode_access_token(raw_token)
 
-    user_id = int(payload["sub"])
-    user = await user_models.get_user_by_id(user_id)
+        user_id = int(payload["sub"])
+        user = await get_cached_user(user_id, user_models.get_user_by_id)
 
     if not user:
         raise HTTPException(
@@ -70,6 +76,7 @@ async def _validate_token(request: Request) -> User | None:
             },
         )
 
+    request.state.principal = (raw_token, user)
     return user
 
 
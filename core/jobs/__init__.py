@@ -0,0 +1,83 @@
+"""jobs: 커밋 이후 부수효과(알림, 평판, 구독 등)를 위한 비동기 잡 큐.
+
+쓰기 API는 enqueue()로 잡을 적재하고 바로 응답하며, 워커가 핸들러를 실행합니다.
+- memory: API 프로세스 안의 워커가 처리 (로컬 개발, 테스트)
+- redis: 별도 워커 프로세스(job_worker.py)가 처리 (K8s 프로덕션)
+"""
+
+import logging
+from typing import Any
+
+from core.config import settings
+from core.jobs.queue_base import Job, JobQueueProtocol
+from core.jobs.registry import get_handler, job_handler, load_handlers
+
+logger = logging.getLogger(__name__)
+
+_queue: JobQueueProtocol | None = None
+
+
+def _create_job_queue() -> JobQueueProtocol:
+    """settings.JOB_QUEUE_BACKEND에 따라 잡 큐 백엔드를 생성합니다."""
+    backend = settings.JOB_QUEUE_BACKEND
+
+    if backend == "memory":
+        from core.jobs.queue_memory import MemoryJobQueue
+
+        return MemoryJobQueue()
+
+    if backend == "redis":
+        from core.jobs.queue_redis import RedisJobQueue
+
+        return RedisJobQueue(
+            redis_url=settings.REDIS_URL,
+            visibility_timeout=settings.JOB_VISIBILITY_TIMEOUT_SECONDS,
+        )
+
+    raise ValueError(f"지원하지 않는 잡 큐 백엔드: {backend}")
+
+
+def get_job_queue() -> JobQueueProtocol:
+    """잡 큐 싱글턴을 반환합니다."""
+    global _queue
+    if _queue is None:
+        _queue = _create_job_queue()
+    return _queue
+
+
+async def enqueue(name: str, payload: dict[str, Any]) -> None:
+    """잡 하나를 적재합니다. 자세한 동작은 enqueue_many() 참고."""
+    await enqueue_many([(name, payload)])
+
+
+async def enqueue_many(items: list[tuple[str, dict[str, Any]]]) -> None:
+    """여러 잡을 한 번에 적재합니다.
+
+    큐 적재에 실패하면(Redis 장애 등) 부수효과를 잃지 않도록 핸들러를 인라인으로 실행하고,
+    인라인 실행도 실패하면 로그만 남깁니다 (best-effort).
+
+    Args:
+        items: (잡 이름, payload) 목록.
+    """
+    jobs = [Job(name=name, payload=payload) for name, payload in items]
+    if not jobs:
+        return
+    try:
+        await get_job_queue().enqueue(*jobs)
+        return
+    except Exception:
+        logger.warning("잡 적재 실패, 인라인 실행으로 대체: %s", [job.name for job in jobs], exc_info=True)
+
+    load_handlers()
+    for job in jobs:
+        handler = get_handler(job.name)
+        if handler is None:
+            logger.error("알 수 없는 잡: %s", job.name)
+            continue
+        try:
+            await handler(job.payload)
+        except Exception:
+            logger.warning("잡 인라인 실행 실패: job=%s", job.name, exc_info=True)
+
+
+__all__ = ["Job", "JobQueueProtocol", "enqueue", "enqueue_many", "get_job_queue", "job_handler"]
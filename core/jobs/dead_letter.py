@@ -0,0 +1,15 @@
+"""dead_letter: 최대 재시도 횟수를 넘긴 잡을 job_dead_letter 테이블에 보관합니다."""
+
+import json
+
+from core.database.connection import transactional
+from core.jobs.queue_base import Job
+
+
+async def record_dead_letter(job: Job, last_error: str) -> None:
+    """실패한 잡과 마지막 에러를 기록합니다 (운영자가 원인 확인 후 수동 재처리)."""
+    async with transactional() as cur:
+        await cur.execute(
+            "INSERT INTO job_dead_letter (job_id, name, payload, attempts, last_error) VALUES (%s, %s, %s, %s, %s)",
+            (job.id, job.name, json.dumps(job.payload, ensure_ascii=False), job.attempts, last_error[:2000]),
+        )
@@ -0,0 +1,69 @@
+"""queue_base: 잡 큐 인터페이스 및 공통 타입 정의."""
+
+import json
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Protocol
+
+# 재시도 백오프 상한 (초)
+MAX_BACKOFF_SECONDS = 300.0
+
+
+@dataclass(frozen=True)
+class Job:
+    """큐에 적재되는 작업 단위.
+
+    Attributes:
+        name: 핸들러 이름 (registry.job_handler로 등록).
+        payload: JSON 직렬화 가능한 인자.
+        id: 잡 고유 ID (재시도 간 유지).
+        attempts: 지금까지 실패한 횟수.
+    """
+
+    name: str
+    payload: dict[str, Any]
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempts: int = 0
+
+    def to_json(self) -> str:
+        """Redis 저장용 JSON 문자열로 직렬화합니다."""
+        return json.dumps(asdict(self), ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, raw: str) -> "Job":
+        """to_json()으로 만든 문자열을 Job으로 복원합니다."""
+        data = json.loads(raw)
+        return cls(name=data["name"], payload=data["payload"], id=data["id"], attempts=data["attempts"])
+
+
+def backoff_seconds(attempts: int, base_seconds: float) -> float:
+    """실패 횟수에 대한 지수 백오프 지연 (base * 2^(attempts-1), 상한 MAX_BACKOFF_SECONDS)."""
+    return min(base_seconds * (2 ** max(attempts - 1, 0)), MAX_BACKOFF_SECONDS)
+
+
+class JobQueueProtocol(Protocol):
+    """잡 큐 백엔드 인터페이스.
+
+    인메모리(로컬/테스트)와 Redis(K8s 프로덕션) 구현을 교체 가능하게 한다.
+    reserve()로 꺼낸 잡은 ack() 또는 retry()를 호출하기 전까지 완료되지 않은 것으로 간주한다 (at-least-once).
+    """
+
+    async def enqueue(self, *jobs: Job) -> None:
+        """잡을 즉시 실행 가능한 상태로 적재한다 (여러 건은 한 번에)."""
+        ...
+
+    async def reserve(self, timeout: float) -> Job | None:
+        """실행할 잡을 하나 꺼낸다. timeout 동안 없으면 None."""
+        ...
+
+    async def ack(self, job: Job) -> None:
+        """잡 처리 완료 (또는 dead-letter 이관 완료)를 기록한다."""
+        ...
+
+    async def retry(self, job: Job, delay_seconds: float) -> None:
+        """잡을 delay_seconds 뒤에 다시 실행되도록 예약한다 (reserve된 잡의 완료 처리 포함)."""
+        ...
+
+    async def pending_count(self) -> int:
+        """즉시 실행 가능한 잡 수를 반환한다."""
+        ...
@@ -0,0 +1,78 @@
+"""queue_memory: 인메모리 잡 큐 (로컬 개발, 테스트, 단일 프로세스).
+
+프로세스가 종료되면 적재된 잡은 사라집니다. 다중 파드 환경에서는 queue_redis를 사용하세요.
+"""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from collections import deque
+
+from core.jobs.queue_base import Job
+
+
+class MemoryJobQueue:
+    """deque(즉시 실행) + heap(지연 실행) 기반 인메모리 잡 큐."""
+
+    def __init__(self) -> None:
+        self._ready: deque[Job] = deque()
+        # (실행 시각(monotonic), 삽입 순번, Job)
+        self._delayed: list[tuple[float, int, Job]] = []
+        self._seq = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+
+    def _event(self) -> asyncio.Event:
+        # 이벤트 루프가 실행 중일 때 생성 (모듈 import 시점에는 루프가 없을 수 있음)
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        return self._wakeup
+
+    def _promote_due(self) -> None:
+        now = time.monotonic()
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, job = heapq.heappop(self._delayed)
+            self._ready.append(job)
+
+    async def enqueue(self, *jobs: Job) -> None:
+        """잡을 즉시 실행 가능한 상태로 적재한다."""
+        self._ready.extend(jobs)
+        self._event().set()
+
+    async def reserve(self, timeout: float) -> Job | None:
+        """실행할 잡을 하나 꺼낸다. 지연 잡은 실행 시각이 되면 승격한다."""
+        deadline = time.monotonic() + timeout
+        while True:
+            self._promote_due()
+            if self._ready:
+                return self._ready.popleft()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            # 가장 이른 지연 잡 실행 시각까지만 대기
+            if self._delayed:
+                remaining = min(remaining, max(self._delayed[0][0] - time.monotonic(), 0.0))
+            event = self._event()
+            event.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(event.wait(), timeout=remaining)
+
+    async def ack(self, job: Job) -> None:
+        """인메모리 큐는 reserve 시점에 제거하므로 별도 처리가 없다."""
+
+    async def retry(self, job: Job, delay_seconds: float) -> None:
+        """잡을 delay_seconds 뒤에 다시 실행되도록 예약한다."""
+        heapq.heappush(self._delayed, (time.monotonic() + delay_seconds, next(self._seq), job))
+        self._event().set()
+
+    async def pending_count(self) -> int:
+        """즉시 실행 가능한 잡 수를 반환한다."""
+        self._promote_due()
+        return len(self._ready)
+
+    def clear(self) -> None:
+        """모든 잡을 버립니다 (테스트용)."""
+        self._ready.clear()
+        self._delayed.clear()
+        self._wakeup = None
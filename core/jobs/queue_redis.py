@@ -0,0 +1,136 @@
+"""queue_redis: Redis 기반 잡 큐 (K8s 프로덕션, 다중 파드).
+
+키 구성:
+- jobs:ready    (LIST) 즉시 실행 가능한 잡. LPUSH로 적재, RPOP으로 꺼냄 (FIFO)
+- jobs:delayed  (ZSET) 재시도 대기 잡. score = 실행 시각(epoch)
+- jobs:leases   (ZSET) 처리 중인 잡. score = 가시성 만료 시각(epoch)
+
+reserve는 RPOP과 임대(lease) 기록을 Lua로 원자 실행하고, 워커가 ack 없이 죽으면
+임대가 만료된 잡을 ready로 되돌려 at-least-once 전달을 보장합니다.
+"""
+
+import asyncio
+import logging
+import time
+
+from core.jobs.queue_base import Job
+from core.utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+READY_KEY = "jobs:ready"
+DELAYED_KEY = "jobs:delayed"
+LEASES_KEY = "jobs:leases"
+
+# 빈 큐 폴링 간격 (초)
+_POLL_INTERVAL_SEC = 0.2
+# 한 번에 ready로 되돌리는 최대 잡 수
+_REQUEUE_BATCH = 100
+
+# RPOP + 임대 기록 (원자적)
+_RESERVE_LUA = """
+local raw = redis.call('RPOP', KEYS[1])
+if raw then
+    redis.call('ZADD', KEYS[2], ARGV[1], raw)
+end
+return raw
+"""
+
+# 실행 시각이 지난 ZSET 항목을 ready 리스트로 이동 (원자적)
+_REQUEUE_DUE_LUA = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, raw in ipairs(due) do
+    redis.call('ZREM', KEYS[1], raw)
+    redis.call('LPUSH', KEYS[2], raw)
+end
+return #due
+"""
+
+
+class RedisJobQueue:
+    """Redis LIST/ZSET 기반 잡 큐."""
+
+    def __init__(self, redis_url: str, visibility_timeout: float):
+        """RedisJobQueue 초기화.
+
+        Args:
+            redis_url: Redis 연결 URL.
+            visibility_timeout: reserve 후 ack가 없으면 재전달하기까지의 시간 (초).
+        """
+        self._redis_url = redis_url
+        self._visibility_timeout = visibility_timeout
+        self._redis = None
+        self._reserve_script = None
+        self._requeue_script = None
+        # reserve한 잡의 원본 문자열 (ack/retry 시 ZREM 멤버로 사용)
+        self._inflight: dict[str, str] = {}
+
+    async def _get_redis(self):
+        if self._redis is None:
+            self._redis = await get_redis(self._redis_url)
+            self._reserve_script = self._redis.register_script(_RESERVE_LUA)
+            self._requeue_script = self._redis.register_script(_REQUEUE_DUE_LUA)
+        return self._redis
+
+    async def enqueue(self, *jobs: Job) -> None:
+        """잡을 즉시 실행 가능한 상태로 적재한다 (여러 건은 LPUSH 1회)."""
+        if not jobs:
+            return
+        redis = await self._get_redis()
+        await redis.lpush(READY_KEY, *(job.to_json() for job in jobs))
+
+    async def _requeue_due(self) -> None:
+        """재시도 시각이 된 잡과 임대가 만료된 잡을 ready로 되돌린다."""
+        now = time.time()
+        assert self._requeue_script is not None
+        await self._requeue_script(keys=[DELAYED_KEY, READY_KEY], args=[now, _REQUEUE_BATCH])
+        expired = await self._requeue_script(keys=[LEASES_KEY, READY_KEY], args=[now, _REQUEUE_BATCH])
+        if expired:
+            logger.warning("임대 만료 잡 재전달: %d건", expired)
+
+    async def reserve(self, timeout: float) -> Job | None:
+        """실행할 잡을 하나 꺼내고 가시성 만료 시각까지 임대한다."""
+        await self._get_redis()
+        assert self._reserve_script is not None
+        deadline = time.monotonic() + timeout
+        while True:
+            await self._requeue_due()
+            raw = await self._reserve_script(
+                keys=[READY_KEY, LEASES_KEY],
+                args=[time.time() + self._visibility_timeout],
+            )
+            if raw is not None:
+                try:
+                    job = Job.from_json(raw)
+                except (ValueError, KeyError):
+                    logger.error("역직렬화 불가 잡 폐기: %.200s", raw)
+                    await self._redis.zrem(LEASES_KEY, raw)  # type: ignore[attr-defined]
+                    continue
+                self._inflight[job.id] = raw
+                return job
+            if time.monotonic() >= deadline:
+                return None
+            await asyncio.sleep(_POLL_INTERVAL_SEC)
+
+    async def ack(self, job: Job) -> None:
+        """임대를 해제하여 잡을 완료 처리한다."""
+        raw = self._inflight.pop(job.id, None)
+        if raw is None:
+            return
+        redis = await self._get_redis()
+        await redis.zrem(LEASES_KEY, raw)
+
+    async def retry(self, job: Job, delay_seconds: float) -> None:
+        """임대 해제와 지연 큐 적재를 한 트랜잭션(MULTI)으로 실행한다."""
+        raw = self._inflight.pop(job.id, None)
+        redis = await self._get_redis()
+        async with redis.pipeline(transaction=True) as pipe:
+            if raw is not None:
+                pipe.zrem(LEASES_KEY, raw)
+            pipe.zadd(DELAYED_KEY, {job.to_json(): time.time() + delay_seconds})
+            await pipe.execute()
+
+    async def pending_count(self) -> int:
+        """즉시 실행 가능한 잡 수를 반환한다."""
+        redis = await self._get_redis()
+        return await redis.llen(READY_KEY)
@@ -0,0 +1,46 @@
+"""registry: 잡 이름 → 핸들러 매핑.
+
+핸들러는 각 도메인 모듈(modules/*/jobs.py)에서 @job_handler로 등록하며,
+워커는 load_handlers()로 JOB_HANDLER_MODULES를 import해 등록을 보장합니다.
+"""
+
+import importlib
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+JobHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+# 핸들러를 정의하는 모듈 목록 (새 잡 모듈 추가 시 등록)
+JOB_HANDLER_MODULES: tuple[str, ...] = (
+    "modules.post.jobs",
+    "modules.reputation.jobs",
+)
+
+_handlers: dict[str, JobHandler] = {}
+
+
+def job_handler(name: str) -> Callable[[JobHandler], JobHandler]:
+    """잡 핸들러 등록 데코레이터.
+
+    핸들러는 payload(dict)를 받아 작업을 수행하고, 실패 시 예외를 던져 재시도를 요청합니다.
+    at-least-once 전달이므로 같은 잡이 두 번 실행되어도 안전하도록 작성해야 합니다.
+    """
+
+    def decorator(func: JobHandler) -> JobHandler:
+        if name in _handlers and _handlers[name] is not func:
+            raise ValueError(f"중복 잡 핸들러 이름: {name}")
+        _handlers[name] = func
+        return func
+
+    return decorator
+
+
+def get_handler(name: str) -> JobHandler | None:
+    """등록된 핸들러를 반환합니다. 없으면 None."""
+    return _handlers.get(name)
+
+
+def load_handlers() -> None:
+    """JOB_HANDLER_MODULES를 import하여 핸들러 등록을 보장합니다 (멱등)."""
+    for module_name in JOB_HANDLER_MODULES:
+        importlib.import_module(module_name)
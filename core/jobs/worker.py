@@ -0,0 +1,136 @@
+"""worker: 잡 처리 루프.
+
+- process_job: 핸들러 실행 → 성공 시 ack, 실패 시 지수 백오프 재시도, 최대 횟수 초과 시 dead-letter
+- run_worker: stop 이벤트가 설정될 때까지 concurrency개의 소비 루프 실행
+- drain: 즉시 실행 가능한 잡을 모두 처리 (테스트/로컬 동기화용)
+"""
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import replace
+
+from core.config import settings
+from core.jobs.dead_letter import record_dead_letter
+from core.jobs.queue_base import Job, JobQueueProtocol, backoff_seconds
+from core.jobs.registry import get_handler, load_handlers
+
+logger = logging.getLogger(__name__)
+
+# 소비 루프의 reserve 대기 시간 (초) — stop 이벤트 확인 주기
+_RESERVE_TIMEOUT_SEC = 1.0
+
+
+async def _dead_letter(queue: JobQueueProtocol, job: Job, error: str) -> None:
+    """잡을 dead-letter 테이블로 이관합니다. 기록 실패 시 ack하지 않아 재전달되도록 둡니다."""
+    try:
+        await record_dead_letter(job, error)
+    except Exception:
+        logger.exception("dead-letter 기록 실패: job=%s id=%s", job.name, job.id)
+        return
+    await queue.ack(job)
+    logger.error("잡 dead-letter 이관: job=%s id=%s attempts=%d error=%s", job.name, job.id, job.attempts, error)
+
+
+async def process_job(queue: JobQueueProtocol, job: Job) -> bool:
+    """잡 하나를 처리합니다.
+
+    Returns:
+        핸들러가 성공했으면 True.
+    """
+    handler = get_handler(job.name)
+    if handler is None:
+        await _dead_letter(queue, job, f"unknown job: {job.name}")
+        return False
+
+    try:
+        await handler(job.payload)
+    except Exception as exc:
+        failed = replace(job, attempts=job.attempts + 1)
+        error = f"{type(exc).__name__}: {exc}"
+        if failed.attempts >= settings.JOB_MAX_ATTEMPTS:
+            await _dead_letter(queue, failed, error)
+        else:
+            delay = backoff_seconds(failed.attempts, settings.JOB_RETRY_BASE_SECONDS)
+            logger.warning(
+                "잡 실패, %.1f초 후 재시도 (%d/%d): job=%s id=%s",
+                delay,
+                failed.attempts,
+                settings.JOB_MAX_ATTEMPTS,
+                job.name,
+                job.id,
+                exc_info=True,
+            )
+            await queue.retry(failed, delay)
+        return False
+
+    await queue.ack(job)
+    return True
+
+
+async def drain(queue: JobQueueProtocol) -> int:
+    """즉시 실행 가능한 잡을 큐가 빌 때까지 처리하고 처리 건수를 반환합니다.
+
+    핸들러가 새 잡을 적재하면 그 잡도 이어서 처리합니다. 재시도 대기 중인 잡은 기다리지 않습니다.
+    """
+    load_handlers()
+    processed = 0
+    while (job := await queue.reserve(timeout=0)) is not None:
+        await process_job(queue, job)
+        processed += 1
+    return processed
+
+
+async def _consume(queue: JobQueueProtocol, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        try:
+            job = await queue.reserve(timeout=_RESERVE_TIMEOUT_SEC)
+        except Exception:
+            logger.warning("잡 reserve 실패, 재시도", exc_info=True)
+            await asyncio.sleep(_RESERVE_TIMEOUT_SEC)
+            continue
+        if job is None:
+            continue
+        try:
+            await process_job(queue, job)
+        except Exception:
+            # ack/retry 자체가 실패한 경우 — 임대 만료 후 재전달됨
+            logger.exception("잡 처리 결과 기록 실패: job=%s id=%s", job.name, job.id)
+
+
+async def run_worker(queue: JobQueueProtocol, stop: asyncio.Event, concurrency: int | None = None) -> None:
+    """stop이 설정될 때까지 잡을 소비합니다.
+
+    Args:
+        queue: 잡 큐 백엔드.
+        stop: 종료 신호 이벤트.
+        concurrency: 동시 소비 루프 수 (기본: settings.JOB_WORKER_CONCURRENCY).
+    """
+    load_handlers()
+    count = concurrency if concurrency is not None else settings.JOB_WORKER_CONCURRENCY
+    await asyncio.gather(*(_consume(queue, stop) for _ in range(count)))
+
+
+_in_process_stop: asyncio.Event | None = None
+_in_process_task: asyncio.Task | None = None
+
+
+def start_in_process_worker(queue: JobQueueProtocol) -> None:
+    """API 프로세스 안에서 워커를 실행합니다 (memory 백엔드, 앱 startup 시 호출)."""
+    global _in_process_stop, _in_process_task
+    if _in_process_task is not None:
+        return
+    _in_process_stop = asyncio.Event()
+    _in_process_task = asyncio.create_task(run_worker(queue, _in_process_stop))
+
+
+async def stop_in_process_worker() -> None:
+    """in-process 워커를 종료합니다 (앱 shutdown 시 호출). 처리 중인 잡은 마무리합니다."""
+    global _in_process_stop, _in_process_task
+    if _in_process_task is None or _in_process_stop is None:
+        return
+    _in_process_stop.set()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _in_process_task
+    _in_process_stop = None
+    _in_process_task = None
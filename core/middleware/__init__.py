@@ -1,9 +1,10 @@
 """middleware: 미들웨어 패키지.
 
-요청 타이밍, Rate Limiting, 요청 상관 ID 등 HTTP 요청/응답 처리를 위한 미들웨어를 제공합니다.
+요청 타이밍, Rate Limiting, 요청 상관 ID, 응답 압축 등 HTTP 요청/응답 처리를 위한 미들웨어를 제공합니다.
 """
 
 from .body_limit import BodyLimitMiddleware
+from .compression import CompressionMiddleware
 from .rate_limiter import RateLimitMiddleware
 from .request_id import RequestIdMiddleware
 from .security_headers import SecurityHeadersMiddleware
@@ -11,6 +12,7 @@ from .timing import TimingMiddleware
 
 __all__ = [
     "BodyLimitMiddleware",
+    "CompressionMiddleware",
     "RateLimitMiddleware",
     "RequestIdMiddleware",
     "SecurityHeadersMiddleware",
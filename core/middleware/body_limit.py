@@ -4,34 +4,74 @@ K8s 환경에서 nginx 없이 직접 노출되는 API Pod의 DoS 방지를 위
 요청 본문 크기를 제한합니다.
 """
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class BodyLimitMiddleware(BaseHTTPMiddleware):
-    """요청 본문 크기 제한 미들웨어.
+class PayloadTooLarge(HTTPException):
+    """본문을 읽는 도중 제한을 넘었을 때 receive()에서 발생하는 413 예외.
 
-    Content-Length 헤더를 검사하여 제한 초과 시 413을 반환합니다.
+    FastAPI는 본문 파싱 중 HTTPException을 그대로 다시 올리므로 기본 핸들러가 같은 413 응답을 만듭니다.
+    """
+
+
+class BodyLimitMiddleware:
+    """요청 본문 크기 제한 미들웨어 (순수 ASGI).
+
+    Content-Length 헤더를 검사하여 제한 초과 시 앱을 호출하지 않고 413을 반환합니다.
+    Content-Length가 없는 chunked 본문(또는 헤더보다 긴 본문)은 receive()를 감싸 읽은 바이트를 세고,
+    제한을 넘는 순간 더 읽지 않고 413으로 끝냅니다.
 
     Args:
         max_body_size: 최대 본문 크기 (바이트). 기본값 10MB.
     """
 
-    def __init__(self, app, max_body_size: int = 10 * 1024 * 1024) -> None:
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, max_body_size: int = 10 * 1024 * 1024) -> None:
+        self.app = app
         self.max_body_size = max_body_size
+        self.detail = {
+            "code": "PAYLOAD_TOO_LARGE",
+            "message": f"요청 본문이 {max_body_size // (1024 * 1024)}MB 제한을 초과합니다.",
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        content_length = request.headers.get("content-length")
+        content_length = Headers(scope=scope).get("content-length")
         if content_length and int(content_length) > self.max_body_size:
-            return JSONResponse(
-                status_code=413,
-                content={
-                    "detail": {
-                        "code": "PAYLOAD_TOO_LARGE",
-                        "message": f"요청 본문이 {self.max_body_size // (1024 * 1024)}MB 제한을 초과합니다.",
-                    }
-                },
-            )
-        return await call_next(request)
+            await self._reject(scope, receive, send)
+            return
+
+        received = 0
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    raise PayloadTooLarge(status_code=413, detail=self.detail)
+            return message
+
+        async def tracking_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except PayloadTooLarge:
+            # 앱이 예외를 처리하지 않고 올린 경우 (응답 전이면 여기서 413)
+            if response_started:
+                raise
+            await self._reject(scope, receive, send)
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send) -> None:
+        response = JSONResponse(status_code=413, content={"detail": self.detail})
+        await response(scope, receive, send)
@@ -0,0 +1,158 @@
+"""compression: 응답 압축 미들웨어 모듈.
+
+API Pod는 nginx 없이 직접 노출되므로 JSON 응답(게시글 목록 미리보기, 위키 마크다운 등)을
+Accept-Encoding 협상으로 brotli 또는 gzip 압축해 전송합니다.
+
+- 협상: q 값이 가장 높은 인코딩 (같으면 br > gzip). brotli 모듈이 없으면 gzip만 사용
+- 건너뜀: 최소 크기 미만 응답, 이미 Content-Encoding이 있는 응답(사전 압축 정적 파일 등),
+  이미지/영상/압축 파일처럼 이미 압축된 형식, 204/304/206 응답, SSE 스트림
+- 스트리밍 응답은 청크 단위로 압축하며 Content-Length를 제거합니다
+"""
+
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.utils import content_encoding
+from core.utils.content_encoding import compress_body, is_compressible, select_encoding
+
+_SKIP_STATUS = frozenset({204, 206, 304})
+
+
+class _Compressor:
+    """인코딩별 스트리밍 압축기 (gzip: zlib wbits=31, br: brotli.Compressor)."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = content_encoding.brotli.Compressor(quality=brotli_quality)
+        else:
+            self._gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        """청크를 압축합니다. 지금까지의 입력을 클라이언트가 바로 풀 수 있도록 flush합니다."""
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.flush()
+        return self._gz.compress(data) + self._gz.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        """스트림을 마칩니다."""
+        if self.encoding == "br":
+            return self._br.finish()
+        return self._gz.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """응답 압축 미들웨어 (순수 ASGI).
+
+    Args:
+        minimum_size: 압축할 최소 본문 크기 (바이트). 스트리밍 응답은 첫 청크 기준.
+        gzip_level: gzip 압축 수준 (1~9).
+        brotli_quality: brotli 품질 (0~11). 실시간 압축이라 낮은 값이 지연/CPU 대비 효율적.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.encodings = content_encoding.supported_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """한 요청의 응답 메시지를 가로채 압축 여부를 정하고 본문을 압축합니다."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Message | None = None
+        # None: 아직 결정 전, False: 그대로 전송, 압축기: 스트리밍 압축 중
+        self._compressor: _Compressor | bool | None = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # 본문 첫 청크를 보고 압축 여부를 정할 때까지 헤더 전송을 미룸
+            self._start = message
+            return
+        if message["type"] != "http.response.body" or self._start is None:
+            await self._send(message)
+            return
+
+        if self._compressor is None:
+            await self._first_body(message)
+        elif self._compressor is False:
+            await self._send(message)
+        else:
+            await self._stream_body(message)
+
+    async def _first_body(self, message: Message) -> None:
+        start = self._start
+        assert start is not None
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        headers = MutableHeaders(scope=start)
+
+        if not self._should_compress(start["status"], headers, body, more_body):
+            self._compressor = False
+            await self._send(start)
+            await self._send(message)
+            return
+
+        del headers["content-length"]
+        headers["content-encoding"] = self.encoding
+        # 표현이 바뀌므로 강한 ETag는 약한 ETag로 (RFC 9110 8.8.3)
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["etag"] = f"W/{etag}"
+
+        middleware = self.middleware
+        if not more_body:
+            compressed = compress_body(body, self.encoding, middleware.gzip_level, middleware.brotli_quality)
+            headers["content-length"] = str(len(compressed))
+            self._compressor = False
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": compressed})
+            return
+
+        compressor = _Compressor(self.encoding, middleware.gzip_level, middleware.brotli_quality)
+        self._compressor = compressor
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": compressor.compress(body), "more_body": True})
+
+    async def _stream_body(self, message: Message) -> None:
+        compressor = self._compressor
+        assert isinstance(compressor, _Compressor)
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        chunk = compressor.compress(body) if body else b""
+        if not more_body:
+            chunk += compressor.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    def _should_compress(self, status: int, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        if status in _SKIP_STATUS or "content-encoding" in headers or "content-range" in headers:
+            return False
+        if not is_compressible(headers.get("content-type", "")):
+            return False
+        # 이미 압축 가능한 형식이면 크기와 관계없이 캐시가 인코딩별로 구분하도록 Vary를 남김
+        headers.add_vary_header("Accept-Encoding")
+        return more_body or len(body) >= self.middleware.minimum_size
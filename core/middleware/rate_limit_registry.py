@@ -0,0 +1,171 @@
+"""rate_limit_registry: 라우트 템플릿별 Rate Limit 레지스트리.
+
+앱의 라우트 템플릿(예: /v1/posts/{post_id}/bookmark)마다 적용할 한도를 시작 시 한 번 결정해 두고,
+요청 경로를 정규식 없이 세그먼트 단위 dict 조회로 템플릿에 매칭합니다.
+매칭된 템플릿은 Rate Limit 키에 쓰입니다.
+"""
+
+import logging
+import re
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, NamedTuple
+
+from starlette.convertors import PathConvertor
+from starlette.routing import BaseRoute, Mount
+
+logger = logging.getLogger(__name__)
+
+# 라우트 템플릿의 경로 파라미터를 설정 키 형식({id})으로 치환 (시작 시에만 사용)
+_TEMPLATE_PARAM_RE = re.compile(r"\{[^}]+\}")
+
+
+class RouteLimit(NamedTuple):
+    """라우트 하나에 적용할 한도.
+
+    Attributes:
+        max_requests: 윈도우 내 최대 요청 수.
+        window_seconds: 시간 윈도우 (초).
+        per_user: True면 유효한 Access Token의 sub(사용자 ID) 기준, 토큰이 없으면 IP 기준.
+    """
+
+    max_requests: int
+    window_seconds: int
+    per_user: bool = False
+
+
+class RouteMatch(NamedTuple):
+    """요청 경로에 매칭된 라우트 템플릿과 한도 (한도 없음이면 None)."""
+
+    template: str
+    limit: RouteLimit | None
+
+
+class _Node:
+    __slots__ = ("param", "routes", "static")
+
+    def __init__(self) -> None:
+        self.static: dict[str, _Node] = {}
+        self.param: _Node | None = None
+        # {METHOD: RouteMatch}
+        self.routes: dict[str, RouteMatch] = {}
+
+
+def _to_limit(config: Mapping[str, Any]) -> RouteLimit:
+    return RouteLimit(config["max_requests"], config["window_seconds"], config.get("key") == "user")
+
+
+def _iter_routes(routes: Iterable[Any], prefix: str = "") -> Iterator[tuple[str, set[str], dict[str, Any]]]:
+    """(경로 템플릿, 메서드, 파라미터 변환기)를 펼쳐서 반환합니다.
+
+    Mount는 하위 라우트로 재귀하고, 최신 FastAPI가 include_router를 감싸는 객체는
+    effective_route_contexts()로 접두사가 붙은 라우트를 꺼냅니다 (구버전은 app.routes가 이미 펼쳐져 있음).
+    """
+    for route in routes:
+        contexts = getattr(route, "effective_route_contexts", None)
+        if callable(contexts):
+            yield from _iter_routes(contexts(), prefix)
+        elif isinstance(route, Mount):
+            yield from _iter_routes(route.routes, prefix + route.path)
+        else:
+            template = getattr(route, "path_format", None)
+            methods = getattr(route, "methods", None)
+            if template and methods:
+                yield prefix + template, set(methods), dict(getattr(route, "param_convertors", None) or {})
+
+
+def _strip(path: str) -> str:
+    # 끝 슬래시 유무는 같은 라우트로 취급 (redirect_slashes로 같은 핸들러에 도달)
+    return path.rstrip("/") or "/"
+
+
+class RateLimitRegistry:
+    """라우트 템플릿 → 한도 매핑과 경로 매처.
+
+    한도 결정 규칙 (기존 RATE_LIMIT_CONFIG 키 형식 그대로):
+    1. "METHOD:/path/{id}" 키
+    2. GET이 아니면 "/path/{id}" 키, 없으면 기본 한도
+    3. GET은 1번 키가 있을 때만 제한
+    경로 파라미터 이름은 {id}로, 끝 슬래시는 무시하고 비교합니다.
+
+    Args:
+        routes: 앱 라우트 (include_router로 포함된 라우터는 펼쳐서 사용).
+        config: 엔드포인트별 한도 설정.
+        default: 설정 없는 비GET 요청의 기본 한도 (매칭되지 않은 경로 포함).
+    """
+
+    def __init__(
+        self,
+        routes: Iterable[BaseRoute],
+        config: Mapping[str, Mapping[str, Any]],
+        default: Mapping[str, Any],
+    ) -> None:
+        self.default = _to_limit(default)
+        normalized_config: dict[str, RouteLimit] = {}
+        for key, value in config.items():
+            method, sep, path = key.rpartition(":")
+            normalized_config[f"{method}{sep}{_strip(path)}"] = _to_limit(value)
+
+        self._static: dict[tuple[str, str], RouteMatch] = {}
+        self._root = _Node()
+        used: set[str] = set()
+        for template, methods, convertors in _iter_routes(routes):
+            # {path:path} 같은 여러 세그먼트 파라미터는 트리로 표현하지 않음 (기본 한도 적용)
+            if any(isinstance(c, PathConvertor) for c in convertors.values()):
+                continue
+            config_path = _strip(_TEMPLATE_PARAM_RE.sub("{id}", template))
+            for method in methods:
+                key = f"{method}:{config_path}"
+                if key not in normalized_config and method not in ("GET", "HEAD"):
+                    key = config_path
+                limit = normalized_config.get(key)
+                if limit is not None:
+                    used.add(key)
+                elif method not in ("GET", "HEAD"):
+                    limit = self.default
+                self._add(method, template, RouteMatch(template, limit))
+
+        unused = sorted(normalized_config.keys() - used)
+        if unused:
+            # 라우트 경로/메서드가 바뀌어 설정이 조용히 기본 한도로 떨어지는 것을 방지
+            logger.warning("어떤 라우트와도 매칭되지 않는 Rate Limit 설정: %s", ", ".join(unused))
+
+    def _add(self, method: str, template: str, match: RouteMatch) -> None:
+        path = _strip(template)
+        if "{" not in path:
+            # 먼저 등록된 라우트가 우선 (Starlette 매칭 순서와 동일)
+            self._static.setdefault((method, path), match)
+            return
+        node = self._root
+        for segment in path.split("/")[1:]:
+            if segment.startswith("{"):
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+            else:
+                node = node.static.setdefault(segment, _Node())
+        node.routes.setdefault(method, match)
+
+    def resolve(self, method: str, path: str) -> RouteMatch | None:
+        """요청 경로에 매칭되는 라우트를 찾습니다. 고정 세그먼트가 파라미터보다 우선합니다.
+
+        Returns:
+            RouteMatch, 매칭되는 라우트가 없으면 None.
+        """
+        path = _strip(path)
+        match = self._static.get((method, path))
+        if match is not None:
+            return match
+        return self._walk(self._root, path.split("/")[1:], 0, method)
+
+    def _walk(self, node: _Node, segments: list[str], index: int, method: str) -> RouteMatch | None:
+        if index == len(segments):
+            return node.routes.get(method)
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            match = self._walk(child, segments, index + 1, method)
+            if match is not None:
+                return match
+        if node.param is not None and segment:
+            return self._walk(node.param, segments, index + 1, method)
+        return None
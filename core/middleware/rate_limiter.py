@@ -1,6 +1,6 @@
 """rate_limiter: API 요청 속도 제한 미들웨어.
 
-브루트포스 공격 방지를 위한 IP 기반 Rate Limiting을 제공합니다.
+브루트포스 공격 방지를 위한 IP/사용자 기반 Rate Limiting을 제공합니다.
 
 주요 개선사항:
 - LRU 기반 메모리 보호 (최대 IP 수 제한)
@@ -10,20 +10,22 @@
 
 import ipaddress
 import logging
-import re
+from collections.abc import Iterable
+from typing import Any
 
-from fastapi import Request, status
+from fastapi import HTTPException, Request, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from core.config import settings
+from core.middleware.rate_limit_registry import RateLimitRegistry
 from core.middleware.rate_limiter_base import RateLimiterProtocol
+from core.utils.jwt_utils import decode_access_token
 
 logger = logging.getLogger(__name__)
 
-# 숫자로만 이루어진 경로 세그먼트를 {id}로 치환
-_PATH_PARAM_RE = re.compile(r"/\d+(?=/|$)")
-
 
 def is_valid_ip(ip_str: str) -> bool:
     """IP 주소 형식을 검증합니다.
@@ -60,7 +62,11 @@ def _create_rate_limiter() -> RateLimiterProtocol:
     if backend == "redis":
         from core.middleware.rate_limiter_redis import RedisRateLimiter
 
-        return RedisRateLimiter(redis_url=settings.REDIS_URL)
+        return RedisRateLimiter(
+            redis_url=settings.REDIS_URL,
+            prefetch_tokens=settings.RATE_LIMIT_PREFETCH_TOKENS,
+            prefetch_min_limit=settings.RATE_LIMIT_PREFETCH_MIN_LIMIT,
+        )
 
     raise ValueError(f"지원하지 않는 Rate Limiter 백엔드: {backend}")
 
@@ -70,64 +76,86 @@ _rate_limiter = _create_rate_limiter()
 
 
 # 엔드포인트별 Rate Limit 설정
-RATE_LIMIT_CONFIG = {
+# 키: "METHOD:/path/{id}" 또는 "/path/{id}"(GET 제외 모든 메서드). 경로 파라미터 이름은 {id}로 통일
+# "key": "user" — 로그인 사용자는 Access Token의 sub(사용자 ID) 기준으로 합산 (NAT 뒤 사용자끼리 한도 공유 방지)
+RATE_LIMIT_CONFIG: dict[str, dict[str, Any]] = {
     # 인증 관련 - 엄격한 제한 (브루트포스 방지)
     "/v1/auth/session": {"max_requests": 5, "window_seconds": 60},  # 1분에 5회
     "/v1/users/": {"max_requests": 3, "window_seconds": 60},  # 1분에 3회 (회원가입)
     # 사용자 정보 변경 - 중간 제한
-    "/v1/users/me/password": {"max_requests": 3, "window_seconds": 60},
-    "DELETE:/v1/users/me": {"max_requests": 2, "window_seconds": 60},  # 회원 탈퇴
-    "PATCH:/v1/users/me": {"max_requests": 10, "window_seconds": 60},  # 프로필 수정
+    "/v1/users/me/password": {"max_requests": 3, "window_seconds": 60, "key": "user"},
+    "DELETE:/v1/users/me": {"max_requests": 2, "window_seconds": 60, "key": "user"},  # 회원 탈퇴
+    "PATCH:/v1/users/me": {"max_requests": 10, "window_seconds": 60, "key": "user"},  # 프로필 수정
     # 게시글 작성 - 스팸 방지
-    "/v1/posts": {"max_requests": 10, "window_seconds": 60},  # POST만 적용
+    "/v1/posts": {"max_requests": 10, "window_seconds": 60, "key": "user"},  # POST만 적용
     # 계정 찾기 - 브루트포스 방지 (5분 윈도우로 강화)
     "/v1/users/find-email": {"max_requests": 5, "window_seconds": 300},
     "/v1/users/reset-password": {"max_requests": 3, "window_seconds": 300},
     # 이메일 인증 - 브루트포스 방지 (GET 엔드포인트는 GET: 접두사 필수)
-    "GET:/v1/auth/verify-email": {"max_requests": 10, "window_seconds": 60},
+    "POST:/v1/auth/verify-email": {"max_requests": 10, "window_seconds": 60},
     "POST:/v1/auth/resend-verification": {"max_requests": 3, "window_seconds": 300},
     # 신고 - 스팸 방지
-    "/v1/reports": {"max_requests": 10, "window_seconds": 60},
-    "/v1/admin/reports": {"max_requests": 30, "window_seconds": 60},
+    "/v1/reports": {"max_requests": 10, "window_seconds": 60, "key": "user"},
+    "PATCH:/v1/admin/reports/{id}": {"max_requests": 30, "window_seconds": 60, "key": "user"},
     # 관리자 사용자 정지 관리
-    "POST:/v1/admin/users/{id}/suspend": {"max_requests": 30, "window_seconds": 60},
-    "DELETE:/v1/admin/users/{id}/suspend": {"max_requests": 30, "window_seconds": 60},
+    "POST:/v1/admin/users/{id}/suspend": {"max_requests": 30, "window_seconds": 60, "key": "user"},
+    "DELETE:/v1/admin/users/{id}/suspend": {"max_requests": 30, "window_seconds": 60, "key": "user"},
     # 내부 배치 작업 (EventBridge 호출)
     "POST:/v1/admin/cleanup/tokens": {"max_requests": 5, "window_seconds": 60},
     "POST:/v1/admin/feed/recompute": {"max_requests": 5, "window_seconds": 60},
+    "POST:/v1/admin/related-posts/rebuild": {"max_requests": 5, "window_seconds": 60},
+    "POST:/v1/admin/read-state/rebuild": {"max_requests": 5, "window_seconds": 60},
     # 북마크·구독·투표 등 (경로 정규화 후 매칭)
-    "POST:/v1/posts/{id}/bookmark": {"max_requests": 30, "window_seconds": 60},
-    "DELETE:/v1/posts/{id}/bookmark": {"max_requests": 30, "window_seconds": 60},
-    "POST:/v1/posts/{id}/comments/{id}/like": {"max_requests": 30, "window_seconds": 60},
-    "DELETE:/v1/posts/{id}/comments/{id}/like": {"max_requests": 30, "window_seconds": 60},
+    "POST:/v1/posts/{id}/bookmark": {"max_requests": 30, "window_seconds": 60, "key": "user"},
+    "DELETE:/v1/posts/{id}/bookmark": {"max_requests": 30, "window_seconds": 60, "key": "user"},
+    "POST:/v1/posts/{id}/comments/{id}/like": {"max_requests": 30, "window_seconds": 60, "key": "user"},
+    "DELETE:/v1/posts/{id}/comments/{id}/like": {"max_requests": 30, "window_seconds": 60, "key": "user"},
     # 사용자 검색 - 자동완성 빈도 고려
     "GET:/v1/users/search": {"max_requests": 30, "window_seconds": 60},
-    "POST:/v1/users/{id}/block": {"max_requests": 10, "window_seconds": 60},
-    "DELETE:/v1/users/{id}/block": {"max_requests": 10, "window_seconds": 60},
+    "POST:/v1/users/{id}/block": {"max_requests": 10, "window_seconds": 60, "key": "user"},
+    "DELETE:/v1/users/{id}/block": {"max_requests": 10, "window_seconds": 60, "key": "user"},
     # 팔로우
-    "POST:/v1/users/{id}/follow": {"max_requests": 10, "window_seconds": 60},
-    "DELETE:/v1/users/{id}/follow": {"max_requests": 10, "window_seconds": 60},
-    # 연관 게시글
-    "GET:/v1/posts/{id}/related": {"max_requests": 30, "window_seconds": 60},
+    "POST:/v1/users/{id}/follow": {"max_requests": 10, "window_seconds": 60, "key": "user"},
+    "DELETE:/v1/users/{id}/follow": {"max_requests": 10, "window_seconds": 60, "key": "user"},
     # 소셜 로그인
     "GET:/v1/auth/social/{id}/authorize": {"max_requests": 10, "window_seconds": 60},
     "GET:/v1/auth/social/{id}/callback": {"max_requests": 10, "window_seconds": 60},
     "POST:/v1/auth/social/complete-signup": {"max_requests": 5, "window_seconds": 60},
     # DM(쪽지)
-    "POST:/v1/dms": {"max_requests": 10, "window_seconds": 60},
-    "POST:/v1/dms/{id}/messages": {"max_requests": 30, "window_seconds": 60},
-    "GET:/v1/dms": {"max_requests": 50, "window_seconds": 60},
-    "GET:/v1/dms/unread-count": {"max_requests": 60, "window_seconds": 60},
-    "GET:/v1/dms/{id}": {"max_requests": 50, "window_seconds": 60},
-    "PATCH:/v1/dms/{id}/read": {"max_requests": 30, "window_seconds": 60},
-    "DELETE:/v1/dms/{id}/messages/{id}": {"max_requests": 20, "window_seconds": 60},
-    "DELETE:/v1/dms/{id}": {"max_requests": 10, "window_seconds": 60},
+    "POST:/v1/dms": {"max_requests": 10, "window_seconds": 60, "key": "user"},
+    "POST:/v1/dms/{id}/messages": {"max_requests": 30, "window_seconds": 60, "key": "user"},
+    "GET:/v1/dms": {"max_requests": 50, "window_seconds": 60, "key": "user"},
+    "GET:/v1/dms/unread-count": {"max_requests": 60, "window_seconds": 60, "key": "user"},
+    "GET:/v1/dms/{id}": {"max_requests": 50, "window_seconds": 60, "key": "user"},
+    "PATCH:/v1/dms/{id}/read": {"max_requests": 30, "window_seconds": 60, "key": "user"},
+    "DELETE:/v1/dms/{id}/messages/{id}": {"max_requests": 20, "window_seconds": 60, "key": "user"},
+    "DELETE:/v1/dms/{id}": {"max_requests": 10, "window_seconds": 60, "key": "user"},
 }
 
 # 기본 Rate Limit (설정되지 않은 엔드포인트)
 DEFAULT_RATE_LIMIT = {"max_requests": 100, "window_seconds": 60}
 
 
+def build_rate_limit_registry(routes: Iterable[BaseRoute]) -> RateLimitRegistry:
+    """앱 라우트와 RATE_LIMIT_CONFIG로 라우트 템플릿별 한도 레지스트리를 만듭니다.
+
+    시작 시(lifespan) 한 번 만들어 app.state.rate_limit_registry에 보관합니다.
+    """
+    return RateLimitRegistry(routes, RATE_LIMIT_CONFIG, DEFAULT_RATE_LIMIT)
+
+
+def _token_subject(scope: Scope) -> str | None:
+    """Authorization 헤더의 유효한 Access Token에서 sub(사용자 ID)를 꺼냅니다. 없거나 무효면 None."""
+    auth_header = Headers(scope=scope).get("authorization")
+    if not auth_header or not auth_header.startswith("Bearer "):
+        return None
+    try:
+        # 서명까지 검증 — 위조한 sub로 새 버킷을 만들어 한도를 우회하지 못하게 함
+        return decode_access_token(auth_header[len("Bearer ") :])["sub"]
+    except HTTPException:
+        return None
+
+
 def get_client_ip(request: Request) -> str:
     """클라이언트 IP를 신뢰할 수 있는 방식으로 추출합니다.
 
@@ -195,76 +223,92 @@ def get_client_ip(request: Request) -> str:
     return "unknown"
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate Limiting 미들웨어.
+class RateLimitMiddleware:
+    """Rate Limiting 미들웨어 (순수 ASGI).
 
-    IP 기반으로 API 요청 속도를 제한합니다.
+    요청 경로를 라우트 템플릿에 매칭해 템플릿별 한도를 적용합니다.
+    키는 "IP:METHOD:템플릿"이며, "key": "user" 한도는 로그인 사용자를 "user:ID:METHOD:템플릿"으로 합산합니다.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._registry: RateLimitRegistry | None = None
+
+    def _get_registry(self, scope: Scope) -> RateLimitRegistry:
+        if self._registry is None:
+            app = scope["app"]
+            registry = getattr(app.state, "rate_limit_registry", None)
+            if registry is None:
+                # lifespan 없이 실행된 앱(테스트 등)은 첫 요청에서 만듦
+                registry = app.state.rate_limit_registry = build_rate_limit_registry(app.routes)
+            self._registry = registry
+        return self._registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         from core.config import settings
 
         # 테스트 환경에서는 Rate Limit 적용 안 함
-        if settings.TESTING:
-            return await call_next(request)
-
-        # OPTIONS: CORS preflight 요청은 브라우저가 자동 생성하므로 제한 불필요
-        if request.method == "OPTIONS":
-            return await call_next(request)
+        if scope["type"] != "http" or settings.TESTING:
+            await self.app(scope, receive, send)
+            return
 
-        # GET 요청: METHOD:path 키가 설정된 엔드포인트만 Rate Limit 적용
-        if request.method == "GET":
-            normalized = _PATH_PARAM_RE.sub("/{id}", request.url.path)
-            method_key = f"GET:{normalized}"
-            if method_key not in RATE_LIMIT_CONFIG:
-                return await call_next(request)
+        method = scope["method"]
 
-        # 정적 파일은 제외
-        if request.url.path.startswith("/assets"):
-            return await call_next(request)
-
-        # Health check 제외
-        if request.url.path == "/health":
-            return await call_next(request)
-
-        client_ip = get_client_ip(request)
-        path = request.url.path
-
-        # 경로 정규화: 숫자 세그먼트를 {id}로 치환하여 config 키와 매칭
-        normalized = _PATH_PARAM_RE.sub("/{id}", path)
-
-        # 엔드포인트별 설정 확인 (METHOD:path 키 우선, path만 있는 키 fallback)
-        method_key = f"{request.method}:{normalized}"
-        config = RATE_LIMIT_CONFIG.get(method_key, RATE_LIMIT_CONFIG.get(normalized, DEFAULT_RATE_LIMIT))
-
-        # 같은 엔드포인트의 다른 ID 요청을 하나로 합산
-        rate_key = f"{client_ip}:{request.method}:{normalized}"
-
-        is_limited, remaining = await _rate_limiter.is_rate_limited(
+        # OPTIONS: CORS preflight 요청은 브라우저가 자동 생성하므로 제한 불필요
+        if method == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        registry = self._get_registry(scope)
+        match = registry.resolve(method, scope["path"])
+        if match is not None:
+            limit, template = match.limit, match.template
+        elif method not in ("GET", "HEAD"):
+            # 매칭되는 라우트가 없는 요청(404/405)은 경로와 무관하게 한 버킷으로 합산
+            limit, template = registry.default, "*"
+        else:
+            limit = None
+
+        # 설정 없는 GET, 정적 파일, Health check 제외
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        subject = _token_subject(scope) if limit.per_user else None
+        if subject is not None:
+            rate_key = f"user:{subject}:{method}:{template}"
+        else:
+            rate_key = f"{get_client_ip(Request(scope))}:{method}:{template}"
+
+        decision = await _rate_limiter.check(
             ip=rate_key,
-            max_requests=config["max_requests"],
-            window_seconds=config["window_seconds"],
+            max_requests=limit.max_requests,
+            window_seconds=limit.window_seconds,
         )
 
-        if is_limited:
-            return JSONResponse(
+        if decision.limited:
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "error": "too_many_requests",
                     "message": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
-                    "retry_after_seconds": config["window_seconds"],
+                    "retry_after_seconds": decision.retry_after,
                 },
                 headers={
-                    "Retry-After": str(config["window_seconds"]),
-                    "X-RateLimit-Limit": str(config["max_requests"]),
+                    "Retry-After": str(decision.retry_after),
+                    "X-RateLimit-Limit": str(limit.max_requests),
                     "X-RateLimit-Remaining": "0",
                 },
             )
-
-        response = await call_next(request)
-
-        # Rate Limit 헤더 추가
-        response.headers["X-RateLimit-Limit"] = str(config["max_requests"])
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-
-        return response
+            await response(scope, receive, send)
+            return
+
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            # Rate Limit 헤더 추가
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(limit.max_requests)
+                headers["X-RateLimit-Remaining"] = str(decision.remaining)
+            await send(message)
+
+        await self.app(scope, receive, send_with_rate_limit_headers)
@@ -1,6 +1,20 @@
 """rate_limiter_base: Rate Limiter 인터페이스 정의."""
 
-from typing import Protocol
+from typing import NamedTuple, Protocol
+
+
+class RateLimitDecision(NamedTuple):
+    """Rate Limit 판정 결과.
+
+    Attributes:
+        limited: 제한 여부.
+        remaining: 지금 더 보낼 수 있는 요청 수.
+        retry_after: 제한된 경우 다음 요청이 허용되기까지의 초 (Retry-After 헤더 값).
+    """
+
+    limited: bool
+    remaining: int
+    retry_after: int
 
 
 class RateLimiterProtocol(Protocol):
@@ -9,6 +23,19 @@ class RateLimiterProtocol(Protocol):
     인메모리(로컬)와 Redis(K8s 프로덕션) 구현을 교체 가능하게 한다.
     """
 
+    async def check(self, ip: str, max_requests: int, window_seconds: int) -> RateLimitDecision:
+        """요청 하나를 판정하고 허용되면 한도에서 차감한다.
+
+        Args:
+            ip: rate_key (IP:METHOD:PATH 형식).
+            max_requests: 윈도우 내 최대 요청 수.
+            window_seconds: 시간 윈도우 (초).
+
+        Returns:
+            RateLimitDecision (제한 여부, 남은 요청 수, 재시도까지 초).
+        """
+        ...
+
     async def is_rate_limited(self, ip: str, max_requests: int, window_seconds: int) -> tuple[bool, int]:
         """요청이 속도 제한에 걸리는지 확인한다.
 
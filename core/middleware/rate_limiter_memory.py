@@ -1,43 +1,85 @@
 """rate_limiter_memory: 인메모리 Rate Limiter 구현.
 
 로컬 개발 환경용. 단일 프로세스에서만 동작하며, 수평 확장 시 상태가 공유되지 않는다.
+Redis 백엔드와 같은 GCRA로 판정하며, 키마다 이론적 도착 시각(TAT) float 하나만 저장한다.
 """
 
-import asyncio
 import logging
-from collections import defaultdict
-from datetime import datetime, timedelta
+import math
+import time
+from collections import OrderedDict
 
 from core.config import settings
+from core.middleware.rate_limiter_base import RateLimitDecision
 
 logger = logging.getLogger(__name__)
 
+# 더 엄격한 제한(최대 10회)을 적용할 IP
+_UNKNOWN_IPS = frozenset({"unknown", "0.0.0.0", ""})
+
 
 class MemoryRateLimiter:
-    """메모리 기반 Rate Limiter (LRU 메모리 보호 적용).
+    """메모리 기반 Rate Limiter (GCRA + LRU).
 
     로컬 개발 및 단일 프로세스 환경 전용. 분산 환경에서는 RedisRateLimiter를 사용한다.
+
+    판정은 await 없는 동기 코드라 이벤트 루프에서 원자적으로 실행되므로 락이 필요 없고,
+    키당 상태가 float 하나라 요청 수와 무관하게 O(1) 시간·메모리로 갱신한다.
+    추적 키가 max_tracked_ips에 도달하면 가장 오래 사용하지 않은 키 하나를 제거한다 (LRU).
     """
 
     def __init__(self, max_tracked_ips: int | None = None):
         """MemoryRateLimiter 초기화.
 
         Args:
-            max_tracked_ips: 최대 추적 IP 수 (기본: settings.RATE_LIMIT_MAX_IPS).
+            max_tracked_ips: 최대 추적 키 수 (기본: settings.RATE_LIMIT_MAX_IPS).
         """
-        # {ip: [timestamp, ...]}
-        self._requests: dict[str, list] = defaultdict(list)
-        self._lock = asyncio.Lock()
+        # {key: TAT(monotonic 초)} — 최근 사용한 키가 뒤쪽
+        self._tat: OrderedDict[str, float] = OrderedDict()
+        self._clock = time.monotonic
         self.max_tracked_ips = max_tracked_ips if max_tracked_ips is not None else settings.RATE_LIMIT_MAX_IPS
+        self.evictions = 0
+
+    async def check(self, ip: str, max_requests: int, window_seconds: int) -> RateLimitDecision:
+        """요청 하나를 판정하고 허용되면 토큰 하나를 차감한다.
+
+        Args:
+            ip: rate_key (IP:METHOD:PATH 형식).
+            max_requests: 윈도우 내 최대 요청 수.
+            window_seconds: 시간 윈도우 (초).
+
+        Returns:
+            RateLimitDecision (제한 여부, 남은 요청 수, 재시도까지 초).
+        """
+        # "unknown" IP는 더 엄격한 제한 적용 (10회로 제한)
+        if ip in _UNKNOWN_IPS:
+            max_requests = min(max_requests, 10)
+            logger.warning(f"Unknown IP 감지: {ip}, 엄격한 제한 적용 (최대 {max_requests}회)")
+
+        now = self._clock()
+        interval = window_seconds / max_requests
+        tat = self._tat.get(ip)
+        if tat is None:
+            if len(self._tat) >= self.max_tracked_ips:
+                self._tat.popitem(last=False)
+                self.evictions += 1
+            tat = now
+        else:
+            self._tat.move_to_end(ip)
+            tat = max(tat, now)
+
+        # 1e-9: 부동소수점 오차로 마지막 토큰을 놓치지 않도록 보정
+        available = math.floor((now + window_seconds - tat) / interval + 1e-9)
+        if available <= 0:
+            self._tat[ip] = tat
+            return RateLimitDecision(True, 0, max(1, math.ceil(tat + interval - window_seconds - now)))
+
+        self._tat[ip] = tat + interval
+        return RateLimitDecision(False, available - 1, 0)
 
     async def is_rate_limited(self, ip: str, max_requests: int, window_seconds: int) -> tuple[bool, int]:
         """요청이 속도 제한에 걸리는지 확인한다.
 
-        배치 제거 방식으로 메모리를 보호한다:
-        1. IP 수가 max_tracked_ips를 초과하면 오래된 IP 10% 일괄 제거
-        2. O(1) 평균 성능 보장 (배치 제거로 인한 분할 상환)
-        3. "unknown" IP는 더 엄격한 제한 적용
-
         Args:
             ip: 클라이언트 IP 주소.
             max_requests: 윈도우 내 최대 요청 수.
@@ -46,37 +88,5 @@ class MemoryRateLimiter:
         Returns:
             (제한 여부, 남은 요청 수) 튜플.
         """
-        async with self._lock:
-            # 메모리 보호: 배치 제거 방식 (성능 최적화)
-            if len(self._requests) >= self.max_tracked_ips:
-                # 10% (1000개)의 오래된 IP를 일괄 제거
-                eviction_count = max(1, self.max_tracked_ips // 10)
-
-                # IP를 마지막 요청 시간 기준으로 정렬 (오래된 순)
-                sorted_ips = sorted(self._requests.items(), key=lambda item: max(item[1]) if item[1] else datetime.min)
-
-                # 가장 오래된 IP부터 제거
-                for ip_to_remove, _ in sorted_ips[:eviction_count]:
-                    del self._requests[ip_to_remove]
-
-                logger.warning(f"Rate Limiter 배치 제거: {eviction_count}개 IP 제거 (남은 IP: {len(self._requests)}개)")
-
-            now = datetime.now()
-            window_start = now - timedelta(seconds=window_seconds)
-
-            # 윈도우 내의 요청만 유지
-            self._requests[ip] = [req_time for req_time in self._requests[ip] if req_time > window_start]
-
-            current_count = len(self._requests[ip])
-
-            # "unknown" IP는 더 엄격한 제한 적용 (10회로 제한)
-            if ip in ("unknown", "0.0.0.0", ""):
-                max_requests = min(max_requests, 10)
-                logger.warning(f"Unknown IP 감지: {ip}, 엄격한 제한 적용 (최대 {max_requests}회)")
-
-            if current_count >= max_requests:
-                return True, 0
-
-            # 새 요청 기록
-            self._requests[ip].append(now)
-            return False, max_requests - current_count - 1
+        decision = await self.check(ip, max_requests, window_seconds)
+        return decision.limited, decision.remaining
@@ -1,39 +1,132 @@
-"""Redis 기반 Rate Limiter — Fixed Window Counter (INCR + EXPIRE)"""
+"""Redis 기반 Rate Limiter — GCRA (Lua 스크립트, EVALSHA 한 번).
+
+GCRA(Generic Cell Rate Algorithm)는 키마다 "이론적 도착 시각(TAT)" 하나만 저장하는 토큰 버킷으로,
+고정 윈도우처럼 경계에서 두 배가 몰리지 않고 남은 요청 수와 재시도 시각을 정확히 계산한다.
+판정·차감·만료 설정을 Lua 스크립트 하나로 실행하므로 요청당 Redis 왕복은 최대 한 번이다.
+"""
 
 import logging
+import math
 import time
 
+from core.middleware.rate_limiter_base import RateLimitDecision
 from core.utils.redis_client import get_redis
 
 logger = logging.getLogger(__name__)
 
+# KEYS[1]: rate 키 / ARGV[1]: 윈도우(ms), ARGV[2]: 윈도우 내 최대 요청 수, ARGV[3]: 가져갈 토큰 수
+# 반환: {허용된 토큰 수, 남은 토큰 수, 재시도까지 ms}
+# 시각은 Redis TIME 기준이라 파드 간 시계 차이의 영향을 받지 않는다.
+_GCRA_SCRIPT = """
+local period = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local want = tonumber(ARGV[3])
+local interval = period / limit
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then tat = now end
+local available = math.floor((now + period - tat) / interval + 1e-9)
+local granted = math.min(want, available)
+if granted <= 0 then
+  return {0, 0, math.ceil(tat + interval - period - now)}
+end
+local new_tat = tat + granted * interval
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(new_tat - now))
+return {granted, available - granted, 0}
+"""
+
+# 미리 가져온 토큰의 로컬 유효 시간 (초). 지나면 남은 토큰은 버린다 (한도가 느슨해지지 않음).
+_LEASE_SECONDS = 1.0
+# 로컬 토큰을 보관하는 최대 키 수
+_MAX_LEASES = 10000
+
 
 class RedisRateLimiter:
-    def __init__(self, redis_url: str):
+    """GCRA Rate Limiter.
+
+    prefetch_tokens가 1보다 크면 max_requests가 prefetch_min_limit 이상인 넉넉한 한도에서
+    Redis 호출 한 번에 토큰을 여러 개 가져와 파드 로컬에서 소비한다. 이미 Redis에서 차감된 토큰이라
+    파드 간 합계가 한도를 넘지 않으며, 쓰지 못한 토큰은 잠시 한도를 더 엄격하게 만들 뿐이다.
+
+    Args:
+        redis_url: Redis 접속 URL.
+        prefetch_tokens: 한 번에 가져올 최대 토큰 수 (0 또는 1이면 요청마다 Redis 호출).
+        prefetch_min_limit: 토큰을 미리 가져올 최소 max_requests (엄격한 인증 한도는 제외).
+    """
+
+    def __init__(self, redis_url: str, prefetch_tokens: int = 0, prefetch_min_limit: int = 100):
         self._redis_url = redis_url
         self._redis = None
+        self._script = None
+        self.prefetch_tokens = prefetch_tokens
+        self.prefetch_min_limit = prefetch_min_limit
+        # {key: [만료 시각(monotonic), 로컬 토큰 수, 가져올 당시 Redis에 남은 토큰 수]}
+        self._leases: dict[str, list] = {}
 
     async def _get_redis(self):
         if self._redis is None:
             self._redis = await get_redis(self._redis_url)
         return self._redis
 
-    async def is_rate_limited(self, ip: str, max_requests: int, window_seconds: int) -> tuple[bool, int]:
-        try:
+    async def _get_script(self):
+        # register_script: EVALSHA로 실행하고 NOSCRIPT이면 EVAL로 스크립트를 적재한다
+        if self._script is None:
             redis = await self._get_redis()
-            bucket_id = int(time.time()) // window_seconds
-            key = f"rate:{ip}:{bucket_id}"
+            self._script = redis.register_script(_GCRA_SCRIPT)
+        return self._script
+
+    def _batch_size(self, max_requests: int) -> int:
+        if self.prefetch_tokens <= 1 or max_requests < self.prefetch_min_limit:
+            return 1
+        # 파드 하나가 한도의 10% 넘게 가져가지 않도록 제한
+        return max(1, min(self.prefetch_tokens, max_requests // 10))
 
-            count = await redis.incr(key)
-            if count == 1:
-                # 첫 요청: 윈도우 만료 + 여유 10초
-                await redis.expire(key, window_seconds + 10)
+    def _take_leased(self, key: str) -> RateLimitDecision | None:
+        lease = self._leases.get(key)
+        if lease is None:
+            return None
+        expires_at, tokens, remaining = lease
+        if tokens <= 0 or expires_at <= time.monotonic():
+            del self._leases[key]
+            return None
+        lease[1] = tokens - 1
+        return RateLimitDecision(False, remaining + tokens - 1, 0)
 
-            if count > max_requests:
-                return (True, 0)
-            return (False, max(0, max_requests - count))
+    def _store_lease(self, key: str, tokens: int, remaining: int) -> None:
+        if len(self._leases) >= _MAX_LEASES:
+            now = time.monotonic()
+            self._leases = {k: v for k, v in self._leases.items() if v[0] > now and v[1] > 0}
+            if len(self._leases) >= _MAX_LEASES:
+                self._leases.clear()
+        self._leases[key] = [time.monotonic() + _LEASE_SECONDS, tokens, remaining]
 
+    async def check(self, ip: str, max_requests: int, window_seconds: int) -> RateLimitDecision:
+        """요청 하나를 판정한다. 로컬 토큰이 있으면 Redis를 호출하지 않는다."""
+        key = f"rate:{ip}"
+        batch = self._batch_size(max_requests)
+        if batch > 1:
+            leased = self._take_leased(key)
+            if leased is not None:
+                return leased
+
+        try:
+            script = await self._get_script()
+            granted, remaining, retry_after_ms = await script(
+                keys=[key], args=[window_seconds * 1000, max_requests, batch]
+            )
         except Exception:
             # fail-open: Redis 장애 시 요청 허용
             logger.warning("Redis rate limiter error, fail-open", exc_info=True)
-            return (False, max_requests)
+            return RateLimitDecision(False, max_requests, 0)
+
+        granted, remaining = int(granted), int(remaining)
+        if granted <= 0:
+            return RateLimitDecision(True, 0, max(1, math.ceil(int(retry_after_ms) / 1000)))
+        if granted > 1:
+            self._store_lease(key, granted - 1, remaining)
+        return RateLimitDecision(False, remaining + granted - 1, 0)
+
+    async def is_rate_limited(self, ip: str, max_requests: int, window_seconds: int) -> tuple[bool, int]:
+        decision = await self.check(ip, max_requests, window_seconds)
+        return decision.limited, decision.remaining
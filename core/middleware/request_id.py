@@ -5,30 +5,39 @@
 
 import uuid
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from core.logging_config import request_id_var
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
-    """요청 상관 ID 미들웨어.
+class RequestIdMiddleware:
+    """요청 상관 ID 미들웨어 (순수 ASGI).
 
     클라이언트가 X-Request-ID 헤더를 보내면 그대로 사용하고,
     없으면 새 UUID를 생성합니다. 응답 헤더에도 포함합니다.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """요청 ID를 생성/전파하고 응답 헤더에 포함합니다."""
-        rid = request.headers.get("x-request-id") or str(uuid.uuid4())
-        request.state.request_id = rid
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rid = Headers(scope=scope).get("x-request-id") or str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = rid
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = rid
+            await send(message)
 
-        # contextvars에 설정 — 이 요청의 모든 로그에 자동 포함
+        # contextvars에 설정 — 이 요청의 모든 로그에 자동 포함 (같은 태스크에서 앱을 호출하므로 그대로 전파)
         token = request_id_var.set(rid)
         try:
-            response = await call_next(request)
-            response.headers["X-Request-ID"] = rid
-            return response
+            await self.app(scope, receive, send_with_request_id)
         finally:
             request_id_var.reset(token)
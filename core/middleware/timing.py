@@ -5,13 +5,11 @@
 
 from datetime import UTC, datetime
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class TimingMiddleware(BaseHTTPMiddleware):
-    """요청 타이밍 미들웨어.
+class TimingMiddleware:
+    """요청 타이밍 미들웨어 (순수 ASGI).
 
     각 요청이 들어올 때 타임스탬프를 request.state에 저장합니다.
     이를 통해 컨트롤러에서 일관된 타임스탬프를 사용할 수 있습니다.
@@ -20,20 +18,20 @@ class TimingMiddleware(BaseHTTPMiddleware):
         app: ASGI 애플리케이션.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """요청을 처리하고 타임스탬프를 주입합니다.
 
         Args:
-            request: 들어온 HTTP 요청.
-            call_next: 다음 미들웨어/라우터 호출 함수.
-
-        Returns:
-            HTTP 응답.
+            scope: ASGI 연결 scope. request.state는 scope["state"]를 그대로 감쌉니다.
+            receive: ASGI receive 채널.
+            send: ASGI send 채널.
         """
-        # UTC 시간으로 요청 시간 기록
-        request.state.request_time = datetime.now(UTC)
+        if scope["type"] == "http":
+            # UTC 시간으로 요청 시간 기록
+            scope.setdefault("state", {})["request_time"] = datetime.now(UTC)
 
         # 다음 미들웨어/라우터로 요청 전달
-        response = await call_next(request)
-
-        return response
+        await self.app(scope, receive, send)
@@ -0,0 +1,92 @@
+"""search: 게시글/위키/태그/패키지 전문 검색.
+
+InnoDB ngram FULLTEXT(MATCH ... AGAINST)는 흔한 한글 2-gram에서 느리고 관련도 정렬이 없으며
+목록과 COUNT에서 같은 검색을 두 번 실행하므로, 검색을 주 DB와 분리된 색인으로 처리합니다.
+- mysql: 기존 MATCH ... AGAINST 검색 (색인 없음)
+- sqlite: 프로세스 로컬 SQLite FTS5 색인 (bm25 관련도 정렬, 하이라이트 스니펫)
+
+색인은 search_outbox 변경 로그를 따라 갱신되며(core/search/sync.py),
+색인이 아직 준비되지 않았거나 검색에 실패하면 호출부는 기존 MySQL 검색으로 폴백합니다.
+"""
+
+import logging
+
+from core.config import settings
+from core.search.base import SEARCH_KINDS, SearchDocument, SearchIndexProtocol, SearchKind, SearchResult
+from core.search.sync import queue_reindex, search_syncer, start_search_syncer, stop_search_syncer
+
+logger = logging.getLogger(__name__)
+
+_index: SearchIndexProtocol | None = None
+
+
+def _create_search_index() -> SearchIndexProtocol | None:
+    """settings.SEARCH_BACKEND에 따라 검색 색인을 생성합니다 (mysql이면 None)."""
+    backend = settings.SEARCH_BACKEND
+
+    if backend == "mysql":
+        return None
+
+    if backend == "sqlite":
+        from core.search.sqlite_index import SqliteSearchIndex
+
+        return SqliteSearchIndex(settings.SEARCH_INDEX_PATH)
+
+    raise ValueError(f"지원하지 않는 검색 백엔드: {backend}")
+
+
+def get_search_index() -> SearchIndexProtocol | None:
+    """검색 색인 싱글턴을 반환합니다. mysql 백엔드면 None."""
+    global _index
+    if _index is None:
+        _index = _create_search_index()
+    return _index
+
+
+async def query_index(kind: SearchKind, query: str) -> SearchResult | None:
+    """색인에서 관련도 순 ID를 최대 SEARCH_MAX_RESULTS개 조회합니다.
+
+    호출부의 필터(카테고리/태그/차단 등)와 COUNT는 이 상한 안의 ID에만 적용되므로,
+    상한을 넘게 일치하는 검색어는 total_count가 실제 일치 수보다 작고 하위 순위 문서는 결과에 나오지 않습니다.
+
+    Returns:
+        검색 결과. mysql 백엔드이거나 색인이 준비되지 않았거나 검색에 실패하면 None (MySQL 검색으로 폴백).
+    """
+    index = get_search_index()
+    if index is None:
+        return None
+    try:
+        if not await index.is_ready(kind):
+            return None
+        return await index.search(kind, query, settings.SEARCH_MAX_RESULTS)
+    except Exception:
+        logger.warning("검색 색인 조회 실패, MySQL 검색으로 폴백: kind=%s", kind, exc_info=True)
+        return None
+
+
+async def search_snippets(kind: SearchKind, ids: list[int], query: str) -> dict[int, str]:
+    """문서별 하이라이트 스니펫을 반환합니다. 색인이 없거나 실패하면 빈 dict (best-effort)."""
+    index = get_search_index()
+    if index is None or not ids:
+        return {}
+    try:
+        return await index.snippets(kind, ids, query)
+    except Exception:
+        logger.warning("검색 스니펫 생성 실패: kind=%s", kind, exc_info=True)
+        return {}
+
+
+__all__ = [
+    "SEARCH_KINDS",
+    "SearchDocument",
+    "SearchIndexProtocol",
+    "SearchKind",
+    "SearchResult",
+    "get_search_index",
+    "query_index",
+    "queue_reindex",
+    "search_snippets",
+    "search_syncer",
+    "start_search_syncer",
+    "stop_search_syncer",
+]
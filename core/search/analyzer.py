@@ -0,0 +1,83 @@
+"""analyzer: 검색 색인/질의 공통 토큰화와 하이라이트 스니펫.
+
+한국어는 띄어쓰기 단위가 아닌 부분 문자열로 검색하는 경우가 많아(예: "리눅스" → "눅스"),
+한글 구간은 겹치는 2-gram으로, 그 외(영문/숫자)는 소문자 단어 그대로 토큰화합니다.
+색인과 질의가 같은 함수를 거치므로 SQLite FTS5 기본 토크나이저(unicode61)는 공백 분리만 담당합니다.
+"""
+
+import html
+import re
+
+_WORD_RE = re.compile(r"[^\W_]+")
+_HANGUL_RE = re.compile(r"[가-힣ㄱ-ㆎ]+")
+
+# 스니펫 기본 길이 (글자 수)
+SNIPPET_LENGTH = 160
+
+
+def _word_tokens(word: str) -> list[str]:
+    """단어 하나를 토큰 목록으로 변환합니다. 한글 구간은 2-gram, 나머지는 그대로."""
+    tokens: list[str] = []
+    position = 0
+    for match in _HANGUL_RE.finditer(word):
+        if match.start() > position:
+            tokens.append(word[position : match.start()])
+        run = match.group()
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+        position = match.end()
+    if position < len(word):
+        tokens.append(word[position:])
+    return tokens
+
+
+def analyze(text: str) -> str:
+    """색인할 텍스트를 공백으로 구분된 토큰 문자열로 변환합니다."""
+    return " ".join(token for word in _WORD_RE.findall(text.lower()) for token in _word_tokens(word))
+
+
+def build_match_query(query: str) -> str | None:
+    """검색어를 FTS5 MATCH 식으로 변환합니다. 검색할 토큰이 없으면 None.
+
+    단어마다 토큰을 구(phrase)로 묶어 인접한 순서로만 일치시키고, 단어끼리는 AND로 결합합니다.
+    각 단어의 마지막 토큰은 접두어 일치("lin" → "linux", "리" → "리눅")를 허용해
+    입력 중인 검색어와 자동완성을 지원합니다.
+    토큰은 글자/숫자만 포함하므로 FTS5 구문 문자를 이스케이프할 필요가 없습니다.
+    """
+    phrases: list[str] = []
+    for word in _WORD_RE.findall(query.lower()):
+        tokens = _word_tokens(word)
+        if not tokens:
+            continue
+        last = tokens[-1]
+        prefix = "*" if len(last) == 1 or not _HANGUL_RE.fullmatch(last) else ""
+        phrases.append(f'"{" ".join(tokens)}"{prefix}')
+    return " AND ".join(phrases) or None
+
+
+def highlight(text: str, query: str, length: int = SNIPPET_LENGTH) -> str:
+    """검색어가 처음 나타나는 위치 주변을 잘라 일치 부분을 <mark>로 감싼 HTML 조각을 반환합니다.
+
+    본문은 HTML 이스케이프하므로 클라이언트는 결과를 그대로 innerHTML로 렌더링해도 안전합니다.
+    일치하는 부분이 없으면 앞부분을 잘라 반환합니다.
+    """
+    words = sorted({word for word in _WORD_RE.findall(query.lower())}, key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE) if words else None
+
+    first = pattern.search(text) if pattern else None
+    start = max(first.start() - length // 4, 0) if first else 0
+    end = min(start + length, len(text))
+    excerpt = text[start:end]
+
+    parts: list[str] = []
+    position = 0
+    if pattern:
+        for match in pattern.finditer(excerpt):
+            parts.append(html.escape(excerpt[position : match.start()]))
+            parts.append(f"<mark>{html.escape(match.group())}</mark>")
+            position = match.end()
+    parts.append(html.escape(excerpt[position:]))
+
+    return ("…" if start > 0 else "") + "".join(parts) + ("…" if end < len(text) else "")
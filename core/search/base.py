@@ -0,0 +1,90 @@
+"""base: 검색 색인 인터페이스 및 공통 타입 정의."""
+
+from dataclasses import dataclass
+from typing import Literal, Protocol
+
+SearchKind = Literal["post", "wiki", "tag", "package"]
+
+# 색인 대상 전체 (재색인 순서)
+SEARCH_KINDS: tuple[SearchKind, ...] = ("post", "wiki", "tag", "package")
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+    """색인 단위 문서.
+
+    Attributes:
+        id: 원본 행의 PK (post.id, wiki_page.id, tag.id, package.id).
+        title: 제목 필드 (관련도 가중치가 본문보다 높음).
+        body: 본문 필드.
+    """
+
+    id: int
+    title: str
+    body: str
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """검색 결과.
+
+    Attributes:
+        ids: 관련도 순 문서 ID (최대 SEARCH_MAX_RESULTS개, 상한을 넘는 일치 문서는 포함되지 않음).
+    """
+
+    ids: list[int]
+
+
+class SearchIndexProtocol(Protocol):
+    """검색 색인 백엔드 인터페이스.
+
+    색인은 원본(MySQL)에서 파생된 읽기 전용 사본이며, search_outbox 변경 로그를 따라
+    SearchSyncer가 갱신한다. 워터마크는 색인과 같은 저장소에 보관해 색인 내용과 함께 원자적으로 바뀐다.
+    """
+
+    async def is_ready(self, kind: SearchKind) -> bool:
+        """전체 색인이 한 번 이상 완료되어 검색에 쓸 수 있으면 True."""
+        ...
+
+    async def search(self, kind: SearchKind, query: str, limit: int) -> SearchResult:
+        """관련도 순으로 최대 limit개의 문서 ID를 반환한다."""
+        ...
+
+    async def snippets(self, kind: SearchKind, ids: list[int], query: str) -> dict[int, str]:
+        """문서별로 검색어를 <mark>로 강조한 본문 발췌를 반환한다."""
+        ...
+
+    async def apply(
+        self,
+        changes: dict[SearchKind, tuple[list[SearchDocument], list[int]]],
+        watermark: tuple[int, int] | None = None,
+    ) -> bool:
+        """종류별 (upsert할 문서, 삭제할 ID)를 한 트랜잭션으로 반영한다.
+
+        watermark=(기대 값, 새 값)이면 현재 워터마크가 기대 값일 때만 새 값으로 올리고 그 결과를 반환한다.
+        """
+        ...
+
+    async def watermark(self) -> tuple[int, float | None]:
+        """(반영한 마지막 search_outbox.id, 마지막 동기화 시각(epoch))을 반환한다."""
+        ...
+
+    async def begin_rebuild(self, kind: SearchKind) -> None:
+        """재색인용 빈 임시 색인을 만든다."""
+        ...
+
+    async def add_to_rebuild(self, kind: SearchKind, documents: list[SearchDocument]) -> None:
+        """임시 색인에 문서를 추가한다."""
+        ...
+
+    async def finish_rebuild(self, kind: SearchKind, watermark: int) -> None:
+        """임시 색인을 현재 색인과 교체하고 워터마크를 재색인 시작 시점으로 되돌린다."""
+        ...
+
+    async def stats(self) -> dict[str, int]:
+        """종류별 색인 문서 수를 반환한다."""
+        ...
+
+    async def clear(self) -> None:
+        """색인과 워터마크를 모두 비운다 (테스트용)."""
+        ...
@@ -0,0 +1,281 @@
+"""sqlite_index: SQLite FTS5 기반 로컬 검색 색인.
+
+종류(post/wiki/tag/package)마다 두 테이블을 둡니다.
+- fts_{kind}: FTS5 가상 테이블. rowid = 원본 ID, 컬럼은 analyzer.analyze()로 토큰화한 제목/본문
+- doc_{kind}: 스니펫 생성을 위한 원문 제목/본문
+
+관련도는 FTS5 bm25()로 계산하며 제목 일치에 본문보다 높은 가중치를 줍니다.
+WAL 모드라 재색인/동기화 쓰기 중에도 다른 프로세스(같은 파일을 쓰는 워커)의 검색은 막히지 않습니다.
+sqlite3 호출은 블로킹이므로 asyncio.to_thread에서 실행하고, 연결 하나를 스레드 락으로 직렬화합니다.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from core.search.analyzer import analyze, build_match_query, highlight
+from core.search.base import SEARCH_KINDS, SearchDocument, SearchKind, SearchResult
+
+# bm25 컬럼 가중치 (title, body)
+_BM25_WEIGHTS = (3.0, 1.0)
+
+
+def _tables(kind: SearchKind, suffix: str = "") -> tuple[str, str]:
+    """(FTS 테이블, 원문 테이블) 이름. kind는 SEARCH_KINDS 중 하나만 허용."""
+    if kind not in SEARCH_KINDS:
+        raise ValueError(f"지원하지 않는 검색 종류: {kind}")
+    return f"fts_{kind}{suffix}", f"doc_{kind}{suffix}"
+
+
+class SqliteSearchIndex:
+    """파일 하나에 모든 종류의 색인과 워터마크를 보관하는 SQLite FTS5 색인."""
+
+    def __init__(self, path: str):
+        """SqliteSearchIndex 초기화.
+
+        Args:
+            path: 색인 파일 경로 (":memory:" 가능). 상위 디렉터리는 없으면 생성.
+        """
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        # 재색인 임시 테이블 접미사 — 같은 파일을 쓰는 다른 프로세스의 재색인과 겹치지 않도록 PID 포함
+        self._build_suffix = f"_build_{os.getpid()}"
+
+    # ---- 연결 ------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            for kind in SEARCH_KINDS:
+                self._create_tables(conn, *_tables(kind))
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _create_tables(conn: sqlite3.Connection, fts_table: str, doc_table: str) -> None:
+        conn.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5(title, body, tokenize='unicode61')")
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {doc_table} (id INTEGER PRIMARY KEY, title TEXT, body TEXT)")
+
+    async def _run(self, fn, *args):
+        def call():
+            with self._lock:
+                return fn(self._connect(), *args)
+
+        return await asyncio.to_thread(call)
+
+    def close(self) -> None:
+        """연결을 닫습니다."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ---- 메타 ------------------------------------------------------------
+
+    @staticmethod
+    def _get_meta(conn: sqlite3.Connection, key: str) -> str | None:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    async def is_ready(self, kind: SearchKind) -> bool:
+        """전체 색인이 한 번 이상 완료되었으면 True."""
+        return await self._run(lambda conn: self._get_meta(conn, f"ready:{kind}") is not None)
+
+    async def watermark(self) -> tuple[int, float | None]:
+        """(반영한 마지막 search_outbox.id, 마지막 동기화 시각)."""
+
+        def read(conn: sqlite3.Connection) -> tuple[int, float | None]:
+            synced_at = self._get_meta(conn, "synced_at")
+            return int(self._get_meta(conn, "watermark") or 0), float(synced_at) if synced_at else None
+
+        return await self._run(read)
+
+    # ---- 검색 ------------------------------------------------------------
+
+    async def search(self, kind: SearchKind, query: str, limit: int) -> SearchResult:
+        """관련도(bm25) 순으로 최대 limit개의 ID를 반환합니다."""
+        match = build_match_query(query)
+        if match is None:
+            return SearchResult(ids=[])
+        fts_table, _ = _tables(kind)
+
+        def run(conn: sqlite3.Connection) -> SearchResult:
+            rows = conn.execute(
+                f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH ?"  # noqa: S608
+                f" ORDER BY bm25({fts_table}, ?, ?), rowid DESC LIMIT ?",
+                (match, *_BM25_WEIGHTS, limit),
+            ).fetchall()
+            return SearchResult(ids=[row[0] for row in rows])
+
+        return await self._run(run)
+
+    async def snippets(self, kind: SearchKind, ids: list[int], query: str) -> dict[int, str]:
+        """문서별로 검색어를 강조한 본문 발췌를 반환합니다 (본문에 없으면 제목)."""
+        if not ids:
+            return {}
+        _, doc_table = _tables(kind)
+        placeholders = ", ".join(["?"] * len(ids))
+
+        def run(conn: sqlite3.Connection) -> list[tuple[int, str, str]]:
+            return conn.execute(
+                f"SELECT id, title, body FROM {doc_table} WHERE id IN ({placeholders})",  # noqa: S608
+                ids,
+            ).fetchall()
+
+        result: dict[int, str] = {}
+        for doc_id, title, body in await self._run(run):
+            snippet = highlight(body or "", query)
+            if "<mark>" not in snippet:
+                title_snippet = highlight(title or "", query)
+                if "<mark>" in title_snippet:
+                    snippet = title_snippet
+            result[doc_id] = snippet
+        return result
+
+    # ---- 증분 반영 -------------------------------------------------------
+
+    @staticmethod
+    def _write(conn: sqlite3.Connection, kind: SearchKind, documents: list[SearchDocument], suffix: str = "") -> None:
+        fts_table, doc_table = _tables(kind, suffix)
+        ids = [(doc.id,) for doc in documents]
+        conn.executemany(f"DELETE FROM {fts_table} WHERE rowid = ?", ids)  # noqa: S608
+        conn.executemany(
+            f"INSERT INTO {fts_table} (rowid, title, body) VALUES (?, ?, ?)",  # noqa: S608
+            [(doc.id, analyze(doc.title), analyze(doc.body)) for doc in documents],
+        )
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {doc_table} (id, title, body) VALUES (?, ?, ?)",  # noqa: S608
+            [(doc.id, doc.title, doc.body) for doc in documents],
+        )
+
+    async def apply(
+        self,
+        changes: dict[SearchKind, tuple[list[SearchDocument], list[int]]],
+        watermark: tuple[int, int] | None = None,
+    ) -> bool:
+        """종류별 upsert/삭제를 한 트랜잭션으로 반영하고, 워터마크를 비교 후 교체(CAS)합니다.
+
+        재색인이 워터마크를 되돌린 뒤라면 CAS가 실패해 워터마크를 올리지 않으므로,
+        재색인 시작 이후의 변경은 다음 동기화에서 다시 반영됩니다 (반영은 멱등).
+        """
+
+        def run(conn: sqlite3.Connection) -> bool:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for kind, (documents, deleted_ids) in changes.items():
+                    fts_table, doc_table = _tables(kind)
+                    removed = [(doc_id,) for doc_id in deleted_ids]
+                    conn.executemany(f"DELETE FROM {fts_table} WHERE rowid = ?", removed)  # noqa: S608
+                    conn.executemany(f"DELETE FROM {doc_table} WHERE id = ?", removed)  # noqa: S608
+                    self._write(conn, kind, documents)
+                advanced = False
+                if watermark is not None:
+                    expected, new = watermark
+                    if int(self._get_meta(conn, "watermark") or 0) == expected:
+                        self._set_meta(conn, "watermark", str(new))
+                        self._set_meta(conn, "synced_at", str(time.time()))
+                        advanced = True
+                conn.execute("COMMIT")
+                return advanced
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        return await self._run(run)
+
+    # ---- 재색인 ----------------------------------------------------------
+
+    async def begin_rebuild(self, kind: SearchKind) -> None:
+        """재색인용 빈 임시 테이블을 만듭니다."""
+        fts_table, doc_table = _tables(kind, self._build_suffix)
+
+        def run(conn: sqlite3.Connection) -> None:
+            conn.execute(f"DROP TABLE IF EXISTS {fts_table}")
+            conn.execute(f"DROP TABLE IF EXISTS {doc_table}")
+            self._create_tables(conn, fts_table, doc_table)
+
+        await self._run(run)
+
+    async def add_to_rebuild(self, kind: SearchKind, documents: list[SearchDocument]) -> None:
+        """임시 테이블에 문서를 추가합니다."""
+
+        def run(conn: sqlite3.Connection) -> None:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._write(conn, kind, documents, self._build_suffix)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        await self._run(run)
+
+    async def finish_rebuild(self, kind: SearchKind, watermark: int) -> None:
+        """임시 테이블을 현재 색인과 교체하고 워터마크를 재색인 시작 시점으로 되돌립니다.
+
+        교체는 한 트랜잭션이라 검색은 이전 색인 또는 새 색인 중 하나만 봅니다.
+        """
+        fts_table, doc_table = _tables(kind)
+        build_fts, build_doc = _tables(kind, self._build_suffix)
+
+        def run(conn: sqlite3.Connection) -> None:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(f"DROP TABLE IF EXISTS {fts_table}")
+                conn.execute(f"DROP TABLE IF EXISTS {doc_table}")
+                conn.execute(f"ALTER TABLE {build_fts} RENAME TO {fts_table}")
+                conn.execute(f"ALTER TABLE {build_doc} RENAME TO {doc_table}")
+                # 재색인 중 동기화가 이전 테이블에 반영한 변경은 새 테이블에 다시 반영해야 하므로 되돌림
+                current = self._get_meta(conn, "watermark")
+                rewound = watermark if current is None else min(int(current), watermark)
+                self._set_meta(conn, "watermark", str(rewound))
+                self._set_meta(conn, "synced_at", str(time.time()))
+                self._set_meta(conn, f"ready:{kind}", str(time.time()))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        await self._run(run)
+
+    # ---- 운영 ------------------------------------------------------------
+
+    async def stats(self) -> dict[str, int]:
+        """종류별 색인 문서 수."""
+
+        def run(conn: sqlite3.Connection) -> dict[str, int]:
+            return {
+                kind: conn.execute(f"SELECT COUNT(*) FROM {_tables(kind)[1]}").fetchone()[0]  # noqa: S608
+                for kind in SEARCH_KINDS
+            }
+
+        return await self._run(run)
+
+    async def clear(self) -> None:
+        """모든 색인을 비우고 워터마크를 0으로, 모든 종류를 준비 완료로 표시합니다 (테스트용)."""
+
+        def run(conn: sqlite3.Connection) -> None:
+            conn.execute("BEGIN IMMEDIATE")
+            for kind in SEARCH_KINDS:
+                fts_table, doc_table = _tables(kind)
+                conn.execute(f"DELETE FROM {fts_table}")  # noqa: S608
+                conn.execute(f"DELETE FROM {doc_table}")  # noqa: S608
+                self._set_meta(conn, f"ready:{kind}", str(time.time()))
+            self._set_meta(conn, "watermark", "0")
+            self._set_meta(conn, "synced_at", str(time.time()))
+            conn.execute("COMMIT")
+
+        await self._run(run)
@@ -0,0 +1,203 @@
+"""sync: search_outbox 변경 로그를 따라 로컬 검색 색인을 갱신합니다.
+
+쓰기 경로는 커밋 후 queue_reindex()로 (종류, ID)를 search_outbox에 적재하기만 하고,
+각 프로세스의 SearchSyncer가 워터마크 이후의 변경을 읽어 원본 행을 다시 조회해 색인에 반영합니다.
+색인이 파드마다 따로 있어도 모두 같은 변경 로그를 따라가므로 결국 같은 상태가 됩니다.
+
+- 반영은 "현재 원본 행으로 덮어쓰기"라 멱등이므로 같은 변경을 여러 번 처리해도 안전합니다.
+- auto-increment ID는 커밋 순서와 다를 수 있어, 적재 후 _SETTLE_SECONDS가 지나지 않은 변경은
+  반영하되 워터마크는 그 앞에서 멈춰 다음 동기화에서 다시 처리합니다 (늦게 커밋된 낮은 ID 유실 방지).
+- 색인이 없거나 SEARCH_OUTBOX_RETENTION_HOURS보다 오래 동기화되지 않았으면 전체 재색인합니다.
+"""
+
+import asyncio
+import contextlib
+import importlib
+import logging
+import time
+
+from core.config import settings
+from core.database.connection import get_cursor
+from core.search.base import SEARCH_KINDS, SearchDocument, SearchIndexProtocol, SearchKind
+
+logger = logging.getLogger(__name__)
+
+# 동기화 1회에 읽는 변경 로그 최대 건수
+_OUTBOX_BATCH = 1000
+# 재색인 시 원본에서 한 번에 읽는 행 수
+_REBUILD_BATCH = 500
+# 이 시간이 지나지 않은 변경은 워터마크를 넘기지 않음 (초)
+_SETTLE_SECONDS = 5
+# 오래된 변경 로그 정리 주기 (초)
+_PRUNE_INTERVAL_SECONDS = 3600
+
+# 종류별 원본 조회 함수(get_search_documents)가 있는 모델 모듈
+_SOURCES: dict[SearchKind, str] = {
+    "post": "modules.post.post_models",
+    "wiki": "modules.wiki.models",
+    "tag": "modules.content.tag_models",
+    "package": "modules.package.models",
+}
+
+
+async def _load_documents(
+    kind: SearchKind,
+    ids: list[int] | None = None,
+    after_id: int = 0,
+    limit: int = _REBUILD_BATCH,
+) -> list[SearchDocument]:
+    """원본 테이블에서 색인할 문서를 읽습니다. 삭제된 행은 포함하지 않습니다."""
+    get_search_documents = importlib.import_module(_SOURCES[kind]).get_search_documents
+    rows = await get_search_documents(ids=ids, after_id=after_id, limit=limit)
+    return [SearchDocument(id=row["id"], title=row["title"] or "", body=row["body"] or "") for row in rows]
+
+
+async def queue_reindex(kind: SearchKind, *ids: int) -> None:
+    """원본 행이 바뀌었음을 변경 로그에 기록하고 이 프로세스의 동기화를 깨웁니다 (커밋 직후 호출).
+
+    적재에 실패해도 쓰기 요청은 실패시키지 않습니다 (best-effort). 누락된 변경은 재색인으로 복구합니다.
+    """
+    if settings.SEARCH_BACKEND == "mysql" or not ids:
+        return
+    try:
+        async with get_cursor() as cur:
+            await cur.executemany(
+                "INSERT INTO search_outbox (kind, entity_id) VALUES (%s, %s)",
+                [(kind, entity_id) for entity_id in ids],
+            )
+    except Exception:
+        logger.warning("검색 변경 로그 적재 실패 (best-effort): kind=%s ids=%s", kind, ids, exc_info=True)
+        return
+    search_syncer.wakeup.set()
+
+
+class SearchSyncer:
+    """변경 로그 → 색인 반영과 전체 재색인을 담당합니다 (프로세스당 하나)."""
+
+    def __init__(self) -> None:
+        """SearchSyncer 초기화."""
+        self._lock = asyncio.Lock()
+        self._last_prune = 0.0
+        self.wakeup = asyncio.Event()
+
+    async def sync(self, index: SearchIndexProtocol) -> int:
+        """워터마크 이후의 변경을 반영하고 처리한 변경 로그 건수를 반환합니다."""
+        async with self._lock:
+            watermark, _ = await index.watermark()
+            async with get_cursor() as cur:
+                await cur.execute(
+                    "SELECT id, kind, entity_id, created_at < NOW(3) - INTERVAL %s SECOND AS settled"
+                    " FROM search_outbox WHERE id > %s ORDER BY id LIMIT %s",
+                    (_SETTLE_SECONDS, watermark, _OUTBOX_BATCH),
+                )
+                rows = await cur.fetchall()
+
+            changed: dict[SearchKind, set[int]] = {}
+            new_watermark = watermark
+            settled = True
+            for row in rows:
+                changed.setdefault(row["kind"], set()).add(row["entity_id"])
+                settled = settled and bool(row["settled"])
+                if settled:
+                    new_watermark = row["id"]
+
+            changes: dict[SearchKind, tuple[list[SearchDocument], list[int]]] = {}
+            for kind, entity_ids in changed.items():
+                documents = await _load_documents(kind, ids=sorted(entity_ids))
+                found = {doc.id for doc in documents}
+                changes[kind] = (documents, sorted(entity_ids - found))
+            # 변경이 없어도 호출해 마지막 동기화 시각을 갱신
+            await index.apply(changes, (watermark, new_watermark))
+
+        await self._prune()
+        return len(rows)
+
+    async def rebuild(self, index: SearchIndexProtocol, kinds: tuple[SearchKind, ...] = SEARCH_KINDS) -> dict[str, int]:
+        """원본 전체를 임시 색인에 다시 만든 뒤 교체하고, 종류별 색인 문서 수를 반환합니다.
+
+        재색인 중 들어온 변경은 교체 후 워터마크를 시작 시점으로 되돌려 다시 반영합니다.
+        """
+        async with self._lock:
+            async with get_cursor() as cur:
+                await cur.execute(
+                    "SELECT COALESCE(MAX(id), 0) AS id FROM search_outbox"
+                    " WHERE created_at < NOW(3) - INTERVAL %s SECOND",
+                    (_SETTLE_SECONDS,),
+                )
+                row = await cur.fetchone()
+            start_watermark = row["id"] if row else 0
+
+            counts: dict[str, int] = {}
+            for kind in kinds:
+                started = time.monotonic()
+                await index.begin_rebuild(kind)
+                after_id = 0
+                counts[kind] = 0
+                while documents := await _load_documents(kind, after_id=after_id):
+                    await index.add_to_rebuild(kind, documents)
+                    after_id = documents[-1].id
+                    counts[kind] += len(documents)
+                await index.finish_rebuild(kind, start_watermark)
+                logger.info("검색 재색인 완료: kind=%s docs=%d (%.1fs)", kind, counts[kind], time.monotonic() - started)
+        return counts
+
+    async def rebuild_if_needed(self, index: SearchIndexProtocol) -> dict[str, int]:
+        """색인이 없는 종류를, 동기화가 보관 기간보다 오래 멈췄으면 전체를 재색인합니다."""
+        _, synced_at = await index.watermark()
+        if synced_at is None or time.time() - synced_at > settings.SEARCH_OUTBOX_RETENTION_HOURS * 3600:
+            return await self.rebuild(index)
+        missing = tuple([kind for kind in SEARCH_KINDS if not await index.is_ready(kind)])
+        return await self.rebuild(index, missing) if missing else {}
+
+    async def _prune(self) -> None:
+        """보관 기간이 지난 변경 로그를 정리합니다 (프로세스당 _PRUNE_INTERVAL_SECONDS마다)."""
+        if time.monotonic() - self._last_prune < _PRUNE_INTERVAL_SECONDS:
+            return
+        self._last_prune = time.monotonic()
+        async with get_cursor() as cur:
+            await cur.execute(
+                "DELETE FROM search_outbox WHERE created_at < NOW() - INTERVAL %s HOUR LIMIT 10000",
+                (settings.SEARCH_OUTBOX_RETENTION_HOURS,),
+            )
+
+
+search_syncer = SearchSyncer()
+
+
+# ---- 주기적 동기화 태스크 ---------------------------------------------------
+
+_syncer_task: asyncio.Task | None = None
+
+
+async def _run_syncer(index: SearchIndexProtocol) -> None:
+    """시작 시 필요하면 재색인하고, 이후 SEARCH_SYNC_SECONDS마다 (또는 쓰기 직후) 동기화합니다."""
+    ready = False
+    while True:
+        try:
+            if not ready:
+                await search_syncer.rebuild_if_needed(index)
+                ready = True
+            await search_syncer.sync(index)
+        except Exception:
+            logger.warning("검색 색인 동기화 실패, 다음 주기에 재시도", exc_info=True)
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(search_syncer.wakeup.wait(), timeout=settings.SEARCH_SYNC_SECONDS)
+        search_syncer.wakeup.clear()
+
+
+def start_search_syncer(index: SearchIndexProtocol | None) -> None:
+    """색인 동기화 태스크를 시작합니다 (앱 startup 시 호출, mysql 백엔드면 index=None으로 시작하지 않음)."""
+    global _syncer_task
+    if index is None or _syncer_task is not None:
+        return
+    _syncer_task = asyncio.create_task(_run_syncer(index))
+
+
+async def stop_search_syncer() -> None:
+    """색인 동기화 태스크를 종료합니다 (앱 shutdown 시 호출)."""
+    global _syncer_task
+    if _syncer_task is not None:
+        _syncer_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _syncer_task
+        _syncer_task = None
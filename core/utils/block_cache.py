@@ -0,0 +1,69 @@
+"""block_cache: 사용자별 차단 ID 집합 캐시.
+
+로그인 사용자의 게시글 목록/상세/관련 게시글/사용자 검색은 매 요청 user_block을 조회했으므로,
+차단 ID 집합을 두 단계로 캐시합니다.
+
+- L1: 프로세스 메모리 TTL/LRU 캐시 (BLOCK_CACHE_BACKEND=local|redis)
+- L2: Redis 공유 캐시 (BLOCK_CACHE_BACKEND=redis). 워커/파드 간 캐시를 공유
+
+차단/차단 해제(block_models.add_block/remove_block)의 커밋 직후 invalidate_blocked_ids()를 호출합니다.
+
+- 같은 워커의 쓰기: L1/L2 모두 즉시 반영 (L2는 사용자별 버전 번호로 무효화)
+- 다른 워커의 쓰기 (redis): L2는 즉시 반영, L1은 최대 BLOCK_CACHE_L1_TTL_SECONDS 동안 이전 값
+- 다른 워커의 쓰기 (local): 최대 BLOCK_CACHE_TTL_SECONDS 동안 이전 값
+
+L1/L2 조회와 버전 비교는 core/utils/versioned_cache.py의 VersionedCache가 처리합니다 (사용자 ID가 네임스페이스).
+읽기 필터 전용입니다. 쪽지 발송처럼 차단 관계를 강제해야 하는 쓰기는 DB를 직접 조회합니다.
+Redis 오류는 캐시 미스로 취급하고 DB 조회로 폴백합니다 (best-effort).
+"""
+
+from collections.abc import Awaitable, Callable
+
+from core.config import settings
+from core.utils.versioned_cache import VersionedCache
+
+
+class BlockCache(VersionedCache[frozenset[int]]):
+    """user_id별 차단 ID 집합 캐시. 설정: BLOCK_CACHE_*."""
+
+    settings_prefix = "BLOCK_CACHE"
+    redis_prefix = "blocks:"
+
+    def version_ttl(self) -> float:
+        # 항목 TTL의 두 배 뒤 만료. 그때는 이전 버전으로 저장된 항목도 이미 만료된 뒤
+        return settings.BLOCK_CACHE_TTL_SECONDS * 2
+
+    def encode(self, value: frozenset[int]) -> str:
+        # 빈 집합도 "차단 없음"으로 캐시해야 하므로 ID 목록이 비어 있어도 저장
+        return ",".join(map(str, value))
+
+    def decode(self, raw: str) -> frozenset[int]:
+        return frozenset(int(v) for v in raw.split(",")) if raw else frozenset()
+
+
+block_cache = BlockCache()
+
+
+async def get_cached_blocked_ids(
+    user_id: int,
+    loader: Callable[[int], Awaitable[set[int]]],
+) -> frozenset[int]:
+    """캐시를 거쳐 user_id가 차단한 사용자 ID 집합을 반환합니다. 미스 시 loader로 DB에서 읽어 캐시합니다.
+
+    반환 값은 캐시와 공유되므로 변경할 수 없는 frozenset입니다.
+    """
+
+    async def load() -> frozenset[int]:
+        return frozenset(await loader(user_id))
+
+    key = str(user_id)
+    return await block_cache.get_or_load(key, (key,), load)
+
+
+async def invalidate_blocked_ids(user_id: int) -> None:
+    """user_id의 차단 ID 집합 캐시를 무효화합니다 (차단/차단 해제의 커밋 직후 호출).
+
+    로컬 버전은 즉시 올리고, redis 모드에서는 사용자별 공유 버전을 INCR합니다 (best-effort).
+    L2 조회 시 버전을 함께 비교하므로, 무효화 전에 DB를 읽은 다른 워커가 이전 집합을 저장해도 쓰이지 않습니다.
+    """
+    await block_cache.invalidate((str(user_id),))
@@ -0,0 +1,87 @@
+"""conditional_get: ETag 기반 조건부 GET (If-None-Match → 304).
+
+게시글 목록/상세, 위키 페이지, 패키지, 사용자 프로필은 폴링과 재방문에도 매번 전체 조회를 실행했으므로,
+응답이 의존하는 리소스의 버전 토큰으로 ETag를 만들어 본문을 조립하기 전에 비교합니다.
+일치하면 조회 없이 304를 반환하므로 재검증 비용은 버전 키 조회 한 번입니다.
+
+- 버전 토큰: response_cache의 네임스페이스 버전 (예: "post:42", "wiki:{slug}", "viewer:{user_id}").
+  쓰기 경로가 이미 커밋 직후 invalidate()로 올리는 번호를 그대로 재사용합니다
+- RESPONSE_CACHE_BACKEND=redis: 파드 간 공유 버전 (Redis MGET 1회) — 어느 파드가 받아도 같은 ETag
+- local/off 또는 ETAG_ENABLED=false: ETag를 만들지 않음. 로컬 버전은 다른 파드의 쓰기를 모르므로
+  ETag를 받은 파드로 재검증이 돌아오면 다른 파드에서 수정된 리소스에 304를 줄 수 있음
+
+조회수/작성자 닉네임처럼 무효화하지 않는 변경을 반영하도록 ETag에 ETAG_MAX_STALE_SECONDS 단위 시간 구간을 넣어
+응답 캐시 TTL과 같은 수준의 지연만 허용합니다. 버전은 조립 전에 읽으므로 조립 중 쓰기가 있으면
+(이전 버전 ETag + 새 본문) 다음 요청에서 불일치로 다시 받습니다.
+"""
+
+import hashlib
+import time
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from core.config import settings
+from core.utils.response_cache import current_versions
+
+
+def _versions_are_shared() -> bool:
+    """네임스페이스 버전을 모든 파드가 공유하는지 (redis 모드) 여부."""
+    return settings.RESPONSE_CACHE_BACKEND == "redis"
+
+
+async def compute_etag(namespaces: tuple[str, ...], signature: str = "") -> str | None:
+    """리소스 버전으로 약한 ETag를 만듭니다. 버전이 공유되지 않거나 알 수 없으면 None (조건부 GET 생략).
+
+    Args:
+        namespaces: 응답이 의존하는 네임스페이스.
+        signature: 같은 리소스의 다른 표현을 구분하는 값 (쿼리 파라미터, 로그인 사용자 ID 등).
+    """
+    if not settings.ETAG_ENABLED or not _versions_are_shared():
+        return None
+    versions = await current_versions(namespaces)
+    if versions is None:
+        return None
+    window = int(time.time() // max(settings.ETAG_MAX_STALE_SECONDS, 1))
+    raw = f"{'+'.join(namespaces)}|{','.join(map(str, versions))}|{signature}|{window}"
+    return f'W/"{hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()}"'
+
+
+def _opaque(tag: str) -> str:
+    """약한 비교용으로 W/ 접두사를 뗍니다 (RFC 9110 8.8.3.2)."""
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(request: Request, etag: str | None) -> bool:
+    """If-None-Match가 etag와 (약한 비교로) 일치하는지 확인합니다. etag가 None이면 항상 False."""
+    if etag is None:
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    expected = _opaque(etag)
+    return any(_opaque(tag.strip()) == expected for tag in header.split(","))
+
+
+def _cache_headers(etag: str, private: bool) -> dict[str, str]:
+    # no-cache: 저장은 허용하되 매번 ETag로 재검증. 로그인 응답은 공유 캐시에 저장하지 않음
+    return {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache" if private else "no-cache",
+        "Vary": "Authorization",
+    }
+
+
+def not_modified_response(etag: str, private: bool = False) -> Response:
+    """본문 없는 304 응답."""
+    return Response(status_code=304, headers=_cache_headers(etag, private))
+
+
+def with_etag(body: dict, etag: str | None, private: bool = False) -> JSONResponse | dict:
+    """ETag가 있으면 검증 헤더를 붙인 JSONResponse로, 없으면 본문 그대로 반환합니다."""
+    if etag is None:
+        return body
+    return JSONResponse(content=jsonable_encoder(body), headers=_cache_headers(etag, private))
@@ -0,0 +1,82 @@
+"""content_encoding: 응답 압축 인코딩 협상과 압축 헬퍼.
+
+응답 압축 미들웨어(core/middleware/compression.py), 사전 압축 정적 파일(core/utils/static_files.py),
+빌드 시 사전 압축 스크립트(scripts/precompress_static.py)가 함께 씁니다.
+설정(settings)에 의존하지 않으므로 환경변수 없는 이미지 빌드 단계에서도 import할 수 있습니다.
+"""
+
+import gzip
+
+try:
+    import brotli
+except ImportError:  # k8s extra 미설치 환경 (로컬 개발) — gzip만 사용
+    brotli = None
+
+# 이미 압축된 형식 — 다시 압축해도 줄지 않고 CPU만 씀
+_INCOMPRESSIBLE_PREFIXES = ("image/", "video/", "audio/", "font/woff")
+_INCOMPRESSIBLE_TYPES = frozenset(
+    {
+        "application/zip",
+        "application/gzip",
+        "application/x-gzip",
+        "application/x-brotli",
+        "application/octet-stream",
+        "application/pdf",
+        "text/event-stream",
+    }
+)
+# image/svg+xml은 텍스트라 압축 대상
+_COMPRESSIBLE_EXCEPTIONS = frozenset({"image/svg+xml"})
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """이 프로세스가 만들 수 있는 인코딩 (선호 순)."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def select_encoding(accept_encoding: str | None, available: tuple[str, ...]) -> str | None:
+    """Accept-Encoding에서 available 중 가장 선호하는 인코딩을 고릅니다. 없으면 None (identity).
+
+    q 값이 높은 순, 같으면 available 순서를 따릅니다. q=0은 거부, *는 나열되지 않은 인코딩에 적용됩니다.
+    """
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+    wildcard = weights.get("*", 0.0)
+    best: str | None = None
+    best_q = 0.0
+    for encoding in available:
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    """Content-Type이 압축할 가치가 있는 형식인지 확인합니다."""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if not media_type or media_type in _INCOMPRESSIBLE_TYPES:
+        return False
+    if media_type in _COMPRESSIBLE_EXCEPTIONS:
+        return True
+    return not media_type.startswith(_INCOMPRESSIBLE_PREFIXES)
+
+
+def compress_body(body: bytes, encoding: str, gzip_level: int, brotli_quality: int) -> bytes:
+    """한 번에 전송되는 본문을 압축합니다."""
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
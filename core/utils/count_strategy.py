@@ -0,0 +1,118 @@
+"""count_strategy: 목록 API의 total_count 계산 전략.
+
+목록 조회마다 같은 필터로 COUNT(*)를 한 번 더 실행하면 DB 작업이 두 배가 되므로,
+엔드포인트별로 다음 중 하나를 선택할 수 있게 합니다.
+
+- exact: 매 요청 COUNT(*) 실행 (기존 동작)
+- cached: 필터 시그니처별로 COUNT 결과를 TTL 동안 프로세스 메모리에 캐시
+- has_more: COUNT를 생략하고 total_count는 None. 다음 페이지 여부는 limit+1 조회로 판단
+
+has_more 값은 전략과 무관하게 목록 쿼리의 limit+1 조회로 계산하므로 항상 정확합니다.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, Literal
+
+from core.config import settings
+
+CountStrategy = Literal["exact", "cached", "has_more"]
+
+
+class CountCache:
+    """필터 시그니처별 COUNT 결과 TTL 캐시 (LRU 상한 적용).
+
+    단일 프로세스 메모리에만 저장하므로 워커 간 값이 최대 TTL만큼 어긋날 수 있습니다.
+    scope별 세대(generation) 번호를 키에 포함해 invalidate()를 O(1)로 처리하고,
+    이전 세대 항목은 LRU/TTL로 자연 소멸합니다.
+    """
+
+    def __init__(self, max_entries: int | None = None):
+        """CountCache 초기화.
+
+        Args:
+            max_entries: 최대 캐시 항목 수 (기본: settings.COUNT_CACHE_MAX_ENTRIES).
+        """
+        # {key: (만료 시각(monotonic), count)}
+        self._entries: OrderedDict[str, tuple[float, int]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self.max_entries = max_entries if max_entries is not None else settings.COUNT_CACHE_MAX_ENTRIES
+
+    def _key(self, scope: str, signature: str) -> str:
+        return f"{scope}:{self._generations.get(scope, 0)}:{signature}"
+
+    def get(self, scope: str, signature: str) -> int | None:
+        """만료되지 않은 캐시 값을 반환합니다. 없거나 만료되었으면 None."""
+        key = self._key(scope, signature)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, count = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return count
+
+    def set(self, scope: str, signature: str, count: int, ttl_seconds: float) -> None:
+        """COUNT 결과를 저장합니다. 상한 초과 시 가장 오래 사용되지 않은 항목부터 제거."""
+        key = self._key(scope, signature)
+        self._entries[key] = (time.monotonic() + ttl_seconds, count)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, scope: str) -> None:
+        """scope의 모든 캐시 값을 무효화합니다 (게시글 작성/삭제 등 총 개수가 바뀌는 쓰기 직후 호출)."""
+        self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    def clear(self) -> None:
+        """전체 캐시를 비웁니다 (테스트용)."""
+        self._entries.clear()
+        self._generations.clear()
+
+
+count_cache = CountCache()
+
+
+def count_signature(**filters: Any) -> str:
+    """필터 조합을 안정적인 캐시 키로 변환합니다.
+
+    set은 정렬하여 순서와 무관하게 같은 키가 나오도록 하고,
+    차단 목록처럼 길어질 수 있는 값 때문에 SHA-1 다이제스트로 축약합니다.
+    """
+    normalized = {k: sorted(v) if isinstance(v, (set, frozenset)) else v for k, v in filters.items()}
+    raw = json.dumps(normalized, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha1(raw.encode(), usedforsecurity=False).hexdigest()
+
+
+async def resolve_total_count(
+    strategy: CountStrategy,
+    scope: str,
+    signature: str,
+    count_fn: Callable[[], Awaitable[int]],
+) -> int | None:
+    """전략에 따라 total_count를 계산합니다.
+
+    Args:
+        strategy: exact | cached | has_more.
+        scope: 캐시 네임스페이스 (예: "posts").
+        signature: count_signature()로 만든 필터 시그니처.
+        count_fn: 실제 COUNT(*)를 실행하는 코루틴 함수.
+
+    Returns:
+        총 개수. has_more 전략이면 None.
+    """
+    if strategy == "has_more":
+        return None
+    if strategy == "cached":
+        cached = count_cache.get(scope, signature)
+        if cached is not None:
+            return cached
+        total = await count_fn()
+        count_cache.set(scope, signature, total, settings.COUNT_CACHE_TTL_SECONDS)
+        return total
+    return await count_fn()
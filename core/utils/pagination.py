@@ -1,5 +1,13 @@
 """pagination: 페이지네이션 파라미터 검증 및 SQL 유틸리티."""
 
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
 from fastapi import HTTPException, status
 
 
@@ -20,3 +28,95 @@ def validate_pagination(offset: int, limit: int, timestamp: str) -> None:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={"error": "invalid_limit", "message": "limit은 1~100 사이여야 합니다.", "timestamp": timestamp},
         )
+
+
+# ============ 키셋(커서) 페이지네이션 ============
+
+
+def _cursor_default(value: Any) -> Any:
+    """커서 JSON 직렬화 — DB 정렬 키 타입을 MySQL이 그대로 비교 가능한 문자열로 변환."""
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"커서에 직렬화할 수 없는 타입: {type(value).__name__}")
+
+
+def encode_cursor(scope: str, values: Sequence[Any]) -> str:
+    """정렬 키 + id를 불투명(opaque) 커서 문자열로 인코딩합니다.
+
+    scope에는 정렬 옵션 등 커서를 발급한 목록의 식별자를 담아,
+    다른 정렬의 커서가 섞여 들어오는 것을 디코딩 시점에 차단합니다.
+    """
+    payload = json.dumps({"s": scope, "k": list(values)}, separators=(",", ":"), default=_cursor_default)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, scope: str, arity: int, timestamp: str) -> list[Any]:
+    """커서 문자열을 정렬 키 값 리스트로 디코딩합니다. 유효하지 않으면 400 에러."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = payload["k"]
+        valid = (
+            payload["s"] == scope
+            and isinstance(values, list)
+            and len(values) == arity
+            and not any(isinstance(v, (dict, list)) for v in values)
+        )
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        valid = False
+
+    # 변조된 커서나 다른 정렬에서 발급된 커서는 엉뚱한 범위를 조회하므로 선제 차단
+    if not valid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "invalid_cursor", "message": "유효하지 않은 커서입니다.", "timestamp": timestamp},
+        )
+    return values
+
+
+def keyset_condition(columns: Sequence[str], values: Sequence[Any], descending: bool = True) -> tuple[str, list]:
+    """(c1, c2, ...) 튜플이 커서 위치보다 뒤에 오는 행만 남기는 WHERE 조건을 생성합니다.
+
+    MySQL은 행 생성자 비교 `(a, b) < (x, y)`에 인덱스 범위 스캔을 잘 쓰지 못하므로
+    `a < x OR (a = x AND b < y)` 형태로 전개합니다. columns는 whitelist된 SQL 식만 전달해야 합니다.
+
+    Returns:
+        (SQL 조건 문자열, 바인딩 파라미터 리스트) 튜플.
+    """
+    op = "<" if descending else ">"
+    branches: list[str] = []
+    params: list = []
+    for i, column in enumerate(columns):
+        terms = [f"{prev} = %s" for prev in columns[:i]]
+        terms.append(f"{column} {op} %s")
+        branches.append("(" + " AND ".join(terms) + ")")
+        params.extend([*values[:i], values[i]])
+    return "(" + " OR ".join(branches) + ")", params
+
+
+def build_pagination(
+    scope: str,
+    *,
+    total_count: int | None,
+    offset: int,
+    limit: int,
+    page_size: int,
+    last_key: Sequence[Any] | None,
+    cursor_mode: bool,
+    has_more: bool | None = None,
+) -> dict[str, Any]:
+    """목록 응답의 pagination 딕셔너리(total_count, has_more, next_cursor)를 생성합니다.
+
+    has_more를 직접 넘기지 않으면 계산합니다. 커서 모드에서는 현재 위치를 알 수 없어
+    total_count로 계산할 수 없으므로 페이지가 가득 찼는지(page_size >= limit)로 판단합니다.
+    limit+1 조회로 정확한 값을 알고 있는 호출자는 has_more를 직접 전달합니다.
+    offset 모드에서도 next_cursor를 함께 내려주어 클라이언트가 2페이지부터 커서로 전환할 수 있습니다.
+    """
+    if has_more is None:
+        has_more = page_size >= limit if cursor_mode or total_count is None else offset + limit < total_count
+    next_cursor = encode_cursor(scope, last_key) if has_more and last_key else None
+    return {"total_count": total_count, "has_more": has_more, "next_cursor": next_cursor}
@@ -0,0 +1,188 @@
+"""principal_cache: 인증 사용자(User) 조회 캐시.
+
+인증이 필요한 거의 모든 요청이 _validate_token에서 user PK 조회를 실행하므로,
+두 단계로 DB 조회를 줄입니다.
+
+- 요청 단위: 검증된 User를 request.state에 보관해 한 요청 안에서 여러 인증 의존성
+  (get_current_user, get_optional_user, require_admin_or_internal 등)이 다시 조회하지 않음
+- 프로세스 단위: user_id 키의 짧은 TTL/LRU 캐시
+
+정지/탈퇴/프로필·비밀번호 변경/이메일 인증 등 User 필드를 바꾸는 쓰기 직후 invalidate_user()를 호출해야 합니다.
+PRINCIPAL_CACHE_INVALIDATION=redis이면 Redis Pub/Sub으로 다른 워커/파드의 캐시도 무효화하며,
+메시지가 유실되더라도 TTL이 지나면 DB 값으로 수렴합니다.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+from core.config import settings
+
+if TYPE_CHECKING:
+    from modules.user.models import User
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "principal:invalidate"
+
+# Redis 구독 재연결 대기 (초)
+_LISTENER_RETRY_DELAY_SEC = 1.0
+
+
+class PrincipalCache:
+    """user_id별 User TTL 캐시 (LRU 상한 적용).
+
+    무효화마다 세대(generation) 번호를 올리고, 조회 시작 시점의 세대가 바뀌었으면
+    set()을 건너뛰어 무효화 직전에 읽은 오래된 행이 다시 캐시되는 경쟁을 막습니다.
+    """
+
+    def __init__(self, ttl_seconds: float | None = None, max_entries: int | None = None):
+        """PrincipalCache 초기화.
+
+        Args:
+            ttl_seconds: 항목 TTL (기본: settings.PRINCIPAL_CACHE_TTL_SECONDS). 0 이하이면 캐시 비활성화.
+            max_entries: 최대 캐시 항목 수 (기본: settings.PRINCIPAL_CACHE_MAX_ENTRIES).
+        """
+        # {user_id: (만료 시각(monotonic), User)}
+        self._entries: OrderedDict[int, tuple[float, User]] = OrderedDict()
+        self.generation = 0
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.PRINCIPAL_CACHE_TTL_SECONDS
+        self.max_entries = max_entries if max_entries is not None else settings.PRINCIPAL_CACHE_MAX_ENTRIES
+
+    def get(self, user_id: int) -> "User | None":
+        """만료되지 않은 캐시 값을 반환합니다. 없거나 만료되었으면 None."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return user
+
+    def set(self, user_id: int, user: "User", generation: int | None = None) -> None:
+        """User를 저장합니다.
+
+        Args:
+            user_id: 사용자 ID.
+            user: 저장할 User.
+            generation: 조회 시작 시점의 세대. 그 사이 무효화가 있었으면 저장하지 않음.
+        """
+        if self.ttl_seconds <= 0:
+            return
+        if generation is not None and generation != self.generation:
+            return
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, user)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """특정 사용자의 캐시 값을 제거합니다."""
+        self.generation += 1
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """전체 캐시를 비웁니다 (테스트용)."""
+        self.generation += 1
+        self._entries.clear()
+
+
+principal_cache = PrincipalCache()
+
+
+async def get_cached_user(
+    user_id: int,
+    loader: "Callable[[int], Awaitable[User | None]]",
+) -> "User | None":
+    """프로세스 캐시를 거쳐 User를 조회합니다. 미스 시 loader로 DB에서 읽어 캐시합니다.
+
+    존재하지 않는 사용자(None)는 캐시하지 않습니다.
+    """
+    cached = principal_cache.get(user_id)
+    if cached is not None:
+        return cached
+    generation = principal_cache.generation
+    user = await loader(user_id)
+    if user is not None:
+        principal_cache.set(user_id, user, generation=generation)
+    return user
+
+
+async def invalidate_user(user_id: int) -> None:
+    """사용자 캐시를 무효화합니다 (User 필드를 바꾸는 쓰기의 커밋 직후 호출).
+
+    로컬 캐시는 즉시 제거하고, redis 모드에서는 다른 워커에도 전파합니다 (best-effort).
+    """
+    principal_cache.invalidate(user_id)
+    if settings.PRINCIPAL_CACHE_INVALIDATION != "redis":
+        return
+    try:
+        from core.utils.redis_client import get_redis
+
+        redis = await get_redis(settings.REDIS_URL)
+        await redis.publish(INVALIDATION_CHANNEL, str(user_id))
+    except Exception:
+        logger.warning("사용자 캐시 무효화 전파 실패 (best-effort): user_id=%d", user_id, exc_info=True)
+
+
+def _handle_invalidation_message(data: str) -> None:
+    """Pub/Sub 메시지(user_id 문자열)를 로컬 캐시 무효화로 반영합니다."""
+    try:
+        user_id = int(data)
+    except (TypeError, ValueError):
+        logger.warning("잘못된 사용자 캐시 무효화 메시지: %r", data)
+        return
+    principal_cache.invalidate(user_id)
+
+
+async def _listen_invalidations() -> None:
+    """Redis SUBSCRIBE → 로컬 캐시 무효화. 연결이 끊기면 전체 캐시를 비우고 재구독합니다."""
+    from core.utils.redis_client import get_redis
+
+    while True:
+        try:
+            redis = await get_redis(settings.REDIS_URL)
+            pubsub = redis.pubsub()
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            try:
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        _handle_invalidation_message(message["data"])
+            finally:
+                await pubsub.unsubscribe(INVALIDATION_CHANNEL)
+                await pubsub.close()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("사용자 캐시 무효화 구독 끊김, 재연결 시도", exc_info=True)
+        # 구독이 끊긴 동안 놓친 무효화가 있을 수 있으므로 전체 캐시를 비움
+        principal_cache.clear()
+        await asyncio.sleep(_LISTENER_RETRY_DELAY_SEC)
+
+
+_listener_task: asyncio.Task | None = None
+
+
+def start_invalidation_listener() -> None:
+    """redis 모드에서 무효화 구독 태스크를 시작합니다 (앱 startup 시 호출)."""
+    global _listener_task
+    if settings.PRINCIPAL_CACHE_INVALIDATION != "redis" or _listener_task is not None:
+        return
+    _listener_task = asyncio.create_task(_listen_invalidations())
+
+
+async def stop_invalidation_listener() -> None:
+    """무효화 구독 태스크를 종료합니다 (앱 shutdown 시 호출)."""
+    global _listener_task
+    if _listener_task is None:
+        return
+    _listener_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _listener_task
+    _listener_task = None
@@ -0,0 +1,243 @@
+"""read_state: 사용자별 읽은 게시글 비트맵 저장소.
+
+게시글 목록의 is_read 플래그는 페이지마다 post_view_log(사용자·게시글·날짜별 행이라 가장 빨리 커지는 테이블)를
+IN (...) 목록으로 조회했으므로, 사용자별로 읽은 게시글 ID를 post_id 블록 단위 비트맵으로 보관합니다.
+블록 하나는 _BLOCK_BITS개 게시글(128바이트)이며, 사용자가 읽은 게시글이 있는 블록만 만듭니다.
+
+READ_STATE_BACKEND:
+- db: 기존처럼 페이지마다 post_view_log 조회 (저장소 없음)
+- memory: 프로세스 메모리 비트맵 (LRU 상한 READ_STATE_MAX_USERS). 사용자별 첫 조회 시 post_view_log에서 적재하고,
+  READ_STATE_TTL_SECONDS마다 최근 기록만 다시 읽어 다른 파드의 조회를 반영
+- redis: Redis 비트셋 (read:{user_id}:{블록 번호}). 모든 파드가 조회 기록 시 SETBIT하므로 TTL 없이 공유.
+  사용자별 적재 표시(read:{user_id}:loaded)가 없으면 post_view_log에서 한 번 적재
+
+조회 기록(view_counter.record_post_view)마다 mark_post_read()로 비트를 세우므로 write-behind 버퍼가 flush되기 전에도
+읽음으로 표시됩니다. 읽음 상태는 단조 증가(읽은 게시글이 다시 안 읽음이 되지 않음)라 적재는 항상 OR로 합칩니다.
+rebuild_read_state()가 post_view_log에서 다시 만들며, Redis 오류는 post_view_log 조회로 폴백합니다 (best-effort).
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from core.config import settings
+from core.utils.response_cache import invalidate, viewer_namespace
+
+logger = logging.getLogger(__name__)
+
+_BLOCK_BITS = 1024
+_REDIS_KEY_PREFIX = "read:"
+# TTL 재적재 시 다시 읽는 기간의 여유분 — write-behind flush가 늦게 삽입한 과거 시각 행도 포함
+_REFRESH_OVERLAP_SECONDS = 3600
+# 전체 재구성 시 post_view_log를 한 번에 읽는 행 수
+_REBUILD_CHUNK_SIZE = 5000
+
+
+def _split(post_id: int) -> tuple[int, int]:
+    """post_id를 (블록 번호, 블록 내 비트 위치)로 나눕니다."""
+    return divmod(post_id, _BLOCK_BITS)
+
+
+def _block_key(user_id: int, block: int) -> str:
+    return f"{_REDIS_KEY_PREFIX}{user_id}:{block}"
+
+
+def _loaded_key(user_id: int) -> str:
+    return f"{_REDIS_KEY_PREFIX}{user_id}:loaded"
+
+
+class ReadBitmap:
+    """한 사용자의 읽은 게시글 ID 비트맵 (post_id 블록별 bytearray)."""
+
+    __slots__ = ("blocks", "loaded_at")
+
+    def __init__(self) -> None:
+        """ReadBitmap 초기화. loaded_at이 None이면 아직 post_view_log를 반영하지 않은 상태입니다."""
+        self.blocks: dict[int, bytearray] = {}
+        self.loaded_at: float | None = None
+
+    def add(self, post_id: int) -> None:
+        """게시글을 읽음으로 표시합니다."""
+        block, bit = _split(post_id)
+        bits = self.blocks.get(block)
+        if bits is None:
+            bits = self.blocks[block] = bytearray(_BLOCK_BITS // 8)
+        bits[bit >> 3] |= 1 << (bit & 7)
+
+    def update(self, post_ids: Iterable[int]) -> None:
+        """여러 게시글을 읽음으로 표시합니다."""
+        for post_id in post_ids:
+            self.add(post_id)
+
+    def __contains__(self, post_id: int) -> bool:
+        block, bit = _split(post_id)
+        bits = self.blocks.get(block)
+        return bits is not None and bool(bits[bit >> 3] & (1 << (bit & 7)))
+
+
+class ReadStateStore:
+    """user_id별 ReadBitmap 저장소 (LRU 상한 적용, memory 백엔드)."""
+
+    def __init__(self, max_users: int | None = None):
+        """ReadStateStore 초기화.
+
+        Args:
+            max_users: 최대 보관 사용자 수 (기본: settings.READ_STATE_MAX_USERS).
+        """
+        self._users: OrderedDict[int, ReadBitmap] = OrderedDict()
+        self.max_users = max_users if max_users is not None else settings.READ_STATE_MAX_USERS
+
+    def get(self, user_id: int) -> ReadBitmap | None:
+        """사용자의 비트맵을 반환합니다. 없으면 None."""
+        bitmap = self._users.get(user_id)
+        if bitmap is not None:
+            self._users.move_to_end(user_id)
+        return bitmap
+
+    def bitmap(self, user_id: int) -> ReadBitmap:
+        """사용자의 비트맵을 반환합니다. 없으면 빈 비트맵을 만들어 저장합니다."""
+        bitmap = self.get(user_id)
+        if bitmap is None:
+            bitmap = self._users[user_id] = ReadBitmap()
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+        return bitmap
+
+    def user_ids(self) -> list[int]:
+        """비트맵을 보관 중인 사용자 ID 목록을 반환합니다."""
+        return list(self._users)
+
+    def clear(self) -> None:
+        """전체 저장소를 비웁니다 (테스트/재구성용)."""
+        self._users.clear()
+
+
+read_state = ReadStateStore()
+
+
+async def mark_post_read(user_id: int, post_id: int) -> None:
+    """게시글을 읽음으로 표시합니다 (조회 기록 시 호출, best-effort).
+
+    새로 읽음이 된 경우 사용자 네임스페이스 버전을 올려 목록의 조건부 GET(ETag)이 is_read 변화를 반영하게 합니다.
+    """
+    backend = settings.READ_STATE_BACKEND
+    newly_read = True
+    if backend == "memory":
+        bitmap = read_state.bitmap(user_id)
+        newly_read = post_id not in bitmap
+        bitmap.add(post_id)
+    elif backend == "redis":
+        block, bit = _split(post_id)
+        try:
+            from core.utils.redis_client import get_redis
+
+            redis = await get_redis(settings.REDIS_URL)
+            newly_read = not await redis.setbit(_block_key(user_id, block), bit, 1)
+        except Exception:
+            # 적재 표시가 남아 있으면 이 조회는 재구성 전까지 안 읽음으로 보일 수 있음 (post_view_log에는 기록됨)
+            logger.warning("읽음 상태 Redis 기록 실패 (best-effort): user_id=%d", user_id, exc_info=True)
+    if newly_read:
+        await invalidate(viewer_namespace(user_id))
+
+
+async def read_post_ids(user_id: int, post_ids: list[int]) -> set[int]:
+    """post_ids 중 사용자가 읽은 게시글 ID 집합을 반환합니다."""
+    if not post_ids:
+        return set()
+    backend = settings.READ_STATE_BACKEND
+    if backend == "memory":
+        return await _read_from_memory(user_id, post_ids)
+    if backend == "redis":
+        try:
+            return await _read_from_redis(user_id, post_ids)
+        except Exception:
+            logger.warning("읽음 상태 Redis 조회 실패, DB 조회로 폴백: user_id=%d", user_id, exc_info=True)
+
+    from modules.post.post_models import get_read_post_ids
+
+    return await get_read_post_ids(user_id, post_ids)
+
+
+async def _read_from_memory(user_id: int, post_ids: list[int]) -> set[int]:
+    from modules.post.post_models import get_viewed_post_ids
+
+    bitmap = read_state.bitmap(user_id)
+    now = time.monotonic()
+    if bitmap.loaded_at is None or now - bitmap.loaded_at >= settings.READ_STATE_TTL_SECONDS:
+        # 첫 적재는 전체 기록, 이후에는 다른 파드에서 기록된 조회를 반영하도록
+        # 마지막 적재 이후 기간만 (user_id, created_at) 인덱스로 다시 읽음 (동시에 적재되어도 OR라 무해)
+        within = None if bitmap.loaded_at is None else int(now - bitmap.loaded_at) + _REFRESH_OVERLAP_SECONDS
+        bitmap.update(await get_viewed_post_ids(user_id, within_seconds=within))
+        bitmap.loaded_at = now
+    return {post_id for post_id in post_ids if post_id in bitmap}
+
+
+async def _read_from_redis(user_id: int, post_ids: list[int]) -> set[int]:
+    from core.utils.redis_client import get_redis
+
+    redis = await get_redis(settings.REDIS_URL)
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.exists(_loaded_key(user_id))
+        for post_id in post_ids:
+            block, bit = _split(post_id)
+            pipe.getbit(_block_key(user_id, block), bit)
+        loaded, *bits = await pipe.execute()
+    read_ids = {post_id for post_id, value in zip(post_ids, bits, strict=True) if value}
+    if loaded:
+        return read_ids
+
+    from modules.post.post_models import get_viewed_post_ids
+
+    viewed = await get_viewed_post_ids(user_id)
+    await _write_bits(redis, {user_id: viewed})
+    return read_ids | (viewed & set(post_ids))
+
+
+async def _write_bits(redis, viewed_by_user: dict[int, set[int]]) -> None:
+    """사용자별 읽은 게시글 비트를 세우고 적재 표시를 남깁니다 (비트를 먼저 쓰고 표시는 마지막에)."""
+    async with redis.pipeline(transaction=False) as pipe:
+        for user_id, post_ids in viewed_by_user.items():
+            for post_id in post_ids:
+                block, bit = _split(post_id)
+                pipe.setbit(_block_key(user_id, block), bit, 1)
+        for user_id in viewed_by_user:
+            pipe.set(_loaded_key(user_id), 1)
+        await pipe.execute()
+
+
+async def rebuild_read_state() -> dict:
+    """읽음 상태를 post_view_log에서 다시 만듭니다 (Redis 유실/백엔드 전환 후 관리자 호출용).
+
+    - memory: 이 프로세스의 저장소를 비움 (사용자별 다음 조회 시 다시 적재)
+    - redis: post_view_log를 id 순으로 읽어 비트를 세우고 기록이 있는 사용자에 적재 표시를 남김.
+      기존 비트에 OR로 합치므로 서비스 중에 실행해도 됨
+
+    Returns:
+        백엔드, 반영한 post_view_log 행 수, 사용자 수, 소요 시간.
+    """
+    started = time.monotonic()
+    backend = settings.READ_STATE_BACKEND
+    rows = 0
+    users: set[int] = set()
+    if backend == "memory":
+        users.update(read_state.user_ids())
+        read_state.clear()
+    elif backend == "redis":
+        from core.utils.redis_client import get_redis
+        from modules.post.post_models import get_view_log_after
+
+        redis = await get_redis(settings.REDIS_URL)
+        after_id = 0
+        while chunk := await get_view_log_after(after_id, _REBUILD_CHUNK_SIZE):
+            viewed_by_user: dict[int, set[int]] = {}
+            for row in chunk:
+                viewed_by_user.setdefault(row["user_id"], set()).add(row["post_id"])
+            await _write_bits(redis, viewed_by_user)
+            users.update(viewed_by_user)
+            rows += len(chunk)
+            after_id = chunk[-1]["id"]
+
+    elapsed = round(time.monotonic() - started, 2)
+    logger.info("읽음 상태 재구성: backend=%s rows=%d users=%d (%.1fs)", backend, rows, len(users), elapsed)
+    return {"backend": backend, "view_log_rows": rows, "users": len(users), "elapsed_seconds": elapsed}
@@ -0,0 +1,126 @@
+"""response_cache: 비로그인 게시글 목록/상세 응답 캐시.
+
+비로그인 사용자의 목록/상세 요청은 사용자별 상태(좋아요/북마크/차단/읽음)가 없어
+같은 쿼리 파라미터면 응답이 같으므로, 직렬화한 응답을 두 단계로 캐시합니다.
+
+- L1: 프로세스 메모리 TTL/LRU 캐시 (RESPONSE_CACHE_BACKEND=local|redis)
+- L2: Redis 공유 캐시 (RESPONSE_CACHE_BACKEND=redis). 워커/파드 간 캐시를 공유
+
+무효화는 네임스페이스(예: "posts", "post:42")별 버전 번호로 처리합니다.
+항목은 저장 시점의 네임스페이스 버전을 함께 기록하고, 조회 시 현재 버전과 다르면 미스로 취급하므로
+invalidate()는 키를 찾아 지울 필요 없이 버전만 올리면 됩니다 (O(1)).
+
+- 같은 워커의 쓰기: 로컬 버전이 즉시 올라가 L1/L2 모두 바로 반영
+- 다른 워커의 쓰기 (redis): L2는 즉시 반영, L1은 최대 RESPONSE_CACHE_L1_TTL_SECONDS 동안 이전 값
+- 다른 워커의 쓰기 (local): 최대 RESPONSE_CACHE_TTL_SECONDS 동안 이전 값
+
+작성자 닉네임/프로필 이미지 변경, 로그인 사용자의 조회수 증가처럼 무효화하지 않는 변경은
+TTL이 지나면 반영됩니다. Redis 오류는 캐시 미스로 취급하고 DB 조회로 폴백합니다 (best-effort).
+
+L1/L2 조회와 버전 비교는 core/utils/versioned_cache.py의 VersionedCache가 처리합니다.
+네임스페이스 버전은 조건부 GET의 ETag 재료로도 쓰입니다 (core/utils/conditional_get.py, current_versions()).
+"""
+
+import logging
+from collections.abc import Awaitable, Callable
+
+from core.config import settings
+from core.utils.versioned_cache import VersionedCache
+
+logger = logging.getLogger(__name__)
+
+POSTS_NAMESPACE = "posts"
+
+
+def post_namespace(post_id: int) -> str:
+    """게시글 상세 응답의 네임스페이스."""
+    return f"post:{post_id}"
+
+
+def wiki_namespace(slug: str) -> str:
+    """위키 페이지 상세 응답의 네임스페이스."""
+    return f"wiki:{slug}"
+
+
+def package_namespace(package_id: int) -> str:
+    """패키지 상세 응답의 네임스페이스."""
+    return f"package:{package_id}"
+
+
+def user_namespace(user_id: int) -> str:
+    """사용자 프로필 응답의 네임스페이스."""
+    return f"user:{user_id}"
+
+
+def viewer_namespace(user_id: int) -> str:
+    """로그인 사용자별 상태(차단/팔로우/읽음)에 의존하는 응답의 네임스페이스."""
+    return f"viewer:{user_id}"
+
+
+class ResponseCache(VersionedCache[str]):
+    """직렬화된 응답(JSON 문자열) 캐시. 설정: RESPONSE_CACHE_*."""
+
+    settings_prefix = "RESPONSE_CACHE"
+    redis_prefix = "resp:"
+
+    def encode(self, value: str) -> str:
+        return value
+
+    def decode(self, raw: str) -> str:
+        return raw
+
+
+response_cache = ResponseCache()
+
+
+async def cached_response(
+    namespaces: tuple[str, ...],
+    signature: str,
+    loader: Callable[[], Awaitable[str]],
+) -> str:
+    """캐시를 거쳐 직렬화된 응답을 반환합니다. 미스 시 loader 결과를 L1/L2에 저장합니다.
+
+    Args:
+        namespaces: 응답이 의존하는 네임스페이스. 하나라도 무효화되면 미스.
+        signature: 정규화된 쿼리 파라미터 시그니처 (count_signature() 등).
+        loader: 응답을 만들어 JSON 문자열로 반환하는 코루틴 함수. 예외는 그대로 전파되고 캐시하지 않음.
+
+    Returns:
+        직렬화된 응답 (JSON 문자열).
+    """
+    return await response_cache.get_or_load(f"{'+'.join(namespaces)}:{signature}", namespaces, loader)
+
+
+async def current_versions(namespaces: tuple[str, ...]) -> tuple[int, ...] | None:
+    """네임스페이스별 현재 버전을 반환합니다 (조건부 GET용).
+
+    redis 모드는 파드 간 공유 버전을 MGET 한 번으로, local 모드는 이 프로세스의 로컬 버전을 반환합니다.
+    off이거나 Redis 조회에 실패하면 None (버전을 알 수 없음).
+    """
+    backend = settings.RESPONSE_CACHE_BACKEND
+    if backend == "off":
+        return None
+    if backend == "local":
+        return response_cache.versions(namespaces)
+    try:
+        return await response_cache.shared_versions(namespaces)
+    except Exception:
+        logger.warning("응답 버전 조회 실패 (조건부 GET 생략): namespaces=%s", namespaces, exc_info=True)
+        return None
+
+
+async def invalidate(*namespaces: str) -> None:
+    """네임스페이스의 캐시 응답을 무효화합니다 (쓰기의 커밋 직후 호출, redis 모드는 공유 버전도 INCR)."""
+    await response_cache.invalidate(namespaces)
+
+
+async def invalidate_post_responses(post_id: int | None = None) -> None:
+    """게시글 목록 응답과 (post_id가 있으면) 해당 게시글 상세 응답을 무효화합니다.
+
+    목록 항목에 좋아요/댓글/북마크 수와 태그가 포함되므로 게시글/댓글/좋아요/북마크/태그 쓰기 모두
+    목록 네임스페이스도 함께 무효화합니다.
+    """
+    if post_id is None:
+        await invalidate(POSTS_NAMESPACE)
+    else:
+        await invalidate(POSTS_NAMESPACE, post_namespace(post_id))
@@ -0,0 +1,82 @@
+"""static_files: 사전 압축 파일을 우선 제공하는 정적 파일 서빙.
+
+/assets, /uploads의 텍스트 형식 파일은 빌드 시 scripts/precompress_static.py가 만든
+.br/.gz 형제 파일이 있으면 Accept-Encoding에 맞춰 그 파일을 Content-Encoding과 함께 그대로 보냅니다.
+요청마다 압축하지 않으므로 CPU를 쓰지 않고 최고 압축률을 씁니다
+(응답 압축 미들웨어는 Content-Encoding이 있는 응답을 건너뜀).
+
+형제 파일이 없거나 원본보다 오래되었으면 원본을 보냅니다. 업로드 파일명은 UUID라 내용이 바뀌지 않으므로
+성공 응답에 max_age초의 `public, immutable` Cache-Control을 붙입니다.
+"""
+
+import mimetypes
+import stat
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from core.utils.content_encoding import is_compressible, select_encoding
+
+# 선호 순 — 클라이언트가 풀 수만 있으면 되므로 서버의 brotli 모듈 설치 여부와 무관
+PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+_CACHEABLE_STATUS = frozenset({200, 206, 304})
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """.br/.gz 형제 파일과 장기 Cache-Control을 지원하는 StaticFiles.
+
+    Args:
+        max_age: 성공 응답의 Cache-Control max-age (초). 0이면 Cache-Control을 붙이지 않음.
+    """
+
+    def __init__(self, *, max_age: int = 0, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.max_age = max_age
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        media_type = mimetypes.guess_type(path)[0]
+        compressible = media_type is not None and is_compressible(media_type)
+
+        response = None
+        if compressible and scope["method"] in ("GET", "HEAD"):
+            response = await self._precompressed_response(path, scope, media_type or "")
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        if response.status_code in _CACHEABLE_STATUS:
+            if compressible:
+                response.headers.add_vary_header("Accept-Encoding")
+            if self.max_age > 0:
+                response.headers["Cache-Control"] = f"public, max-age={self.max_age}, immutable"
+        return response
+
+    async def _precompressed_response(self, path: str, scope: Scope, media_type: str) -> Response | None:
+        """수락된 인코딩의 최신 형제 파일이 있으면 그 파일의 응답을, 없으면 None을 반환합니다."""
+        request_headers = Headers(scope=scope)
+        available = tuple(PRECOMPRESSED_SUFFIXES)
+        original_mtime: float | None = None
+        while encoding := select_encoding(request_headers.get("accept-encoding"), available):
+            available = tuple(e for e in available if e != encoding)
+            if original_mtime is None:
+                _, original = await anyio.to_thread.run_sync(self.lookup_path, path)
+                if original is None or not stat.S_ISREG(original.st_mode):
+                    return None
+                original_mtime = original.st_mtime
+            full_path, stat_result = await anyio.to_thread.run_sync(
+                self.lookup_path, path + PRECOMPRESSED_SUFFIXES[encoding]
+            )
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode) or stat_result.st_mtime < original_mtime:
+                continue
+            response = FileResponse(
+                full_path,
+                stat_result=stat_result,
+                media_type=media_type,
+                headers={"Content-Encoding": encoding},
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+        return None
@@ -0,0 +1,227 @@
+"""versioned_cache: 네임스페이스 버전 기반 2단계(L1 프로세스 + L2 Redis) 캐시.
+
+응답 캐시(response_cache), 차단 ID 캐시(block_cache), 투표 스냅샷 캐시(poll_tally)가 공유하는 기반 클래스입니다.
+
+- L1: 프로세스 메모리 TTL/LRU 캐시 ({PREFIX}_BACKEND=local|redis)
+- L2: Redis 공유 캐시 ({PREFIX}_BACKEND=redis). 워커/파드 간 캐시를 공유
+
+무효화는 네임스페이스별 버전 번호로 처리합니다. 항목은 저장 시점의 버전과 함께 기록되고, 조회 시 현재 버전과
+다르면 미스로 취급하므로 invalidate()는 키를 찾아 지울 필요 없이 버전만 올리면 됩니다 (O(1)).
+
+- L1 버전: 프로세스 로컬 시계. 조회 시작 이후 무효화가 있었으면 저장을 건너뛰어, 무효화 직전에 읽은
+  오래된 값이 다시 캐시되는 경쟁을 막습니다 (principal_cache와 같은 방식)
+- L2 버전: Redis 카운터(INCR). 데이터와 버전을 MGET 한 번으로 읽어 비교
+
+Redis 오류는 캐시 미스로 취급하고 loader로 폴백합니다 (best-effort).
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+
+class VersionedCache(Generic[V]):  # noqa: UP046  # requires-python >= 3.11 (PEP 695 문법 미사용)
+    """네임스페이스 버전 기반 L1 + L2 캐시.
+
+    하위 클래스는 settings_prefix({PREFIX}_BACKEND/_TTL_SECONDS/_L1_TTL_SECONDS/_MAX_ENTRIES 설정)와
+    redis_prefix를 정하고, L2에 저장하려면 encode/decode를 구현합니다.
+    """
+
+    settings_prefix: str
+    redis_prefix: str = ""
+
+    def __init__(self, max_entries: int | None = None):
+        """VersionedCache 초기화.
+
+        Args:
+            max_entries: L1 최대 항목 수 (기본: settings.{PREFIX}_MAX_ENTRIES).
+        """
+        # {key: (만료 시각(monotonic), 조회 시작 시점의 로컬 시계, 값)}
+        self._entries: OrderedDict[str, tuple[float, int, V]] = OrderedDict()
+        # {namespace: 마지막 무효화 시점의 로컬 시계} — 항목 수와 같은 상한으로 LRU 제거
+        self._versions: OrderedDict[str, int] = OrderedDict()
+        self._clock = 0
+        # 제거된 네임스페이스의 마지막 버전. 이보다 먼저 조회한 항목은 모두 미스로 취급
+        self._floor = 0
+        self.max_entries = max_entries if max_entries is not None else self._setting("MAX_ENTRIES")
+
+    # ---- 설정 -----------------------------------------------------------
+
+    def _setting(self, name: str) -> Any:
+        return getattr(settings, f"{self.settings_prefix}_{name}")
+
+    def backend(self) -> str:
+        """off | local | redis."""
+        return self._setting("BACKEND")
+
+    def ttl(self) -> float:
+        """L2(또는 local 모드의 L1) TTL (초)."""
+        return self._setting("TTL_SECONDS")
+
+    def l1_ttl(self) -> float:
+        """L1 TTL (초). redis 모드에서는 다른 워커의 무효화가 반영되는 최대 지연."""
+        if self.backend() == "redis":
+            return min(self._setting("L1_TTL_SECONDS"), self.ttl())
+        return self.ttl()
+
+    def version_ttl(self) -> float | None:
+        """L2 버전 키 TTL (초). None이면 만료 없음."""
+        return None
+
+    def encode(self, value: V) -> str:
+        """L2 저장 형식으로 직렬화합니다."""
+        raise NotImplementedError
+
+    def decode(self, raw: str) -> V:
+        """L2 저장 형식을 역직렬화합니다."""
+        raise NotImplementedError
+
+    # ---- L1 -------------------------------------------------------------
+
+    def versions(self, namespaces: tuple[str, ...]) -> tuple[int, ...]:
+        """네임스페이스별 현재 로컬 버전 (무효화된 적 없으면 0)."""
+        return tuple(self._versions.get(ns, 0) for ns in namespaces)
+
+    def _is_current(self, namespaces: tuple[str, ...], stamp: int) -> bool:
+        """stamp 시점 이후 네임스페이스가 무효화되지 않았으면 True."""
+        return stamp >= self._floor and all(self._versions.get(ns, 0) <= stamp for ns in namespaces)
+
+    def lookup(self, key: str, namespaces: tuple[str, ...]) -> tuple[bool, V | None]:
+        """(적중 여부, 값)을 반환합니다. 만료되었거나 이후 무효화된 항목은 미스. 값이 None인 적중도 있습니다."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, stamp, value = entry
+        if expires_at <= time.monotonic() or not self._is_current(namespaces, stamp):
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def store(self, key: str, namespaces: tuple[str, ...], value: V, ttl_seconds: float, stamp: int) -> None:
+        """L1에 저장합니다. stamp(조회 시작 시점) 이후 무효화가 있었으면 저장하지 않습니다."""
+        if ttl_seconds <= 0 or not self._is_current(namespaces, stamp):
+            return
+        self._entries[key] = (time.monotonic() + ttl_seconds, stamp, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def bump(self, namespaces: tuple[str, ...]) -> None:
+        """네임스페이스의 로컬 버전을 올려 이 프로세스의 기존 L1 항목을 무효화합니다."""
+        for ns in namespaces:
+            self._clock += 1
+            self._versions[ns] = self._clock
+            self._versions.move_to_end(ns)
+        while len(self._versions) > self.max_entries:
+            _, self._floor = self._versions.popitem(last=False)
+
+    def clear(self) -> None:
+        """전체 캐시를 비웁니다 (테스트용). 진행 중인 조회는 저장하지 않습니다."""
+        self._entries.clear()
+        self._versions.clear()
+        self._clock += 1
+        self._floor = self._clock
+
+    # ---- L1 + L2 --------------------------------------------------------
+
+    async def get_or_load(self, key: str, namespaces: tuple[str, ...], loader: Callable[[], Awaitable[V]]) -> V:
+        """캐시를 거쳐 값을 반환합니다. 미스 시 loader 결과를 L1/L2에 저장합니다.
+
+        Args:
+            key: 캐시 키 (L2 키는 redis_prefix + key).
+            namespaces: 값이 의존하는 네임스페이스. 하나라도 무효화되면 미스.
+            loader: 값을 만드는 코루틴 함수. 예외는 그대로 전파되고 캐시하지 않음.
+        """
+        backend = self.backend()
+        if backend == "off":
+            return await loader()
+
+        hit, cached = self.lookup(key, namespaces)
+        if hit:
+            return cached  # type: ignore[return-value]  # 적중이면 저장한 값 (None일 수 있음)
+        stamp = self._clock
+
+        # L2 조회: 데이터와 네임스페이스 버전을 MGET 한 번으로 읽음 (저장 시점 버전이 다르면 미스)
+        shared_versions: tuple[int, ...] | None = None
+        if backend == "redis":
+            try:
+                from core.utils.redis_client import get_redis
+
+                redis = await get_redis(settings.REDIS_URL)
+                values = await redis.mget(self.redis_prefix + key, *(self._version_key(ns) for ns in namespaces))
+                raw: str | None = values[0]  # type: ignore[assignment]  # decode_responses=True
+                shared_versions = tuple(int(v or 0) for v in values[1:])
+                if raw is not None:
+                    header, _, body = raw.partition("|")
+                    if tuple(int(v) for v in header.split(",")) == shared_versions:
+                        value = self.decode(body)
+                        self.store(key, namespaces, value, self.l1_ttl(), stamp)
+                        return value
+            except Exception:
+                logger.warning("%s L2 조회 실패, loader로 폴백: key=%s", self.settings_prefix, key, exc_info=True)
+                shared_versions = None
+
+        value = await loader()
+
+        # 조회 중 같은 워커에서 무효화가 있었으면 저장하지 않음
+        if not self._is_current(namespaces, stamp):
+            return value
+        self.store(key, namespaces, value, self.l1_ttl(), stamp)
+        if shared_versions is not None:
+            try:
+                from core.utils.redis_client import get_redis
+
+                redis = await get_redis(settings.REDIS_URL)
+                header = ",".join(map(str, shared_versions))
+                await redis.set(self.redis_prefix + key, f"{header}|{self.encode(value)}", ex=int(self.ttl()))
+            except Exception:
+                logger.warning("%s L2 저장 실패 (best-effort): key=%s", self.settings_prefix, key, exc_info=True)
+        return value
+
+    def _version_key(self, namespace: str) -> str:
+        return f"{self.redis_prefix}ver:{namespace}"
+
+    async def shared_versions(self, namespaces: tuple[str, ...]) -> tuple[int, ...]:
+        """네임스페이스별 L2 공유 버전을 MGET 한 번으로 조회합니다. Redis 오류는 그대로 전파합니다."""
+        from core.utils.redis_client import get_redis
+
+        redis = await get_redis(settings.REDIS_URL)
+        values = await redis.mget(*(self._version_key(ns) for ns in namespaces))
+        return tuple(int(v or 0) for v in values)
+
+    async def invalidate(self, namespaces: tuple[str, ...]) -> None:
+        """네임스페이스의 캐시 값을 무효화합니다 (쓰기의 커밋 직후 호출).
+
+        로컬 버전은 즉시 올리고, redis 모드에서는 공유 버전도 INCR합니다 (best-effort).
+        L2 조회 시 버전을 함께 비교하므로 다른 워커도 다음 L2 조회부터 새 값을 만듭니다.
+        """
+        backend = self.backend()
+        if backend == "off":
+            return
+        self.bump(namespaces)
+        if backend != "redis":
+            return
+        version_ttl = self.version_ttl()
+        try:
+            from core.utils.redis_client import get_redis
+
+            redis = await get_redis(settings.REDIS_URL)
+            async with redis.pipeline(transaction=False) as pipe:
+                for ns in namespaces:
+                    pipe.incr(self._version_key(ns))
+                    if version_ttl is not None:
+                        pipe.expire(self._version_key(ns), int(version_ttl))
+                await pipe.execute()
+        except Exception:
+            logger.warning(
+                "%s 무효화 전파 실패 (best-effort): namespaces=%s", self.settings_prefix, namespaces, exc_info=True
+            )
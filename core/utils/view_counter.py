@@ -0,0 +1,294 @@
+"""view_counter: 게시글/위키 조회수 write-behind 버퍼.
+
+조회마다 post/wiki_page 행을 UPDATE하면 인기 게시글에 조회가 몰릴 때 같은 행 잠금에서 직렬화되므로,
+조회를 프로세스 메모리에 모았다가 주기적으로 다중 행 쓰기로 반영합니다.
+
+- 게시글: 사용자당 하루 1회 중복 제거 후 (user_id, post_id, 조회 시각)을 버퍼링.
+  flush 시 post_models.flush_post_views()가 post_view_log 다중 행 INSERT IGNORE + 게시글당 1회 UPDATE
+- 위키: 페이지별 증가량을 누적. flush 시 wiki_models.add_views()가 UPDATE 1회
+
+VIEW_COUNTER_BACKEND:
+- direct: 기존처럼 조회마다 즉시 쓰기 (버퍼 없음)
+- memory: 중복 제거를 프로세스 메모리의 날짜별 집합으로 수행
+- redis: 중복 제거를 Redis 날짜별 SET(SADD)으로 수행해 파드 간 공유. 버퍼는 프로세스별
+
+최종 중복 제거는 post_view_log의 (user_id, post_id, view_date) 유니크 키가 맡으므로,
+앞단 중복 제거가 놓친 조회(재시작 직후 등)도 조회수를 두 번 올리지 않습니다.
+종료 시 남은 버퍼를 flush하며, 프로세스가 비정상 종료되면 마지막 flush 이후의 조회는 유실될 수 있습니다.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+from core.config import settings
+from core.utils.read_state import mark_post_read
+
+logger = logging.getLogger(__name__)
+
+_SEEN_KEY_PREFIX = "views:seen:"
+# 날짜별 중복 제거 SET 보관 기간 (자정 직후 전날 키 조회 여유 포함)
+_SEEN_TTL_SECONDS = 2 * 24 * 3600
+
+
+@dataclass
+class ViewCounterStats:
+    """flush 지연/처리량 지표 (프로세스 단위)."""
+
+    pending_post_views: int = 0
+    pending_wiki_views: int = 0
+    oldest_pending_age_seconds: float = 0.0
+    last_flush_at: str | None = None
+    last_flush_duration_ms: float = 0.0
+    flushed_post_views_total: int = 0
+    flushed_wiki_views_total: int = 0
+    flush_failures_total: int = 0
+    backend: str = field(default_factory=lambda: settings.VIEW_COUNTER_BACKEND)
+
+
+class ViewCounter:
+    """조회 기록 버퍼와 중복 제거 상태.
+
+    flush()는 버퍼를 통째로 교체한 뒤 DB에 쓰므로 flush 중에 들어온 조회는 다음 flush로 넘어가고,
+    쓰기가 실패하면 꺼낸 항목을 버퍼에 되돌려 다음 주기에 다시 시도합니다.
+    """
+
+    def __init__(self) -> None:
+        """ViewCounter 초기화."""
+        self._post_views: list[tuple[int, int, datetime]] = []
+        self._pending_by_post: dict[int, int] = {}
+        self._wiki_views: dict[int, int] = {}
+        self._oldest_pending: float | None = None
+        self._seen_date: date | None = None
+        self._seen: set[tuple[int, int]] = set()
+        self._flush_lock = asyncio.Lock()
+        self.full = asyncio.Event()
+        self.stats = ViewCounterStats()
+
+    # ---- 중복 제거 -------------------------------------------------------
+
+    async def _first_view_today(self, post_id: int, user_id: int, today: date) -> bool:
+        """오늘 처음 보는 (user_id, post_id)이면 True."""
+        if settings.VIEW_COUNTER_BACKEND == "redis":
+            try:
+                from core.utils.redis_client import get_redis
+
+                redis = await get_redis(settings.REDIS_URL)
+                key = f"{_SEEN_KEY_PREFIX}{today.isoformat()}"
+                async with redis.pipeline(transaction=False) as pipe:
+                    pipe.sadd(key, f"{user_id}:{post_id}")
+                    pipe.expire(key, _SEEN_TTL_SECONDS)
+                    added, _ = await pipe.execute()
+                return bool(added)
+            except Exception:
+                # Redis 장애 시 로컬 집합으로 폴백 — 최종 중복 제거는 DB 유니크 키가 보장
+                logger.warning("조회 중복 제거 Redis 실패, 로컬 집합으로 폴백", exc_info=True)
+
+        if self._seen_date != today:
+            self._seen_date = today
+            self._seen.clear()
+        if (user_id, post_id) in self._seen:
+            return False
+        self._seen.add((user_id, post_id))
+        return True
+
+    # ---- 기록 ------------------------------------------------------------
+
+    async def record_post_view(self, post_id: int, user_id: int) -> tuple[bool, int]:
+        """게시글 조회를 기록합니다.
+
+        Returns:
+            (이번 조회가 카운트되었는지, 이 호출 전에 읽은 게시글 행의 조회수에 더할 값).
+            direct 모드는 즉시 반영하므로 카운트되면 1, 버퍼 모드는 아직 flush되지 않은 이 게시글의 조회 수.
+        """
+        # 읽음 상태는 중복 제거와 무관하게 매 조회 표시 (flush 전에도 목록에서 읽음으로 보이도록)
+        await mark_post_read(user_id, post_id)
+
+        if settings.VIEW_COUNTER_BACKEND == "direct":
+            from modules.post.post_models import increment_view_count
+
+            counted = await increment_view_count(post_id, user_id)
+            return counted, int(counted)
+
+        now = datetime.now()
+        counted = await self._first_view_today(post_id, user_id, now.date())
+        if counted:
+            self._post_views.append((user_id, post_id, now))
+            self._pending_by_post[post_id] = self._pending_by_post.get(post_id, 0) + 1
+            self._mark_pending()
+        return counted, self._pending_by_post.get(post_id, 0)
+
+    async def record_wiki_view(self, wiki_page_id: int) -> int:
+        """위키 페이지 조회를 기록하고, 이 호출 전에 읽은 행의 조회수에 더할 값을 반환합니다."""
+        if settings.VIEW_COUNTER_BACKEND == "direct":
+            from modules.wiki.models import increment_views
+
+            await increment_views(wiki_page_id)
+            return 1
+
+        self._wiki_views[wiki_page_id] = self._wiki_views.get(wiki_page_id, 0) + 1
+        self._mark_pending()
+        return self._wiki_views[wiki_page_id]
+
+    def _mark_pending(self) -> None:
+        if self._oldest_pending is None:
+            self._oldest_pending = time.monotonic()
+        if len(self._post_views) + len(self._wiki_views) >= settings.VIEW_COUNTER_MAX_PENDING:
+            self.full.set()
+
+    # ---- flush -----------------------------------------------------------
+
+    async def flush(self) -> int:
+        """버퍼를 DB에 반영합니다. 반영한 조회 수(게시글 + 위키)를 반환합니다."""
+        async with self._flush_lock:
+            self.full.clear()
+            post_views, self._post_views = self._post_views, []
+            pending_by_post, self._pending_by_post = self._pending_by_post, {}
+            wiki_views, self._wiki_views = self._wiki_views, {}
+            oldest_pending, self._oldest_pending = self._oldest_pending, None
+            if not post_views and not wiki_views:
+                self._update_stats()
+                return 0
+
+            started = time.monotonic()
+            flushed = 0
+            try:
+                if post_views:
+                    from modules.post.post_models import flush_post_views
+
+                    increments = await flush_post_views(post_views)
+                    self.stats.flushed_post_views_total += sum(increments.values())
+                    flushed += sum(increments.values())
+                    post_views, pending_by_post = [], {}
+                if wiki_views:
+                    from modules.wiki.models import add_views
+
+                    await add_views(wiki_views)
+                    self.stats.flushed_wiki_views_total += sum(wiki_views.values())
+                    flushed += sum(wiki_views.values())
+                    wiki_views = {}
+            except Exception:
+                self.stats.flush_failures_total += 1
+                logger.warning(
+                    "조회수 flush 실패, 다음 주기에 재시도: 게시글 %d건, 위키 %d건",
+                    len(post_views),
+                    sum(wiki_views.values()),
+                    exc_info=True,
+                )
+                self._requeue(post_views, pending_by_post, wiki_views, oldest_pending)
+                self._update_stats()
+                return flushed
+
+            self.stats.last_flush_at = datetime.now().isoformat(timespec="seconds")
+            self.stats.last_flush_duration_ms = round((time.monotonic() - started) * 1000, 2)
+            self._update_stats()
+            return flushed
+
+    def _requeue(
+        self,
+        post_views: list[tuple[int, int, datetime]],
+        pending_by_post: dict[int, int],
+        wiki_views: dict[int, int],
+        oldest_pending: float | None,
+    ) -> None:
+        """flush하지 못한 항목을 버퍼 앞쪽에 되돌립니다."""
+        self._post_views[:0] = post_views
+        for post_id, count in pending_by_post.items():
+            self._pending_by_post[post_id] = self._pending_by_post.get(post_id, 0) + count
+        for page_id, count in wiki_views.items():
+            self._wiki_views[page_id] = self._wiki_views.get(page_id, 0) + count
+        if oldest_pending is not None:
+            self._oldest_pending = min(oldest_pending, self._oldest_pending or oldest_pending)
+
+    def _update_stats(self) -> None:
+        self.stats.pending_post_views = len(self._post_views)
+        self.stats.pending_wiki_views = sum(self._wiki_views.values())
+        self.stats.oldest_pending_age_seconds = (
+            round(time.monotonic() - self._oldest_pending, 2) if self._oldest_pending is not None else 0.0
+        )
+        _export_metrics(self.stats)
+
+    def snapshot(self) -> ViewCounterStats:
+        """현재 지표를 갱신해 반환합니다."""
+        self._update_stats()
+        return self.stats
+
+    def clear(self) -> None:
+        """버퍼와 중복 제거 상태를 비웁니다 (테스트용)."""
+        self._post_views.clear()
+        self._pending_by_post.clear()
+        self._wiki_views.clear()
+        self._oldest_pending = None
+        self._seen_date = None
+        self._seen.clear()
+        self.full.clear()
+        self.stats = ViewCounterStats()
+
+
+view_counter = ViewCounter()
+
+
+# ---- Prometheus 지표 (prometheus_client 설치 시에만) ----------------------
+
+_gauges: dict | None = None
+
+
+def _export_metrics(stats: ViewCounterStats) -> None:
+    global _gauges
+    if _gauges is None:
+        try:
+            from prometheus_client import Gauge
+        except ImportError:
+            _gauges = {}
+            return
+        _gauges = {
+            "pending_post_views": Gauge("view_counter_pending_post_views", "flush 대기 중인 게시글 조회 수"),
+            "pending_wiki_views": Gauge("view_counter_pending_wiki_views", "flush 대기 중인 위키 조회 수"),
+            "oldest_pending_age_seconds": Gauge(
+                "view_counter_oldest_pending_age_seconds", "가장 오래된 미반영 조회의 대기 시간 (초)"
+            ),
+            "flush_failures_total": Gauge("view_counter_flush_failures", "조회수 flush 실패 횟수"),
+        }
+    for name, gauge in _gauges.items():
+        gauge.set(getattr(stats, name))
+
+
+# ---- 주기적 flush 태스크 ----------------------------------------------------
+
+_flusher_task: asyncio.Task | None = None
+
+
+async def _run_flusher() -> None:
+    """VIEW_COUNTER_FLUSH_SECONDS마다 (또는 버퍼가 상한에 도달하면 즉시) flush합니다."""
+    while True:
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(view_counter.full.wait(), timeout=settings.VIEW_COUNTER_FLUSH_SECONDS)
+        # 종료 시 취소되어도 진행 중인 쓰기는 끝까지 실행 (꺼낸 버퍼 유실 방지)
+        await asyncio.shield(view_counter.flush())
+        lag = view_counter.stats.oldest_pending_age_seconds
+        if lag > settings.VIEW_COUNTER_FLUSH_SECONDS * 10:
+            logger.warning("조회수 flush 지연: 가장 오래된 미반영 조회 %.1f초", lag)
+
+
+def start_view_counter_flusher() -> None:
+    """버퍼 모드에서 주기적 flush 태스크를 시작합니다 (앱 startup 시 호출)."""
+    global _flusher_task
+    if settings.VIEW_COUNTER_BACKEND == "direct" or _flusher_task is not None:
+        return
+    _flusher_task = asyncio.create_task(_run_flusher())
+
+
+async def stop_view_counter_flusher() -> None:
+    """flush 태스크를 종료하고 남은 버퍼를 반영합니다 (앱 shutdown 시, DB 풀 종료 전에 호출)."""
+    global _flusher_task
+    if _flusher_task is not None:
+        _flusher_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _flusher_task
+        _flusher_task = None
+    flushed = await view_counter.flush()
+    if flushed:
+        logger.info("종료 전 조회수 flush: %d건", flushed)
@@ -3,6 +3,10 @@
 best-effort 전송 — 실패해도 예외를 전파하지 않습니다.
 알림은 이미 MySQL에 저장되어 있으므로, 푸시 실패 시 다음 폴링에서 수신 가능합니다.
 
+- push_to_user: 사용자의 모든 연결 (채널 notify:{user_id})
+- push_to_topic: 토픽을 구독한 모든 연결 (채널 topic:{토픽}, 예: poll:{poll_id}).
+  클라이언트는 {"type": "subscribe", "topic": ...} 메시지로 구독합니다
+
 K8s 프로덕션: Redis Pub/Sub
 로컬 (DEBUG=True): routers/websocket_router.py의 인메모리 연결 사용
 """
@@ -40,3 +44,27 @@ async def push_to_user(user_id: int, event: dict[str, Any]) -> None:
             pass
         except Exception:
             logger.warning("로컬 WebSocket 푸시 실패", exc_info=True)
+
+
+async def push_to_topic(topic: str, event: dict[str, Any]) -> None:
+    """topic을 구독한 모든 WebSocket 연결에 이벤트를 전송합니다 (best-effort)."""
+    if settings.WS_BACKEND == "redis":
+        try:
+            from core.utils.redis_client import get_redis
+
+            redis = await get_redis(settings.REDIS_URL)
+            payload = json.dumps(event, ensure_ascii=False)
+            await redis.publish(f"topic:{topic}", payload)
+        except Exception:
+            logger.warning("Redis topic push 실패 (best-effort)", exc_info=True)
+        return
+
+    if settings.DEBUG:
+        try:
+            from routers.websocket_router import local_push_to_topic
+
+            await local_push_to_topic(topic, event)
+        except ImportError:
+            pass
+        except Exception:
+            logger.warning("로컬 WebSocket 토픽 푸시 실패", exc_info=True)
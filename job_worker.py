@@ -0,0 +1,43 @@
+"""K8s 잡 워커 — Redis 잡 큐 소비 (JOB_QUEUE_BACKEND=redis)
+
+API 이미지와 같은 이미지에서 실행: python job_worker.py
+SIGTERM/SIGINT를 받으면 처리 중인 잡을 마무리하고 종료합니다.
+"""
+
+import asyncio
+import logging
+import signal
+
+from core.config import settings
+from core.database.connection import close_db, init_db
+from core.jobs import get_job_queue
+from core.jobs.worker import run_worker
+from core.logging_config import setup_logging
+
+logger = logging.getLogger("job_worker")
+
+
+async def main() -> None:
+    setup_logging(debug=settings.DEBUG)
+    if settings.JOB_QUEUE_BACKEND != "redis":
+        logger.warning("JOB_QUEUE_BACKEND=%s — 잡은 API 프로세스 안에서 처리됩니다", settings.JOB_QUEUE_BACKEND)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    await init_db()
+    try:
+        logger.info("잡 워커 시작 (concurrency=%d)", settings.JOB_WORKER_CONCURRENCY)
+        await run_worker(get_job_queue(), stop)
+    finally:
+        from core.utils.redis_client import close_redis
+
+        await close_redis()
+        await close_db()
+        logger.info("잡 워커 종료")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
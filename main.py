@@ -10,18 +10,30 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 from core.config import settings
 from core.database.connection import close_db, init_db
+from core.jobs import get_job_queue
+from core.jobs.worker import start_in_process_worker, stop_in_process_worker
 from core.logging_config import setup_logging
-from core.middleware import BodyLimitMiddleware, RateLimitMiddleware, SecurityHeadersMiddleware, TimingMiddleware
+from core.middleware import (
+    BodyLimitMiddleware,
+    CompressionMiddleware,
+    RateLimitMiddleware,
+    SecurityHeadersMiddleware,
+    TimingMiddleware,
+)
 from core.middleware.exception_handler import (
     global_exception_handler,
     request_validation_exception_handler,
 )
+from core.middleware.rate_limiter import build_rate_limit_registry
 from core.middleware.request_id import RequestIdMiddleware
+from core.search import get_search_index, start_search_syncer, stop_search_syncer
+from core.utils.principal_cache import start_invalidation_listener, stop_invalidation_listener
+from core.utils.static_files import PrecompressedStaticFiles
+from core.utils.view_counter import start_view_counter_flusher, stop_view_counter_flusher
 from modules.admin.router import report_router
 from modules.auth.router import auth_router
 from modules.auth.social_router import router as social_auth_router
@@ -32,6 +44,7 @@ from modules.content.terms_router import terms_router
 from modules.dm.router import router as dm_router
 from modules.notification.router import router as notification_router
 from modules.package.router import package_router
+from modules.post.poll_tally import poll_pusher
 from modules.post.router import post_router
 from modules.reputation.router import reputation_router
 from modules.user.router import user_router
@@ -53,8 +66,26 @@ async def lifespan(app: FastAPI):
     배치 작업(토큰 정리, 피드 점수 재계산)은 K8s CronJob으로 실행됩니다.
     """
     await init_db()
+    # 다른 워커/파드의 사용자 캐시 무효화 구독 (PRINCIPAL_CACHE_INVALIDATION=redis일 때만)
+    start_invalidation_listener()
+    # memory 잡 큐는 API 프로세스 안에서 소비 (redis 백엔드는 job_worker.py가 소비)
+    if settings.JOB_QUEUE_BACKEND == "memory":
+        start_in_process_worker(get_job_queue())
+    # 조회수 write-behind 주기적 flush (VIEW_COUNTER_BACKEND=direct이면 시작하지 않음)
+    start_view_counter_flusher()
+    # 검색 색인 재색인(필요 시) 및 변경 로그 동기화 (SEARCH_BACKEND=mysql이면 시작하지 않음)
+    start_search_syncer(get_search_index())
+    # 라우트 템플릿별 Rate Limit 한도를 한 번만 계산 (RateLimitMiddleware가 요청마다 조회)
+    app.state.rate_limit_registry = build_rate_limit_registry(app.routes)
     yield
-    # Redis 연결 종료 (레이트리밋, WebSocket pusher가 사용)
+    # 남은 조회수 버퍼는 DB 풀을 닫기 전에 반영
+    await stop_view_counter_flusher()
+    await stop_search_syncer()
+    # 대기 중인 투표 결과 푸시 취소 (결과는 다음 상세 조회에서 반영)
+    await poll_pusher.close()
+    await stop_in_process_worker()
+    await stop_invalidation_listener()
+    # Redis 연결 종료 (레이트리밋, WebSocket pusher, 사용자 캐시 무효화, 잡 큐가 사용)
     from core.utils.redis_client import close_redis
 
     await close_redis()
@@ -83,6 +114,15 @@ app.add_middleware(RateLimitMiddleware)
 # 요청 본문 크기 제한 — K8s에서 nginx 없이 직접 노출 시 DoS 방지 (10MB)
 app.add_middleware(BodyLimitMiddleware)
 
+# 응답 압축 (gzip/brotli) — nginx 없이 직접 노출되므로 앱에서 Accept-Encoding 협상
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
@@ -131,13 +171,22 @@ if settings.TESTING:
     app.include_router(test_router)
 
 os.makedirs("assets", exist_ok=True)
-app.mount("/assets", StaticFiles(directory="assets"), name="assets")
+# 빌드 시 만든 .br/.gz 형제 파일 우선 (scripts/precompress_static.py), 장기 immutable 캐시
+app.mount(
+    "/assets",
+    PrecompressedStaticFiles(directory="assets", max_age=settings.STATIC_CACHE_MAX_AGE_SECONDS),
+    name="assets",
+)
 
 # 업로드 파일 서빙 (UPLOAD_DIR 환경변수)
 _upload_dir = os.environ.get("UPLOAD_DIR")
 if _upload_dir:
     os.makedirs(_upload_dir, exist_ok=True)
-    app.mount("/uploads", StaticFiles(directory=_upload_dir), name="uploads")
+    app.mount(
+        "/uploads",
+        PrecompressedStaticFiles(directory=_upload_dir, max_age=settings.STATIC_CACHE_MAX_AGE_SECONDS),
+        name="uploads",
+    )
 
 
 @app.get("/livez", status_code=200)
@@ -0,0 +1,71 @@
+"""post 테이블에 비정규화 카운터 컬럼 추가 (likes_count, comments_count, bookmarks_count).
+
+목록/관련글/다이제스트/hot score 쿼리가 post_like, comment, post_bookmark 전체를
+GROUP BY 하던 파생 테이블 JOIN을 제거하기 위함.
+기존 게시글은 원본 테이블 집계로 백필.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # likes_count 컬럼 존재 여부로 멱등성 판단
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.columns "
+            "WHERE table_schema = DATABASE() AND table_name = 'post' "
+            "AND column_name = 'likes_count'"
+        )
+    )
+    if not result.scalar():
+        conn.execute(
+            text(
+                "ALTER TABLE post"
+                " ADD COLUMN likes_count INT UNSIGNED NOT NULL DEFAULT 0 AFTER views,"
+                " ADD COLUMN comments_count INT UNSIGNED NOT NULL DEFAULT 0 AFTER likes_count,"
+                " ADD COLUMN bookmarks_count INT UNSIGNED NOT NULL DEFAULT 0 AFTER comments_count"
+            )
+        )
+
+    # 원본 테이블 기준 백필 (재실행해도 동일 결과)
+    conn.execute(
+        text(
+            """
+            UPDATE post p
+            LEFT JOIN (
+                SELECT post_id, COUNT(*) AS cnt FROM post_like GROUP BY post_id
+            ) lk ON p.id = lk.post_id
+            LEFT JOIN (
+                SELECT post_id, COUNT(*) AS cnt FROM comment
+                WHERE deleted_at IS NULL GROUP BY post_id
+            ) cm ON p.id = cm.post_id
+            LEFT JOIN (
+                SELECT post_id, COUNT(*) AS cnt FROM post_bookmark GROUP BY post_id
+            ) bk ON p.id = bk.post_id
+            SET p.likes_count = COALESCE(lk.cnt, 0),
+                p.comments_count = COALESCE(cm.cnt, 0),
+                p.bookmarks_count = COALESCE(bk.cnt, 0)
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("ALTER TABLE post DROP COLUMN IF EXISTS bookmarks_count"))
+    conn.execute(text("ALTER TABLE post DROP COLUMN IF EXISTS comments_count"))
+    conn.execute(text("ALTER TABLE post DROP COLUMN IF EXISTS likes_count"))
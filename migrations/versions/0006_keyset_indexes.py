@@ -0,0 +1,51 @@
+"""키셋(커서) 페이지네이션용 인덱스 추가.
+
+게시글 목록, 알림, 팔로잉/팔로워, 내가 쓴 글 목록이 OFFSET 대신
+(정렬 키, id) 범위 조건으로 이어서 조회할 수 있도록 정렬 키 인덱스를 추가.
+InnoDB 보조 인덱스는 PK(id)를 암묵적으로 포함하므로 id를 따로 명시하지 않음.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (인덱스명, 테이블명, 컬럼 목록)
+_INDEXES = (
+    ("idx_post_feed_keyset", "post", "deleted_at, is_pinned, created_at"),
+    ("idx_notification_user_created", "notification", "user_id, created_at"),
+    ("idx_user_follow_follower_created", "user_follow", "follower_id, created_at"),
+    ("idx_user_follow_following_created", "user_follow", "following_id, created_at"),
+    ("idx_post_author_created", "post", "author_id, deleted_at, created_at"),
+)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    for name, table, columns in _INDEXES:
+        # 인덱스 존재 여부로 멱등성 판단
+        result = conn.execute(
+            text(
+                "SELECT COUNT(*) FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = :table AND index_name = :name"
+            ),
+            {"table": table, "name": name},
+        )
+        if not result.scalar():
+            conn.execute(text(f"CREATE INDEX {name} ON {table} ({columns})"))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    for name, table, _ in _INDEXES:
+        conn.execute(text(f"DROP INDEX IF EXISTS {name} ON {table}"))
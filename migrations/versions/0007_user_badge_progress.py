@@ -0,0 +1,51 @@
+"""배지 트리거 증분 카운터 테이블 추가 (user_badge_progress).
+
+평판 이벤트마다 post/comment/post_like 등을 COUNT(*)로 다시 집계하던 배지 트리거 평가를
+사용자별 카운터 갱신으로 대체하기 위함.
+기존 사용자는 첫 이벤트 시 원본 테이블 집계로 시드되므로 백필하지 않음.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0007"
+down_revision: str | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = 'user_badge_progress'"
+        )
+    )
+    if result.scalar():
+        return
+
+    conn.execute(
+        text("""
+        CREATE TABLE user_badge_progress (
+            user_id       INT UNSIGNED NOT NULL,
+            trigger_type  VARCHAR(30) NOT NULL,
+            value         INT NOT NULL DEFAULT 0,
+            updated_at    DATETIME NOT NULL DEFAULT NOW() ON UPDATE NOW(),
+            PRIMARY KEY (user_id, trigger_type),
+            FOREIGN KEY (user_id) REFERENCES user(id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("DROP TABLE IF EXISTS user_badge_progress"))
@@ -0,0 +1,52 @@
+"""비동기 잡 dead-letter 테이블 추가 (job_dead_letter).
+
+댓글/좋아요 후속 처리(알림, 평판, 구독)를 잡 큐로 옮기면서,
+최대 재시도 횟수를 넘긴 잡을 유실하지 않고 보관하기 위함.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0008"
+down_revision: str | None = "0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = 'job_dead_letter'"
+        )
+    )
+    if result.scalar():
+        return
+
+    conn.execute(
+        text("""
+        CREATE TABLE job_dead_letter (
+            id          BIGINT AUTO_INCREMENT PRIMARY KEY,
+            job_id      CHAR(32) NOT NULL,
+            name        VARCHAR(100) NOT NULL,
+            payload     JSON NOT NULL,
+            attempts    INT NOT NULL,
+            last_error  TEXT NULL,
+            created_at  DATETIME NOT NULL DEFAULT NOW(),
+            INDEX idx_created (created_at)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("DROP TABLE IF EXISTS job_dead_letter"))
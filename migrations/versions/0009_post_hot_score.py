@@ -0,0 +1,62 @@
+"""post 테이블에 hot_score 저장 컬럼과 정렬 인덱스 추가.
+
+sort=hot 목록, 연관 게시글, 추천 후보, 다이제스트가 매 요청마다 전체 게시글에 대해
+hot score 수식을 계산한 뒤 정렬하던 것을 저장 컬럼 인덱스 범위 스캔으로 대체하기 위함.
+기존 게시글은 현재 시각 기준 수식으로 백필.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0009"
+down_revision: str | None = "0008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # hot_score 컬럼 존재 여부로 멱등성 판단
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.columns "
+            "WHERE table_schema = DATABASE() AND table_name = 'post' "
+            "AND column_name = 'hot_score'"
+        )
+    )
+    if not result.scalar():
+        conn.execute(text("ALTER TABLE post ADD COLUMN hot_score DOUBLE NOT NULL DEFAULT 0 AFTER bookmarks_count"))
+
+    # 현재 시각 기준 백필 (재실행해도 동일 결과) — 수식은 modules/post/hot_score.py와 동일
+    conn.execute(
+        text(
+            """
+            UPDATE post
+            SET hot_score = (likes_count * 3 + comments_count * 2 + views * 0.5)
+                / POW(TIMESTAMPDIFF(HOUR, created_at, NOW()) + 2, 1.5)
+            WHERE deleted_at IS NULL
+            """
+        )
+    )
+
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = 'post' AND index_name = 'idx_post_hot'"
+        )
+    )
+    if not result.scalar():
+        conn.execute(text("CREATE INDEX idx_post_hot ON post (deleted_at, is_pinned, hot_score, created_at)"))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("DROP INDEX IF EXISTS idx_post_hot ON post"))
+    conn.execute(text("ALTER TABLE post DROP COLUMN IF EXISTS hot_score"))
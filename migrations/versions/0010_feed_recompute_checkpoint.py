@@ -0,0 +1,52 @@
+"""추천 피드 재계산 체크포인트 테이블 추가 (feed_recompute_checkpoint).
+
+피드 재계산을 user_id % N 샤드로 나눠 여러 Pod에서 실행하면서,
+샤드별 진행 위치를 남겨 중단된 실행을 처음부터 다시 하지 않고 이어서 처리하기 위함.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0010"
+down_revision: str | None = "0009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = 'feed_recompute_checkpoint'"
+        )
+    )
+    if result.scalar():
+        return
+
+    conn.execute(
+        text("""
+        CREATE TABLE feed_recompute_checkpoint (
+            shard_count     INT NOT NULL,
+            shard_index     INT NOT NULL,
+            run_started_at  DATETIME NOT NULL,
+            last_user_id    INT UNSIGNED NOT NULL DEFAULT 0,
+            users_processed INT NOT NULL DEFAULT 0,
+            completed_at    DATETIME NULL,
+            updated_at      TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            PRIMARY KEY (shard_count, shard_index)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("DROP TABLE IF EXISTS feed_recompute_checkpoint"))
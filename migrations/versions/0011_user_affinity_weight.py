@@ -0,0 +1,52 @@
+"""추천 피드 사용자 친화도 가중치 테이블 추가 (user_affinity_weight).
+
+배치마다 30일 원시 이력으로 프로필을 다시 만드는 대신, 좋아요/북마크/댓글/팔로우/조회 이벤트가
+태그/카테고리/작성자 가중치를 증분 갱신하고 배치는 시간 감쇠만 반영하기 위함.
+기존 사용자의 초기 가중치는 첫 배치 또는 첫 이벤트에서 최근 신호로 채워지므로 백필하지 않음.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0011"
+down_revision: str | None = "0010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = 'user_affinity_weight'"
+        )
+    )
+    if result.scalar():
+        return
+
+    conn.execute(
+        text("""
+        CREATE TABLE user_affinity_weight (
+            user_id     INT UNSIGNED NOT NULL,
+            kind        ENUM('tag', 'category', 'author') NOT NULL,
+            key_id      INT UNSIGNED NOT NULL,
+            weight      DOUBLE NOT NULL,
+            decayed_at  DATETIME NOT NULL,
+            PRIMARY KEY (user_id, kind, key_id),
+            FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("DROP TABLE IF EXISTS user_affinity_weight"))
@@ -0,0 +1,50 @@
+"""검색 색인 변경 로그 테이블 추가 (search_outbox).
+
+MATCH ... AGAINST 대신 파드별 로컬 전문 검색 색인(core/search)을 쓰기 위해,
+게시글/위키/태그/패키지 쓰기가 (종류, ID)를 적재하고 각 파드가 워터마크 이후 변경을 따라가 색인을 갱신함.
+기존 데이터는 색인이 처음 만들어질 때 전체 재색인하므로 백필하지 않음.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0012"
+down_revision: str | None = "0011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = 'search_outbox'"
+        )
+    )
+    if result.scalar():
+        return
+
+    conn.execute(
+        text("""
+        CREATE TABLE search_outbox (
+            id          BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+            kind        ENUM('post', 'wiki', 'tag', 'package') NOT NULL,
+            entity_id   INT UNSIGNED NOT NULL,
+            created_at  DATETIME(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3),
+            INDEX idx_search_outbox_created (created_at)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("DROP TABLE IF EXISTS search_outbox"))
@@ -0,0 +1,54 @@
+"""연관 게시글 색인 테이블 추가 (post_related).
+
+GET /v1/posts/{id}/related가 요청마다 전체 게시글을 post_tag와 GROUP BY로 정렬하던 것을
+게시글별로 미리 계산한 상위 K개를 읽는 PK 범위 조회로 바꿈 (modules/post/related_service.py).
+기존 게시글은 첫 조회 시 또는 POST /v1/admin/related-posts/rebuild 실행 시 계산되므로 백필하지 않음.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0013"
+down_revision: str | None = "0012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = 'post_related'"
+        )
+    )
+    if result.scalar():
+        return
+
+    conn.execute(
+        text("""
+        CREATE TABLE post_related (
+            post_id          INT UNSIGNED NOT NULL,
+            position         TINYINT UNSIGNED NOT NULL,
+            related_post_id  INT UNSIGNED NOT NULL,
+            similarity       FLOAT NOT NULL DEFAULT 0,
+            computed_at      TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (post_id, position),
+            INDEX idx_post_related_related (related_post_id),
+            FOREIGN KEY (post_id) REFERENCES post(id) ON DELETE CASCADE,
+            FOREIGN KEY (related_post_id) REFERENCES post(id) ON DELETE CASCADE
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("DROP TABLE IF EXISTS post_related"))
@@ -0,0 +1,91 @@
+"""comment 테이블에 비정규화 카운터 컬럼과 스레드 페이지네이션 인덱스 추가.
+
+게시글 상세가 게시글의 모든 댓글을 comment_like 전체 GROUP BY와 함께 읽던 것을
+루트 댓글 키셋 페이지 + 대댓글 엔드포인트로 나누기 위함 (modules/post/comment_models.py).
+
+- likes_count: 댓글 좋아요 수 (comment_like 증감 시 같은 트랜잭션에서 갱신)
+- replies_count: 삭제되지 않은 대댓글 수 (대댓글 작성/삭제 시 같은 트랜잭션에서 갱신)
+- idx_comment_thread_created: (post_id, parent_id, created_at) — oldest/latest 정렬
+- idx_comment_thread_likes: (post_id, parent_id, likes_count, created_at) — popular 정렬
+
+루트 댓글은 parent_id IS NULL, 대댓글은 parent_id = ? 동등 조건이라 두 목록이 같은 인덱스를 씀.
+기존 댓글은 원본 테이블 집계로 백필.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0014"
+down_revision: str | None = "0013"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (인덱스명, 컬럼 목록) — InnoDB 보조 인덱스는 PK(id)를 암묵적으로 포함하므로 id를 따로 명시하지 않음
+_INDEXES = (
+    ("idx_comment_thread_created", "post_id, parent_id, created_at"),
+    ("idx_comment_thread_likes", "post_id, parent_id, likes_count, created_at"),
+)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # likes_count 컬럼 존재 여부로 멱등성 판단
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.columns "
+            "WHERE table_schema = DATABASE() AND table_name = 'comment' "
+            "AND column_name = 'likes_count'"
+        )
+    )
+    if not result.scalar():
+        conn.execute(
+            text(
+                "ALTER TABLE comment"
+                " ADD COLUMN likes_count INT UNSIGNED NOT NULL DEFAULT 0 AFTER parent_id,"
+                " ADD COLUMN replies_count INT UNSIGNED NOT NULL DEFAULT 0 AFTER likes_count"
+            )
+        )
+
+    # 원본 테이블 기준 백필 (재실행해도 동일 결과)
+    conn.execute(
+        text(
+            """
+            UPDATE comment c
+            LEFT JOIN (
+                SELECT comment_id, COUNT(*) AS cnt FROM comment_like GROUP BY comment_id
+            ) lk ON c.id = lk.comment_id
+            LEFT JOIN (
+                SELECT parent_id, COUNT(*) AS cnt FROM comment
+                WHERE parent_id IS NOT NULL AND deleted_at IS NULL GROUP BY parent_id
+            ) rp ON c.id = rp.parent_id
+            SET c.likes_count = COALESCE(lk.cnt, 0),
+                c.replies_count = COALESCE(rp.cnt, 0)
+            """
+        )
+    )
+
+    for name, columns in _INDEXES:
+        result = conn.execute(
+            text(
+                "SELECT COUNT(*) FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = 'comment' AND index_name = :name"
+            ),
+            {"name": name},
+        )
+        if not result.scalar():
+            conn.execute(text(f"CREATE INDEX {name} ON comment ({columns})"))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    for name, _ in _INDEXES:
+        conn.execute(text(f"DROP INDEX IF EXISTS {name} ON comment"))
+    conn.execute(text("ALTER TABLE comment DROP COLUMN IF EXISTS replies_count"))
+    conn.execute(text("ALTER TABLE comment DROP COLUMN IF EXISTS likes_count"))
@@ -0,0 +1,58 @@
+"""poll_option 테이블에 투표 수 카운터 컬럼 추가.
+
+게시글 상세마다 poll_vote 전체를 COUNT(...) GROUP BY로 집계하던 투표 결과를
+선택지별 카운터로 읽기 위함 (modules/post/poll_models.py, modules/post/poll_tally.py).
+
+- vote_count: 선택지의 투표 수 (투표/변경/취소 시 같은 트랜잭션에서 증감)
+
+기존 투표는 poll_vote 집계로 백필.
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0015"
+down_revision: str | None = "0014"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # vote_count 컬럼 존재 여부로 멱등성 판단
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.columns "
+            "WHERE table_schema = DATABASE() AND table_name = 'poll_option' "
+            "AND column_name = 'vote_count'"
+        )
+    )
+    if not result.scalar():
+        conn.execute(
+            text("ALTER TABLE poll_option ADD COLUMN vote_count INT UNSIGNED NOT NULL DEFAULT 0 AFTER sort_order")
+        )
+
+    # 원본 테이블 기준 백필 (재실행해도 동일 결과)
+    conn.execute(
+        text(
+            """
+            UPDATE poll_option po
+            LEFT JOIN (
+                SELECT option_id, COUNT(*) AS cnt FROM poll_vote GROUP BY option_id
+            ) pv ON po.id = pv.option_id
+            SET po.vote_count = COALESCE(pv.cnt, 0)
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("ALTER TABLE poll_option DROP COLUMN IF EXISTS vote_count"))
@@ -0,0 +1,49 @@
+"""친화도 이벤트 적용 기록 테이블 추가 (affinity_event_applied).
+
+친화도 가중치는 이벤트마다 delta를 더하므로, Redis 잡 큐가 커밋 후 ack 전에 잡을 다시 전달하면
+가중치가 두 번 반영됨. 잡 payload의 event_id를 가중치 갱신과 같은 트랜잭션에 기록해 재전달을 건너뛰기 위함.
+기록은 재전달 가능 기간만 필요하므로 추천 피드 배치가 샤드별로 오래된 행을 정리함.
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from sqlalchemy import text
+
+revision: str = "0016"
+down_revision: str | None = "0015"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    result = conn.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = 'affinity_event_applied'"
+        )
+    )
+    if result.scalar():
+        return
+
+    conn.execute(
+        text("""
+        CREATE TABLE affinity_event_applied (
+            event_id    CHAR(32) NOT NULL PRIMARY KEY,
+            user_id     INT UNSIGNED NOT NULL,
+            applied_at  DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_affinity_event_applied_at (applied_at)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+    )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    conn.execute(text("DROP TABLE IF EXISTS affinity_event_applied"))
@@ -1,10 +1,15 @@
 """admin_controller: 관리자 대시보드 컨트롤러 모듈."""
 
 import logging
+import time
 
 from fastapi import Request
 
+from core.config import settings
 from core.dependencies.request_context import get_request_timestamp
+from core.utils.error_codes import ErrorCode
+from core.utils.exceptions import bad_request_error
+from core.utils.response_cache import invalidate_post_responses
 from modules.admin import admin_models
 from modules.user.models import User
 from schemas.common import create_response
@@ -81,3 +86,136 @@ async def cleanup_tokens(request: Request) -> dict:
             "verification_tokens_deleted": verification_deleted,
         },
     }
+
+
+async def reconcile_post_counters(request: Request) -> dict:
+    """게시글 비정규화 카운터를 원본 테이블 기준으로 재계산합니다 (관리자 또는 내부 호출).
+
+    쓰기 경로에서 증감하는 likes_count/comments_count/bookmarks_count와
+    댓글의 likes_count/replies_count, 투표 선택지의 vote_count 드리프트를 복구합니다.
+    """
+    from modules.post.comment_models import reconcile_comment_counters
+    from modules.post.poll_models import reconcile_poll_counters
+    from modules.post.post_models import reconcile_post_counters as _reconcile
+
+    repaired = await _reconcile()
+    comments_repaired = await reconcile_comment_counters()
+    poll_options_repaired = await reconcile_poll_counters()
+    if repaired or comments_repaired or poll_options_repaired:
+        logger.warning(
+            "게시글 카운터 드리프트 복구: 게시글 %d건, 댓글 %d건, 투표 선택지 %d건",
+            repaired,
+            comments_repaired,
+            poll_options_repaired,
+        )
+        # 목록 응답만 무효화 — 복구된 게시글의 상세 응답/투표 스냅샷은 TTL 안에 반영
+        await invalidate_post_responses()
+
+    return {
+        "status": "success",
+        "data": {
+            "posts_repaired": repaired,
+            "comments_repaired": comments_repaired,
+            "poll_options_repaired": poll_options_repaired,
+        },
+    }
+
+
+async def recompute_feed_scores(request: Request, shard: int, shards: int) -> dict:
+    """추천 피드 점수를 샤드 단위로 재계산합니다 (관리자 또는 내부 호출)."""
+    from modules.post.feed_service import FeedService
+
+    if shard >= shards:
+        raise bad_request_error(
+            ErrorCode.INVALID_OPTION,
+            get_request_timestamp(request),
+            "shard는 shards보다 작아야 합니다.",
+        )
+
+    result = await FeedService.recompute_all_scores(shard_index=shard, shard_count=shards)
+    return {"status": "success", "data": result}
+
+
+async def recompute_hot_scores(request: Request) -> dict:
+    """감쇠 구간 안의 게시글 hot_score 컬럼을 재계산합니다 (관리자 또는 내부 호출)."""
+    from modules.post.post_models import recompute_hot_scores as _recompute
+
+    updated = await _recompute(settings.HOT_SCORE_WINDOW_DAYS)
+    if updated:
+        await invalidate_post_responses()
+    return {"status": "success", "data": {"posts_updated": updated}}
+
+
+async def rebuild_related_posts(request: Request) -> dict:
+    """모든 게시글의 연관 게시글 색인을 다시 계산합니다 (관리자 또는 내부 호출).
+
+    증분 갱신이 반영하지 못한 hot_score 변화와 인기 태그의 후보 변화를 주기적으로 반영합니다.
+    """
+    from modules.post.related_service import RelatedPostService
+
+    result = await RelatedPostService.rebuild_all()
+    return {"status": "success", "data": result}
+
+
+async def rebuild_read_state(request: Request) -> dict:
+    """게시글 읽음 상태 저장소를 post_view_log에서 다시 만듭니다 (관리자 또는 내부 호출).
+
+    memory 백엔드는 요청을 처리한 프로세스의 저장소만 비웁니다 (다른 파드는 TTL 재적재로 반영).
+    """
+    from core.utils.read_state import rebuild_read_state as rebuild
+
+    result = await rebuild()
+    return {"status": "success", "data": result}
+
+
+async def get_view_counter_status(request: Request) -> dict:
+    """이 프로세스의 조회수 write-behind 버퍼 지표를 반환합니다 (관리자 또는 내부 호출).
+
+    버퍼와 flush는 프로세스(파드) 단위이므로 응답은 요청을 처리한 프로세스의 값입니다.
+    """
+    from dataclasses import asdict
+
+    from core.utils.view_counter import view_counter
+
+    return {"status": "success", "data": asdict(view_counter.snapshot())}
+
+
+async def get_search_index_status(request: Request) -> dict:
+    """이 프로세스의 검색 색인 상태를 반환합니다 (관리자 또는 내부 호출).
+
+    색인은 파드 로컬 파일이므로 응답은 요청을 처리한 프로세스의 값입니다.
+    """
+    from core.search import get_search_index
+
+    index = get_search_index()
+    if index is None:
+        return {"status": "success", "data": {"backend": settings.SEARCH_BACKEND}}
+    watermark, synced_at = await index.watermark()
+    return {
+        "status": "success",
+        "data": {
+            "backend": settings.SEARCH_BACKEND,
+            "documents": await index.stats(),
+            "watermark": watermark,
+            "sync_lag_seconds": round(time.time() - synced_at, 2) if synced_at is not None else None,
+        },
+    }
+
+
+async def reindex_search(request: Request, kind: str | None = None) -> dict:
+    """이 프로세스의 검색 색인을 원본 테이블 기준으로 다시 만듭니다 (관리자 또는 내부 호출).
+
+    색인 손상이나 변경 로그 누락 복구용. 재색인 중에도 이전 색인으로 검색이 계속됩니다.
+    """
+    from core.search import SEARCH_KINDS, get_search_index, search_syncer
+
+    timestamp = get_request_timestamp(request)
+    index = get_search_index()
+    if index is None:
+        raise bad_request_error(
+            "SEARCH_INDEX_DISABLED", timestamp, "SEARCH_BACKEND=mysql에서는 재색인할 색인이 없습니다."
+        )
+    kinds = SEARCH_KINDS if kind is None else tuple(k for k in SEARCH_KINDS if k == kind)
+    counts = await search_syncer.rebuild(index, kinds)
+    logger.info("검색 재색인 완료: %s", counts)
+    return {"status": "success", "data": {"documents_indexed": counts}}
@@ -2,11 +2,14 @@
 
 import logging
 
+from core.search import queue_reindex
 from core.utils.error_codes import ErrorCode
 from core.utils.exceptions import bad_request_error, not_found_error
 from core.utils.formatters import format_datetime
+from core.utils.response_cache import invalidate_post_responses
 from modules.admin import report_models, suspension_models
 from modules.post import comment_models, post_models
+from modules.post.jobs import enqueue_related_refresh
 from modules.user import models as user_models
 
 logger = logging.getLogger(__name__)
@@ -120,16 +123,32 @@ class ReportService:
         # resolve 후 delete 실패 시 관리자가 수동으로 삭제해야 함.
         if new_status == "resolved":
             author_id = None
+            deleted = False
+            created_event = f"{report.target_type}_created"
             if report.target_type == "post":
                 post_target = await post_models.get_post_by_id(report.target_id)
                 if post_target:
                     author_id = post_target.author_id
-                await post_models.delete_post(report.target_id)
+                deleted = await post_models.delete_post(report.target_id)
+                await invalidate_post_responses(report.target_id)
+                await queue_reindex("post", report.target_id)
+                await enqueue_related_refresh(report.target_id)
             elif report.target_type == "comment":
                 comment_target = await comment_models.get_comment_by_id(report.target_id)
                 if comment_target:
                     author_id = comment_target.author_id
-                await comment_models.delete_comment(report.target_id)
+                deleted = await comment_models.delete_comment(report.target_id)
+                if comment_target:
+                    await invalidate_post_responses(comment_target.post_id)
+
+            # 삭제된 콘텐츠의 배지 집계 카운터(post_count/comment_count) 되돌리기 (best-effort)
+            if deleted and author_id:
+                try:
+                    from modules.reputation.service import ReputationService
+
+                    await ReputationService.retract_counters(author_id, created_event)
+                except Exception:
+                    logger.warning("신고 #%d 처리 중 배지 카운터 회수 실패", report_id, exc_info=True)
 
             # 작성자 정지 (관리자 지정 시)
             # NOTE: 콘텐츠 삭제와 정지는 별도 트랜잭션. 정지 실패 시 로그 기록
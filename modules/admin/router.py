@@ -125,15 +125,15 @@ async def get_admin_users(
 async def recompute_feed_scores(
     request: Request,
     current_user: User | None = Depends(require_admin_or_internal),
+    shard: int = Query(0, ge=0, description="처리할 샤드 번호 (user_id % shards == shard)"),
+    shards: int = Query(1, ge=1, le=64, description="전체 샤드 수 (CronJob 팬아웃 단위)"),
 ) -> dict:
     """추천 피드 점수를 수동으로 재계산합니다 (관리자 또는 내부 호출).
 
     관리자 UI에서 수동 호출하거나 EventBridge 스케줄로 자동 호출합니다.
+    shards > 1이면 샤드별로 나눠 호출해 여러 Pod에서 병렬 처리할 수 있습니다.
     """
-    from modules.post.feed_service import FeedService
-
-    result = await FeedService.recompute_all_scores()
-    return {"status": "success", "data": result}
+    return await admin_controller.recompute_feed_scores(request, shard, shards)
 
 
 # ============ 내부 배치 작업 ============
@@ -148,6 +148,70 @@ async def cleanup_tokens(
     return await admin_controller.cleanup_tokens(request)
 
 
+@report_router.post("/v1/admin/reconcile/post-counters", status_code=status.HTTP_200_OK)
+async def reconcile_post_counters(
+    request: Request,
+    current_user: User | None = Depends(require_admin_or_internal),
+) -> dict:
+    """게시글 좋아요/댓글/북마크 카운터 드리프트를 복구합니다 (CronJob 호출용)."""
+    return await admin_controller.reconcile_post_counters(request)
+
+
+@report_router.post("/v1/admin/hot-scores/recompute", status_code=status.HTTP_200_OK)
+async def recompute_hot_scores(
+    request: Request,
+    current_user: User | None = Depends(require_admin_or_internal),
+) -> dict:
+    """게시글 hot_score 시간 감쇠를 반영합니다 (CronJob 호출용)."""
+    return await admin_controller.recompute_hot_scores(request)
+
+
+@report_router.post("/v1/admin/related-posts/rebuild", status_code=status.HTTP_200_OK)
+async def rebuild_related_posts(
+    request: Request,
+    current_user: User | None = Depends(require_admin_or_internal),
+) -> dict:
+    """모든 게시글의 연관 게시글 색인을 다시 계산합니다 (CronJob 호출용)."""
+    return await admin_controller.rebuild_related_posts(request)
+
+
+@report_router.post("/v1/admin/read-state/rebuild", status_code=status.HTTP_200_OK)
+async def rebuild_read_state(
+    request: Request,
+    current_user: User | None = Depends(require_admin_or_internal),
+) -> dict:
+    """게시글 읽음 상태 저장소를 post_view_log에서 다시 만듭니다 (Redis 유실/백엔드 전환 후)."""
+    return await admin_controller.rebuild_read_state(request)
+
+
+@report_router.get("/v1/admin/view-counters", status_code=status.HTTP_200_OK)
+async def get_view_counter_status(
+    request: Request,
+    current_user: User | None = Depends(require_admin_or_internal),
+) -> dict:
+    """조회수 write-behind 버퍼의 대기 건수/flush 지연 지표를 조회합니다 (모니터링용)."""
+    return await admin_controller.get_view_counter_status(request)
+
+
+@report_router.get("/v1/admin/search", status_code=status.HTTP_200_OK)
+async def get_search_index_status(
+    request: Request,
+    current_user: User | None = Depends(require_admin_or_internal),
+) -> dict:
+    """이 프로세스의 검색 색인 문서 수와 동기화 지연을 조회합니다 (모니터링용)."""
+    return await admin_controller.get_search_index_status(request)
+
+
+@report_router.post("/v1/admin/search/reindex", status_code=status.HTTP_200_OK)
+async def reindex_search(
+    request: Request,
+    kind: Literal["post", "wiki", "tag", "package"] | None = Query(None, description="재색인할 종류 (생략 시 전체)"),
+    current_user: User | None = Depends(require_admin_or_internal),
+) -> dict:
+    """이 프로세스의 검색 색인을 원본 테이블 기준으로 다시 만듭니다."""
+    return await admin_controller.reindex_search(request, kind)
+
+
 @report_router.post("/v1/admin/digest/send", status_code=status.HTTP_200_OK)
 async def send_digest(
     request: Request,
@@ -3,6 +3,7 @@
 from datetime import UTC, datetime, timedelta
 
 from core.database.connection import transactional
+from core.utils.principal_cache import invalidate_user
 
 
 async def suspend_user(user_id: int, duration_days: int, reason: str) -> bool:
@@ -14,7 +15,11 @@ async def suspend_user(user_id: int, duration_days: int, reason: str) -> bool:
             "UPDATE user SET suspended_until = %s, suspended_reason = %s WHERE id = %s AND deleted_at IS NULL",
             (suspended_until, reason, user_id),
         )
-        return cur.rowcount > 0
+        updated = cur.rowcount > 0
+
+    if updated:
+        await invalidate_user(user_id)
+    return updated
 
 
 async def unsuspend_user(user_id: int) -> bool:
@@ -25,4 +30,8 @@ async def unsuspend_user(user_id: int) -> bool:
             "WHERE id = %s AND deleted_at IS NULL AND suspended_until IS NOT NULL",
             (user_id,),
         )
-        return cur.rowcount > 0
+        updated = cur.rowcount > 0
+
+    if updated:
+        await invalidate_user(user_id)
+    return updated
@@ -10,6 +10,7 @@ from datetime import UTC, datetime, timedelta
 
 from core.database.connection import get_cursor, transactional
 from core.utils.jwt_utils import hash_refresh_token
+from core.utils.principal_cache import invalidate_user
 
 logger = logging.getLogger("api")
 
@@ -66,6 +67,7 @@ async def verify_token(raw_token: str) -> int | None:
             (user_id,),
         )
 
+    await invalidate_user(user_id)
     return user_id
 
 
@@ -3,6 +3,7 @@
 from fastapi import HTTPException, Request, status
 
 from core.dependencies.request_context import get_request_timestamp
+from core.search import query_index, queue_reindex
 from modules.content.tag_models import (
     get_tag_by_name,
     normalize_tag_name,
@@ -16,9 +17,12 @@ from schemas.common import create_response
 
 
 async def get_tags(request: Request, search: str = "") -> dict:
-    """태그 검색 (자동완성)."""
+    """태그 검색 (자동완성). 검색 색인이 있으면 이름/설명/본문을 관련도 순으로 검색합니다."""
     timestamp = get_request_timestamp(request)
-    tags = await search_tags(search) if search else []
+    tags: list[dict] = []
+    if search:
+        search_result = await query_index("tag", search)
+        tags = await search_tags(search, search_ids=search_result.ids if search_result is not None else None)
     return create_response(
         "TAGS_RETRIEVED",
         "태그 목록 조회에 성공했습니다.",
@@ -100,6 +104,8 @@ async def update_tag(
     await update_tag_description(normalized, data.description, data.body, current_user.id)
 
     updated_tag = await get_tag_by_name(normalized)
+    if updated_tag:
+        await queue_reindex("tag", updated_tag["id"])
     return create_response(
         "TAG_UPDATED",
         "태그가 수정되었습니다.",
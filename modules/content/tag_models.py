@@ -68,25 +68,58 @@ async def get_posts_tags(post_ids: list[int]) -> dict[int, list[dict]]:
         return result
 
 
-async def search_tags(search: str, limit: int = 10) -> list[dict]:
-    """태그 자동완성 검색. 게시글 수 포함."""
+async def search_tags(search: str, limit: int = 10, search_ids: list[int] | None = None) -> list[dict]:
+    """태그 자동완성 검색. 게시글 수 포함.
+
+    search_ids(검색 색인이 관련도 순으로 찾은 ID)가 주어지면 이름 LIKE 대신 해당 태그를 색인 순서대로 반환합니다.
+    """
+    if search_ids is not None:
+        if not search_ids:
+            return []
+        search_ids = search_ids[:limit]
+        placeholders = ", ".join(["%s"] * len(search_ids))
+        where = f"t.id IN ({placeholders})"
+        order_by = f"FIELD(t.id, {placeholders})"
+        params: list = [*search_ids, *search_ids, limit]
+    else:
+        where = "t.name LIKE %s"
+        order_by = "post_count DESC, t.name ASC"
+        params = [f"%{escape_like(search)}%", limit]
+
     async with get_cursor() as cur:
         await cur.execute(
-            """
+            f"""
                 SELECT t.id, t.name, t.description, COUNT(pt.post_id) AS post_count
                 FROM tag t
                 LEFT JOIN post_tag pt ON t.id = pt.tag_id
                 LEFT JOIN post p ON pt.post_id = p.id AND p.deleted_at IS NULL
-                WHERE t.name LIKE %s
+                WHERE {where}
                 GROUP BY t.id, t.name
-                ORDER BY post_count DESC, t.name ASC
+                ORDER BY {order_by}
                 LIMIT %s
                 """,
-            (f"%{escape_like(search)}%", limit),
+            params,
         )
         return [dict(row) for row in await cur.fetchall()]
 
 
+async def get_search_documents(ids: list[int] | None = None, after_id: int = 0, limit: int = 500) -> list[dict]:
+    """검색 색인용 (id, title, body) 행을 반환합니다. 제목은 태그 이름, 본문은 설명 + 본문.
+
+    ids가 주어지면 해당 태그만, 아니면 after_id 이후를 id 순으로 limit개 반환합니다 (전체 재색인).
+    """
+    columns = "id, name AS title, CONCAT_WS(' ', description, body) AS body"
+    async with get_cursor() as cur:
+        if ids is not None:
+            if not ids:
+                return []
+            placeholders = ", ".join(["%s"] * len(ids))
+            await cur.execute(f"SELECT {columns} FROM tag WHERE id IN ({placeholders})", ids)
+        else:
+            await cur.execute(f"SELECT {columns} FROM tag WHERE id > %s ORDER BY id LIMIT %s", (after_id, limit))
+        return list(await cur.fetchall())
+
+
 async def get_tag_by_name(tag_name: str) -> dict | None:
     """태그 이름으로 상세 정보를 조회합니다 (게시글/위키 사용 수 포함)."""
     async with get_cursor() as cur:
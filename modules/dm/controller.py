@@ -5,6 +5,7 @@ from fastapi.responses import JSONResponse
 
 from core.dependencies.request_context import get_request_timestamp
 from core.utils.formatters import format_datetime
+from core.utils.pagination import build_pagination, decode_cursor
 from modules.dm import models as dm_models
 from modules.dm import service as dm_service
 from modules.user.models import User
@@ -47,18 +48,37 @@ async def create_conversation(recipient_id: int, current_user: User, request: Re
     return JSONResponse(content=body, status_code=200)
 
 
-async def get_conversations(current_user: User, request: Request, offset: int = 0, limit: int = 20) -> dict:
-    """대화 목록을 조회합니다."""
+async def get_conversations(
+    current_user: User,
+    request: Request,
+    offset: int = 0,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> dict:
+    """대화 목록을 조회합니다. cursor가 주어지면 offset 대신 키셋으로 이어서 조회합니다."""
     timestamp = get_request_timestamp(request)
-    conversations, total_count = await dm_service.get_conversations(current_user.id, timestamp, offset, limit)
-    # has_more: 다음 페이지 존재 여부 — 커서 기반이 아닌 offset 방식이므로 단순 비교
-    has_more = offset + limit < total_count
+    columns = dm_models.CONVERSATION_CURSOR_COLUMNS
+    cursor_values = decode_cursor(cursor, "dm_conversations", len(columns), timestamp) if cursor else None
+    conversations, total_count, has_more, last_key = await dm_service.get_conversations(
+        current_user.id, timestamp, offset, limit, cursor=cursor_values
+    )
+    # has_more: limit+1 조회로 판단하므로 total_count 전략(exact/cached/has_more)과 무관하게 정확
+    pagination = build_pagination(
+        "dm_conversations",
+        total_count=total_count,
+        offset=offset,
+        limit=limit,
+        page_size=len(conversations),
+        last_key=last_key,
+        cursor_mode=cursor_values is not None,
+        has_more=has_more,
+    )
     return create_response(
         "CONVERSATIONS_LOADED",
         "대화 목록을 조회했습니다.",
         data={
             "conversations": conversations,
-            "pagination": {"total_count": total_count, "has_more": has_more},
+            "pagination": pagination,
         },
         timestamp=timestamp,
     )
@@ -70,16 +90,27 @@ async def get_messages(
     request: Request,
     offset: int = 0,
     limit: int = 50,
+    cursor: str | None = None,
 ) -> dict:
-    """대화의 메시지 목록을 조회합니다."""
+    """대화의 메시지 목록을 조회합니다. cursor가 주어지면 offset 대신 키셋으로 이어서 조회합니다."""
     timestamp = get_request_timestamp(request)
+    columns = dm_models.MESSAGE_CURSOR_COLUMNS
+    cursor_values = decode_cursor(cursor, "dm_messages", len(columns), timestamp) if cursor else None
 
     # 조회와 동시에 읽음 처리 수행 — 서비스에서 WebSocket 푸시까지 처리
     # _read_count는 컨트롤러 응답에 포함하지 않음 (내부 처리 결과)
-    messages, other_user, total_count, _read_count = await dm_service.get_messages(
-        conversation_id, current_user.id, timestamp, offset, limit
+    messages, other_user, total_count, _read_count, last_key = await dm_service.get_messages(
+        conversation_id, current_user.id, timestamp, offset, limit, cursor=cursor_values
+    )
+    pagination = build_pagination(
+        "dm_messages",
+        total_count=total_count,
+        offset=offset,
+        limit=limit,
+        page_size=len(messages),
+        last_key=last_key,
+        cursor_mode=cursor_values is not None,
     )
-    has_more = offset + limit < total_count
 
     return create_response(
         "MESSAGES_LOADED",
@@ -87,7 +118,7 @@ async def get_messages(
         data={
             "messages": messages,
             "other_user": other_user,
-            "pagination": {"total_count": total_count, "has_more": has_more},
+            "pagination": pagination,
         },
         timestamp=timestamp,
     )
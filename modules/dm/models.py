@@ -5,11 +5,16 @@ from datetime import datetime
 
 from core.database.connection import get_cursor, transactional
 from core.utils.formatters import format_datetime
+from core.utils.pagination import keyset_condition
 from schemas.common import DEFAULT_PROFILE_IMAGE
 
 # DM 목록에서 미리보기로 보여줄 최대 글자 수
 DM_PREVIEW_LENGTH = 100
 
+# 키셋 커서 구성 컬럼 (ORDER BY와 동일 순서) — 대화 목록은 DESC, 메시지는 ASC
+CONVERSATION_CURSOR_COLUMNS = ("COALESCE(c.last_message_at, c.created_at)", "c.id")
+MESSAGE_CURSOR_COLUMNS = ("m.created_at", "m.id")
+
 
 @dataclass
 class Conversation:
@@ -78,8 +83,8 @@ async def get_conversation_by_id(conversation_id: int) -> Conversation | None:
         return Conversation(**row) if row else None
 
 
-async def get_conversations(user_id: int, offset: int = 0, limit: int = 20) -> tuple[list[dict], int]:
-    """사용자의 대화 목록을 페이지네이션하여 반환합니다."""
+async def count_conversations(user_id: int) -> int:
+    """사용자가 참여 중인 대화 총 개수를 반환합니다."""
     async with get_cursor() as cur:
         await cur.execute(
             """
@@ -90,14 +95,38 @@ async def get_conversations(user_id: int, offset: int = 0, limit: int = 20) -> t
                 """,
             (user_id, user_id),
         )
-        total_count = (await cur.fetchone())["cnt"]
+        return (await cur.fetchone())["cnt"]
+
+
+async def get_conversations(
+    user_id: int,
+    offset: int = 0,
+    limit: int = 20,
+    cursor: list | None = None,
+) -> tuple[list[dict], bool, list | None]:
+    """사용자의 대화 목록을 페이지네이션하여 반환합니다.
+
+    limit+1개를 조회해 COUNT 없이 다음 페이지 존재 여부를 판단하며,
+    cursor가 주어지면 offset 대신 키셋 조건으로 이어서 조회합니다.
+
+    Returns:
+        (conversations, has_more, last_key) 튜플.
+    """
+    keyset = ""
+    keyset_params: list = []
+    if cursor is not None:
+        condition, keyset_params = keyset_condition(CONVERSATION_CURSOR_COLUMNS, cursor)
+        keyset = f"AND {condition}"
+        offset = 0
 
+    async with get_cursor() as cur:
         await cur.execute(
-            """
+            f"""
                 SELECT
                     c.id,
                     c.last_message_at,
                     c.created_at,
+                    COALESCE(c.last_message_at, c.created_at) AS sort_at,
                     u.id AS other_user_id,
                     u.nickname,
                     u.profile_img,
@@ -131,14 +160,17 @@ async def get_conversations(user_id: int, offset: int = 0, limit: int = 20) -> t
                     c.participant1_id
                 )
                 WHERE (c.participant1_id = %s OR c.participant2_id = %s)
-                  AND c.deleted_at IS NULL
-                ORDER BY COALESCE(c.last_message_at, c.created_at) DESC
+                  AND c.deleted_at IS NULL {keyset}
+                ORDER BY COALESCE(c.last_message_at, c.created_at) DESC, c.id DESC
                 LIMIT %s OFFSET %s
                 """,
-            (user_id, user_id, user_id, user_id, limit, offset),
+            (user_id, user_id, user_id, user_id, *keyset_params, limit + 1, offset),
         )
         rows = await cur.fetchall()
 
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
     conversations = []
     for row in rows:
         other_nickname = row["nickname"] if row["nickname"] and row["user_deleted_at"] is None else "탈퇴한 사용자"
@@ -180,7 +212,8 @@ async def get_conversations(user_id: int, offset: int = 0, limit: int = 20) -> t
             }
         )
 
-    return conversations, total_count
+    last_key = [rows[-1]["sort_at"], rows[-1]["id"]] if rows else None
+    return conversations, has_more, last_key
 
 
 async def send_message(conversation_id: int, sender_id: int, content: str) -> dict:
@@ -216,8 +249,23 @@ async def send_message(conversation_id: int, sender_id: int, content: str) -> di
         }
 
 
-async def get_messages(conversation_id: int, offset: int = 0, limit: int = 50) -> tuple[list[dict], int]:
-    """대화의 메시지 목록을 페이지네이션하여 반환합니다."""
+async def get_messages(
+    conversation_id: int,
+    offset: int = 0,
+    limit: int = 50,
+    cursor: list | None = None,
+) -> tuple[list[dict], int, list | None]:
+    """대화의 메시지 목록을 페이지네이션하여 반환합니다.
+
+    cursor가 주어지면 offset 대신 키셋 조건으로 이어서 조회하며, 마지막 행의 커서 키를 함께 반환합니다.
+    """
+    keyset = ""
+    keyset_params: list = []
+    if cursor is not None:
+        condition, keyset_params = keyset_condition(MESSAGE_CURSOR_COLUMNS, cursor, descending=False)
+        keyset = f"AND {condition}"
+        offset = 0
+
     async with get_cursor() as cur:
         await cur.execute(
             "SELECT COUNT(*) AS cnt FROM dm_message WHERE conversation_id = %s AND deleted_at IS NULL",
@@ -226,17 +274,17 @@ async def get_messages(conversation_id: int, offset: int = 0, limit: int = 50) -
         total_count = (await cur.fetchone())["cnt"]
 
         await cur.execute(
-            """
+            f"""
                 SELECT m.id, m.sender_id, u.nickname AS sender_nickname,
                        u.profile_img AS sender_profile_image,
                        m.content, m.is_read, m.created_at, m.deleted_at
                 FROM dm_message m
                 JOIN user u ON m.sender_id = u.id
-                WHERE m.conversation_id = %s
-                ORDER BY m.created_at ASC
+                WHERE m.conversation_id = %s {keyset}
+                ORDER BY m.created_at ASC, m.id ASC
                 LIMIT %s OFFSET %s
                 """,
-            (conversation_id, limit, offset),
+            (conversation_id, *keyset_params, limit, offset),
         )
         rows = await cur.fetchall()
 
@@ -256,7 +304,8 @@ async def get_messages(conversation_id: int, offset: int = 0, limit: int = 50) -
             }
         )
 
-    return messages, total_count
+    last_key = [rows[-1]["created_at"], rows[-1]["id"]] if rows else None
+    return messages, total_count, last_key
 
 
 async def mark_as_read(conversation_id: int, reader_id: int) -> int:
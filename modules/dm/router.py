@@ -33,9 +33,10 @@ async def get_conversations(
     request: Request,
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, max_length=512),
     current_user: User = Depends(require_verified_email),
 ):
-    return await dm_controller.get_conversations(current_user, request, offset, limit)
+    return await dm_controller.get_conversations(current_user, request, offset, limit, cursor)
 
 
 @router.get("/{conversation_id}")
@@ -44,9 +45,10 @@ async def get_messages(
     request: Request,
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(None, max_length=512),
     current_user: User = Depends(require_verified_email),
 ):
-    return await dm_controller.get_messages(conversation_id, current_user, request, offset, limit)
+    return await dm_controller.get_messages(conversation_id, current_user, request, offset, limit, cursor)
 
 
 @router.post("/{conversation_id}/messages", status_code=201)
@@ -4,6 +4,8 @@ import logging
 
 from pymysql import IntegrityError
 
+from core.config import settings
+from core.utils.count_strategy import count_signature, resolve_total_count
 from core.utils.error_codes import ErrorCode
 from core.utils.exceptions import bad_request_error, forbidden_error, not_found_error
 from core.utils.websocket_pusher import push_to_user
@@ -82,14 +84,28 @@ async def create_or_get_conversation(user_id: int, target_id: int, timestamp: st
     return conversation, created, other_user
 
 
-async def get_conversations(user_id: int, timestamp: str, offset: int = 0, limit: int = 20) -> tuple[list[dict], int]:
+async def get_conversations(
+    user_id: int,
+    timestamp: str,
+    offset: int = 0,
+    limit: int = 20,
+    cursor: list | None = None,
+) -> tuple[list[dict], int | None, bool, list | None]:
     """대화 목록을 조회합니다.
 
+    total_count는 COUNT_STRATEGY_DM 전략에 따라 계산하며, has_more 전략이면 None입니다.
+
     Returns:
-        (conversations, total_count) 튜플.
+        (conversations, total_count, has_more, last_key) 튜플.
     """
-    conversations, total_count = await dm_models.get_conversations(user_id, offset, limit)
-    return conversations, total_count
+    conversations, has_more, last_key = await dm_models.get_conversations(user_id, offset, limit, cursor=cursor)
+    total_count = await resolve_total_count(
+        settings.COUNT_STRATEGY_DM,
+        "dm_conversations",
+        count_signature(user_id=user_id),
+        lambda: dm_models.count_conversations(user_id),
+    )
+    return conversations, total_count, has_more, last_key
 
 
 async def get_messages(
@@ -98,13 +114,14 @@ async def get_messages(
     timestamp: str,
     offset: int = 0,
     limit: int = 50,
-) -> tuple[list[dict], dict, int, int]:
+    cursor: list | None = None,
+) -> tuple[list[dict], dict, int, int, list | None]:
     """메시지 목록을 조회하고 읽음 처리를 수행합니다.
 
     대화 존재 확인, 참여자 검증, 상대방 정보 조회, 읽음 처리 + WebSocket 푸시를 포함합니다.
 
     Returns:
-        (messages, other_user_dict, total_count, read_count) 튜플.
+        (messages, other_user_dict, total_count, read_count, last_key) 튜플.
     """
     conversation = await dm_models.get_conversation_by_id(conversation_id)
     if not conversation:
@@ -112,7 +129,7 @@ async def get_messages(
 
     _verify_participant(conversation, user_id, timestamp)
 
-    messages, total_count = await dm_models.get_messages(conversation_id, offset, limit)
+    messages, total_count, last_key = await dm_models.get_messages(conversation_id, offset, limit, cursor=cursor)
 
     # 상대방 정보
     other_user_id = get_other_user_id(conversation, user_id)
@@ -140,7 +157,7 @@ async def get_messages(
                 exc_info=True,
             )
 
-    return messages, other_user, total_count, read_count
+    return messages, other_user, total_count, read_count, last_key
 
 
 async def mark_read(conversation_id: int, user_id: int, timestamp: str) -> int:
@@ -294,6 +311,14 @@ async def delete_message_with_push(conversation_id: int, message_id: int, user_i
     if result.get("already_deleted"):
         raise bad_request_error(ErrorCode.ALREADY_DELETED, timestamp, "이미 삭제된 메시지입니다.")
 
+    # 배지 집계 카운터 되돌리기 (best-effort, 본인 메시지만 삭제 가능하므로 user_id가 발신자)
+    try:
+        from modules.reputation.service import ReputationService
+
+        await ReputationService.retract_counters(user_id, "dm_sent")
+    except Exception:
+        logger.warning("배지 카운터 회수 실패 (message_id=%d)", message_id, exc_info=True)
+
     # 상대방에게 WebSocket 푸시 (best-effort)
     other_user_id = get_other_user_id(conversation, user_id)
     try:
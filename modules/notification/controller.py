@@ -3,25 +3,53 @@
 from fastapi import Request
 from fastapi.responses import JSONResponse, Response
 
+from core.config import settings
 from core.dependencies.request_context import get_request_timestamp
+from core.utils.count_strategy import count_signature, resolve_total_count
 from core.utils.exceptions import not_found_error
+from core.utils.pagination import build_pagination, decode_cursor
 from modules.notification import models as notification_models
 from modules.user.models import User
 from schemas.common import create_response
 
 
-async def get_notifications(current_user: User, request: Request, offset: int = 0, limit: int = 20) -> dict:
-    """내 알림 목록을 조회합니다."""
+async def get_notifications(
+    current_user: User,
+    request: Request,
+    offset: int = 0,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> dict:
+    """내 알림 목록을 조회합니다. cursor가 주어지면 offset 대신 키셋으로 이어서 조회합니다."""
     timestamp = get_request_timestamp(request)
-    notifications, total_count = await notification_models.get_notifications(current_user.id, offset, limit)
-    # has_more: FE가 "더 보기" 버튼 렌더링 여부를 결정하기 위해 사용
-    has_more = offset + limit < total_count
+    columns = notification_models.NOTIFICATION_CURSOR_COLUMNS
+    cursor_values = decode_cursor(cursor, "notifications", len(columns), timestamp) if cursor else None
+    notifications, has_more, last_key = await notification_models.get_notifications(
+        current_user.id, offset, limit, cursor=cursor_values
+    )
+    total_count = await resolve_total_count(
+        settings.COUNT_STRATEGY_NOTIFICATIONS,
+        "notifications",
+        count_signature(user_id=current_user.id),
+        lambda: notification_models.count_notifications(current_user.id),
+    )
+    # has_more: FE가 "더 보기" 버튼 렌더링 여부를 결정하기 위해 사용 — limit+1 조회로 COUNT 없이 판단
+    pagination = build_pagination(
+        "notifications",
+        total_count=total_count,
+        offset=offset,
+        limit=limit,
+        page_size=len(notifications),
+        last_key=last_key,
+        cursor_mode=cursor_values is not None,
+        has_more=has_more,
+    )
     return create_response(
         "NOTIFICATIONS_LOADED",
         "알림 목록을 조회했습니다.",
         data={
             "notifications": notifications,
-            "pagination": {"total_count": total_count, "has_more": has_more},
+            "pagination": pagination,
         },
         timestamp=timestamp,
     )
@@ -54,27 +54,12 @@ async def get_top_posts(lookback_days: int, limit: int = 5) -> list[dict]:
             SELECT
                 p.id,
                 p.title,
-                COALESCE(lk.cnt, 0) AS likes,
-                COALESCE(cm.cnt, 0) AS comments,
-                (COALESCE(lk.cnt, 0) * 3
-                 + COALESCE(cm.cnt, 0) * 2
-                 + p.views * 0.5)
-                / POW(TIMESTAMPDIFF(HOUR, p.created_at, NOW()) + 2, 1.5) AS hot_score
+                p.likes_count AS likes,
+                p.comments_count AS comments
             FROM post p
-            LEFT JOIN (
-                SELECT post_id, COUNT(*) AS cnt
-                FROM post_like
-                GROUP BY post_id
-            ) lk ON lk.post_id = p.id
-            LEFT JOIN (
-                SELECT post_id, COUNT(*) AS cnt
-                FROM comment
-                WHERE deleted_at IS NULL
-                GROUP BY post_id
-            ) cm ON cm.post_id = p.id
             WHERE p.deleted_at IS NULL
               AND p.created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-            ORDER BY hot_score DESC
+            ORDER BY p.hot_score DESC
             LIMIT %s
             """,
             (lookback_days, limit),
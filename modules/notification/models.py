@@ -5,10 +5,14 @@ from typing import Literal
 
 from core.database.connection import get_cursor, transactional
 from core.utils.formatters import format_datetime
+from core.utils.pagination import keyset_condition
 from schemas.common import build_author_dict
 
 logger = logging.getLogger(__name__)
 
+# 알림 목록 키셋 커서 구성 컬럼 (ORDER BY와 동일 순서, 모두 DESC)
+NOTIFICATION_CURSOR_COLUMNS = ("n.created_at", "n.id")
+
 NotificationType = Literal["comment", "like", "mention", "follow", "bookmark", "reply", "badge_earned", "level_up"]
 
 
@@ -100,17 +104,37 @@ async def create_notifications_bulk(
         )
 
 
-async def get_notifications(user_id: int, offset: int = 0, limit: int = 20) -> tuple[list[dict], int]:
-    """사용자의 알림 목록과 총 개수를 반환합니다."""
+async def count_notifications(user_id: int) -> int:
+    """사용자의 알림 총 개수를 반환합니다."""
     async with get_cursor() as cur:
         await cur.execute(
             "SELECT COUNT(*) AS cnt FROM notification WHERE user_id = %s",
             (user_id,),
         )
-        total_count = (await cur.fetchone())["cnt"]
+        return (await cur.fetchone())["cnt"]
+
 
+async def get_notifications(
+    user_id: int,
+    offset: int = 0,
+    limit: int = 20,
+    cursor: list | None = None,
+) -> tuple[list[dict], bool, list | None]:
+    """사용자의 알림 목록과 다음 페이지 존재 여부, 마지막 행의 커서 키를 반환합니다.
+
+    limit+1개를 조회해 COUNT 없이 다음 페이지 존재 여부를 판단합니다.
+    cursor([created_at, id])가 주어지면 offset 대신 키셋 조건으로 이어서 조회합니다.
+    """
+    keyset = ""
+    keyset_params: list = []
+    if cursor is not None:
+        condition, keyset_params = keyset_condition(NOTIFICATION_CURSOR_COLUMNS, cursor)
+        keyset = f"AND {condition}"
+        offset = 0
+
+    async with get_cursor() as cur:
         await cur.execute(
-            """
+            f"""
                 SELECT n.id AS notification_id, n.type, n.post_id, n.comment_id,
                        n.is_read, n.created_at,
                        u.id AS actor_id, u.nickname AS actor_nickname,
@@ -119,14 +143,17 @@ async def get_notifications(user_id: int, offset: int = 0, limit: int = 20) -> t
                 FROM notification n
                 LEFT JOIN user u ON n.actor_id = u.id
                 LEFT JOIN post p ON n.post_id = p.id
-                WHERE n.user_id = %s
-                ORDER BY n.created_at DESC
+                WHERE n.user_id = %s {keyset}
+                ORDER BY n.created_at DESC, n.id DESC
                 LIMIT %s OFFSET %s
                 """,
-            (user_id, limit, offset),
+            (user_id, *keyset_params, limit + 1, offset),
         )
         rows = await cur.fetchall()
 
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
     notifications = []
     for row in rows:
         notifications.append(
@@ -147,7 +174,8 @@ async def get_notifications(user_id: int, offset: int = 0, limit: int = 20) -> t
             }
         )
 
-    return notifications, total_count
+    last_key = [rows[-1]["created_at"], rows[-1]["notification_id"]] if rows else None
+    return notifications, has_more, last_key
 
 
 async def get_unread_count_with_latest(user_id: int) -> dict:
@@ -35,9 +35,10 @@ async def get_notifications(
     request: Request,
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, max_length=512),
     current_user: User = Depends(get_current_user),
 ):
-    return await notification_controller.get_notifications(current_user, request, offset, limit)
+    return await notification_controller.get_notifications(current_user, request, offset, limit, cursor)
 
 
 @router.get("/unread-count")
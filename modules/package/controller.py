@@ -1,10 +1,13 @@
 """package_controller: 패키지 관련 컨트롤러."""
 
-from fastapi import HTTPException, Request, status
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
 from pymysql.err import IntegrityError
 
 from core.dependencies.request_context import get_request_timestamp
+from core.utils.conditional_get import compute_etag, is_not_modified, not_modified_response, with_etag
 from core.utils.pagination import validate_pagination
+from core.utils.response_cache import package_namespace
 from modules.package.models import ALLOWED_SORT_OPTIONS
 from modules.package.review_models import ALLOWED_REVIEW_SORT_OPTIONS
 from modules.package.schemas import (
@@ -62,18 +65,26 @@ async def get_packages(
 async def get_package(
     package_id: int,
     request: Request,
-) -> dict:
-    """패키지 상세 정보를 조회합니다."""
+) -> dict | JSONResponse | Response:
+    """패키지 상세 정보를 조회합니다.
+
+    If-None-Match가 패키지 버전(수정/리뷰 작성·삭제 시 증가)으로 만든 ETag와 같으면 조회 없이 304를 반환합니다.
+    """
     timestamp = get_request_timestamp(request)
 
+    etag = await compute_etag((package_namespace(package_id),))
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified_response(etag)
+
     result = await PackageService.get_package(package_id, timestamp)
 
-    return create_response(
+    body = create_response(
         "PACKAGE_RETRIEVED",
         "패키지 조회에 성공했습니다.",
         data=result,
         timestamp=timestamp,
     )
+    return with_etag(body, etag)
 
 
 async def create_package(
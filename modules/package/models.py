@@ -17,6 +17,8 @@ ALLOWED_SORT_OPTIONS = {
     "name": "p.name ASC",
     "rating": "avg_rating DESC, p.created_at DESC",
     "reviews": "reviews_count DESC, p.created_at DESC",
+    # 검색 색인 관련도 순 — search_ids가 주어지면 FIELD()로 색인 순위를 따르고, 없으면 최신순
+    "relevance": "p.created_at DESC",
 }
 
 ALLOWED_PACKAGE_COLUMNS = {
@@ -93,8 +95,12 @@ async def get_packages_with_stats(
     sort: str = "latest",
     category: str | None = None,
     search: str | None = None,
+    search_ids: list[int] | None = None,
 ) -> list[dict]:
-    """패키지 목록을 평균 평점 및 리뷰 수와 함께 조회합니다."""
+    """패키지 목록을 평균 평점 및 리뷰 수와 함께 조회합니다.
+
+    search_ids(검색 색인이 관련도 순으로 찾은 ID)가 주어지면 search LIKE 대신 PK 목록으로 제한합니다.
+    """
     sort_clause = ALLOWED_SORT_OPTIONS.get(sort, ALLOWED_SORT_OPTIONS["latest"])
 
     where = "1=1"
@@ -104,12 +110,22 @@ async def get_packages_with_stats(
         where += " AND p.category = %s"
         params.append(category)
 
-    if search:
+    order_params: list = []
+    if search_ids is not None:
+        if not search_ids:
+            return []
+        placeholders = ", ".join(["%s"] * len(search_ids))
+        where += f" AND p.id IN ({placeholders})"
+        params.extend(search_ids)
+        if sort == "relevance":
+            sort_clause = f"FIELD(p.id, {placeholders})"
+            order_params = list(search_ids)
+    elif search:
         where += " AND (p.name LIKE %s OR p.display_name LIKE %s OR p.description LIKE %s)"
         like_pattern = f"%{escape_like(search)}%"
         params.extend([like_pattern, like_pattern, like_pattern])
 
-    params.extend([limit, offset])
+    params.extend([*order_params, limit, offset])
 
     async with get_cursor() as cur:
         await cur.execute(
@@ -155,8 +171,12 @@ async def get_packages_with_stats(
         ]
 
 
-async def get_packages_count(category: str | None = None, search: str | None = None) -> int:
-    """패키지 총 개수를 반환합니다."""
+async def get_packages_count(
+    category: str | None = None,
+    search: str | None = None,
+    search_ids: list[int] | None = None,
+) -> int:
+    """패키지 총 개수를 반환합니다. search_ids가 주어지면 search 대신 PK 목록으로 제한합니다."""
     where = "1=1"
     params: list = []
 
@@ -164,7 +184,13 @@ async def get_packages_count(category: str | None = None, search: str | None = N
         where += " AND category = %s"
         params.append(category)
 
-    if search:
+    if search_ids is not None:
+        if not search_ids:
+            return 0
+        placeholders = ", ".join(["%s"] * len(search_ids))
+        where += f" AND id IN ({placeholders})"
+        params.extend(search_ids)
+    elif search:
         where += " AND (name LIKE %s OR display_name LIKE %s OR description LIKE %s)"
         like_pattern = f"%{escape_like(search)}%"
         params.extend([like_pattern, like_pattern, like_pattern])
@@ -175,6 +201,23 @@ async def get_packages_count(category: str | None = None, search: str | None = N
         return row["cnt"] if row else 0
 
 
+async def get_search_documents(ids: list[int] | None = None, after_id: int = 0, limit: int = 500) -> list[dict]:
+    """검색 색인용 (id, title, body) 행을 반환합니다. 제목은 이름 + 표시 이름, 본문은 설명.
+
+    ids가 주어지면 해당 패키지만, 아니면 after_id 이후를 id 순으로 limit개 반환합니다 (전체 재색인).
+    """
+    columns = "id, CONCAT_WS(' ', name, display_name) AS title, description AS body"
+    async with get_cursor() as cur:
+        if ids is not None:
+            if not ids:
+                return []
+            placeholders = ", ".join(["%s"] * len(ids))
+            await cur.execute(f"SELECT {columns} FROM package WHERE id IN ({placeholders})", ids)
+        else:
+            await cur.execute(f"SELECT {columns} FROM package WHERE id > %s ORDER BY id LIMIT %s", (after_id, limit))
+        return list(await cur.fetchall())
+
+
 async def update_package(package_id: int, **kwargs: str | None) -> bool:
     """패키지 정보를 수정합니다."""
     updates: list[str] = []
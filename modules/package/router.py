@@ -1,6 +1,6 @@
 """package_router: 패키지 관련 라우터 모듈."""
 
-from fastapi import APIRouter, Depends, Path, Query, Request, status
+from fastapi import APIRouter, Depends, Path, Query, Request, Response, status
 
 from core.dependencies.auth import get_optional_user, require_verified_email
 from modules.package import controller as package_controller
@@ -24,7 +24,7 @@ async def get_packages(
     request: Request,
     offset: int = Query(0, ge=0, description="시작 위치 (0부터 시작)"),
     limit: int = Query(10, ge=1, le=100, description="조회할 패키지 수"),
-    sort: str = Query("latest", description="정렬: latest, name, rating, reviews"),
+    sort: str = Query("latest", description="정렬: latest, name, rating, reviews, relevance(검색 시)"),
     category: str | None = Query(None, description="카테고리 필터"),
     search: str | None = Query(None, max_length=100, description="검색어 (패키지명/설명)"),
     _current_user: User | None = Depends(get_optional_user),
@@ -52,12 +52,12 @@ async def get_packages(
     )
 
 
-@package_router.get("/{package_id}", status_code=status.HTTP_200_OK)
+@package_router.get("/{package_id}", status_code=status.HTTP_200_OK, response_model=None)
 async def get_package(
     request: Request,
     package_id: int = Path(ge=1, description="패키지 ID"),
     _current_user: User | None = Depends(get_optional_user),
-) -> dict:
+) -> dict | Response:
     """패키지 상세 정보를 조회합니다.
 
     Args:
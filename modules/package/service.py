@@ -2,8 +2,10 @@
 
 import logging
 
+from core.search import query_index, queue_reindex, search_snippets
 from core.utils.exceptions import bad_request_error, forbidden_error, not_found_error
 from core.utils.formatters import format_datetime
+from core.utils.response_cache import invalidate, package_namespace
 from modules.package import models as package_models
 from modules.package import review_models as package_review_models
 from modules.package.schemas import (
@@ -32,26 +34,41 @@ class PackageService:
         Args:
             offset: 시작 위치.
             limit: 조회할 개수.
-            sort: 정렬 옵션.
+            sort: 정렬 옵션 (relevance는 검색 색인 관련도 순, 색인 미사용 시 최신순).
             category: 카테고리 필터.
             search: 검색어.
 
         Returns:
             패키지 목록과 페이지네이션 정보.
         """
+        # 전문 검색: 색인이 관련도 순 ID를 찾으면 LIKE 대신 PK 목록으로 제한
+        search_ids: list[int] | None = None
+        if search:
+            search_result = await query_index("package", search)
+            if search_result is not None:
+                search_ids = search_result.ids
+
         packages = await package_models.get_packages_with_stats(
             offset=offset,
             limit=limit,
             sort=sort,
             category=category,
             search=search,
+            search_ids=search_ids,
         )
         total_count = await package_models.get_packages_count(
             category=category,
             search=search,
+            search_ids=search_ids,
         )
         has_more = offset + limit < total_count
 
+        # 검색어 하이라이트 스니펫 (색인 검색일 때만)
+        if search and search_ids is not None:
+            snippets = await search_snippets("package", [p["package_id"] for p in packages], search)
+            for package in packages:
+                package["snippet"] = snippets.get(package["package_id"])
+
         return {
             "packages": packages,
             "pagination": {
@@ -119,7 +136,7 @@ class PackageService:
                 "이미 등록된 패키지 이름입니다.",
             )
 
-        return await package_models.create_package(
+        package_id = await package_models.create_package(
             name=data.name,
             display_name=data.display_name,
             description=data.description,
@@ -128,6 +145,8 @@ class PackageService:
             package_manager=data.package_manager,
             created_by=user_id,
         )
+        await queue_reindex("package", package_id)
+        return package_id
 
     @staticmethod
     async def update_package(
@@ -170,6 +189,8 @@ class PackageService:
             )
 
         await package_models.update_package(package_id, **update_fields)
+        await queue_reindex("package", package_id)
+        await invalidate(package_namespace(package_id))
 
         # 수정된 패키지 다시 조회
         updated = await package_models.get_package_by_id(package_id)
@@ -218,6 +239,8 @@ class PackageService:
             title=data.title,
             content=data.content,
         )
+        # 상세의 reviews_count 변경
+        await invalidate(package_namespace(package_id))
 
         # 평판 포인트 부여 (best-effort)
         try:
@@ -361,4 +384,14 @@ class PackageService:
                 "리뷰 작성자 또는 관리자만 삭제할 수 있습니다.",
             )
 
-        await package_review_models.delete_review(review_id)
+        deleted = await package_review_models.delete_review(review_id)
+        await invalidate(package_namespace(package_id))
+
+        # 배지 집계 카운터 되돌리기 (best-effort)
+        if deleted:
+            try:
+                from modules.reputation.service import ReputationService
+
+                await ReputationService.retract_counters(review["author"]["user_id"], "package_review_created")
+            except Exception:
+                logger.warning("배지 카운터 회수 실패 (delete_review)", exc_info=True)
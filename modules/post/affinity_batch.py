@@ -0,0 +1,207 @@
+"""affinity_batch: 추천 피드 점수 일괄 계산 엔진 (NumPy/SciPy).
+
+affinity_scorer.profile_from_weights + rank_candidates를 사용자 청크 x 후보 게시글 행렬 연산으로 계산합니다.
+DB/HTTP 의존성 없음. numpy/scipy는 k8s extra의 선택 의존성이므로 feed_service에서 지연 import합니다.
+
+결과는 기준 구현과 비트 단위로 같아야 하므로 부동소수 연산 순서를 그대로 따릅니다.
+- 프로필: 원시 가중치 희소 행렬을 행 최댓값으로 나눔 (역수 곱 아님)
+- 태그 점수: 희소 행렬 곱 대신 게시글 태그 순서대로 열을 모아 더함 (sum() 순서와 동일)
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import scipy.sparse as sp
+
+from modules.post.affinity_models import AffinityWeights
+from modules.post.affinity_scorer import AUTHOR_COEFF, CATEGORY_COEFF, TAG_COEFF
+
+
+@dataclass
+class CandidateMatrix:
+    """후보 게시글을 열 인덱스 배열로 변환한 결과 (배치 실행당 1회 생성).
+
+    Attributes:
+        post_ids: 후보 게시글 ID (후보 순서 유지).
+        hot_scores: 게시글별 hot_score.
+        author_ids: 게시글별 작성자 ID (없으면 -1).
+        tag_vocab / category_vocab / author_vocab: 후보에 등장하는 키 → 열 번호.
+        tag_columns: (게시글 수, 최대 태그 수) 태그 열 번호. 빈 칸은 0 열(len(tag_vocab))을 가리킴.
+        tag_counts: 게시글별 태그 수.
+        category_columns / author_columns: 게시글별 열 번호. 없으면 0 열.
+    """
+
+    post_ids: list[int]
+    hot_scores: np.ndarray
+    author_ids: np.ndarray
+    tag_vocab: dict[int, int]
+    category_vocab: dict[int, int]
+    author_vocab: dict[int, int]
+    tag_columns: np.ndarray
+    tag_counts: np.ndarray
+    category_columns: np.ndarray
+    author_columns: np.ndarray
+
+
+def _vocab(keys) -> dict[int, int]:
+    vocab: dict[int, int] = {}
+    for key in keys:
+        if key is not None and key not in vocab:
+            vocab[key] = len(vocab)
+    return vocab
+
+
+def prepare_candidates(candidates: list[dict]) -> CandidateMatrix:
+    """affinity_models.get_candidate_posts_meta() 결과를 행렬 연산용 인덱스로 변환합니다."""
+    tag_vocab = _vocab(tid for post in candidates for tid in post["tag_ids"])
+    category_vocab = _vocab(post["category_id"] for post in candidates)
+    author_vocab = _vocab(post["author_id"] for post in candidates)
+
+    max_tags = max((len(post["tag_ids"]) for post in candidates), default=0)
+    tag_columns = np.full((len(candidates), max_tags), len(tag_vocab), dtype=np.int64)
+    for i, post in enumerate(candidates):
+        for k, tid in enumerate(post["tag_ids"]):
+            tag_columns[i, k] = tag_vocab[tid]
+
+    def _column(vocab: dict[int, int], key: int | None) -> int:
+        return vocab[key] if key is not None else len(vocab)
+
+    return CandidateMatrix(
+        post_ids=[post["post_id"] for post in candidates],
+        hot_scores=np.array([post["hot_score"] for post in candidates], dtype=np.float64),
+        author_ids=np.array(
+            [post["author_id"] if post["author_id"] is not None else -1 for post in candidates], dtype=np.int64
+        ),
+        tag_vocab=tag_vocab,
+        category_vocab=category_vocab,
+        author_vocab=author_vocab,
+        tag_columns=tag_columns,
+        tag_counts=np.array([len(post["tag_ids"]) for post in candidates], dtype=np.int64),
+        category_columns=np.array(
+            [_column(category_vocab, post["category_id"]) for post in candidates], dtype=np.int64
+        ),
+        author_columns=np.array([_column(author_vocab, post["author_id"]) for post in candidates], dtype=np.int64),
+    )
+
+
+def _normalized_profile(
+    weights: list[AffinityWeights],
+    attr: str,
+    candidate_vocab: dict[int, int],
+) -> np.ndarray:
+    """원시 가중치를 행 최댓값으로 정규화한 뒤 후보 키 열만 남긴 밀집 행렬을 반환합니다.
+
+    반환 행렬의 마지막 열은 0 열로, 후보에 키가 없는 게시글(태그 빈 칸, 카테고리/작성자 없음)이 가리킵니다.
+    """
+    vocab = _vocab(key for user_weights in weights for key in getattr(user_weights, attr))
+    rows: list[int] = []
+    cols: list[int] = []
+    data: list[float] = []
+    for row, user_weights in enumerate(weights):
+        for key, value in getattr(user_weights, attr).items():
+            rows.append(row)
+            cols.append(vocab[key])
+            data.append(value)
+    raw = sp.csr_matrix((np.array(data, dtype=np.float64), (rows, cols)), shape=(len(weights), len(vocab)))
+
+    # 행 최댓값으로 나눔 (_max_normalize와 같이 나눗셈 사용, 최댓값이 0 이하인 행은 빈 프로필)
+    if raw.nnz:
+        row_max = np.repeat(raw.max(axis=1).toarray().ravel(), np.diff(raw.indptr))
+        positive = row_max > 0
+        raw.data = np.divide(raw.data, row_max, out=np.zeros_like(raw.data), where=positive)
+
+    # 후보 키 → 전체 키 열 매핑 (사용자 가중치에 없는 후보 키와 0 열은 빈 열)
+    dense = np.zeros((len(weights), len(candidate_vocab) + 1), dtype=np.float64)
+    pairs = [(col, vocab[key]) for key, col in candidate_vocab.items() if key in vocab]
+    if pairs and raw.nnz:
+        target_cols, source_cols = zip(*pairs, strict=True)
+        dense[:, list(target_cols)] = raw[:, list(source_cols)].toarray()
+    return dense
+
+
+def rank_users_batch(
+    user_ids: list[int],
+    weights: dict[int, AffinityWeights],
+    candidates: CandidateMatrix,
+    limit: int,
+) -> dict[int, list[dict]]:
+    """여러 사용자의 후보 점수를 한 번에 계산하고 사용자별 상위 limit개를 반환합니다.
+
+    결과는 사용자마다 affinity_scorer.rank_candidates(user_id, profile_from_weights(weights), ...)와 같습니다.
+    weights에 없는 사용자는 빈 프로필로 취급합니다.
+
+    Returns:
+        {user_id: [{post_id, affinity_score, hot_score, combined_score}]}.
+    """
+    user_weights = [weights.get(user_id) or AffinityWeights() for user_id in user_ids]
+    tag_weights = _normalized_profile(user_weights, "tags", candidates.tag_vocab)
+    category_weights = _normalized_profile(user_weights, "categories", candidates.category_vocab)
+    author_weights = _normalized_profile(user_weights, "authors", candidates.author_vocab)
+
+    # 태그 점수: 게시글 태그 순서대로 더한 뒤 태그 수로 나눔
+    n_posts = len(candidates.post_ids)
+    tag_sum = np.zeros((len(user_ids), n_posts), dtype=np.float64)
+    for k in range(candidates.tag_columns.shape[1]):
+        tag_sum += tag_weights[:, candidates.tag_columns[:, k]]
+    has_tags = candidates.tag_counts > 0
+    tag_score = np.zeros_like(tag_sum)
+    tag_score[:, has_tags] = tag_sum[:, has_tags] / candidates.tag_counts[has_tags]
+
+    category_score = category_weights[:, candidates.category_columns]
+    author_score = author_weights[:, candidates.author_columns]
+
+    affinity = tag_score * TAG_COEFF + category_score * CATEGORY_COEFF + author_score * AUTHOR_COEFF
+    np.clip(affinity, 0.0, 1.0, out=affinity)
+    # 자기 게시글 제외
+    affinity[np.asarray(user_ids, dtype=np.int64)[:, None] == candidates.author_ids[None, :]] = 0.0
+
+    return {user_id: _top_rows(affinity[row], candidates, limit) for row, user_id in enumerate(user_ids)}
+
+
+def _top_rows(affinity: np.ndarray, candidates: CandidateMatrix, limit: int) -> list[dict]:
+    """한 사용자 행에서 상위 limit개 행을 rank_candidates와 같은 반올림/정렬 규칙으로 뽑습니다."""
+    indices = np.flatnonzero(affinity > 0.0)
+    if indices.size == 0:
+        return []
+    combined = affinity[indices] * candidates.hot_scores[indices]
+
+    # 반올림 전 점수 내림차순(동점은 후보 순서)으로 자른 뒤, 반올림 후 동점인 경계 항목까지 포함
+    order = indices[np.lexsort((indices, -combined))]
+    cut = min(limit, order.size)
+    if cut < order.size:
+        boundary = round(float(affinity[order[cut - 1]] * candidates.hot_scores[order[cut - 1]]), 6)
+        while cut < order.size and (
+            round(float(affinity[order[cut]] * candidates.hot_scores[order[cut]]), 6) == boundary
+        ):
+            cut += 1
+
+    rows = [
+        {
+            "post_id": candidates.post_ids[i],
+            "affinity_score": round(float(affinity[i]), 6),
+            "hot_score": round(float(candidates.hot_scores[i]), 6),
+            "combined_score": round(float(affinity[i] * candidates.hot_scores[i]), 6),
+        }
+        for i in sorted(order[:cut].tolist())
+    ]
+    rows.sort(key=lambda r: r["combined_score"], reverse=True)
+    return rows[:limit]
+
+
+# ============ 프로세스 풀 워커 ============
+
+# 워커 프로세스마다 1회 생성하는 후보 행렬 (청크마다 후보 전체를 직렬화해 보내지 않도록)
+_worker_candidates: CandidateMatrix | None = None
+
+
+def init_worker(candidates: list[dict]) -> None:
+    """ProcessPoolExecutor initializer: 워커 프로세스에 후보 행렬을 준비합니다."""
+    global _worker_candidates
+    _worker_candidates = prepare_candidates(candidates)
+
+
+def rank_users_in_worker(user_ids: list[int], weights: dict[int, AffinityWeights], limit: int) -> dict[int, list[dict]]:
+    """init_worker()로 준비한 후보 행렬로 rank_users_batch()를 실행합니다 (워커 프로세스 전용)."""
+    if _worker_candidates is None:
+        raise RuntimeError("init_worker()가 호출되지 않은 프로세스입니다.")
+    return rank_users_batch(user_ids, weights, _worker_candidates, limit)
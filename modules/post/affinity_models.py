@@ -3,7 +3,9 @@
 from dataclasses import dataclass, field
 
 from core.database.connection import get_cursor, transactional
-from modules.post.post_models import hot_score_sql
+
+# 친화도 가중치 종류 (user_affinity_weight.kind) → AffinityWeights 필드
+WEIGHT_KINDS = {"tag": "tags", "category": "categories", "author": "authors"}
 
 
 @dataclass
@@ -19,110 +21,134 @@ class UserSignals:
     bookmarked_author_counts: dict[int, int] = field(default_factory=dict)
 
 
-async def get_user_signals(user_id: int, lookback_days: int = 30) -> UserSignals:
-    """사용자의 최근 상호작용 신호를 수집합니다."""
-    signals = UserSignals()
-    async with get_cursor() as cur:
-        # 1. 좋아요한 게시글의 태그
-        await cur.execute(
-            """
-                SELECT pt.tag_id, COUNT(*) AS cnt
-                FROM post_like pl
-                INNER JOIN post_tag pt ON pl.post_id = pt.post_id
-                WHERE pl.user_id = %s AND pl.created_at > NOW() - INTERVAL %s DAY
-                GROUP BY pt.tag_id
-                """,
-            (user_id, lookback_days),
-        )
-        for row in await cur.fetchall():
-            signals.liked_tag_counts[row["tag_id"]] = row["cnt"]
+@dataclass
+class AffinityWeights:
+    """사용자 친화도 원시 가중치 (신호 가중합, 정규화 전, 시간 감쇠 반영)."""
 
-        # 2. 북마크한 게시글의 태그
-        await cur.execute(
-            """
-                SELECT pt.tag_id, COUNT(*) AS cnt
-                FROM post_bookmark pb
-                INNER JOIN post_tag pt ON pb.post_id = pt.post_id
-                WHERE pb.user_id = %s AND pb.created_at > NOW() - INTERVAL %s DAY
-                GROUP BY pt.tag_id
-                """,
-            (user_id, lookback_days),
-        )
-        for row in await cur.fetchall():
-            signals.bookmarked_tag_counts[row["tag_id"]] = row["cnt"]
+    tags: dict[int, float] = field(default_factory=dict)
+    categories: dict[int, float] = field(default_factory=dict)
+    authors: dict[int, float] = field(default_factory=dict)
 
-        # 3. 댓글 단 게시글의 태그
-        await cur.execute(
-            """
-                SELECT pt.tag_id, COUNT(*) AS cnt
-                FROM comment c
-                INNER JOIN post_tag pt ON c.post_id = pt.post_id
-                WHERE c.author_id = %s AND c.deleted_at IS NULL
-                  AND c.created_at > NOW() - INTERVAL %s DAY
-                GROUP BY pt.tag_id
-                """,
-            (user_id, lookback_days),
-        )
-        for row in await cur.fetchall():
-            signals.commented_tag_counts[row["tag_id"]] = row["cnt"]
 
-        # 4. 조회한 게시글의 카테고리
-        await cur.execute(
-            """
-                SELECT p.category_id, COUNT(*) AS cnt
-                FROM post_view_log pvl
-                INNER JOIN post p ON pvl.post_id = p.id AND p.deleted_at IS NULL
-                WHERE pvl.user_id = %s AND p.category_id IS NOT NULL
-                  AND pvl.created_at > NOW() - INTERVAL %s DAY
-                GROUP BY p.category_id
-                """,
-            (user_id, lookback_days),
-        )
-        for row in await cur.fetchall():
-            signals.viewed_category_counts[row["category_id"]] = row["cnt"]
+# 사용자 청크 단위 일괄 신호 쿼리: (UserSignals 필드명, 키 컬럼, SQL)
+# 각 쿼리는 user_id IN (...) 자리에 {users}, lookback_days 자리에 %s 하나를 가짐
+_BULK_SIGNAL_QUERIES: tuple[tuple[str, str, str], ...] = (
+    (
+        "liked_tag_counts",
+        "tag_id",
+        """
+        SELECT pl.user_id, pt.tag_id, COUNT(*) AS cnt
+        FROM post_like pl
+        INNER JOIN post_tag pt ON pl.post_id = pt.post_id
+        WHERE pl.user_id IN ({users}) AND pl.created_at > NOW() - INTERVAL %s DAY
+        GROUP BY pl.user_id, pt.tag_id
+        """,
+    ),
+    (
+        "bookmarked_tag_counts",
+        "tag_id",
+        """
+        SELECT pb.user_id, pt.tag_id, COUNT(*) AS cnt
+        FROM post_bookmark pb
+        INNER JOIN post_tag pt ON pb.post_id = pt.post_id
+        WHERE pb.user_id IN ({users}) AND pb.created_at > NOW() - INTERVAL %s DAY
+        GROUP BY pb.user_id, pt.tag_id
+        """,
+    ),
+    (
+        "commented_tag_counts",
+        "tag_id",
+        """
+        SELECT c.author_id AS user_id, pt.tag_id, COUNT(*) AS cnt
+        FROM comment c
+        INNER JOIN post_tag pt ON c.post_id = pt.post_id
+        WHERE c.author_id IN ({users}) AND c.deleted_at IS NULL
+          AND c.created_at > NOW() - INTERVAL %s DAY
+        GROUP BY c.author_id, pt.tag_id
+        """,
+    ),
+    (
+        "viewed_category_counts",
+        "category_id",
+        """
+        SELECT pvl.user_id, p.category_id, COUNT(*) AS cnt
+        FROM post_view_log pvl
+        INNER JOIN post p ON pvl.post_id = p.id AND p.deleted_at IS NULL
+        WHERE pvl.user_id IN ({users}) AND p.category_id IS NOT NULL
+          AND pvl.created_at > NOW() - INTERVAL %s DAY
+        GROUP BY pvl.user_id, p.category_id
+        """,
+    ),
+    (
+        "liked_author_counts",
+        "author_id",
+        """
+        SELECT pl.user_id, p.author_id, COUNT(*) AS cnt
+        FROM post_like pl
+        INNER JOIN post p ON pl.post_id = p.id
+        WHERE pl.user_id IN ({users}) AND p.author_id IS NOT NULL
+          AND pl.created_at > NOW() - INTERVAL %s DAY
+        GROUP BY pl.user_id, p.author_id
+        """,
+    ),
+    (
+        "bookmarked_author_counts",
+        "author_id",
+        """
+        SELECT pb.user_id, p.author_id, COUNT(*) AS cnt
+        FROM post_bookmark pb
+        INNER JOIN post p ON pb.post_id = p.id
+        WHERE pb.user_id IN ({users}) AND p.author_id IS NOT NULL
+          AND pb.created_at > NOW() - INTERVAL %s DAY
+        GROUP BY pb.user_id, p.author_id
+        """,
+    ),
+)
 
-        # 5. 팔로우한 작성자
-        await cur.execute(
-            "SELECT following_id FROM user_follow WHERE follower_id = %s",
-            (user_id,),
-        )
-        signals.followed_author_ids = {row["following_id"] for row in await cur.fetchall()}
 
-        # 6. 좋아요한 게시글의 작성자
-        await cur.execute(
-            """
-                SELECT p.author_id, COUNT(*) AS cnt
-                FROM post_like pl
-                INNER JOIN post p ON pl.post_id = p.id
-                WHERE pl.user_id = %s AND p.author_id IS NOT NULL
-                  AND pl.created_at > NOW() - INTERVAL %s DAY
-                GROUP BY p.author_id
-                """,
-            (user_id, lookback_days),
-        )
-        for row in await cur.fetchall():
-            signals.liked_author_counts[row["author_id"]] = row["cnt"]
+async def get_users_signals(user_ids: list[int], lookback_days: int = 30) -> dict[int, UserSignals]:
+    """여러 사용자의 최근 상호작용 신호를 일괄 수집합니다.
+
+    사용자 수와 무관하게 7개 쿼리로 조회합니다 (user_id로 GROUP BY).
+    저장된 친화도 가중치가 없는 사용자의 초기값(cold start)을 만들 때만 사용합니다.
+
+    Returns:
+        {user_id: UserSignals}. 신호가 없는 사용자도 빈 UserSignals로 포함.
+    """
+    result = {user_id: UserSignals() for user_id in user_ids}
+    if not user_ids:
+        return result
+
+    users = ", ".join(["%s"] * len(user_ids))
+    async with get_cursor() as cur:
+        for field_name, key_column, sql in _BULK_SIGNAL_QUERIES:
+            await cur.execute(sql.format(users=users), [*user_ids, lookback_days])
+            for row in await cur.fetchall():
+                getattr(result[row["user_id"]], field_name)[row[key_column]] = row["cnt"]
 
-        # 7. 북마크한 게시글의 작성자
         await cur.execute(
-            """
-                SELECT p.author_id, COUNT(*) AS cnt
-                FROM post_bookmark pb
-                INNER JOIN post p ON pb.post_id = p.id
-                WHERE pb.user_id = %s AND p.author_id IS NOT NULL
-                  AND pb.created_at > NOW() - INTERVAL %s DAY
-                GROUP BY p.author_id
-                """,
-            (user_id, lookback_days),
+            f"SELECT follower_id, following_id FROM user_follow WHERE follower_id IN ({users})",
+            user_ids,
         )
         for row in await cur.fetchall():
-            signals.bookmarked_author_counts[row["author_id"]] = row["cnt"]
+            result[row["follower_id"]].followed_author_ids.add(row["following_id"])
+
+    return result
 
-    return signals
 
+async def get_active_user_ids(
+    lookback_days: int = 30,
+    shard_count: int = 1,
+    shard_index: int = 0,
+    after_user_id: int = 0,
+) -> list[int]:
+    """최근 활동했거나 저장된 친화도 가중치가 있는 사용자 ID 목록을 오름차순으로 반환합니다.
 
-async def get_active_user_ids(lookback_days: int = 30) -> list[int]:
-    """최근 활동한 사용자 ID 목록을 반환합니다."""
+    Args:
+        lookback_days: 활동 조회 기간 (일).
+        shard_count / shard_index: user_id % shard_count == shard_index 인 사용자만 반환.
+        after_user_id: 이 ID보다 큰 사용자만 반환 (체크포인트 재개용).
+    """
     async with get_cursor() as cur:
         await cur.execute(
             """
@@ -139,9 +165,13 @@ async def get_active_user_ids(lookback_days: int = 30) -> list[int]:
                     SELECT author_id AS user_id FROM comment
                     WHERE deleted_at IS NULL
                       AND created_at > NOW() - INTERVAL %s DAY
+                    UNION
+                    SELECT DISTINCT user_id FROM user_affinity_weight
                 ) active_users
+                WHERE user_id %% %s = %s AND user_id > %s
+                ORDER BY user_id
                 """,
-            (lookback_days, lookback_days, lookback_days, lookback_days),
+            (lookback_days, lookback_days, lookback_days, lookback_days, shard_count, shard_index, after_user_id),
         )
         return [row["user_id"] for row in await cur.fetchall()]
 
@@ -150,21 +180,13 @@ async def get_candidate_posts_meta(max_age_days: int = 7) -> list[dict]:
     """추천 후보 게시글의 메타데이터를 벌크 조회합니다."""
     async with get_cursor() as cur:
         await cur.execute(
-            f"""
+            """
                 SELECT
                     p.id AS post_id,
                     p.category_id,
                     p.author_id,
-                    {hot_score_sql("lk", "cm")} AS hot_score
+                    p.hot_score
                 FROM post p
-                LEFT JOIN (
-                    SELECT post_id, COUNT(*) AS cnt
-                    FROM post_like GROUP BY post_id
-                ) lk ON p.id = lk.post_id
-                LEFT JOIN (
-                    SELECT post_id, COUNT(*) AS cnt
-                    FROM comment WHERE deleted_at IS NULL GROUP BY post_id
-                ) cm ON p.id = cm.post_id
                 WHERE p.deleted_at IS NULL
                   AND p.created_at > NOW() - INTERVAL %s DAY
                 """,
@@ -201,59 +223,283 @@ async def get_candidate_posts_meta(max_age_days: int = 7) -> list[dict]:
         return posts
 
 
-async def upsert_user_post_scores(user_id: int, rows: list[dict]) -> int:
-    """user_post_score 테이블에 점수를 배치 UPSERT합니다."""
-    if not rows:
-        return 0
+async def replace_user_post_scores(user_ids: list[int], rows: list[tuple[int, int, float, float, float]]) -> int:
+    """여러 사용자의 추천 점수를 한 트랜잭션에서 교체합니다 (배치 엔진용).
+
+    기존 점수 DELETE 1회 + 다중 행 INSERT 1회로, 사용자별 UPSERT + 오래된 점수 DELETE와 같은 결과를 만듭니다.
 
-    chunk_size = 500
-    total = 0
-    for i in range(0, len(rows), chunk_size):
-        chunk = rows[i : i + chunk_size]
-        values_sql = ", ".join(["(%s, %s, %s, %s, %s)"] * len(chunk))
-        params: list = []
-        for r in chunk:
-            params.extend([user_id, r["post_id"], r["affinity_score"], r["hot_score"], r["combined_score"]])
+    Args:
+        user_ids: 점수를 교체할 사용자 ID 목록 (rows가 없는 사용자는 점수가 모두 삭제됨).
+        rows: (user_id, post_id, affinity_score, hot_score, combined_score) 목록.
+
+    Returns:
+        저장된 점수 행 수.
+    """
+    if not user_ids:
+        return 0
 
-        async with transactional() as cur:
+    users = ", ".join(["%s"] * len(user_ids))
+    async with transactional() as cur:
+        await cur.execute(f"DELETE FROM user_post_score WHERE user_id IN ({users})", user_ids)
+        if rows:
+            values_sql = ", ".join(["(%s, %s, %s, %s, %s)"] * len(rows))
             await cur.execute(
                 f"""
                 INSERT INTO user_post_score
                     (user_id, post_id, affinity_score, hot_score, combined_score)
                 VALUES {values_sql}
+                """,
+                [value for row in rows for value in row],
+            )
+    return len(rows)
+
+
+async def user_has_scores(user_id: int) -> bool:
+    """사용자의 추천 점수가 존재하는지 확인합니다."""
+    async with get_cursor() as cur:
+        await cur.execute(
+            "SELECT 1 FROM user_post_score WHERE user_id = %s LIMIT 1",
+            (user_id,),
+        )
+        return await cur.fetchone() is not None
+
+
+# ============ 친화도 가중치 (user_affinity_weight) ============
+
+# 마지막 감쇠 시점(decayed_at) 이후 경과 시간만큼 반감기 감쇠를 적용한 현재 가중치. %s = 반감기(초)
+_DECAYED_WEIGHT_SQL = "weight * POW(0.5, TIMESTAMPDIFF(SECOND, decayed_at, NOW()) / %s)"
+
+# 이벤트 적용 기록 보관 기간 (시간) — 잡 재시도 백오프와 리스 만료 재전달을 충분히 덮는 기간
+_APPLIED_EVENT_RETENTION_HOURS = 24
+
+
+async def get_affinity_weights(user_ids: list[int], half_life_seconds: float) -> dict[int, AffinityWeights]:
+    """사용자들의 저장된 친화도 가중치를 현재 시각 기준 감쇠를 반영해 조회합니다.
+
+    Returns:
+        {user_id: AffinityWeights}. 저장된 가중치가 없는 사용자는 포함하지 않음.
+    """
+    if not user_ids:
+        return {}
+    users = ", ".join(["%s"] * len(user_ids))
+    async with get_cursor() as cur:
+        await cur.execute(
+            f"""
+            SELECT user_id, kind, key_id, {_DECAYED_WEIGHT_SQL} AS weight
+            FROM user_affinity_weight
+            WHERE user_id IN ({users})
+            ORDER BY user_id, kind, key_id
+            """,
+            [half_life_seconds, *user_ids],
+        )
+        result: dict[int, AffinityWeights] = {}
+        for row in await cur.fetchall():
+            weights = result.setdefault(row["user_id"], AffinityWeights())
+            getattr(weights, WEIGHT_KINDS[row["kind"]])[row["key_id"]] = row["weight"]
+        return result
+
+
+async def add_affinity_weights(
+    user_id: int,
+    deltas: list[tuple[str, int, float]],
+    half_life_seconds: float,
+    event_id: str | None = None,
+) -> bool:
+    """친화도 가중치를 증감합니다 (이벤트 단위 증분 갱신).
+
+    기존 값에 지금까지의 감쇠를 먼저 적용한 뒤 delta를 더하므로, 감쇠 배치 주기와 무관하게 정확합니다.
+    양수 delta는 없으면 새로 만들고, 음수 delta(좋아요/북마크 취소, 언팔로우)는 있는 값만 0 아래로 내려가지 않게 뺍니다.
+
+    Args:
+        deltas: (kind, key_id, delta) 목록. kind는 WEIGHT_KINDS의 키.
+        event_id: 이벤트 식별자. 주면 같은 트랜잭션에 적용 기록을 남기고, 이미 적용된 이벤트면 건너뜁니다.
+
+    Returns:
+        가중치를 갱신했으면 True, 이미 적용된 이벤트라 건너뛰었으면 False.
+    """
+    increments = [(kind, key_id, delta) for kind, key_id, delta in deltas if delta > 0]
+    decrements = [(kind, key_id, -delta) for kind, key_id, delta in deltas if delta < 0]
+    async with transactional() as cur:
+        if event_id is not None and not await _mark_event_applied(cur, event_id, user_id):
+            return False
+        if increments:
+            values_sql = ", ".join(["(%s, %s, %s, %s, NOW())"] * len(increments))
+            await cur.execute(
+                f"""
+                INSERT INTO user_affinity_weight (user_id, kind, key_id, weight, decayed_at)
+                VALUES {values_sql}
                 ON DUPLICATE KEY UPDATE
-                    affinity_score = VALUES(affinity_score),
-                    hot_score = VALUES(hot_score),
-                    combined_score = VALUES(combined_score)
+                    weight = {_DECAYED_WEIGHT_SQL} + VALUES(weight),
+                    decayed_at = NOW()
+                """,
+                [
+                    *(value for kind, key_id, delta in increments for value in (user_id, kind, key_id, delta)),
+                    half_life_seconds,
+                ],
+            )
+        for kind, key_id, amount in decrements:
+            await cur.execute(
+                f"""
+                UPDATE user_affinity_weight
+                SET weight = GREATEST(0, {_DECAYED_WEIGHT_SQL} - %s), decayed_at = NOW()
+                WHERE user_id = %s AND kind = %s AND key_id = %s
                 """,
-                params,
+                (half_life_seconds, amount, user_id, kind, key_id),
             )
-            total += cur.rowcount
+    return True
 
-    return total
 
+async def _mark_event_applied(cur, event_id: str, user_id: int) -> bool:
+    """이벤트 적용 기록을 남깁니다. 이미 기록된 이벤트(잡 재전달)면 False."""
+    await cur.execute(
+        "INSERT IGNORE INTO affinity_event_applied (event_id, user_id) VALUES (%s, %s)",
+        (event_id, user_id),
+    )
+    return cur.rowcount > 0
 
-async def delete_stale_scores(user_id: int, valid_post_ids: set[int]) -> int:
-    """해당 사용자의 후보 목록에 없는 오래된 점수를 삭제합니다."""
-    if not valid_post_ids:
-        async with transactional() as cur:
-            await cur.execute("DELETE FROM user_post_score WHERE user_id = %s", (user_id,))
-            return cur.rowcount
 
-    placeholders = ", ".join(["%s"] * len(valid_post_ids))
+async def mark_affinity_event_applied(event_id: str, user_id: int) -> bool:
+    """가중치를 증감하지 않고 반영한 이벤트(초기 가중치 시드 등)의 적용 기록을 남깁니다. 이미 있으면 False."""
     async with transactional() as cur:
+        return await _mark_event_applied(cur, event_id, user_id)
+
+
+async def insert_affinity_weights(weights: dict[int, AffinityWeights]) -> None:
+    """저장된 가중치가 없는 사용자의 초기 가중치를 저장합니다 (최근 신호 기반 cold start).
+
+    이미 행이 있으면(동시에 이벤트가 먼저 반영된 경우) 그 값을 유지합니다.
+    """
+    rows = [
+        (user_id, kind, key_id, weight)
+        for user_id, user_weights in weights.items()
+        for kind, attr in WEIGHT_KINDS.items()
+        for key_id, weight in getattr(user_weights, attr).items()
+    ]
+    if not rows:
+        return
+    values_sql = ", ".join(["(%s, %s, %s, %s, NOW())"] * len(rows))
+    async with get_cursor() as cur:
         await cur.execute(
-            f"DELETE FROM user_post_score WHERE user_id = %s AND post_id NOT IN ({placeholders})",
-            [user_id, *valid_post_ids],
+            f"""
+            INSERT IGNORE INTO user_affinity_weight (user_id, kind, key_id, weight, decayed_at)
+            VALUES {values_sql}
+            """,
+            [value for row in rows for value in row],
         )
-        return cur.rowcount
 
 
-async def user_has_scores(user_id: int) -> bool:
-    """사용자의 추천 점수가 존재하는지 확인합니다."""
+async def decay_affinity_weights(
+    half_life_seconds: float,
+    min_weight: float,
+    shard_count: int = 1,
+    shard_index: int = 0,
+) -> int:
+    """샤드 사용자의 친화도 가중치에 감쇠를 반영해 저장하고, min_weight 미만으로 줄어든 행을 삭제합니다.
+
+    보관 기간이 지난 이벤트 적용 기록(affinity_event_applied)도 함께 정리합니다.
+
+    Returns:
+        삭제된 행 수.
+    """
     async with get_cursor() as cur:
         await cur.execute(
-            "SELECT 1 FROM user_post_score WHERE user_id = %s LIMIT 1",
-            (user_id,),
+            f"""
+            UPDATE user_affinity_weight
+            SET weight = {_DECAYED_WEIGHT_SQL}, decayed_at = NOW()
+            WHERE user_id %% %s = %s
+            """,
+            (half_life_seconds, shard_count, shard_index),
+        )
+        await cur.execute(
+            "DELETE FROM user_affinity_weight WHERE user_id %% %s = %s AND weight < %s",
+            (shard_count, shard_index, min_weight),
+        )
+        pruned = cur.rowcount
+        # 재전달 가능 기간이 지난 이벤트 적용 기록 정리
+        await cur.execute(
+            "DELETE FROM affinity_event_applied WHERE user_id %% %s = %s AND applied_at < NOW() - INTERVAL %s HOUR",
+            (shard_count, shard_index, _APPLIED_EVENT_RETENTION_HOURS),
+        )
+        return pruned
+
+
+async def get_post_affinity_keys(post_id: int) -> dict | None:
+    """이벤트 대상 게시글의 친화도 키(태그/카테고리/작성자)를 조회합니다.
+
+    Returns:
+        {"category_id", "author_id", "tag_ids"} 또는 삭제된 게시글이면 None.
+    """
+    async with get_cursor() as cur:
+        await cur.execute(
+            "SELECT category_id, author_id FROM post WHERE id = %s AND deleted_at IS NULL",
+            (post_id,),
+        )
+        post = await cur.fetchone()
+        if not post:
+            return None
+        await cur.execute("SELECT tag_id FROM post_tag WHERE post_id = %s", (post_id,))
+        post["tag_ids"] = [row["tag_id"] for row in await cur.fetchall()]
+        return post
+
+
+# ============ 배치 재계산 체크포인트 ============
+
+
+async def start_recompute_checkpoint(shard_count: int, shard_index: int, resume_within_minutes: int) -> int:
+    """샤드의 재계산 체크포인트를 열고 재개 지점(user_id)을 반환합니다.
+
+    완료되지 않은 실행이 resume_within_minutes 이내에 시작됐다면 그 진행 위치부터 재개하고,
+    아니면 새 실행으로 초기화해 0을 반환합니다. 호출자는 샤드 리스를 보유하고 있어야 합니다.
+    """
+    async with transactional() as cur:
+        await cur.execute(
+            """
+            SELECT last_user_id FROM feed_recompute_checkpoint
+            WHERE shard_count = %s AND shard_index = %s
+              AND completed_at IS NULL
+              AND run_started_at > NOW() - INTERVAL %s MINUTE
+            FOR UPDATE
+            """,
+            (shard_count, shard_index, resume_within_minutes),
+        )
+        row = await cur.fetchone()
+        if row:
+            return row["last_user_id"]
+
+        await cur.execute(
+            """
+            INSERT INTO feed_recompute_checkpoint (shard_count, shard_index, run_started_at)
+            VALUES (%s, %s, NOW())
+            ON DUPLICATE KEY UPDATE
+                run_started_at = NOW(), last_user_id = 0, users_processed = 0, completed_at = NULL
+            """,
+            (shard_count, shard_index),
+        )
+        return 0
+
+
+async def advance_recompute_checkpoint(
+    shard_count: int, shard_index: int, last_user_id: int, users_processed: int
+) -> None:
+    """샤드의 진행 위치를 last_user_id까지 전진시킵니다 (그 이하 사용자는 처리 완료)."""
+    async with get_cursor() as cur:
+        await cur.execute(
+            """
+            UPDATE feed_recompute_checkpoint
+            SET last_user_id = %s, users_processed = users_processed + %s
+            WHERE shard_count = %s AND shard_index = %s
+            """,
+            (last_user_id, users_processed, shard_count, shard_index),
+        )
+
+
+async def complete_recompute_checkpoint(shard_count: int, shard_index: int) -> None:
+    """샤드의 재계산 실행을 완료로 표시합니다 (다음 실행은 처음부터 시작)."""
+    async with get_cursor() as cur:
+        await cur.execute(
+            """
+            UPDATE feed_recompute_checkpoint SET completed_at = NOW()
+            WHERE shard_count = %s AND shard_index = %s
+            """,
+            (shard_count, shard_index),
         )
-        return await cur.fetchone() is not None
@@ -5,7 +5,7 @@ DB/HTTP 의존성 없음. 단위 테스트 가능.
 
 from dataclasses import dataclass, field
 
-from modules.post.affinity_models import UserSignals
+from modules.post.affinity_models import AffinityWeights, UserSignals
 
 # 신호 가중치 — 튜닝 시 이 상수만 수정
 SIGNAL_WEIGHTS = {
@@ -18,6 +18,16 @@ SIGNAL_WEIGHTS = {
     "bookmarked_author": 0.8,
 }
 
+# 게시글 이벤트 → 친화도 가중치 종류별 증감량. 취소 이벤트는 같은 양을 뺌
+POST_EVENT_WEIGHTS: dict[str, tuple[tuple[str, float], ...]] = {
+    "like": (("tag", SIGNAL_WEIGHTS["liked_tag"]), ("author", SIGNAL_WEIGHTS["liked_author"])),
+    "unlike": (("tag", -SIGNAL_WEIGHTS["liked_tag"]), ("author", -SIGNAL_WEIGHTS["liked_author"])),
+    "bookmark": (("tag", SIGNAL_WEIGHTS["bookmarked_tag"]), ("author", SIGNAL_WEIGHTS["bookmarked_author"])),
+    "unbookmark": (("tag", -SIGNAL_WEIGHTS["bookmarked_tag"]), ("author", -SIGNAL_WEIGHTS["bookmarked_author"])),
+    "comment": (("tag", SIGNAL_WEIGHTS["commented_tag"]),),
+    "view": (("category", SIGNAL_WEIGHTS["viewed_category"]),),
+}
+
 # 점수 구성 비율 (합계 = 1.0)
 TAG_COEFF = 0.5
 CATEGORY_COEFF = 0.3
@@ -57,14 +67,14 @@ def _max_normalize(weights: dict[int, float]) -> dict[int, float]:
     return {k: v / max_val for k, v in weights.items()}
 
 
-def build_profile(signals: UserSignals) -> UserAffinityProfile:
-    """UserSignals → 정규화된 UserAffinityProfile 변환.
+def weights_from_signals(signals: UserSignals) -> AffinityWeights:
+    """UserSignals → 신호 가중합 원시 가중치 (저장된 가중치가 없는 사용자의 초기값).
 
     Args:
         signals: 사용자의 원시 상호작용 데이터.
 
     Returns:
-        0–1 범위로 정규화된 친화도 프로필.
+        정규화 전 태그/카테고리/작성자 가중치.
     """
     # 태그 가중합산
     raw_tags = _weighted_merge(
@@ -86,13 +96,49 @@ def build_profile(signals: UserSignals) -> UserAffinityProfile:
         (signals.bookmarked_author_counts, SIGNAL_WEIGHTS["bookmarked_author"]),
     )
 
+    return AffinityWeights(tags=raw_tags, categories=raw_categories, authors=raw_authors)
+
+
+def profile_from_weights(weights: AffinityWeights) -> UserAffinityProfile:
+    """원시 가중치 → 종류별 최댓값으로 정규화한 UserAffinityProfile."""
     return UserAffinityProfile(
-        tag_weights=_max_normalize(raw_tags),
-        category_weights=_max_normalize(raw_categories),
-        author_weights=_max_normalize(raw_authors),
+        tag_weights=_max_normalize(weights.tags),
+        category_weights=_max_normalize(weights.categories),
+        author_weights=_max_normalize(weights.authors),
     )
 
 
+def build_profile(signals: UserSignals) -> UserAffinityProfile:
+    """UserSignals → 정규화된 UserAffinityProfile 변환.
+
+    Args:
+        signals: 사용자의 원시 상호작용 데이터.
+
+    Returns:
+        0–1 범위로 정규화된 친화도 프로필.
+    """
+    return profile_from_weights(weights_from_signals(signals))
+
+
+def post_event_deltas(event: str, post: dict) -> list[tuple[str, int, float]]:
+    """게시글 이벤트의 친화도 가중치 증감 목록을 만듭니다.
+
+    Args:
+        event: POST_EVENT_WEIGHTS의 키 (like, unlike, bookmark, unbookmark, comment, view).
+        post: affinity_models.get_post_affinity_keys() 결과.
+
+    Returns:
+        (kind, key_id, delta) 목록.
+    """
+    deltas: list[tuple[str, int, float]] = []
+    for kind, delta in POST_EVENT_WEIGHTS[event]:
+        if kind == "tag":
+            deltas.extend(("tag", tag_id, delta) for tag_id in post["tag_ids"])
+        elif post[f"{kind}_id"] is not None:
+            deltas.append((kind, post[f"{kind}_id"], delta))
+    return deltas
+
+
 def score_post(
     profile: UserAffinityProfile,
     post_tag_ids: list[int],
@@ -146,3 +192,53 @@ def compute_combined_score(affinity: float, hot_score: float) -> float:
     if affinity <= 0.0:
         return hot_score
     return affinity * hot_score
+
+
+def rank_candidates(
+    user_id: int,
+    profile: UserAffinityProfile,
+    candidates: list[dict],
+    limit: int,
+) -> list[dict]:
+    """한 사용자에 대해 후보 게시글 점수를 계산하고 상위 limit개를 반환합니다.
+
+    자기 게시글과 친화도 0인 게시글은 제외하며, 저장 단위(소수점 6자리)로 반올림한 결합 점수 내림차순
+    (동점은 후보 순서)으로 정렬합니다. affinity_batch.rank_users_batch의 기준 구현입니다.
+
+    Args:
+        user_id: 사용자 ID.
+        profile: 사용자 친화도 프로필.
+        candidates: affinity_models.get_candidate_posts_meta() 결과.
+        limit: 최대 반환 개수.
+
+    Returns:
+        [{post_id, affinity_score, hot_score, combined_score}] 목록.
+    """
+    scored_rows: list[dict] = []
+    for post in candidates:
+        if post["author_id"] == user_id:
+            continue
+
+        affinity = score_post(
+            profile,
+            post_tag_ids=post["tag_ids"],
+            post_category_id=post["category_id"],
+            post_author_id=post["author_id"],
+        )
+
+        if affinity <= 0.0:
+            continue
+
+        combined = compute_combined_score(affinity, post["hot_score"])
+        scored_rows.append(
+            {
+                "post_id": post["post_id"],
+                "affinity_score": round(affinity, 6),
+                "hot_score": round(post["hot_score"], 6),
+                "combined_score": round(combined, 6),
+            }
+        )
+
+    # 점수 순 정렬 후 상위 N개만 반환
+    scored_rows.sort(key=lambda r: r["combined_score"], reverse=True)
+    return scored_rows[:limit]
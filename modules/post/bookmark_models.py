@@ -3,6 +3,7 @@
 post_like 패턴을 미러링합니다:
 - transactional() 내에서 INSERT+SELECT 원자적 처리
 - IntegrityError는 모델에서 catch하지 않고 컨트롤러로 전파
+- post.bookmarks_count 비정규화 카운터를 같은 트랜잭션에서 증감
 """
 
 from dataclasses import dataclass
@@ -33,10 +34,10 @@ async def get_bookmark(post_id: int, user_id: int) -> Bookmark | None:
 
 
 async def get_post_bookmarks_count(post_id: int) -> int:
-    """게시글의 북마크 수를 조회합니다."""
+    """게시글의 북마크 수를 조회합니다. (post.bookmarks_count 카운터 컬럼)"""
     async with get_cursor() as cur:
         await cur.execute(
-            "SELECT COUNT(*) AS cnt FROM post_bookmark WHERE post_id = %s",
+            "SELECT bookmarks_count AS cnt FROM post WHERE id = %s",
             (post_id,),
         )
         row = await cur.fetchone()
@@ -56,6 +57,11 @@ async def add_bookmark(post_id: int, user_id: int) -> Bookmark:
         )
         bookmark_id = cur.lastrowid
 
+        await cur.execute(
+            "UPDATE post SET bookmarks_count = bookmarks_count + 1 WHERE id = %s",
+            (post_id,),
+        )
+
         await cur.execute(
             "SELECT id, user_id, post_id, created_at FROM post_bookmark WHERE id = %s",
             (bookmark_id,),
@@ -77,4 +83,12 @@ async def remove_bookmark(post_id: int, user_id: int) -> bool:
             "DELETE FROM post_bookmark WHERE post_id = %s AND user_id = %s",
             (post_id, user_id),
         )
-        return cur.rowcount > 0
+        if cur.rowcount == 0:
+            return False
+
+        # UNSIGNED 언더플로 방지
+        await cur.execute(
+            "UPDATE post SET bookmarks_count = GREATEST(bookmarks_count, 1) - 1 WHERE id = %s",
+            (post_id,),
+        )
+        return True
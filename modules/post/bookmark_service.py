@@ -4,7 +4,9 @@ from pymysql.err import IntegrityError
 
 from core.utils.error_codes import ErrorCode
 from core.utils.exceptions import conflict_error, not_found_error, safe_notify
+from core.utils.response_cache import invalidate_post_responses
 from modules.post import bookmark_models, post_models
+from modules.post.jobs import enqueue_affinity_event
 
 
 class BookmarkService:
@@ -42,6 +44,10 @@ class BookmarkService:
             raise conflict_error(ErrorCode.ALREADY_BOOKMARKED, timestamp, "이미 북마크한 게시글입니다.") from None
 
         bookmarks_count = await bookmark_models.get_post_bookmarks_count(post_id)
+        await invalidate_post_responses(post_id)
+
+        # 추천 피드 친화도 갱신
+        await enqueue_affinity_event(user_id, "bookmark", post_id=post_id)
 
         # 자기 글이 아닌 경우 알림 생성
         if post.author_id and post.author_id != user_id:
@@ -83,5 +89,8 @@ class BookmarkService:
             raise not_found_error("bookmark", timestamp)
 
         bookmarks_count = await bookmark_models.get_post_bookmarks_count(post_id)
+        await invalidate_post_responses(post_id)
+
+        await enqueue_affinity_event(user_id, "unbookmark", post_id=post_id)
 
         return {"bookmarks_count": bookmarks_count}
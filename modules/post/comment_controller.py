@@ -10,6 +10,80 @@ from modules.user.models import User
 from schemas.common import create_response
 
 
+async def get_comments(
+    post_id: int,
+    request: Request,
+    current_user: User | None,
+    sort: str,
+    limit: int,
+    cursor: str | None,
+) -> dict:
+    """게시글의 루트 댓글 목록을 조회합니다 (루트 댓글별 대댓글 미리보기 포함).
+
+    Args:
+        post_id: 게시글 ID.
+        request: FastAPI Request 객체.
+        current_user: 현재 인증된 사용자 (선택적).
+        sort: 정렬 옵션 (oldest, latest, popular).
+        limit: 조회할 루트 댓글 수.
+        cursor: 이전 응답의 next_cursor.
+
+    Returns:
+        댓글 목록과 페이지네이션 정보가 포함된 응답 딕셔너리.
+
+    Raises:
+        HTTPException: 커서가 유효하지 않으면 400, 게시글 없으면 404.
+    """
+    timestamp = get_request_timestamp(request)
+
+    result = await CommentService.get_comments(post_id, current_user, sort, limit, cursor, timestamp)
+
+    return create_response(
+        "COMMENTS_RETRIEVED",
+        "댓글 목록 조회에 성공했습니다.",
+        data=result,
+        timestamp=timestamp,
+    )
+
+
+async def get_replies(
+    post_id: int,
+    comment_id: int,
+    request: Request,
+    current_user: User | None,
+    sort: str,
+    limit: int,
+    cursor: str | None,
+) -> dict:
+    """루트 댓글의 대댓글 목록을 조회합니다.
+
+    Args:
+        post_id: 게시글 ID.
+        comment_id: 루트 댓글 ID.
+        request: FastAPI Request 객체.
+        current_user: 현재 인증된 사용자 (선택적).
+        sort: 정렬 옵션 (oldest, latest, popular).
+        limit: 조회할 대댓글 수.
+        cursor: 이전 응답의 next_cursor 또는 댓글 목록의 replies_cursor.
+
+    Returns:
+        대댓글 목록과 페이지네이션 정보가 포함된 응답 딕셔너리.
+
+    Raises:
+        HTTPException: 커서가 유효하지 않으면 400, 게시글/루트 댓글 없으면 404.
+    """
+    timestamp = get_request_timestamp(request)
+
+    result = await CommentService.get_replies(post_id, comment_id, current_user, sort, limit, cursor, timestamp)
+
+    return create_response(
+        "REPLIES_RETRIEVED",
+        "대댓글 목록 조회에 성공했습니다.",
+        data=result,
+        timestamp=timestamp,
+    )
+
+
 async def create_comment(
     post_id: int,
     comment_data: CreateCommentRequest,
@@ -1,6 +1,6 @@
 """comment_like_models: 댓글 좋아요 관련 데이터 모델 및 함수 모듈.
 
-post_like 패턴을 미러링합니다.
+post_like 패턴을 미러링합니다. comment.likes_count 비정규화 카운터를 같은 트랜잭션에서 증감합니다.
 """
 
 from dataclasses import dataclass
@@ -31,30 +31,28 @@ async def get_comment_like(comment_id: int, user_id: int) -> CommentLike | None:
 
 
 async def get_comment_likes_count(comment_id: int) -> int:
-    """댓글의 좋아요 수를 조회합니다."""
+    """댓글의 좋아요 수를 조회합니다. (comment.likes_count 카운터 컬럼)"""
     async with get_cursor() as cur:
         await cur.execute(
-            "SELECT COUNT(*) AS cnt FROM comment_like WHERE comment_id = %s",
+            "SELECT likes_count AS cnt FROM comment WHERE id = %s",
             (comment_id,),
         )
         row = await cur.fetchone()
         return row["cnt"] if row else 0
 
 
-async def get_liked_comment_ids(user_id: int, post_id: int) -> set[int]:
-    """특정 사용자가 특정 게시글의 댓글 중 좋아요한 댓글 ID 집합을 반환합니다.
+async def get_liked_comment_ids(user_id: int, comment_ids: list[int]) -> set[int]:
+    """특정 사용자가 좋아요한 댓글 ID 집합을 주어진 댓글 중에서 반환합니다.
 
-    N+1 방지를 위한 벌크 조회.
+    N+1 방지를 위한 벌크 조회. 응답에 담긴 댓글만 (user_id, comment_id) 유니크 인덱스로 확인합니다.
     """
+    if not comment_ids:
+        return set()
+    placeholders = ", ".join(["%s"] * len(comment_ids))
     async with get_cursor() as cur:
         await cur.execute(
-            """
-                SELECT cl.comment_id
-                FROM comment_like cl
-                JOIN comment c ON cl.comment_id = c.id
-                WHERE cl.user_id = %s AND c.post_id = %s
-                """,
-            (user_id, post_id),
+            f"SELECT comment_id FROM comment_like WHERE user_id = %s AND comment_id IN ({placeholders})",
+            [user_id, *comment_ids],
         )
         rows = await cur.fetchall()
         return {row["comment_id"] for row in rows}
@@ -73,6 +71,8 @@ async def add_comment_like(comment_id: int, user_id: int) -> CommentLike:
         )
         like_id = cur.lastrowid
 
+        await cur.execute("UPDATE comment SET likes_count = likes_count + 1 WHERE id = %s", (comment_id,))
+
         await cur.execute(
             "SELECT id, user_id, comment_id, created_at FROM comment_like WHERE id = %s",
             (like_id,),
@@ -94,4 +94,12 @@ async def remove_comment_like(comment_id: int, user_id: int) -> bool:
             "DELETE FROM comment_like WHERE comment_id = %s AND user_id = %s",
             (comment_id, user_id),
         )
-        return cur.rowcount > 0
+        if cur.rowcount == 0:
+            return False
+
+        # UNSIGNED 언더플로 방지
+        await cur.execute(
+            "UPDATE comment SET likes_count = GREATEST(likes_count, 1) - 1 WHERE id = %s",
+            (comment_id,),
+        )
+        return True
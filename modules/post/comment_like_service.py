@@ -6,6 +6,7 @@ from pymysql.err import IntegrityError
 
 from core.utils.error_codes import ErrorCode
 from core.utils.exceptions import conflict_error, not_found_error, safe_notify
+from core.utils.response_cache import invalidate_post_responses
 from modules.post import comment_like_models, post_models
 from modules.post.comment_models import get_comment_by_id
 
@@ -54,6 +55,7 @@ class CommentLikeService:
             raise conflict_error(ErrorCode.ALREADY_COMMENT_LIKED, timestamp, "이미 좋아요를 누른 댓글입니다.") from None
 
         likes_count = await comment_like_models.get_comment_likes_count(comment_id)
+        await invalidate_post_responses(post_id)
 
         # 자기 댓글이 아닌 경우 알림 생성
         if comment.author_id and comment.author_id != user_id:
@@ -66,27 +68,29 @@ class CommentLikeService:
                 comment_id=comment_id,
             )
 
-        # 평판 포인트 부여 (best-effort)
-        try:
-            from modules.reputation.service import ReputationService
-
-            await ReputationService.award_points(
-                user_id=comment.author_id,
-                event_type="comment_liked",
-                points=5,
-                source_user_id=user_id,
-                source_type="comment",
-                source_id=comment_id,
-            )
-            await ReputationService.award_points(
-                user_id=user_id,
-                event_type="comment_like_given",
-                points=1,
-                source_type="comment",
-                source_id=comment_id,
-            )
-        except Exception:
-            logger.warning("평판 포인트 부여 실패 (like_comment)", exc_info=True)
+        # 평판 포인트 부여 — 받은 사람 + 누른 사람 이벤트를 한 잡(한 트랜잭션)으로 적재
+        from modules.reputation.jobs import enqueue_award
+        from modules.reputation.service import ReputationEvent
+
+        await enqueue_award(
+            [
+                ReputationEvent(
+                    user_id=comment.author_id,
+                    event_type="comment_liked",
+                    points=5,
+                    source_user_id=user_id,
+                    source_type="comment",
+                    source_id=comment_id,
+                ),
+                ReputationEvent(
+                    user_id=user_id,
+                    event_type="comment_like_given",
+                    points=1,
+                    source_type="comment",
+                    source_id=comment_id,
+                ),
+            ]
+        )
 
         return {"likes_count": likes_count}
 
@@ -124,24 +128,28 @@ class CommentLikeService:
             raise not_found_error("comment_like", timestamp)
 
         likes_count = await comment_like_models.get_comment_likes_count(comment_id)
-
-        # 평판 포인트 회수 (best-effort)
-        try:
-            from modules.reputation.service import ReputationService
-
-            await ReputationService.revoke_points(
-                user_id=comment.author_id,
-                event_type="comment_liked",
-                source_type="comment",
-                source_id=comment_id,
-            )
-            await ReputationService.revoke_points(
-                user_id=user_id,
-                event_type="comment_like_given",
-                source_type="comment",
-                source_id=comment_id,
-            )
-        except Exception:
-            logger.warning("평판 포인트 회수 실패 (unlike_comment)", exc_info=True)
+        await invalidate_post_responses(post_id)
+
+        # 평판 포인트 회수
+        from modules.reputation.jobs import enqueue_revoke
+        from modules.reputation.service import ReputationRevocation
+
+        await enqueue_revoke(
+            [
+                ReputationRevocation(
+                    user_id=comment.author_id,
+                    event_type="comment_liked",
+                    source_type="comment",
+                    source_id=comment_id,
+                    source_user_id=user_id,
+                ),
+                ReputationRevocation(
+                    user_id=user_id,
+                    event_type="comment_like_given",
+                    source_type="comment",
+                    source_id=comment_id,
+                ),
+            ]
+        )
 
         return {"likes_count": likes_count}
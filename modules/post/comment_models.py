@@ -3,12 +3,17 @@
 주요 개선사항:
 - create_comment 함수에 명시적 트랜잭션 적용
 - INSERT와 SELECT을 원자적으로 처리
+- post.comments_count 비정규화 카운터를 같은 트랜잭션에서 증감
+- 부모 댓글의 replies_count 비정규화 카운터를 같은 트랜잭션에서 증감
+- 게시글 상세/댓글 목록은 루트 댓글 키셋 페이지 + 대댓글 미리보기로 조회 (전체 트리를 읽지 않음)
 """
 
 from dataclasses import dataclass
 from datetime import datetime
 
 from core.database.connection import get_cursor, transactional
+from core.utils.pagination import keyset_condition
+from modules.post.hot_score import HOT_SCORE_ASSIGNMENT
 from schemas.common import build_author_dict
 
 ALLOWED_COMMENT_SORT_OPTIONS = {"oldest", "latest", "popular"}
@@ -91,6 +96,13 @@ async def create_comment(post_id: int, author_id: int, content: str, parent_id:
         )
         comment_id = cur.lastrowid
 
+        await cur.execute(
+            f"UPDATE post SET comments_count = comments_count + 1, {HOT_SCORE_ASSIGNMENT} WHERE id = %s",
+            (post_id,),
+        )
+        if parent_id is not None:
+            await cur.execute("UPDATE comment SET replies_count = replies_count + 1 WHERE id = %s", (parent_id,))
+
         await cur.execute(
             "SELECT id, content, author_id, post_id, created_at, updated_at, deleted_at, parent_id "
             "FROM comment WHERE id = %s",
@@ -135,122 +147,252 @@ async def delete_comment(comment_id: int) -> bool:
             "UPDATE comment SET deleted_at = NOW() WHERE id = %s AND deleted_at IS NULL",
             (comment_id,),
         )
-        return cur.rowcount > 0
+        if cur.rowcount == 0:
+            return False
+
+        await cur.execute("SELECT post_id, parent_id FROM comment WHERE id = %s", (comment_id,))
+        row = await cur.fetchone()
+
+        # UNSIGNED 언더플로 방지
+        await cur.execute(
+            f"UPDATE post SET comments_count = GREATEST(comments_count, 1) - 1, {HOT_SCORE_ASSIGNMENT} WHERE id = %s",
+            (row["post_id"],),
+        )
+        if row["parent_id"] is not None:
+            await cur.execute(
+                "UPDATE comment SET replies_count = GREATEST(replies_count, 1) - 1 WHERE id = %s",
+                (row["parent_id"],),
+            )
+        return True
+
+
+# 댓글 스레드 정렬별 (키셋 커서를 구성하는 SQL 식 목록, 내림차순 여부)
+# popular는 기존 트리 정렬과 같은 (좋아요 수, 작성 시간) 내림차순이며, 동점은 id로 고정
+_THREAD_SORT_KEYS: dict[str, tuple[tuple[str, ...], bool]] = {
+    "oldest": (("c.created_at", "c.id"), False),
+    "latest": (("c.created_at", "c.id"), True),
+    "popular": (("c.likes_count", "c.created_at", "c.id"), True),
+}
+
+
+def _thread_select(extra_columns: str = "") -> str:
+    """댓글 스레드 조회의 SELECT ... FROM 절 (작성자, 채택 여부 포함)."""
+    return f"""
+    SELECT c.id, c.content, c.created_at, c.updated_at, c.parent_id, c.deleted_at,
+           c.likes_count, c.replies_count,
+           u.id AS user_id, u.nickname, u.profile_img, u.distro,
+           (p.accepted_answer_id <=> c.id) AS is_accepted{extra_columns}
+    FROM comment c
+    INNER JOIN post p ON p.id = c.post_id
+    LEFT JOIN user u ON c.author_id = u.id
+"""
+
+
+def thread_cursor_arity(sort: str) -> int:
+    """댓글 스레드 키셋 커서의 값 개수를 반환합니다."""
+    return len(_THREAD_SORT_KEYS[sort][0])
+
+
+def _not_blocked_clause(author_column: str) -> str:
+    """blocked_by 사용자가 차단한 작성자의 댓글을 제외하는 조건 (파라미터: blocked_by).
+
+    post_models와 같은 user_block 상관 서브쿼리입니다. 작성자가 없는(NULL) 댓글은 그대로 포함됩니다.
+    """
+    return f"NOT EXISTS (SELECT 1 FROM user_block ub WHERE ub.blocker_id = %s AND ub.blocked_id = {author_column})"
+
+
+def _thread_order(sort: str, cursor: list | None) -> tuple[str, str, list]:
+    """정렬 옵션에 맞는 (키셋 조건, ORDER BY 절, 파라미터)를 반환합니다."""
+    columns, descending = _THREAD_SORT_KEYS[sort]
+    direction = "DESC" if descending else "ASC"
+    order_by = "ORDER BY " + ", ".join(f"{column} {direction}" for column in columns)
+    if cursor is None:
+        return "", order_by, []
+    condition, params = keyset_condition(columns, cursor, descending=descending)
+    return f" AND {condition}", order_by, params
 
 
-async def get_comments_with_author(
+def _row_to_thread_comment(row: dict, sort: str) -> dict:
+    """스레드 조회 행을 응답용 댓글 dict로 변환합니다. 삭제된 댓글은 내용/작성자를 가립니다.
+
+    sort_key는 다음 페이지 커서를 만들 때 쓰고 응답 전에 제거합니다.
+    """
+    is_deleted = row["deleted_at"] is not None
+    sort_key = [row["created_at"], row["id"]]
+    if sort == "popular":
+        sort_key.insert(0, row["likes_count"])
+    return {
+        "comment_id": row["id"],
+        "content": None if is_deleted else row["content"],
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+        "author": None
+        if is_deleted
+        else build_author_dict(row["user_id"], row["nickname"], row["profile_img"], row["distro"]),
+        "parent_id": row["parent_id"],
+        "is_deleted": is_deleted,
+        "likes_count": row["likes_count"],
+        "replies_count": row["replies_count"],
+        "is_liked": False,
+        "is_accepted": bool(row["is_accepted"]),
+        "sort_key": sort_key,
+    }
+
+
+async def get_root_comments(
     post_id: int,
-    current_user_id: int | None = None,
-    blocked_user_ids: set[int] | None = None,
-    comment_sort: str = "oldest",
-    accepted_answer_id: int | None = None,
+    sort: str,
+    limit: int,
+    cursor: list | None = None,
+    blocked_by: int | None = None,
 ) -> list[dict]:
-    """게시글의 댓글 목록을 트리 구조로 반환합니다.
+    """게시글의 루트 댓글을 정렬 순서대로 최대 limit개 조회합니다 (키셋 페이지네이션).
 
     삭제된 댓글 처리:
-    - 대댓글이 있는 삭제된 부모 댓글: is_deleted=True, content=None, author=None
-    - 대댓글이 없는 삭제된 댓글: 목록에서 제외
+    - 삭제되지 않은 대댓글이 있는 삭제된 루트 댓글: is_deleted=True, content=None, author=None
+    - 대댓글이 없는 삭제된 루트 댓글: 목록에서 제외
+
+    blocked_by가 주어지면 그 사용자가 차단한 작성자의 댓글을 제외하고,
+    삭제된 루트 댓글은 차단되지 않은 대댓글이 남아 있을 때만 포함합니다.
     """
-    # 로그인 사용자의 좋아요 상태 벌크 조회 (N+1 방지)
-    liked_comment_ids: set[int] = set()
-    if current_user_id:
-        from modules.post.comment_like_models import get_liked_comment_ids
+    if blocked_by is None:
+        visible = "(c.deleted_at IS NULL OR c.replies_count > 0)"
+        params: list = [post_id]
+    else:
+        visible = (
+            f"((c.deleted_at IS NULL AND {_not_blocked_clause('c.author_id')})"
+            " OR (c.deleted_at IS NOT NULL AND c.replies_count > 0 AND EXISTS ("
+            "SELECT 1 FROM comment r WHERE r.post_id = c.post_id AND r.parent_id = c.id"
+            f" AND r.deleted_at IS NULL AND {_not_blocked_clause('r.author_id')})))"
+        )
+        params = [post_id, blocked_by, blocked_by]
 
-        liked_comment_ids = await get_liked_comment_ids(current_user_id, post_id)
+    keyset, order_by, cursor_params = _thread_order(sort, cursor)
+    async with get_cursor() as cur:
+        await cur.execute(
+            f"{_thread_select()} WHERE c.post_id = %s AND c.parent_id IS NULL AND {visible}"
+            f"{keyset} {order_by} LIMIT %s",
+            [*params, *cursor_params, limit],
+        )
+        rows = await cur.fetchall()
+    return [_row_to_thread_comment(row, sort) for row in rows]
 
+
+async def get_replies(
+    post_id: int,
+    parent_id: int,
+    sort: str,
+    limit: int,
+    cursor: list | None = None,
+    blocked_by: int | None = None,
+) -> list[dict]:
+    """루트 댓글의 삭제되지 않은 대댓글을 정렬 순서대로 최대 limit개 조회합니다 (키셋 페이지네이션)."""
+    blocked = ""
+    params: list = [post_id, parent_id]
+    if blocked_by is not None:
+        blocked = f" AND {_not_blocked_clause('c.author_id')}"
+        params.append(blocked_by)
+
+    keyset, order_by, cursor_params = _thread_order(sort, cursor)
     async with get_cursor() as cur:
-        # 삭제된 댓글도 포함하여 조회 (대댓글이 있는 경우 표시 필요)
         await cur.execute(
-            """
-                SELECT c.id, c.content, c.created_at, c.updated_at,
-                       u.id AS user_id, u.nickname, u.profile_img, u.distro,
-                       c.parent_id, c.deleted_at,
-                       COALESCE(cl.cnt, 0) AS likes_count,
-                       c.author_id
-                FROM comment c
-                LEFT JOIN user u ON c.author_id = u.id
+            f"{_thread_select()} WHERE c.post_id = %s AND c.parent_id = %s AND c.deleted_at IS NULL"
+            f"{blocked}{keyset} {order_by} LIMIT %s",
+            [*params, *cursor_params, limit],
+        )
+        rows = await cur.fetchall()
+    return [_row_to_thread_comment(row, sort) for row in rows]
+
+
+async def get_reply_previews(
+    post_id: int,
+    parent_ids: list[int],
+    per_parent: int,
+    blocked_by: int | None = None,
+) -> dict[int, list[dict]]:
+    """루트 댓글별로 가장 오래된 대댓글 최대 per_parent개를 한 번에 조회합니다 (oldest 정렬).
+
+    루트 댓글 페이지의 미리보기용입니다. 나머지는 get_replies()로 이어서 조회합니다.
+    """
+    if not parent_ids:
+        return {}
+    placeholders = ", ".join(["%s"] * len(parent_ids))
+    blocked = ""
+    params: list = [post_id, *parent_ids]
+    if blocked_by is not None:
+        blocked = f" AND {_not_blocked_clause('c.author_id')}"
+        params.append(blocked_by)
+
+    columns = _thread_select(", ROW_NUMBER() OVER (PARTITION BY c.parent_id ORDER BY c.created_at, c.id) AS rn")
+    async with get_cursor() as cur:
+        await cur.execute(
+            f"""
+                SELECT * FROM (
+                    {columns}
+                    WHERE c.post_id = %s AND c.parent_id IN ({placeholders}) AND c.deleted_at IS NULL{blocked}
+                ) ranked
+                WHERE rn <= %s
+                ORDER BY parent_id, created_at, id
+                """,
+            [*params, per_parent],
+        )
+        rows = await cur.fetchall()
+
+    previews: dict[int, list[dict]] = {parent_id: [] for parent_id in parent_ids}
+    for row in rows:
+        previews[row["parent_id"]].append(_row_to_thread_comment(row, "oldest"))
+    return previews
+
+
+async def is_root_comment(post_id: int, comment_id: int) -> bool:
+    """comment_id가 post_id의 루트 댓글인지 확인합니다 (삭제된 루트 댓글 포함 — 대댓글은 계속 조회 가능)."""
+    async with get_cursor() as cur:
+        await cur.execute(
+            "SELECT 1 FROM comment WHERE id = %s AND post_id = %s AND parent_id IS NULL",
+            (comment_id, post_id),
+        )
+        return await cur.fetchone() is not None
+
+
+async def reconcile_comment_counters(batch_size: int = 5000) -> int:
+    """comment.likes_count/replies_count 컬럼의 드리프트를 원본 테이블 기준으로 복구합니다.
+
+    reconcile_post_counters()와 같이 id 범위 단위로 나눠 처리하여 긴 락을 피합니다.
+
+    Returns:
+        카운터가 수정된 댓글 수.
+    """
+    async with get_cursor() as cur:
+        await cur.execute("SELECT COALESCE(MAX(id), 0) AS max_id FROM comment")
+        row = await cur.fetchone()
+        max_id = row["max_id"] if row else 0
+
+    repaired = 0
+    for start in range(1, max_id + 1, batch_size):
+        end = start + batch_size - 1
+        async with transactional() as cur:
+            await cur.execute(
+                """
+                UPDATE comment c
                 LEFT JOIN (
                     SELECT comment_id, COUNT(*) AS cnt
                     FROM comment_like
+                    WHERE comment_id BETWEEN %s AND %s
                     GROUP BY comment_id
-                ) cl ON c.id = cl.comment_id
-                WHERE c.post_id = %s
-                ORDER BY c.created_at ASC
+                ) lk ON c.id = lk.comment_id
+                LEFT JOIN (
+                    SELECT parent_id, COUNT(*) AS cnt
+                    FROM comment
+                    WHERE parent_id BETWEEN %s AND %s AND deleted_at IS NULL
+                    GROUP BY parent_id
+                ) rp ON c.id = rp.parent_id
+                SET c.likes_count = COALESCE(lk.cnt, 0),
+                    c.replies_count = COALESCE(rp.cnt, 0)
+                WHERE c.id BETWEEN %s AND %s
+                  AND (c.likes_count <> COALESCE(lk.cnt, 0) OR c.replies_count <> COALESCE(rp.cnt, 0))
                 """,
-            (post_id,),
-        )
-        rows = await cur.fetchall()
-
-        # 1. 모든 댓글을 dict로 변환
-        all_comments: dict[int, dict] = {}
-        for row in rows:
-            comment_id = row["id"]
-            is_deleted = row["deleted_at"] is not None
-            author_id = row["author_id"]
-            all_comments[comment_id] = {
-                "comment_id": comment_id,
-                "content": None if is_deleted else row["content"],
-                "created_at": row["created_at"],
-                "updated_at": row["updated_at"],
-                "author": None
-                if is_deleted
-                else build_author_dict(
-                    row["user_id"],
-                    row["nickname"],
-                    row["profile_img"],
-                    row["distro"],
-                ),
-                "parent_id": row["parent_id"],
-                "is_deleted": is_deleted,
-                "likes_count": row["likes_count"],
-                "is_liked": comment_id in liked_comment_ids,
-                "is_accepted": comment_id == accepted_answer_id,
-                "author_id": author_id,
-                "replies": [],
-            }
-
-        # 2. 부모-자식 관계 구성
-        root_comments: list[dict] = []
-        for comment in all_comments.values():
-            parent_id = comment["parent_id"]
-            if parent_id is not None and parent_id in all_comments:
-                all_comments[parent_id]["replies"].append(comment)
-            else:
-                root_comments.append(comment)
-
-        # 3. 대댓글이 없는 삭제된 루트 댓글 제거
-        root_comments = [c for c in root_comments if not c["is_deleted"] or len(c["replies"]) > 0]
-
-        # 4. 삭제된 대댓글 제거
-        for c in root_comments:
-            c["replies"] = [r for r in c["replies"] if not r["is_deleted"]]
-
-        # 5. 차단된 사용자 댓글 필터링 (Python 후처리)
-        if blocked_user_ids:
-            filtered_root: list[dict] = []
-            for c in root_comments:
-                if c["is_deleted"]:
-                    c["replies"] = [r for r in c["replies"] if r.get("author_id") not in blocked_user_ids]
-                    if c["replies"]:
-                        filtered_root.append(c)
-                elif c.get("author_id") not in blocked_user_ids:
-                    c["replies"] = [r for r in c["replies"] if r.get("author_id") not in blocked_user_ids]
-                    filtered_root.append(c)
-            root_comments = filtered_root
-
-        # 6. 루트 댓글 정렬 (대댓글은 항상 시간순 유지)
-        if comment_sort == "latest":
-            root_comments.reverse()
-        elif comment_sort == "popular":
-            root_comments.sort(
-                key=lambda c: (c["likes_count"], c["created_at"]),
-                reverse=True,
+                (start, end, start, end, start, end),
             )
+            repaired += cur.rowcount
 
-        # 7. author_id 키 제거 (API 응답에 불필요)
-        for c in root_comments:
-            c.pop("author_id", None)
-            for r in c.get("replies", []):
-                r.pop("author_id", None)
-
-        return root_comments
+    return repaired
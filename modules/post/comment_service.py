@@ -1,18 +1,45 @@
 """comment_service: 댓글 관련 비즈니스 로직을 처리하는 서비스."""
 
+import json
 import logging
+from collections.abc import Awaitable, Callable
 
+from fastapi.encoders import jsonable_encoder
+
+from core.config import settings
+from core.jobs import enqueue_many
 from core.utils.error_codes import ErrorCode
 from core.utils.exceptions import bad_request_error, forbidden_error, not_found_error, safe_notify
+from core.utils.formatters import format_datetime
 from core.utils.mention import extract_mentions
-from modules.notification import models as notification_models
-from modules.notification.setting_models import get_muted_user_ids
-from modules.post import comment_models, post_models, subscription_models
-from modules.user.models import get_users_by_nicknames
+from core.utils.pagination import decode_cursor, encode_cursor
+from core.utils.response_cache import cached_response, invalidate_post_responses, post_namespace
+from modules.post import comment_models, post_models
+from modules.post.comment_like_models import get_liked_comment_ids
+from modules.user.models import User, get_users_by_nicknames
 
 logger = logging.getLogger(__name__)
 
 
+def _comments_scope(post_id: int, sort: str) -> str:
+    """루트 댓글 커서 scope — 다른 게시글/정렬의 커서가 섞여 들어오는 것을 차단."""
+    return f"comments:{post_id}:{sort}"
+
+
+def _replies_scope(parent_id: int, sort: str) -> str:
+    """대댓글 커서 scope — 다른 루트 댓글/정렬의 커서가 섞여 들어오는 것을 차단."""
+    return f"replies:{parent_id}:{sort}"
+
+
+def _finalize(comments: list[dict], liked_ids: set[int]) -> None:
+    """좋아요 상태를 채우고 날짜를 포맷하며 내부용 sort_key를 제거합니다."""
+    for comment in comments:
+        comment["is_liked"] = comment["comment_id"] in liked_ids
+        comment["created_at"] = format_datetime(comment["created_at"])
+        comment["updated_at"] = format_datetime(comment.get("updated_at"))
+        comment.pop("sort_key", None)
+
+
 class CommentService:
     """댓글 관리 서비스."""
 
@@ -51,6 +78,155 @@ class CommentService:
 
         return post, comment
 
+    @staticmethod
+    async def get_comment_page(
+        post_id: int,
+        sort: str,
+        limit: int,
+        cursor: list | None = None,
+        viewer_id: int | None = None,
+    ) -> dict:
+        """루트 댓글 한 페이지와 루트 댓글별 대댓글 미리보기를 조회합니다.
+
+        게시글 상세와 댓글 목록 엔드포인트가 공유하며, 게시글 존재 확인은 호출자가 합니다.
+        viewer_id가 있으면 그 사용자가 차단한 작성자의 댓글을 제외하고 좋아요 상태를 채웁니다.
+        루트 댓글마다 가장 오래된 대댓글 COMMENT_REPLY_PREVIEW_SIZE개를 담고,
+        더 있으면 has_more_replies와 대댓글 엔드포인트에 넘길 replies_cursor를 함께 반환합니다.
+
+        Returns:
+            {"comments": 루트 댓글 목록, "pagination": {"has_more", "next_cursor"}}.
+        """
+        roots = await comment_models.get_root_comments(post_id, sort, limit + 1, cursor=cursor, blocked_by=viewer_id)
+        has_more = len(roots) > limit
+        roots = roots[:limit]
+
+        # 미리보기는 한 개 더 읽어 대댓글이 더 있는지 정확히 판단 (차단 필터 적용 후 기준)
+        preview_size = settings.COMMENT_REPLY_PREVIEW_SIZE
+        parent_ids = [c["comment_id"] for c in roots if c["replies_count"]] if preview_size > 0 else []
+        previews = await comment_models.get_reply_previews(post_id, parent_ids, preview_size + 1, blocked_by=viewer_id)
+
+        replies_all: list[dict] = []
+        for comment in roots:
+            fetched = previews.get(comment["comment_id"], [])
+            shown = fetched[:preview_size]
+            has_more_replies = len(fetched) > preview_size if preview_size > 0 else comment["replies_count"] > 0
+            comment["replies"] = shown
+            comment["has_more_replies"] = has_more_replies
+            comment["replies_cursor"] = (
+                encode_cursor(_replies_scope(comment["comment_id"], "oldest"), shown[-1]["sort_key"])
+                if has_more_replies and shown
+                else None
+            )
+            replies_all.extend(shown)
+
+        next_cursor = encode_cursor(_comments_scope(post_id, sort), roots[-1]["sort_key"]) if has_more else None
+
+        liked_ids: set[int] = set()
+        if viewer_id is not None:
+            liked_ids = await get_liked_comment_ids(viewer_id, [c["comment_id"] for c in roots + replies_all])
+        _finalize(roots, liked_ids)
+        _finalize(replies_all, liked_ids)
+
+        return {"comments": roots, "pagination": {"has_more": has_more, "next_cursor": next_cursor}}
+
+    @staticmethod
+    async def _cached_for_anonymous(
+        post_id: int,
+        current_user: User | None,
+        signature: str,
+        load: Callable[[], Awaitable[dict]],
+    ) -> dict:
+        """비로그인 요청은 응답이 쿼리 파라미터로 결정되므로 게시글 상세와 같은 네임스페이스로 캐시합니다."""
+        if current_user is not None:
+            return await load()
+
+        async def serialize() -> str:
+            return json.dumps(jsonable_encoder(await load()), ensure_ascii=False)
+
+        return json.loads(await cached_response((post_namespace(post_id),), signature, serialize))
+
+    @staticmethod
+    async def get_comments(
+        post_id: int,
+        current_user: User | None,
+        sort: str,
+        limit: int,
+        cursor: str | None,
+        timestamp: str,
+    ) -> dict:
+        """게시글의 루트 댓글 목록을 키셋 페이지네이션으로 조회합니다.
+
+        Raises:
+            HTTPException: 커서가 유효하지 않으면 400, 게시글 없으면 404.
+        """
+        cursor_values = None
+        if cursor is not None:
+            cursor_values = decode_cursor(
+                cursor, _comments_scope(post_id, sort), comment_models.thread_cursor_arity(sort), timestamp
+            )
+
+        async def load() -> dict:
+            if not await post_models.get_post_by_id(post_id):
+                raise not_found_error("post", timestamp)
+            return await CommentService.get_comment_page(
+                post_id,
+                sort,
+                limit,
+                cursor=cursor_values,
+                viewer_id=current_user.id if current_user else None,
+            )
+
+        return await CommentService._cached_for_anonymous(
+            post_id, current_user, f"comments:{sort}:{limit}:{cursor or ''}", load
+        )
+
+    @staticmethod
+    async def get_replies(
+        post_id: int,
+        comment_id: int,
+        current_user: User | None,
+        sort: str,
+        limit: int,
+        cursor: str | None,
+        timestamp: str,
+    ) -> dict:
+        """루트 댓글의 대댓글 목록을 키셋 페이지네이션으로 조회합니다.
+
+        삭제된 루트 댓글(플레이스홀더)의 대댓글도 조회할 수 있습니다.
+
+        Raises:
+            HTTPException: 커서가 유효하지 않으면 400, 게시글 또는 루트 댓글이 없으면 404.
+        """
+        cursor_values = None
+        if cursor is not None:
+            cursor_values = decode_cursor(
+                cursor, _replies_scope(comment_id, sort), comment_models.thread_cursor_arity(sort), timestamp
+            )
+        viewer_id = current_user.id if current_user else None
+
+        async def load() -> dict:
+            if not await post_models.get_post_by_id(post_id):
+                raise not_found_error("post", timestamp)
+            if not await comment_models.is_root_comment(post_id, comment_id):
+                raise not_found_error("comment", timestamp)
+
+            replies = await comment_models.get_replies(
+                post_id, comment_id, sort, limit + 1, cursor=cursor_values, blocked_by=viewer_id
+            )
+            has_more = len(replies) > limit
+            replies = replies[:limit]
+            next_cursor = encode_cursor(_replies_scope(comment_id, sort), replies[-1]["sort_key"]) if has_more else None
+
+            liked_ids: set[int] = set()
+            if viewer_id is not None:
+                liked_ids = await get_liked_comment_ids(viewer_id, [r["comment_id"] for r in replies])
+            _finalize(replies, liked_ids)
+            return {"replies": replies, "pagination": {"has_more": has_more, "next_cursor": next_cursor}}
+
+        return await CommentService._cached_for_anonymous(
+            post_id, current_user, f"replies:{comment_id}:{sort}:{limit}:{cursor or ''}", load
+        )
+
     @staticmethod
     async def create_comment(
         post_id: int,
@@ -113,90 +289,40 @@ class CommentService:
             content=content,
             parent_id=parent_id,
         )
-
-        # 평판 포인트 부여 (best-effort)
-        try:
-            from modules.reputation.service import ReputationService
-
-            await ReputationService.award_points(
-                user_id=user_id,
-                event_type="comment_created",
-                points=2,
-                source_type="comment",
-                source_id=comment.id,
-            )
-        except Exception:
-            logger.warning("평판 포인트 부여 실패 (create_comment)", exc_info=True)
-
-        # 알림 생성 (실패해도 댓글 생성에 영향 없음)
-        if comment.parent_id and parent_id is not None:
-            # 대댓글 → 부모 댓글 작성자에게 알림
-            if parent_comment and parent_comment.author_id:
-                await safe_notify(
-                    user_id=parent_comment.author_id,
-                    notification_type="comment",
-                    actor_id=user_id,
-                    actor_nickname=actor_nickname,
-                    post_id=post_id,
-                    comment_id=comment.id,
-                )
-        else:
-            # 일반 댓글 → 게시글 작성자에게 알림
-            if post.author_id:
-                await safe_notify(
-                    user_id=post.author_id,
-                    notification_type="comment",
-                    actor_id=user_id,
-                    actor_nickname=actor_nickname,
-                    post_id=post_id,
-                    comment_id=comment.id,
-                )
-
-        # 멘션 알림 — 닉네임 일괄 조회로 N+1 방지 (자기 자신 제외는 create_notification 내부에서 처리)
-        nicknames = extract_mentions(content)
-        mentioned_users: dict = {}
-        if nicknames:
-            try:
-                mentioned_users = await get_users_by_nicknames(list(nicknames))
-            except Exception:
-                logger.warning("멘션 사용자 일괄 조회 실패", exc_info=True)
-                mentioned_users = {}
-            for mentioned_user in mentioned_users.values():
-                await safe_notify(
-                    user_id=mentioned_user.id,
-                    notification_type="mention",
-                    actor_id=user_id,
-                    actor_nickname=actor_nickname,
-                    post_id=post_id,
-                    comment_id=comment.id,
-                )
-
-        # 댓글 작성자 자동 구독
-        await subscription_models.auto_subscribe(user_id, post_id)
-
-        # watching 구독자에게 reply 알림 발송
-        try:
-            watching_ids = await subscription_models.get_watching_user_ids(post_id)
-            # 이미 알림 받은 사용자 제외: 댓글 작성자, 게시글 작성자, 부모 댓글 작성자, 멘션 대상자
-            already_notified: set[int] = {user_id}
-            if post.author_id:
-                already_notified.add(post.author_id)
-            if parent_comment and parent_comment.author_id:
-                already_notified.add(parent_comment.author_id)
-            # mentioned_users는 위 멘션 섹션에서 이미 조회됨
-            if mentioned_users:
-                already_notified.update(u.id for u in mentioned_users.values())
-
-            candidates = [wid for wid in watching_ids if wid not in already_notified]
-            muted = await get_muted_user_ids(candidates, "reply") if candidates else set()
-            bulk_rows: list[tuple] = [
-                (wid, "reply", post_id, comment.id, user_id) for wid in candidates if wid not in muted
+        await invalidate_post_responses(post_id)
+
+        # 평판/알림/구독 후속 처리는 잡으로 적재하고 바로 응답 (워커가 처리)
+        from modules.post.jobs import comment_created_jobs
+        from modules.reputation.jobs import award_job
+        from modules.reputation.service import ReputationEvent
+
+        await enqueue_many(
+            [
+                award_job(
+                    [
+                        ReputationEvent(
+                            user_id=user_id,
+                            event_type="comment_created",
+                            points=2,
+                            source_type="comment",
+                            source_id=comment.id,
+                        )
+                    ]
+                ),
+                *comment_created_jobs(
+                    {
+                        "post_id": post_id,
+                        "comment_id": comment.id,
+                        "user_id": user_id,
+                        "actor_nickname": actor_nickname,
+                        "post_author_id": post.author_id,
+                        "is_reply": parent_comment is not None,
+                        "parent_author_id": parent_comment.author_id if parent_comment else None,
+                        "mentions": list(extract_mentions(content)),
+                    }
+                ),
             ]
-
-            if bulk_rows:
-                await notification_models.create_notifications_bulk(bulk_rows)
-        except Exception:
-            logger.warning("구독자 reply 알림 생성 실패", exc_info=True)
+        )
 
         return comment
 
@@ -246,6 +372,7 @@ class CommentService:
             content,
         )
         assert updated_comment is not None  # 댓글 존재는 위에서 검증됨
+        await invalidate_post_responses(post_id)
 
         # 새로 추가된 멘션에 대해서만 알림 — 닉네임 일괄 조회로 N+1 방지
         new_mentions = set(extract_mentions(content)) - old_mentions
@@ -301,4 +428,14 @@ class CommentService:
                 message="댓글 작성자만 수정/삭제할 수 있습니다.",
             )
 
-        await comment_models.delete_comment(comment_id)
+        deleted = await comment_models.delete_comment(comment_id)
+        await invalidate_post_responses(post_id)
+
+        # 배지 집계 카운터 되돌리기 (best-effort)
+        if deleted:
+            try:
+                from modules.reputation.service import ReputationService
+
+                await ReputationService.retract_counters(comment.author_id, "comment_created")
+            except Exception:
+                logger.warning("배지 카운터 회수 실패 (comment_id=%d)", comment_id, exc_info=True)
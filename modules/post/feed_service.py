@@ -1,161 +1,377 @@
-"""feed_service: 추천 피드 배치 오케스트레이션.
+"""feed_service: 추천 피드 친화도 갱신 및 점수 계산 오케스트레이션.
 
-신호 수집 → 점수 계산 → DB UPSERT를 주기적으로 실행합니다.
+- 이벤트 경로: 좋아요/북마크/댓글/팔로우/조회 잡이 사용자 친화도 가중치를 증분 갱신하고 그 사용자만 재정렬
+- 배치 경로: 가중치에 시간 감쇠를 반영하고, 저장된 가중치로 전체 사용자 점수를 재계산 (hot_score/후보 변화 반영)
 """
 
 import asyncio
 import logging
+import multiprocessing
 import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from types import ModuleType
 
+from core.config import settings
+from core.database.connection import advisory_lock
 from modules.post import affinity_models
+from modules.post.affinity_models import AffinityWeights
 from modules.post.affinity_scorer import (
-    build_profile,
-    compute_combined_score,
-    score_post,
+    SIGNAL_WEIGHTS,
+    post_event_deltas,
+    profile_from_weights,
+    rank_candidates,
+    weights_from_signals,
 )
 
 logger = logging.getLogger(__name__)
 
-# 동시 배치 실행 방지
-_CONCURRENCY_LOCK = asyncio.Lock()
-
 # 후보 게시글 최대 기간 (일)
 _CANDIDATE_MAX_AGE_DAYS = 7
 
-# 신호 수집 기간 (일)
+# 신호 수집 기간 (일) — 활성 사용자 판정, 저장된 가중치가 없는 사용자의 초기값 계산에 사용
 _SIGNAL_LOOKBACK_DAYS = 30
 
+# 감쇠 후 이 값 미만인 친화도 가중치는 삭제
+_MIN_AFFINITY_WEIGHT = 0.01
+
+# 이벤트 재정렬용 후보 게시글 캐시 TTL (초). 배치는 매번 새로 조회
+_CANDIDATE_CACHE_SECONDS = 60.0
+
 # 사용자당 최대 저장 점수 수
 _MAX_SCORES_PER_USER = 200
 
+# 배치 엔진 사용자 청크 크기 (청크당 신호 쿼리 7회 + 점수 교체 트랜잭션 1회, 체크포인트 단위)
+_BATCH_USER_CHUNK_SIZE = 200
+
+# 중단된 실행을 이어서 처리하는 최대 경과 시간 (분). 더 오래된 미완료 체크포인트는 처음부터 다시 실행
+_CHECKPOINT_RESUME_MINUTES = 120
+
+# 청크 점수 계산기: (사용자 청크, 가중치) → {user_id: 상위 점수 행}
+_ChunkScorer = Callable[[list[int], dict[int, AffinityWeights]], Awaitable[dict[int, list[dict]]]]
+
+# 이벤트 재정렬용 후보 게시글 캐시: (만료 시각, 후보 목록)
+_candidate_cache: tuple[float, list[dict]] | None = None
+
+
+def _half_life_seconds() -> float:
+    return settings.AFFINITY_HALF_LIFE_DAYS * 86400
+
+
+def clear_candidate_cache() -> None:
+    """이벤트 재정렬용 후보 게시글 캐시를 비웁니다 (테스트 격리용)."""
+    global _candidate_cache
+    _candidate_cache = None
+
+
+async def _get_cached_candidates() -> list[dict]:
+    global _candidate_cache
+    now = time.monotonic()
+    if _candidate_cache is None or _candidate_cache[0] <= now:
+        candidates = await affinity_models.get_candidate_posts_meta(max_age_days=_CANDIDATE_MAX_AGE_DAYS)
+        _candidate_cache = (now + _CANDIDATE_CACHE_SECONDS, candidates)
+    return _candidate_cache[1]
+
+
+def _rank_per_user(
+    chunk: list[int], weights: dict[int, AffinityWeights], candidates: list[dict]
+) -> dict[int, list[dict]]:
+    """사용자별 기준 구현으로 청크를 계산합니다 (numpy/scipy 미설치 폴백, 이벤트 재정렬)."""
+    return {
+        user_id: rank_candidates(
+            user_id,
+            profile_from_weights(weights.get(user_id) or AffinityWeights()),
+            candidates,
+            _MAX_SCORES_PER_USER,
+        )
+        for user_id in chunk
+    }
+
+
+def _score_rows(chunk: list[int], ranked: dict[int, list[dict]]) -> list[tuple[int, int, float, float, float]]:
+    return [
+        (user_id, r["post_id"], r["affinity_score"], r["hot_score"], r["combined_score"])
+        for user_id in chunk
+        for r in ranked[user_id]
+    ]
+
+
+def _load_batch_engine() -> ModuleType | None:
+    """affinity_batch 모듈을 반환합니다. numpy/scipy(k8s extra)가 없으면 None."""
+    try:
+        from modules.post import affinity_batch
+    except ImportError:
+        logger.info("numpy/scipy 미설치 — 사용자별 추천 점수 계산으로 대체")
+        return None
+    return affinity_batch
+
 
 class FeedService:
     """추천 피드 점수 관리 서비스."""
 
     @staticmethod
-    async def recompute_all_scores() -> dict:
-        """전체 활성 사용자의 추천 점수를 재계산합니다.
+    async def recompute_all_scores(shard_index: int = 0, shard_count: int = 1) -> dict:
+        """활성 사용자 중 한 샤드(user_id % shard_count == shard_index)의 추천 점수를 재계산합니다.
+
+        친화도 가중치는 이벤트 잡이 증분 갱신하므로, 배치는 시간 감쇠만 반영한 뒤
+        저장된 가중치로 후보 게시글(hot_score 변화 포함)을 다시 정렬합니다.
 
-        멱등 설계: 락으로 동시 실행 방지, UPSERT로 부분 실패 시 재실행 안전.
+        샤드마다 MySQL GET_LOCK 리스로 Pod 간 동시 실행을 막고, 청크마다 진행 위치를
+        체크포인트로 남겨 중단된 실행은 다음 호출에서 이어서 처리합니다.
+        기본값(shard_count=1)은 전체 사용자를 한 번에 처리합니다.
 
         Returns:
-            {"users_processed": int, "scores_written": int, "elapsed_s": float}
-            또는 이미 실행 중이면 {"skipped": True}.
+            {"users_processed", "completed", "candidates", "engine", "processes", "shard_index", "shard_count",
+             "resumed_after_user_id", "weights_pruned", "elapsed_s"}.
+            같은 샤드가 실행 중이면 {"skipped": True, ...}.
         """
-        if _CONCURRENCY_LOCK.locked():
-            logger.warning("피드 배치 작업 이미 실행 중 — 건너뜀")
-            return {"skipped": True}
+        shard = {"shard_index": shard_index, "shard_count": shard_count}
+        async with advisory_lock(f"feed_recompute:{shard_count}:{shard_index}") as acquired:
+            if not acquired:
+                logger.warning("피드 배치 샤드 %d/%d 이미 실행 중 — 건너뜀", shard_index, shard_count)
+                return {"skipped": True, **shard}
+            return {**await FeedService._recompute_shard(shard_index, shard_count), **shard}
+
+    @staticmethod
+    async def _recompute_shard(shard_index: int, shard_count: int) -> dict:
+        """리스를 보유한 상태에서 샤드 하나를 재계산합니다."""
+        start = time.monotonic()
 
-        async with _CONCURRENCY_LOCK:
-            start = time.monotonic()
-            users_processed = 0
+        # 1. 후보 게시글 메타 로드 (최근 N일)
+        candidates = await affinity_models.get_candidate_posts_meta(
+            max_age_days=_CANDIDATE_MAX_AGE_DAYS,
+        )
+        if not candidates:
+            logger.info("추천 후보 게시글 없음")
+            return {
+                "users_processed": 0,
+                "scores_written": 0,
+                "elapsed_s": 0.0,
+            }
+
+        # 2. 체크포인트 이후의 샤드 활성 사용자 목록 (오름차순)
+        resume_after = await affinity_models.start_recompute_checkpoint(
+            shard_count, shard_index, _CHECKPOINT_RESUME_MINUTES
+        )
 
-            # 1. 후보 게시글 메타 로드 (최근 N일)
-            candidates = await affinity_models.get_candidate_posts_meta(
-                max_age_days=_CANDIDATE_MAX_AGE_DAYS,
+        # 3. 새 실행이면 샤드 친화도 가중치에 시간 감쇠 반영 (재개 시에는 이미 반영됨)
+        weights_pruned = 0
+        if resume_after == 0:
+            weights_pruned = await affinity_models.decay_affinity_weights(
+                _half_life_seconds(), _MIN_AFFINITY_WEIGHT, shard_count, shard_index
             )
-            if not candidates:
-                logger.info("추천 후보 게시글 없음")
-                return {
-                    "users_processed": 0,
-                    "scores_written": 0,
-                    "elapsed_s": 0.0,
-                }
-
-            candidate_post_ids = {c["post_id"] for c in candidates}
-
-            # 2. 활성 사용자 목록
-            user_ids = await affinity_models.get_active_user_ids(
-                lookback_days=_SIGNAL_LOOKBACK_DAYS,
+        user_ids = await affinity_models.get_active_user_ids(
+            lookback_days=_SIGNAL_LOOKBACK_DAYS,
+            shard_count=shard_count,
+            shard_index=shard_index,
+            after_user_id=resume_after,
+        )
+        logger.info(
+            "피드 배치 시작 (샤드 %d/%d, user_id > %d부터): 후보 %d개, 사용자 %d명",
+            shard_index,
+            shard_count,
+            resume_after,
+            len(candidates),
+            len(user_ids),
+        )
+        chunks = [user_ids[i : i + _BATCH_USER_CHUNK_SIZE] for i in range(0, len(user_ids), _BATCH_USER_CHUNK_SIZE)]
+
+        # 4. 점수 계산 — numpy/scipy가 있으면 사용자 청크 단위 배치 엔진, 없으면 사용자별 계산
+        batch_engine = _load_batch_engine()
+        processes = settings.FEED_RECOMPUTE_PROCESSES if batch_engine is not None else 0
+        if batch_engine is None:
+
+            async def score_per_user(chunk: list[int], weights: dict) -> dict[int, list[dict]]:
+                return await asyncio.to_thread(_rank_per_user, chunk, weights, candidates)
+
+            users_processed, completed = await FeedService._run_chunks(
+                shard_index,
+                shard_count,
+                chunks,
+                partial(FeedService._process_chunk, score=score_per_user),
+                parallelism=1,
             )
-            logger.info(
-                "피드 배치 시작: 후보 %d개, 사용자 %d명",
-                len(candidates),
-                len(user_ids),
+        elif processes > 0:
+            # CPU 연산을 프로세스 풀로 분산 (워커마다 후보 행렬 1회 준비, spawn으로 이벤트 루프 상태 미상속)
+            executor = ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=batch_engine.init_worker,
+                initargs=(candidates,),
             )
+            loop = asyncio.get_running_loop()
 
-            # 3. 사용자별 점수 계산
-            for user_id in user_ids:
-                try:
-                    await FeedService._process_user(
-                        user_id,
-                        candidates,
-                        candidate_post_ids,
-                    )
-                    users_processed += 1
-                except Exception:
-                    logger.warning(
-                        "사용자 %s 추천 점수 계산 실패",
-                        user_id,
-                        exc_info=True,
-                    )
-
-                # 이벤트 루프 양보 (HTTP 요청 블로킹 방지)
-                await asyncio.sleep(0)
-
-            elapsed = time.monotonic() - start
-            result = {
-                "users_processed": users_processed,
-                "candidates": len(candidates),
-                "elapsed_s": round(elapsed, 2),
-            }
-            logger.info("피드 배치 완료: %s", result)
-            return result
+            async def score_in_pool(chunk: list[int], weights: dict) -> dict[int, list[dict]]:
+                return await loop.run_in_executor(
+                    executor, batch_engine.rank_users_in_worker, chunk, weights, _MAX_SCORES_PER_USER
+                )
+
+            try:
+                users_processed, completed = await FeedService._run_chunks(
+                    shard_index,
+                    shard_count,
+                    chunks,
+                    partial(FeedService._process_chunk, score=score_in_pool),
+                    parallelism=processes,
+                )
+            finally:
+                await asyncio.to_thread(executor.shutdown)
+        else:
+            candidate_matrix = batch_engine.prepare_candidates(candidates)
+
+            async def score_in_thread(chunk: list[int], weights: dict) -> dict[int, list[dict]]:
+                # CPU 연산은 스레드로 넘겨 이벤트 루프(HTTP 요청)를 막지 않음
+                return await asyncio.to_thread(
+                    batch_engine.rank_users_batch, chunk, weights, candidate_matrix, _MAX_SCORES_PER_USER
+                )
+
+            users_processed, completed = await FeedService._run_chunks(
+                shard_index,
+                shard_count,
+                chunks,
+                partial(FeedService._process_chunk, score=score_in_thread),
+                parallelism=1,
+            )
+
+        elapsed = time.monotonic() - start
+        result = {
+            "users_processed": users_processed,
+            "completed": completed,
+            "candidates": len(candidates),
+            "engine": "batch" if batch_engine is not None else "per_user",
+            "processes": processes,
+            "resumed_after_user_id": resume_after,
+            "weights_pruned": weights_pruned,
+            "elapsed_s": round(elapsed, 2),
+        }
+        logger.info("피드 배치 완료 (샤드 %d/%d): %s", shard_index, shard_count, result)
+        return result
 
     @staticmethod
-    async def _process_user(
-        user_id: int,
-        candidates: list[dict],
-        candidate_post_ids: set[int],
-    ) -> None:
-        """단일 사용자의 추천 점수를 계산하고 저장합니다."""
-        # 신호 수집
-        signals = await affinity_models.get_user_signals(
-            user_id,
-            lookback_days=_SIGNAL_LOOKBACK_DAYS,
-        )
+    async def _run_chunks(
+        shard_index: int,
+        shard_count: int,
+        chunks: list[list[int]],
+        process_chunk: Callable[[list[int]], Awaitable[int | None]],
+        parallelism: int,
+    ) -> tuple[int, bool]:
+        """청크를 parallelism개씩 동시에 처리하고, 묶음이 끝날 때마다 체크포인트를 전진시킵니다.
+
+        사용자 ID 오름차순 청크를 순서대로 묶으므로, 체크포인트는 앞에서부터 연속으로 성공한 청크의
+        마지막 사용자까지만 전진합니다. 실패한 청크가 있으면 그 묶음에서 멈추고 체크포인트를 완료하지 않으므로
+        다음 실행이 실패한 청크부터 재개합니다.
+
+        Returns:
+            (처리에 성공한 사용자 수, 샤드 전체를 끝까지 처리했는지).
+        """
+        processed = 0
+        for i in range(0, len(chunks), parallelism):
+            wave = chunks[i : i + parallelism]
+            results = await asyncio.gather(*(process_chunk(chunk) for chunk in wave))
+            succeeded = 0
+            while succeeded < len(results) and results[succeeded] is not None:
+                succeeded += 1
+            if succeeded:
+                wave_processed = sum(r or 0 for r in results[:succeeded])
+                processed += wave_processed
+                await affinity_models.advance_recompute_checkpoint(
+                    shard_count, shard_index, wave[succeeded - 1][-1], wave_processed
+                )
+            if succeeded < len(wave):
+                logger.warning(
+                    "피드 배치 샤드 %d/%d 중단: user_id %d부터의 청크 실패 — 다음 실행에서 재개",
+                    shard_index,
+                    shard_count,
+                    wave[succeeded][0],
+                )
+                return processed, False
+        await affinity_models.complete_recompute_checkpoint(shard_count, shard_index)
+        return processed, True
 
-        # 프로필 구축
-        profile = build_profile(signals)
-        if profile.is_empty:
-            # 활동이 있지만 태깅/카테고리 없는 사용자 — 점수 생성 불필요
-            await affinity_models.delete_stale_scores(user_id, set())
+    @staticmethod
+    async def _process_chunk(chunk: list[int], score: _ChunkScorer) -> int | None:
+        """사용자 청크의 가중치 일괄 조회 → 점수 계산 → 점수 교체를 수행합니다.
+
+        Returns:
+            처리에 성공한 사용자 수, 실패하면 None (체크포인트를 전진시키지 않음).
+        """
+        try:
+            weights = await affinity_models.get_affinity_weights(chunk, _half_life_seconds())
+            weights.update(await FeedService._seed_missing_weights([u for u in chunk if u not in weights]))
+            ranked = await score(chunk, weights)
+            await affinity_models.replace_user_post_scores(chunk, _score_rows(chunk, ranked))
+        except Exception:
+            logger.warning("사용자 청크 추천 점수 계산 실패: %s..%s", chunk[0], chunk[-1], exc_info=True)
+            return None
+        return len(chunk)
+
+    @staticmethod
+    async def _seed_missing_weights(user_ids: list[int]) -> dict[int, AffinityWeights]:
+        """저장된 가중치가 없는 사용자의 초기 가중치를 최근 신호로 만들어 저장합니다 (cold start).
+
+        Returns:
+            {user_id: 초기 가중치}. 신호가 없는 사용자도 빈 가중치로 포함.
+        """
+        if not user_ids:
+            return {}
+        signals = await affinity_models.get_users_signals(user_ids, lookback_days=_SIGNAL_LOOKBACK_DAYS)
+        seeded = {user_id: weights_from_signals(user_signals) for user_id, user_signals in signals.items()}
+        await affinity_models.insert_affinity_weights(seeded)
+        return seeded
+
+    # ============ 이벤트 기반 증분 갱신 ============
+
+    @staticmethod
+    async def apply_post_event(user_id: int, event: str, post_id: int, event_id: str | None = None) -> None:
+        """게시글 이벤트(좋아요/북마크/댓글/조회 및 취소)를 사용자 친화도 가중치에 반영합니다.
+
+        저장된 가중치가 없는 사용자는 이 이벤트를 이미 포함한 최근 신호로 초기값을 만들므로 증감을 건너뜁니다.
+        event_id가 있으면 이미 적용된 이벤트(잡 재전달)는 다시 반영하지 않습니다.
+        """
+        post = await affinity_models.get_post_affinity_keys(post_id)
+        if post is None:
             return
+        if await FeedService._seed_missing_weights_for(user_id, event_id):
+            return
+        deltas = post_event_deltas(event, post)
+        if deltas:
+            await affinity_models.add_affinity_weights(user_id, deltas, _half_life_seconds(), event_id)
 
-        # 후보 게시글 점수 계산 (자기 게시글 제외)
-        scored_rows: list[dict] = []
-        for post in candidates:
-            if post["author_id"] == user_id:
-                continue
-
-            affinity = score_post(
-                profile,
-                post_tag_ids=post["tag_ids"],
-                post_category_id=post["category_id"],
-                post_author_id=post["author_id"],
-            )
+    @staticmethod
+    async def apply_follow_event(user_id: int, author_id: int, followed: bool, event_id: str | None = None) -> None:
+        """팔로우/언팔로우를 작성자 친화도 가중치에 반영합니다.
 
-            if affinity <= 0.0:
-                continue
-
-            combined = compute_combined_score(affinity, post["hot_score"])
-            scored_rows.append(
-                {
-                    "post_id": post["post_id"],
-                    "affinity_score": round(affinity, 6),
-                    "hot_score": round(post["hot_score"], 6),
-                    "combined_score": round(combined, 6),
-                }
-            )
+        언팔로우는 팔로우 몫만 빼므로 그 작성자 글에 남긴 좋아요/댓글 등의 가중치는 유지됩니다 (좋아요 취소와 동일).
+        """
+        if await FeedService._seed_missing_weights_for(user_id, event_id):
+            return
+        weight = SIGNAL_WEIGHTS["followed_author"]
+        await affinity_models.add_affinity_weights(
+            user_id, [("author", author_id, weight if followed else -weight)], _half_life_seconds(), event_id
+        )
 
-        # 점수 순 정렬 후 상위 N개만 저장
-        scored_rows.sort(key=lambda r: r["combined_score"], reverse=True)
-        scored_rows = scored_rows[:_MAX_SCORES_PER_USER]
+    @staticmethod
+    async def _seed_missing_weights_for(user_id: int, event_id: str | None = None) -> bool:
+        """사용자의 저장된 가중치가 없으면 초기값을 만들고 True를 반환합니다.
 
-        # UPSERT
-        if scored_rows:
-            await affinity_models.upsert_user_post_scores(user_id, scored_rows)
+        초기값은 이벤트를 이미 포함하므로, 재전달된 이벤트가 시드 후 다시 더해지지 않도록 적용 기록을 먼저 남깁니다.
+        """
+        if await affinity_models.get_affinity_weights([user_id], _half_life_seconds()):
+            return False
+        if event_id is not None:
+            await affinity_models.mark_affinity_event_applied(event_id, user_id)
+        await FeedService._seed_missing_weights([user_id])
+        return True
 
-        # 후보 목록에 없는 오래된 점수 삭제
-        valid_ids = {r["post_id"] for r in scored_rows}
-        await affinity_models.delete_stale_scores(user_id, valid_ids)
+    @staticmethod
+    async def rerank_user(user_id: int) -> int:
+        """저장된 가중치로 한 사용자의 추천 점수를 즉시 다시 계산합니다.
+
+        Returns:
+            저장된 점수 행 수.
+        """
+        candidates = await _get_cached_candidates()
+        weights = await affinity_models.get_affinity_weights([user_id], _half_life_seconds())
+        ranked = await asyncio.to_thread(_rank_per_user, [user_id], weights, candidates)
+        return await affinity_models.replace_user_post_scores([user_id], _score_rows([user_id], ranked))
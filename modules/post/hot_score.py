@@ -0,0 +1,27 @@
+"""hot_score: 게시글 인기도(Hot Score) 수식.
+
+post.hot_score 컬럼에 저장해 두고 (deleted_at, is_pinned, hot_score, created_at) 인덱스로 정렬합니다.
+- 좋아요/댓글/조회 쓰기: 카운터를 증감하는 같은 UPDATE에서 HOT_SCORE_ASSIGNMENT로 즉시 갱신
+- 시간 감쇠: 배치(post_models.recompute_hot_scores)가 감쇠 구간 안의 게시글만 주기적으로 재계산하고,
+  구간을 벗어난 게시글은 0으로 내림
+"""
+
+
+def hot_score_sql(alias: str = "p") -> str:
+    """Hot Score SQL 수식을 반환합니다.
+
+    가중치: 좋아요 x3, 댓글 x2, 조회 x0.5 / 시간 감쇠(1.5제곱)
+    비정규화 카운터 컬럼(likes_count, comments_count)을 직접 읽으므로 집계 JOIN이 필요 없습니다.
+    수식 변경 시 이 함수만 수정하면 저장 컬럼 갱신/배치 재계산에 모두 반영됩니다.
+    """
+    return (
+        f"({alias}.likes_count * 3"
+        f" + {alias}.comments_count * 2"
+        f" + {alias}.views * 0.5)"
+        f" / POW(TIMESTAMPDIFF(HOUR, {alias}.created_at, NOW()) + 2, 1.5)"
+    )
+
+
+# 단일 테이블 UPDATE post SET 절에 카운터 증감 뒤에 붙이는 할당식.
+# MySQL은 단일 테이블 UPDATE의 할당을 왼쪽부터 평가하므로 증감된 카운터 값으로 계산됩니다.
+HOT_SCORE_ASSIGNMENT = f"hot_score = {hot_score_sql('post')}"
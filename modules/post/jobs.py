@@ -0,0 +1,187 @@
+"""jobs: 댓글 작성 후속 처리 및 추천 피드 친화도 갱신 비동기 잡 핸들러.
+
+댓글 작성 API는 댓글 INSERT 커밋 후 아래 잡을 적재하고 바로 응답합니다.
+- post.comment_notify: 부모 댓글/게시글 작성자 알림 + 멘션 알림 (best-effort, 재시도하지 않음)
+- post.auto_subscribe: 댓글 작성자 자동 구독 (INSERT IGNORE라 재실행에 안전)
+- post.comment_watcher_fanout: watching 구독자 reply 알림 일괄 생성 (실패 시 재시도)
+
+좋아요/북마크/댓글/조회/팔로우는 post.affinity_event로 사용자 친화도 가중치를 갱신하고 추천 점수를 재정렬합니다.
+게시글 작성/태그·카테고리 변경/삭제는 post.related_refresh로 연관 게시글 색인을 갱신합니다.
+"""
+
+import logging
+import uuid
+from typing import Any
+
+from core.jobs import enqueue
+from core.jobs.registry import job_handler
+from core.utils.exceptions import safe_notify
+from modules.notification import models as notification_models
+from modules.notification.setting_models import get_muted_user_ids
+from modules.post import subscription_models
+from modules.user.models import get_users_by_nicknames
+
+logger = logging.getLogger(__name__)
+
+COMMENT_NOTIFY_JOB = "post.comment_notify"
+AUTO_SUBSCRIBE_JOB = "post.auto_subscribe"
+COMMENT_WATCHER_FANOUT_JOB = "post.comment_watcher_fanout"
+AFFINITY_EVENT_JOB = "post.affinity_event"
+RELATED_REFRESH_JOB = "post.related_refresh"
+
+
+def comment_created_jobs(payload: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
+    """댓글 작성 후 적재할 잡 목록을 반환합니다.
+
+    Args:
+        payload: post_id, comment_id, user_id, actor_nickname, post_author_id,
+            is_reply, parent_author_id(대댓글이 아니거나 탈퇴한 작성자면 None), mentions(닉네임 목록).
+    """
+    return [
+        (COMMENT_NOTIFY_JOB, payload),
+        (AUTO_SUBSCRIBE_JOB, {"user_id": payload["user_id"], "post_id": payload["post_id"]}),
+        (COMMENT_WATCHER_FANOUT_JOB, payload),
+        affinity_event_job(payload["user_id"], "comment", post_id=payload["post_id"]),
+    ]
+
+
+def affinity_event_job(
+    user_id: int,
+    event: str,
+    post_id: int | None = None,
+    author_id: int | None = None,
+) -> tuple[str, dict[str, Any]]:
+    """친화도 이벤트 잡 (이름, payload)을 만듭니다.
+
+    Args:
+        event: 게시글 이벤트(like, unlike, bookmark, unbookmark, comment, view)면 post_id,
+            follow/unfollow면 author_id를 함께 전달.
+    """
+    return AFFINITY_EVENT_JOB, {
+        "user_id": user_id,
+        "event": event,
+        "post_id": post_id,
+        "author_id": author_id,
+        # 재전달 시 중복 반영 방지용 식별자 (affinity_event_applied)
+        "event_id": uuid.uuid4().hex,
+    }
+
+
+async def enqueue_affinity_event(
+    user_id: int,
+    event: str,
+    post_id: int | None = None,
+    author_id: int | None = None,
+) -> None:
+    """친화도 이벤트 잡을 적재합니다."""
+    await enqueue(*affinity_event_job(user_id, event, post_id=post_id, author_id=author_id))
+
+
+async def enqueue_related_refresh(post_id: int) -> None:
+    """연관 게시글 색인 갱신 잡을 적재합니다 (게시글 작성/태그·카테고리 변경/삭제 커밋 후)."""
+    await enqueue(RELATED_REFRESH_JOB, {"post_id": post_id})
+
+
+async def _mentioned_user_ids(nicknames: list[str]) -> list[int]:
+    if not nicknames:
+        return []
+    users = await get_users_by_nicknames(nicknames)
+    return [user.id for user in users.values()]
+
+
+@job_handler(COMMENT_NOTIFY_JOB)
+async def handle_comment_notify(payload: dict[str, Any]) -> None:
+    """대댓글이면 부모 댓글 작성자, 아니면 게시글 작성자에게 알리고 멘션 대상에게 알립니다.
+
+    개별 알림은 safe_notify로 실패를 삼키므로 이 잡은 재시도되지 않습니다 (중복 알림 방지).
+    """
+    common = {
+        "actor_id": payload["user_id"],
+        "actor_nickname": payload["actor_nickname"],
+        "post_id": payload["post_id"],
+        "comment_id": payload["comment_id"],
+    }
+    recipient_id = payload["parent_author_id"] if payload["is_reply"] else payload["post_author_id"]
+    if recipient_id:
+        await safe_notify(user_id=recipient_id, notification_type="comment", **common)
+
+    # 닉네임 일괄 조회로 N+1 방지 (자기 자신 제외는 create_notification 내부에서 처리)
+    try:
+        mentioned_ids = await _mentioned_user_ids(payload["mentions"])
+    except Exception:
+        logger.warning("멘션 사용자 일괄 조회 실패", exc_info=True)
+        mentioned_ids = []
+    for mentioned_id in mentioned_ids:
+        await safe_notify(user_id=mentioned_id, notification_type="mention", **common)
+
+
+@job_handler(AUTO_SUBSCRIBE_JOB)
+async def handle_auto_subscribe(payload: dict[str, Any]) -> None:
+    """댓글 작성자를 게시글에 자동 구독(watching)합니다."""
+    await subscription_models.auto_subscribe(payload["user_id"], payload["post_id"])
+
+
+@job_handler(COMMENT_WATCHER_FANOUT_JOB)
+async def handle_comment_watcher_fanout(payload: dict[str, Any]) -> None:
+    """watching 구독자에게 reply 알림을 일괄 생성합니다.
+
+    이미 알림을 받은 사용자(댓글 작성자, 게시글 작성자, 부모 댓글 작성자, 멘션 대상자)와
+    reply 알림을 끈 사용자는 제외합니다.
+    """
+    post_id = payload["post_id"]
+    user_id = payload["user_id"]
+
+    watching_ids = await subscription_models.get_watching_user_ids(post_id)
+    already_notified: set[int] = {user_id}
+    for author_id in (payload["post_author_id"], payload["parent_author_id"]):
+        if author_id:
+            already_notified.add(author_id)
+    already_notified.update(await _mentioned_user_ids(payload["mentions"]))
+
+    candidates = [wid for wid in watching_ids if wid not in already_notified]
+    if not candidates:
+        return
+    muted = await get_muted_user_ids(candidates, "reply")
+    bulk_rows: list[tuple] = [
+        (wid, "reply", post_id, payload["comment_id"], user_id) for wid in candidates if wid not in muted
+    ]
+    if bulk_rows:
+        await notification_models.create_notifications_bulk(bulk_rows)
+
+
+@job_handler(AFFINITY_EVENT_JOB)
+async def handle_affinity_event(payload: dict[str, Any]) -> None:
+    """친화도 가중치를 갱신하고 그 사용자의 추천 점수를 재정렬합니다.
+
+    가중치 갱신은 payload의 event_id 적용 기록과 한 트랜잭션이라, 실패 후 재시도나
+    커밋 후 ack 전 재전달(at-least-once)에도 중복 반영되지 않습니다.
+    재정렬은 best-effort로, 실패해도 다음 배치 재계산에서 반영되므로 재시도하지 않습니다.
+    """
+    from modules.post.feed_service import FeedService
+
+    user_id = payload["user_id"]
+    event = payload["event"]
+    # event_id 도입 전에 적재된 잡은 None (중복 검사 없이 반영)
+    event_id = payload.get("event_id")
+    if event in ("follow", "unfollow"):
+        await FeedService.apply_follow_event(
+            user_id, payload["author_id"], followed=event == "follow", event_id=event_id
+        )
+    else:
+        await FeedService.apply_post_event(user_id, event, payload["post_id"], event_id=event_id)
+
+    try:
+        await FeedService.rerank_user(user_id)
+    except Exception:
+        logger.warning("사용자 %s 추천 점수 재정렬 실패", user_id, exc_info=True)
+
+
+@job_handler(RELATED_REFRESH_JOB)
+async def handle_related_refresh(payload: dict[str, Any]) -> None:
+    """게시글과 영향을 받는 게시글의 연관 게시글 목록을 다시 계산합니다.
+
+    목록을 통째로 교체하므로 재실행해도 같은 결과이며, 실패하면 재시도합니다.
+    """
+    from modules.post.related_service import RelatedPostService
+
+    await RelatedPostService.refresh(payload["post_id"])
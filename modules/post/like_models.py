@@ -3,12 +3,14 @@
 주요 개선사항:
 - add_like 함수에 트랜잭션 적용 (경쟁 상태 방지)
 - INSERT와 SELECT을 원자적으로 처리하여 Phantom Read 방지
+- post.likes_count 비정규화 카운터를 같은 트랜잭션에서 증감
 """
 
 from dataclasses import dataclass
 from datetime import datetime
 
 from core.database.connection import get_cursor, transactional
+from modules.post.hot_score import HOT_SCORE_ASSIGNMENT
 
 
 @dataclass
@@ -40,10 +42,10 @@ async def get_like(post_id: int, user_id: int) -> Like | None:
 
 
 async def get_post_likes_count(post_id: int) -> int:
-    """게시글의 좋아요 개수를 조회합니다."""
+    """게시글의 좋아요 개수를 조회합니다. (post.likes_count 카운터 컬럼)"""
     async with get_cursor() as cur:
         await cur.execute(
-            "SELECT COUNT(*) AS cnt FROM post_like WHERE post_id = %s",
+            "SELECT likes_count AS cnt FROM post WHERE id = %s",
             (post_id,),
         )
         row = await cur.fetchone()
@@ -67,6 +69,11 @@ async def add_like(post_id: int, user_id: int) -> Like:
         )
         like_id = cur.lastrowid
 
+        await cur.execute(
+            f"UPDATE post SET likes_count = likes_count + 1, {HOT_SCORE_ASSIGNMENT} WHERE id = %s",
+            (post_id,),
+        )
+
         await cur.execute(
             "SELECT id, user_id, post_id, created_at FROM post_like WHERE id = %s",
             (like_id,),
@@ -86,4 +93,12 @@ async def remove_like(post_id: int, user_id: int) -> bool:
             "DELETE FROM post_like WHERE post_id = %s AND user_id = %s",
             (post_id, user_id),
         )
-        return cur.rowcount > 0
+        if cur.rowcount == 0:
+            return False
+
+        # UNSIGNED 언더플로 방지
+        await cur.execute(
+            f"UPDATE post SET likes_count = GREATEST(likes_count, 1) - 1, {HOT_SCORE_ASSIGNMENT} WHERE id = %s",
+            (post_id,),
+        )
+        return True
@@ -6,7 +6,9 @@ from pymysql.err import IntegrityError
 
 from core.utils.error_codes import ErrorCode
 from core.utils.exceptions import conflict_error, not_found_error, safe_notify
+from core.utils.response_cache import invalidate_post_responses
 from modules.post import like_models, post_models
+from modules.post.jobs import enqueue_affinity_event
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +48,7 @@ class LikeService:
             raise conflict_error(ErrorCode.ALREADY_LIKED, timestamp, "이미 좋아요를 누른 게시글입니다.") from None
 
         likes_count = await like_models.get_post_likes_count(post_id)
+        await invalidate_post_responses(post_id)
 
         # 자기 글이 아닌 경우 알림 생성
         if post.author_id and post.author_id != user_id:
@@ -57,27 +60,32 @@ class LikeService:
                 post_id=post_id,
             )
 
-        # 평판 포인트 부여 (best-effort)
-        try:
-            from modules.reputation.service import ReputationService
-
-            await ReputationService.award_points(
-                user_id=post.author_id,
-                event_type="post_liked",
-                points=10,
-                source_user_id=user_id,
-                source_type="post",
-                source_id=post_id,
-            )
-            await ReputationService.award_points(
-                user_id=user_id,
-                event_type="post_like_given",
-                points=1,
-                source_type="post",
-                source_id=post_id,
-            )
-        except Exception:
-            logger.warning("평판 포인트 부여 실패 (like_post)", exc_info=True)
+        # 추천 피드 친화도 갱신
+        await enqueue_affinity_event(user_id, "like", post_id=post_id)
+
+        # 평판 포인트 부여 — 받은 사람 + 누른 사람 이벤트를 한 잡(한 트랜잭션)으로 적재
+        from modules.reputation.jobs import enqueue_award
+        from modules.reputation.service import ReputationEvent
+
+        await enqueue_award(
+            [
+                ReputationEvent(
+                    user_id=post.author_id,
+                    event_type="post_liked",
+                    points=10,
+                    source_user_id=user_id,
+                    source_type="post",
+                    source_id=post_id,
+                ),
+                ReputationEvent(
+                    user_id=user_id,
+                    event_type="post_like_given",
+                    points=1,
+                    source_type="post",
+                    source_id=post_id,
+                ),
+            ]
+        )
 
         return {"likes_count": likes_count}
 
@@ -109,24 +117,30 @@ class LikeService:
             raise not_found_error("like", timestamp)
 
         likes_count = await like_models.get_post_likes_count(post_id)
-
-        # 평판 포인트 회수 (best-effort)
-        try:
-            from modules.reputation.service import ReputationService
-
-            await ReputationService.revoke_points(
-                user_id=post.author_id,
-                event_type="post_liked",
-                source_type="post",
-                source_id=post_id,
-            )
-            await ReputationService.revoke_points(
-                user_id=user_id,
-                event_type="post_like_given",
-                source_type="post",
-                source_id=post_id,
-            )
-        except Exception:
-            logger.warning("평판 포인트 회수 실패 (unlike_post)", exc_info=True)
+        await invalidate_post_responses(post_id)
+
+        await enqueue_affinity_event(user_id, "unlike", post_id=post_id)
+
+        # 평판 포인트 회수
+        from modules.reputation.jobs import enqueue_revoke
+        from modules.reputation.service import ReputationRevocation
+
+        await enqueue_revoke(
+            [
+                ReputationRevocation(
+                    user_id=post.author_id,
+                    event_type="post_liked",
+                    source_type="post",
+                    source_id=post_id,
+                    source_user_id=user_id,
+                ),
+                ReputationRevocation(
+                    user_id=user_id,
+                    event_type="post_like_given",
+                    source_type="post",
+                    source_id=post_id,
+                ),
+            ]
+        )
 
         return {"likes_count": likes_count}
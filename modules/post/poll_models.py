@@ -1,6 +1,9 @@
-"""poll_models: 투표 관련 데이터 모델 및 함수 모듈."""
+"""poll_models: 투표 관련 데이터 모델 및 함수 모듈.
 
-from datetime import UTC, datetime
+선택지별 poll_option.vote_count 비정규화 카운터를 투표/변경/취소와 같은 트랜잭션에서 증감합니다.
+"""
+
+from datetime import datetime
 
 from core.database.connection import get_cursor, transactional
 
@@ -26,52 +29,27 @@ async def create_poll(
     return poll_id
 
 
-async def get_poll_by_post_id(post_id: int, current_user_id: int | None = None) -> dict | None:
-    """게시글의 투표 데이터를 조회합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            "SELECT id, question, expires_at, created_at FROM poll WHERE post_id = %s",
-            (post_id,),
-        )
-        poll_row = await cur.fetchone()
-        if not poll_row:
-            return None
-
-        poll_id = poll_row["id"]
-        expires_at = poll_row["expires_at"]
-
-        is_expired = False
-        if expires_at:
-            now = datetime.now(UTC)
-            if expires_at.tzinfo is None:
-                expires_at = expires_at.replace(tzinfo=UTC)
-            is_expired = now > expires_at
+async def get_poll_snapshot(post_id: int) -> dict | None:
+    """게시글의 투표 결과 스냅샷(질문, 선택지별 투표 수, 총 투표 수)을 조회합니다.
 
+    선택지별 poll_option.vote_count 카운터를 읽으므로 poll_vote를 집계하지 않습니다 (선택지 수에 비례).
+    사용자별 값(my_vote)과 시각에 따라 바뀌는 값(is_expired)은 담지 않습니다 (poll_tally 참고).
+    """
+    async with get_cursor() as cur:
         await cur.execute(
             """
-                SELECT po.id AS option_id, po.option_text, po.sort_order,
-                       COUNT(pv.id) AS vote_count
-                FROM poll_option po
-                LEFT JOIN poll_vote pv ON po.id = pv.option_id
-                WHERE po.poll_id = %s
-                GROUP BY po.id, po.option_text, po.sort_order
-                ORDER BY po.sort_order
-                """,
-            (poll_id,),
+            SELECT p.id AS poll_id, p.question, p.expires_at,
+                   po.id AS option_id, po.option_text, po.sort_order, po.vote_count
+            FROM poll p
+            LEFT JOIN poll_option po ON po.poll_id = p.id
+            WHERE p.post_id = %s
+            ORDER BY po.sort_order, po.id
+            """,
+            (post_id,),
         )
-        option_rows = await cur.fetchall()
-
-        total_votes = sum(r["vote_count"] for r in option_rows)
-
-        my_vote = None
-        if current_user_id:
-            await cur.execute(
-                "SELECT option_id FROM poll_vote WHERE poll_id = %s AND user_id = %s",
-                (poll_id, current_user_id),
-            )
-            vote_row = await cur.fetchone()
-            if vote_row:
-                my_vote = vote_row["option_id"]
+        rows = await cur.fetchall()
+    if not rows:
+        return None
 
     options = [
         {
@@ -80,62 +58,101 @@ async def get_poll_by_post_id(post_id: int, current_user_id: int | None = None)
             "sort_order": r["sort_order"],
             "vote_count": r["vote_count"],
         }
-        for r in option_rows
+        for r in rows
+        if r["option_id"] is not None
     ]
-
     return {
-        "poll_id": poll_id,
-        "question": poll_row["question"],
-        "expires_at": poll_row["expires_at"].isoformat() if poll_row["expires_at"] else None,
-        "is_expired": is_expired,
+        "poll_id": rows[0]["poll_id"],
+        "question": rows[0]["question"],
+        "expires_at": rows[0]["expires_at"],
         "options": options,
-        "total_votes": total_votes,
-        "my_vote": my_vote,
+        "total_votes": sum(option["vote_count"] for option in options),
     }
 
 
+async def get_user_vote(poll_id: int, user_id: int) -> int | None:
+    """사용자가 선택한 옵션 ID를 조회합니다. 투표하지 않았으면 None."""
+    async with get_cursor() as cur:
+        await cur.execute(
+            "SELECT option_id FROM poll_vote WHERE poll_id = %s AND user_id = %s",
+            (poll_id, user_id),
+        )
+        row = await cur.fetchone()
+        return row["option_id"] if row else None
+
+
 async def vote(poll_id: int, option_id: int, user_id: int) -> None:
-    """투표합니다. Raises IntegrityError if already voted."""
+    """투표합니다. 선택지의 vote_count를 같은 트랜잭션에서 올립니다. Raises IntegrityError if already voted."""
     async with transactional() as cur:
         await cur.execute(
             "INSERT INTO poll_vote (poll_id, option_id, user_id) VALUES (%s, %s, %s)",
             (poll_id, option_id, user_id),
         )
+        await cur.execute("UPDATE poll_option SET vote_count = vote_count + 1 WHERE id = %s", (option_id,))
+
+
+async def _lock_user_vote(cur, poll_id: int, user_id: int) -> int | None:
+    """사용자의 투표 행을 잠그고 선택한 옵션 ID를 반환합니다 (카운터 증감 대상 확인용)."""
+    await cur.execute(
+        "SELECT option_id FROM poll_vote WHERE poll_id = %s AND user_id = %s FOR UPDATE",
+        (poll_id, user_id),
+    )
+    row = await cur.fetchone()
+    return row["option_id"] if row else None
 
 
 async def delete_vote(poll_id: int, user_id: int) -> bool:
-    """투표를 취소합니다."""
+    """투표를 취소합니다. 선택했던 선택지의 vote_count를 같은 트랜잭션에서 내립니다."""
     async with transactional() as cur:
+        option_id = await _lock_user_vote(cur, poll_id, user_id)
+        if option_id is None:
+            return False
         await cur.execute(
             "DELETE FROM poll_vote WHERE poll_id = %s AND user_id = %s",
             (poll_id, user_id),
         )
-        return cur.rowcount > 0
+        await cur.execute(
+            "UPDATE poll_option SET vote_count = GREATEST(vote_count, 1) - 1 WHERE id = %s",
+            (option_id,),
+        )
+        return True
 
 
 async def change_vote(poll_id: int, option_id: int, user_id: int) -> bool:
-    """투표를 변경합니다."""
+    """투표를 변경합니다. 이전/새 선택지의 vote_count를 같은 트랜잭션에서 옮깁니다."""
     async with transactional() as cur:
+        previous_option_id = await _lock_user_vote(cur, poll_id, user_id)
+        if previous_option_id is None:
+            return False
+        if previous_option_id == option_id:
+            return True
         await cur.execute(
             "UPDATE poll_vote SET option_id = %s WHERE poll_id = %s AND user_id = %s",
             (option_id, poll_id, user_id),
         )
-        return cur.rowcount > 0
-
-
-async def option_belongs_to_poll(option_id: int, poll_id: int) -> bool:
-    """옵션이 해당 투표에 속하는지 확인합니다."""
-    async with get_cursor() as cur:
         await cur.execute(
-            "SELECT 1 FROM poll_option WHERE id = %s AND poll_id = %s",
-            (option_id, poll_id),
+            "UPDATE poll_option SET vote_count = GREATEST(vote_count, 1) - 1 WHERE id = %s",
+            (previous_option_id,),
         )
-        return await cur.fetchone() is not None
+        await cur.execute("UPDATE poll_option SET vote_count = vote_count + 1 WHERE id = %s", (option_id,))
+        return True
 
 
-async def get_poll_id_by_post_id(post_id: int) -> int | None:
-    """게시글의 투표 ID를 조회합니다."""
-    async with get_cursor() as cur:
-        await cur.execute("SELECT id FROM poll WHERE post_id = %s", (post_id,))
-        row = await cur.fetchone()
-        return row["id"] if row else None
+async def reconcile_poll_counters() -> int:
+    """poll_option.vote_count 컬럼의 드리프트를 poll_vote 기준으로 복구합니다.
+
+    Returns:
+        카운터가 수정된 선택지 수.
+    """
+    async with transactional() as cur:
+        await cur.execute(
+            """
+            UPDATE poll_option po
+            LEFT JOIN (
+                SELECT option_id, COUNT(*) AS cnt FROM poll_vote GROUP BY option_id
+            ) pv ON po.id = pv.option_id
+            SET po.vote_count = COALESCE(pv.cnt, 0)
+            WHERE po.vote_count <> COALESCE(pv.cnt, 0)
+            """
+        )
+        return cur.rowcount
@@ -1,4 +1,7 @@
-"""poll_service: 투표 관련 비즈니스 로직을 처리하는 서비스."""
+"""poll_service: 투표 관련 비즈니스 로직을 처리하는 서비스.
+
+투표 존재/만료/옵션 소속 검증은 poll_tally의 결과 스냅샷 캐시로 합니다 (선택지와 마감 시각은 생성 후 바뀌지 않음).
+"""
 
 from pymysql.err import IntegrityError
 
@@ -8,12 +11,42 @@ from core.utils.exceptions import (
     conflict_error,
     not_found_error,
 )
+from core.utils.response_cache import invalidate_post_responses
 from modules.post import poll_models
+from modules.post.poll_tally import get_poll_snapshot, is_expired, on_poll_changed
 
 
 class PollService:
     """투표 관리 서비스."""
 
+    @staticmethod
+    async def _get_open_poll(post_id: int, timestamp: str, expired_message: str) -> dict:
+        """게시글의 투표 스냅샷을 반환합니다.
+
+        Raises:
+            HTTPException: 투표 없음(404), 만료(400).
+        """
+        snapshot = await get_poll_snapshot(post_id)
+        if snapshot is None:
+            raise not_found_error(ErrorCode.POLL_NOT_FOUND, timestamp)
+        if is_expired(snapshot):
+            raise bad_request_error(ErrorCode.POLL_EXPIRED, timestamp, expired_message)
+        return snapshot
+
+    @staticmethod
+    def _check_option(snapshot: dict, option_id: int, timestamp: str) -> None:
+        """옵션이 투표에 속하는지 확인합니다 (cross-poll vote injection 방지).
+
+        Raises:
+            HTTPException: 옵션 불일치(400).
+        """
+        if all(option["option_id"] != option_id for option in snapshot["options"]):
+            raise bad_request_error(
+                ErrorCode.INVALID_OPTION,
+                timestamp,
+                "해당 투표에 속하지 않는 옵션입니다.",
+            )
+
     @staticmethod
     async def vote_on_poll(
         post_id: int,
@@ -32,32 +65,17 @@ class PollService:
         Raises:
             HTTPException: 투표 없음(404), 만료(400), 옵션 불일치(400), 이미 투표(409).
         """
-        poll_id = await poll_models.get_poll_id_by_post_id(post_id)
-        if not poll_id:
-            raise not_found_error(ErrorCode.POLL_NOT_FOUND, timestamp)
-
-        # 만료 확인
-        poll_data = await poll_models.get_poll_by_post_id(post_id)
-        if poll_data and poll_data["is_expired"]:
-            raise bad_request_error(
-                ErrorCode.POLL_EXPIRED,
-                timestamp,
-                "만료된 투표입니다.",
-            )
-
-        # 옵션 소속 검증 (cross-poll vote injection 방지)
-        if not await poll_models.option_belongs_to_poll(option_id, poll_id):
-            raise bad_request_error(
-                ErrorCode.INVALID_OPTION,
-                timestamp,
-                "해당 투표에 속하지 않는 옵션입니다.",
-            )
+        snapshot = await PollService._get_open_poll(post_id, timestamp, "만료된 투표입니다.")
+        poll_id = snapshot["poll_id"]
+        PollService._check_option(snapshot, option_id, timestamp)
 
         # IntegrityError는 transactional() 밖에서 처리
         try:
             await poll_models.vote(poll_id, option_id, user_id)
         except IntegrityError:
             raise conflict_error(ErrorCode.ALREADY_VOTED, timestamp, "이미 투표한 투표입니다.") from None
+        on_poll_changed(post_id)
+        await invalidate_post_responses(post_id)
 
     @staticmethod
     async def cancel_vote(
@@ -70,21 +88,13 @@ class PollService:
         Raises:
             HTTPException: 투표 없음(404), 만료(400), 투표 기록 없음(404).
         """
-        poll_id = await poll_models.get_poll_id_by_post_id(post_id)
-        if not poll_id:
-            raise not_found_error(ErrorCode.POLL_NOT_FOUND, timestamp)
-
-        poll_data = await poll_models.get_poll_by_post_id(post_id)
-        if poll_data and poll_data["is_expired"]:
-            raise bad_request_error(
-                ErrorCode.POLL_EXPIRED,
-                timestamp,
-                "만료된 투표는 취소할 수 없습니다.",
-            )
+        snapshot = await PollService._get_open_poll(post_id, timestamp, "만료된 투표는 취소할 수 없습니다.")
 
-        deleted = await poll_models.delete_vote(poll_id, user_id)
+        deleted = await poll_models.delete_vote(snapshot["poll_id"], user_id)
         if not deleted:
             raise not_found_error(ErrorCode.VOTE_NOT_FOUND, timestamp)
+        on_poll_changed(post_id)
+        await invalidate_post_responses(post_id)
 
     @staticmethod
     async def change_vote(
@@ -98,25 +108,11 @@ class PollService:
         Raises:
             HTTPException: 투표 없음(404), 만료(400), 옵션 불일치(400), 투표 기록 없음(404).
         """
-        poll_id = await poll_models.get_poll_id_by_post_id(post_id)
-        if not poll_id:
-            raise not_found_error(ErrorCode.POLL_NOT_FOUND, timestamp)
-
-        poll_data = await poll_models.get_poll_by_post_id(post_id)
-        if poll_data and poll_data["is_expired"]:
-            raise bad_request_error(
-                ErrorCode.POLL_EXPIRED,
-                timestamp,
-                "만료된 투표는 변경할 수 없습니다.",
-            )
-
-        if not await poll_models.option_belongs_to_poll(option_id, poll_id):
-            raise bad_request_error(
-                ErrorCode.INVALID_OPTION,
-                timestamp,
-                "해당 투표에 속하지 않는 옵션입니다.",
-            )
+        snapshot = await PollService._get_open_poll(post_id, timestamp, "만료된 투표는 변경할 수 없습니다.")
+        PollService._check_option(snapshot, option_id, timestamp)
 
-        changed = await poll_models.change_vote(poll_id, option_id, user_id)
+        changed = await poll_models.change_vote(snapshot["poll_id"], option_id, user_id)
         if not changed:
             raise not_found_error(ErrorCode.VOTE_NOT_FOUND, timestamp)
+        on_poll_changed(post_id)
+        await invalidate_post_responses(post_id)
@@ -0,0 +1,151 @@
+"""poll_tally: 투표 결과 스냅샷 캐시와 실시간 결과 푸시.
+
+게시글 상세마다 poll_vote를 집계하던 투표 결과를 선택지별 카운터(poll_option.vote_count)로 읽고,
+그 결과 스냅샷을 게시글별로 프로세스 메모리에 캐시합니다. 인기 투표의 조회 비용은 선택지 수에 비례합니다.
+
+- 스냅샷: 질문/선택지/선택지별 투표 수 (투표가 없는 게시글도 None으로 캐시). POLL_SNAPSHOT_TTL_SECONDS 동안 유지하고,
+  이 프로세스의 투표/변경/취소는 즉시 무효화. 다른 파드의 투표는 최대 TTL 동안 이전 값
+- 사용자별 값(my_vote)은 (poll_id, user_id) 유니크 키로 따로 조회하고, is_expired는 조회 시각 기준으로 계산
+- 푸시: 투표 변경을 WebSocket 토픽(poll:{poll_id})으로 보내되, 게시글별로 POLL_PUSH_INTERVAL_SECONDS에
+  최대 한 번만 보냅니다. 첫 변경은 바로 보내고, 간격 안의 나머지 변경은 간격이 끝날 때 한 번으로 합칩니다
+"""
+
+import asyncio
+import contextlib
+import logging
+from datetime import UTC, datetime
+
+from core.config import settings
+from core.utils.versioned_cache import VersionedCache
+from core.utils.websocket_pusher import push_to_topic
+from modules.post import poll_models
+
+logger = logging.getLogger(__name__)
+
+
+class PollSnapshotCache(VersionedCache[dict | None]):
+    """post_id별 투표 결과 스냅샷 캐시 (프로세스 로컬, 투표가 없는 게시글은 None). 설정: POLL_SNAPSHOT_*."""
+
+    settings_prefix = "POLL_SNAPSHOT"
+
+    def backend(self) -> str:
+        # 스냅샷은 datetime을 담고 TTL이 짧아 L2 없이 프로세스 로컬로만 캐시
+        return "local"
+
+    def invalidate_post(self, post_id: int) -> None:
+        """이 프로세스의 게시글 스냅샷을 무효화합니다."""
+        self.bump((str(post_id),))
+
+
+poll_snapshots = PollSnapshotCache()
+
+
+async def get_poll_snapshot(post_id: int) -> dict | None:
+    """게시글의 투표 결과 스냅샷을 반환합니다 (캐시 미스 시 카운터 조회). 반환값은 읽기 전용입니다."""
+    key = str(post_id)
+    return await poll_snapshots.get_or_load(key, (key,), lambda: poll_models.get_poll_snapshot(post_id))
+
+
+def is_expired(snapshot: dict) -> bool:
+    """투표 마감 시각이 지났는지 확인합니다."""
+    expires_at: datetime | None = snapshot["expires_at"]
+    if expires_at is None:
+        return False
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=UTC)
+    return datetime.now(UTC) > expires_at
+
+
+async def get_poll(post_id: int, current_user_id: int | None = None) -> dict | None:
+    """게시글 상세 응답용 투표 데이터를 반환합니다. 투표가 없으면 None."""
+    snapshot = await get_poll_snapshot(post_id)
+    if snapshot is None:
+        return None
+
+    my_vote = None
+    if current_user_id:
+        my_vote = await poll_models.get_user_vote(snapshot["poll_id"], current_user_id)
+
+    return {
+        "poll_id": snapshot["poll_id"],
+        "question": snapshot["question"],
+        "expires_at": snapshot["expires_at"].isoformat() if snapshot["expires_at"] else None,
+        "is_expired": is_expired(snapshot),
+        "options": [dict(option) for option in snapshot["options"]],
+        "total_votes": snapshot["total_votes"],
+        "my_vote": my_vote,
+    }
+
+
+# ---- 실시간 결과 푸시 ------------------------------------------------------
+
+
+class PollUpdatePusher:
+    """게시글별 투표 결과 변경을 합쳐 최대 POLL_PUSH_INTERVAL_SECONDS에 한 번 푸시합니다 (프로세스 단위)."""
+
+    def __init__(self) -> None:
+        self._tasks: dict[int, asyncio.Task] = {}
+        self._dirty: set[int] = set()
+
+    def notify(self, post_id: int) -> None:
+        """투표 결과가 바뀌었음을 알립니다. 이미 푸시 주기가 진행 중이면 다음 푸시에 합칩니다."""
+        self._dirty.add(post_id)
+        if post_id not in self._tasks:
+            self._tasks[post_id] = asyncio.create_task(self._run(post_id))
+
+    async def _run(self, post_id: int) -> None:
+        try:
+            while post_id in self._dirty:
+                # 푸시 직전에 표시를 지워, 푸시 중에 들어온 변경은 다음 주기에 보냄
+                self._dirty.discard(post_id)
+                await self._push(post_id)
+                await asyncio.sleep(settings.POLL_PUSH_INTERVAL_SECONDS)
+        finally:
+            self._tasks.pop(post_id, None)
+
+    @staticmethod
+    async def _push(post_id: int) -> None:
+        try:
+            # 다른 파드의 투표까지 반영하도록 카운터를 다시 읽음 (변경당이 아니라 주기당 한 번)
+            poll_snapshots.invalidate_post(post_id)
+            snapshot = await get_poll_snapshot(post_id)
+            if snapshot is None:
+                return
+            event = {
+                "type": "poll_updated",
+                "post_id": post_id,
+                "poll_id": snapshot["poll_id"],
+                "options": [
+                    {"option_id": option["option_id"], "vote_count": option["vote_count"]}
+                    for option in snapshot["options"]
+                ],
+                "total_votes": snapshot["total_votes"],
+            }
+            await push_to_topic(f"poll:{snapshot['poll_id']}", event)
+        except Exception:
+            logger.warning("투표 결과 푸시 실패 (best-effort): post_id=%d", post_id, exc_info=True)
+
+    @property
+    def pending(self) -> int:
+        """진행 중인 푸시 주기 수."""
+        return len(self._tasks)
+
+    async def close(self) -> None:
+        """진행 중인 푸시 주기를 모두 취소합니다 (앱 shutdown/테스트 정리용)."""
+        tasks = list(self._tasks.values())
+        self._dirty.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks.clear()
+
+
+poll_pusher = PollUpdatePusher()
+
+
+def on_poll_changed(post_id: int) -> None:
+    """투표/변경/취소 커밋 직후 호출합니다: 이 프로세스의 스냅샷을 무효화하고 결과 푸시를 예약합니다."""
+    poll_snapshots.invalidate_post(post_id)
+    poll_pusher.notify(post_id)
@@ -1,9 +1,20 @@
-from fastapi import HTTPException, Request, UploadFile, status
+from fastapi import HTTPException, Request, Response, UploadFile, status
+from fastapi.responses import JSONResponse
 
 from core.dependencies.request_context import get_request_timestamp
+from core.utils.conditional_get import compute_etag, is_not_modified, not_modified_response, with_etag
+from core.utils.count_strategy import count_signature
 from core.utils.exceptions import bad_request_error, forbidden_error, not_found_error
 from core.utils.pagination import validate_pagination
+from core.utils.response_cache import (
+    POSTS_NAMESPACE,
+    invalidate_post_responses,
+    post_namespace,
+    viewer_namespace,
+)
 from core.utils.upload import save_file
+from core.utils.view_counter import view_counter
+from modules.post.jobs import enqueue_affinity_event
 from modules.post.post_models import ALLOWED_SORT_OPTIONS
 from modules.post.post_schemas import CreatePostRequest, UpdatePostRequest
 from modules.post.post_service import PostService
@@ -25,10 +36,13 @@ async def get_posts(
     tag: str | None = None,
     following: bool = False,
     solved: bool | None = None,
-) -> dict:
+    cursor: str | None = None,
+) -> dict | JSONResponse | Response:
     """
     게시글 목록을 조회합니다.
 
+    If-None-Match가 목록(과 로그인 사용자 상태) 버전으로 만든 ETag와 같으면 조회 없이 304를 반환합니다.
+
     Args:
         offset (int): 조회 시작 위치 (0 이상)
         limit (int): 조회할 게시글 수 (1~100)
@@ -36,6 +50,7 @@ async def get_posts(
         search (str | None): 검색어 (제목+내용). None이면 전체 조회.
         sort (str): 정렬 옵션 (latest, likes, views, comments).
         author_id (int | None): 작성자 ID로 필터링. None이면 전체 조회.
+        cursor (str | None): 이전 응답의 next_cursor. 지정하면 offset은 무시.
 
     Returns:
         dict: 게시글 목록과 페이지네이션 정보를 포함한 응답 딕셔너리
@@ -57,6 +72,27 @@ async def get_posts(
     if sort not in ALLOWED_SORT_OPTIONS:
         sort = "latest"
 
+    # 조건부 GET — 차단/팔로우/읽음 상태가 응답에 섞이는 로그인 요청은 사용자 네임스페이스도 함께 비교
+    namespaces = (POSTS_NAMESPACE,) if current_user is None else (POSTS_NAMESPACE, viewer_namespace(current_user.id))
+    etag = await compute_etag(
+        namespaces,
+        count_signature(
+            offset=offset,
+            limit=limit,
+            search=search,
+            sort=sort,
+            author_id=author_id,
+            category_id=category_id,
+            tag=tag,
+            following=following,
+            solved=solved,
+            cursor=cursor,
+            viewer=current_user.id if current_user else None,
+        ),
+    )
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified_response(etag, private=current_user is not None)
+
     # Service Layer 호출
     result = await PostService.get_posts(
         offset,
@@ -69,6 +105,8 @@ async def get_posts(
         tag=tag,
         following=following,
         solved=solved,
+        cursor=cursor,
+        timestamp=timestamp,
     )
 
     response_data = {
@@ -78,6 +116,7 @@ async def get_posts(
             "limit": limit,
             "total_count": result.total_count,
             "has_more": result.has_more,
+            "next_cursor": result.next_cursor,
         },
     }
 
@@ -86,12 +125,13 @@ async def get_posts(
     if result.effective_sort is not None:
         response_data["effective_sort"] = result.effective_sort
 
-    return create_response(
+    body = create_response(
         "POSTS_RETRIEVED",
         "게시글 목록 조회에 성공했습니다.",
         data=response_data,
         timestamp=timestamp,
     )
+    return with_etag(body, etag, private=current_user is not None)
 
 
 async def get_post(
@@ -99,10 +139,13 @@ async def get_post(
     request: Request,
     current_user: User | None = None,
     comment_sort: str = "oldest",
-) -> dict:
+) -> dict | JSONResponse | Response:
     """
     게시글 상세 정보를 조회합니다.
 
+    If-None-Match가 게시글(과 로그인 사용자 상태) 버전으로 만든 ETag와 같으면 조회 없이 304를 반환합니다.
+    로그인 사용자의 조회 기록은 304에서도 남깁니다 (재방문도 조회).
+
     Args:
         post_id (int): 조회할 게시글 ID
         request (Request): FastAPI Request 객체
@@ -126,15 +169,31 @@ async def get_post(
             },
         )
 
+    # 조건부 GET — 게시글 삭제/수정/댓글/좋아요/투표는 post 네임스페이스, 차단/팔로우는 사용자 네임스페이스를 올림
+    namespaces = (
+        (post_namespace(post_id),)
+        if current_user is None
+        else (post_namespace(post_id), viewer_namespace(current_user.id))
+    )
+    etag = await compute_etag(namespaces, f"{comment_sort}|{current_user.id if current_user else ''}")
+    if etag is not None and is_not_modified(request, etag):
+        # 조회 기록/친화도 갱신은 200 응답 경로(PostService.get_post_detail)와 동일하게 처리
+        if current_user is not None:
+            view_counted, _ = await view_counter.record_post_view(post_id, current_user.id)
+            if view_counted:
+                await enqueue_affinity_event(current_user.id, "view", post_id=post_id)
+        return not_modified_response(etag, private=current_user is not None)  # type: ignore[arg-type]
+
     # Service Layer 호출
     result_data = await PostService.get_post_detail(post_id, current_user, timestamp, comment_sort=comment_sort)
 
-    return create_response(
+    body = create_response(
         "POST_RETRIEVED",
         "게시글 조회에 성공했습니다.",
         data=result_data,
         timestamp=timestamp,
     )
+    return with_etag(body, etag, private=current_user is not None)
 
 
 async def create_post(
@@ -397,6 +456,7 @@ async def accept_answer(
 
     # 6. DB 업데이트
     await post_models.set_accepted_answer(post_id, comment_id)
+    await invalidate_post_responses(post_id)
 
     # 평판 포인트 부여 (best-effort)
     try:
@@ -465,6 +525,7 @@ async def unaccept_answer(
 
     # 4. DB 업데이트
     await post_models.unset_accepted_answer(post_id)
+    await invalidate_post_responses(post_id)
 
     # 평판 회수 (best-effort)
     if old_answer_author_id and old_answer_id:
@@ -8,41 +8,57 @@ from datetime import datetime
 
 from core.database.connection import get_cursor, transactional
 from core.utils.formatters import escape_fulltext_query
-from modules.post.comment_models import get_comments_with_author
+from core.utils.pagination import keyset_condition
+from modules.post.hot_score import HOT_SCORE_ASSIGNMENT
 from schemas.common import build_author_dict
 
 # 게시글당 허용되는 최대 이미지 수
 MAX_POST_IMAGES = 5
 
 
-def hot_score_sql(likes_alias: str = "likes", comments_alias: str = "comments") -> str:
-    """Hot Score SQL 수식을 반환합니다.
-
-    가중치: 좋아요 x3, 댓글 x2, 조회 x0.5 / 시간 감쇠(1.5제곱)
-    수식 변경 시 이 함수만 수정하면 모든 쿼리에 반영됩니다.
-    """
-    return (
-        f"(COALESCE({likes_alias}.cnt, 0) * 3"
-        f" + COALESCE({comments_alias}.cnt, 0) * 2"
-        f" + p.views * 0.5)"
-        f" / POW(TIMESTAMPDIFF(HOUR, p.created_at, NOW()) + 2, 1.5)"
-    )
-
-
 # SQL Injection 방지: 허용된 컬럼명 whitelist
 ALLOWED_POST_COLUMNS = {"title", "content", "image_url", "category_id", "updated_at"}
 
 # SQL Injection 방지: 허용된 정렬 옵션 whitelist
+# 모든 정렬은 p.id로 끝나야 키셋 커서가 행을 유일하게 가리킬 수 있음
 ALLOWED_SORT_OPTIONS = {
     "latest": "p.created_at DESC, p.id DESC",
-    "likes": "likes_count DESC, p.created_at DESC",
-    "views": "p.views DESC, p.created_at DESC",
-    "comments": "comments_count DESC, p.created_at DESC",
-    "hot": "hot_score DESC, p.created_at DESC",
-    "for_you": "COALESCE(upc.combined_score, 0) DESC, p.created_at DESC",
+    "likes": "p.likes_count DESC, p.created_at DESC, p.id DESC",
+    "views": "p.views DESC, p.created_at DESC, p.id DESC",
+    "comments": "p.comments_count DESC, p.created_at DESC, p.id DESC",
+    "hot": "p.hot_score DESC, p.created_at DESC, p.id DESC",
+    "for_you": "COALESCE(upc.combined_score, 0) DESC, p.created_at DESC, p.id DESC",
+    # 검색 색인 관련도 순 — search_ids가 주어지면 FIELD()로 색인 순위를 따르고, 없으면 최신순
+    "relevance": "p.created_at DESC, p.id DESC",
+}
+
+# 정렬별 1차 정렬 키: (WHERE 절에서 쓸 SQL 식, 결과 행의 컬럼명). latest는 created_at이 곧 1차 키
+_SORT_KEY_COLUMNS: dict[str, tuple[str, str] | None] = {
+    "latest": None,
+    "likes": ("p.likes_count", "likes_count"),
+    "views": ("p.views", "views_count"),
+    "comments": ("p.comments_count", "comments_count"),
+    "hot": ("p.hot_score", "hot_score"),
+    "for_you": ("COALESCE(upc.combined_score, 0)", "combined_score"),
+    # 관련도 순은 색인 순위가 바뀔 수 있어 키셋 커서를 지원하지 않음 (offset 페이지네이션)
+    "relevance": None,
 }
 
 
+def post_cursor_columns(sort: str) -> list[tuple[str, str]]:
+    """게시글 목록 키셋 커서를 구성하는 (SQL 식, 행 컬럼명) 목록을 반환합니다.
+
+    ORDER BY p.is_pinned DESC, {정렬} 과 동일한 순서이며 모두 DESC입니다.
+    """
+    primary = _SORT_KEY_COLUMNS.get(sort)
+    return [
+        ("p.is_pinned", "is_pinned"),
+        *([primary] if primary else []),
+        ("p.created_at", "created_at"),
+        ("p.id", "post_id"),
+    ]
+
+
 @dataclass
 class Post:
     """게시글 데이터 클래스."""
@@ -87,6 +103,16 @@ _POST_COLUMNS = (
 )
 
 
+def _not_blocked_clause(author_column: str) -> str:
+    """blocked_by 사용자가 차단한 작성자의 게시글을 제외하는 조건 (파라미터: blocked_by).
+
+    차단 목록을 NOT IN (%s, ...)으로 펼치면 목록 길이마다 쿼리 형태가 달라지고 길이에 비례해 커지므로,
+    user_block (blocker_id, blocked_id) 유니크 인덱스를 타는 상관 서브쿼리로 거릅니다.
+    작성자가 없는(NULL) 게시글은 일치하는 행이 없어 그대로 포함됩니다.
+    """
+    return f" AND NOT EXISTS (SELECT 1 FROM user_block ub WHERE ub.blocker_id = %s AND ub.blocked_id = {author_column})"
+
+
 # ============ 게시글 관련 함수 ============
 
 
@@ -94,12 +120,16 @@ async def get_total_posts_count(
     search: str | None = None,
     author_id: int | None = None,
     category_id: int | None = None,
-    blocked_user_ids: set[int] | None = None,
+    blocked_by: int | None = None,
     tag: str | None = None,
     author_ids: set[int] | None = None,
     solved: bool | None = None,
+    search_ids: list[int] | None = None,
 ) -> int:
-    """삭제되지 않은 게시글의 총 개수를 반환합니다."""
+    """삭제되지 않은 게시글의 총 개수를 반환합니다.
+
+    search_ids(검색 색인이 찾은 ID)가 주어지면 search 대신 ID 목록으로 제한합니다.
+    """
     async with get_cursor() as cur:
         where = "deleted_at IS NULL"
         params: list = []
@@ -109,7 +139,13 @@ async def get_total_posts_count(
         elif solved is False:
             where += " AND accepted_answer_id IS NULL"
 
-        if search:
+        if search_ids is not None:
+            if not search_ids:
+                return 0
+            placeholders = ", ".join(["%s"] * len(search_ids))
+            where += f" AND id IN ({placeholders})"
+            params.extend(search_ids)
+        elif search:
             escaped = escape_fulltext_query(search)
             where += " AND MATCH(title, content) AGAINST(%s IN BOOLEAN MODE)"
             params.append(escaped)
@@ -122,10 +158,9 @@ async def get_total_posts_count(
             where += " AND category_id = %s"
             params.append(category_id)
 
-        if blocked_user_ids:
-            placeholders = ", ".join(["%s"] * len(blocked_user_ids))
-            where += f" AND (author_id NOT IN ({placeholders}) OR author_id IS NULL)"
-            params.extend(blocked_user_ids)
+        if blocked_by is not None:
+            where += _not_blocked_clause("post.author_id")
+            params.append(blocked_by)
 
         if author_ids:
             placeholders = ", ".join(["%s"] * len(author_ids))
@@ -257,13 +292,78 @@ async def increment_view_count(post_id: int, user_id: int) -> bool:
         )
         if cur.rowcount > 0:
             await cur.execute(
-                "UPDATE post SET views = views + 1 WHERE id = %s",
+                f"UPDATE post SET views = views + 1, {HOT_SCORE_ASSIGNMENT} WHERE id = %s",
                 (post_id,),
             )
             return True
         return False
 
 
+async def flush_post_views(views: list[tuple[int, int, datetime]]) -> dict[int, int]:
+    """버퍼에 쌓인 조회 기록을 한 트랜잭션으로 반영합니다 (view_counter flush용).
+
+    게시글별로 post_view_log에 다중 행 INSERT IGNORE를 실행하고, 실제로 삽입된 행 수만큼
+    한 번의 UPDATE로 조회수를 올립니다. (user_id, post_id, 날짜) 유니크 키가 최종 중복 제거를 맡으므로
+    프로세스 재시작 등으로 앞단 중복 제거가 놓친 조회도 두 번 세지 않습니다.
+    삭제된 게시글/사용자의 FK 오류도 IGNORE로 건너뜁니다.
+    게시글 ID 순으로 잠가 동시에 flush하는 다른 프로세스와의 교착을 피합니다.
+
+    Args:
+        views: (user_id, post_id, 조회 시각) 목록. 조회 시각으로 view_date가 정해집니다.
+
+    Returns:
+        게시글 ID별 증가한 조회수.
+    """
+    by_post: dict[int, list[tuple[int, int, datetime]]] = {}
+    for user_id, post_id, viewed_at in views:
+        by_post.setdefault(post_id, []).append((user_id, post_id, viewed_at))
+
+    increments: dict[int, int] = {}
+    async with transactional() as cur:
+        for post_id in sorted(by_post):
+            rows = by_post[post_id]
+            placeholders = ", ".join(["(%s, %s, %s)"] * len(rows))
+            await cur.execute(
+                f"INSERT IGNORE INTO post_view_log (user_id, post_id, created_at) VALUES {placeholders}",
+                [value for row in rows for value in row],
+            )
+            if cur.rowcount > 0:
+                increments[post_id] = cur.rowcount
+
+        if increments:
+            post_ids = sorted(increments)
+            cases = " ".join(["WHEN %s THEN %s"] * len(post_ids))
+            id_placeholders = ", ".join(["%s"] * len(post_ids))
+            await cur.execute(
+                f"UPDATE post SET views = views + CASE id {cases} END, {HOT_SCORE_ASSIGNMENT} "
+                f"WHERE id IN ({id_placeholders})",
+                [*(value for post_id in post_ids for value in (post_id, increments[post_id])), *post_ids],
+            )
+    return increments
+
+
+async def get_search_documents(ids: list[int] | None = None, after_id: int = 0, limit: int = 500) -> list[dict]:
+    """검색 색인용 (id, title, body) 행을 반환합니다. 삭제된 게시글은 제외합니다.
+
+    ids가 주어지면 해당 게시글만, 아니면 after_id 이후를 id 순으로 limit개 반환합니다 (전체 재색인).
+    """
+    async with get_cursor() as cur:
+        if ids is not None:
+            if not ids:
+                return []
+            placeholders = ", ".join(["%s"] * len(ids))
+            await cur.execute(
+                f"SELECT id, title, content AS body FROM post WHERE id IN ({placeholders}) AND deleted_at IS NULL",
+                ids,
+            )
+        else:
+            await cur.execute(
+                "SELECT id, title, content AS body FROM post WHERE id > %s AND deleted_at IS NULL ORDER BY id LIMIT %s",
+                (after_id, limit),
+            )
+        return list(await cur.fetchall())
+
+
 async def get_read_post_ids(user_id: int, post_ids: list[int]) -> set[int]:
     """사용자가 조회한 게시글 ID 집합을 반환합니다."""
     if not post_ids:
@@ -277,6 +377,33 @@ async def get_read_post_ids(user_id: int, post_ids: list[int]) -> set[int]:
         return {row["post_id"] for row in await cur.fetchall()}
 
 
+async def get_viewed_post_ids(user_id: int, within_seconds: int | None = None) -> set[int]:
+    """사용자가 조회한 게시글 ID 집합을 반환합니다 (읽음 상태 저장소 적재용).
+
+    within_seconds가 주어지면 최근 within_seconds초 동안의 기록만 (user_id, created_at) 인덱스로 읽습니다.
+    """
+    async with get_cursor() as cur:
+        if within_seconds is None:
+            await cur.execute("SELECT DISTINCT post_id FROM post_view_log WHERE user_id = %s", (user_id,))
+        else:
+            await cur.execute(
+                "SELECT DISTINCT post_id FROM post_view_log"
+                " WHERE user_id = %s AND created_at >= NOW() - INTERVAL %s SECOND",
+                (user_id, within_seconds),
+            )
+        return {row["post_id"] for row in await cur.fetchall()}
+
+
+async def get_view_log_after(after_id: int, limit: int) -> list[dict]:
+    """post_view_log 행 (id, user_id, post_id)을 after_id 다음부터 limit개 반환합니다 (읽음 상태 재구성용)."""
+    async with get_cursor() as cur:
+        await cur.execute(
+            "SELECT id, user_id, post_id FROM post_view_log WHERE id > %s ORDER BY id LIMIT %s",
+            (after_id, limit),
+        )
+        return list(await cur.fetchall())
+
+
 async def get_posts_with_details(
     offset: int = 0,
     limit: int = 10,
@@ -284,13 +411,22 @@ async def get_posts_with_details(
     sort: str = "latest",
     author_id: int | None = None,
     category_id: int | None = None,
-    blocked_user_ids: set[int] | None = None,
+    blocked_by: int | None = None,
     tag: str | None = None,
     author_ids: set[int] | None = None,
     current_user_id: int | None = None,
     solved: bool | None = None,
+    cursor: list | None = None,
+    search_ids: list[int] | None = None,
 ) -> list[dict]:
-    """게시글 목록을 작성자 정보, 좋아요 수, 댓글 수, 북마크 수와 함께 조회합니다."""
+    """게시글 목록을 작성자 정보, 좋아요 수, 댓글 수, 북마크 수와 함께 조회합니다.
+
+    카운트는 post 테이블의 비정규화 컬럼에서 읽으므로 참여 데이터 규모와 무관하게 동작합니다.
+    cursor(정렬 키 값 리스트)가 주어지면 offset 대신 키셋 조건으로 이어서 조회하며,
+    각 행의 sort_key에 다음 커서로 쓸 정렬 키 값을 담아 반환합니다.
+    search_ids(검색 색인이 관련도 순으로 찾은 ID)가 주어지면 MATCH ... AGAINST 대신 PK 목록으로 제한합니다.
+    blocked_by(로그인 사용자 ID)가 주어지면 그 사용자가 차단한 작성자의 게시글을 제외합니다.
+    """
     # SQL Injection 방지: whitelist 검증 후 fallback
     order_by = ALLOWED_SORT_OPTIONS.get(sort, ALLOWED_SORT_OPTIONS["latest"])
 
@@ -302,7 +438,17 @@ async def get_posts_with_details(
     elif solved is False:
         where += " AND p.accepted_answer_id IS NULL"
 
-    if search:
+    order_params: list = []
+    if search_ids is not None:
+        if not search_ids:
+            return []
+        placeholders = ", ".join(["%s"] * len(search_ids))
+        where += f" AND p.id IN ({placeholders})"
+        params.extend(search_ids)
+        if sort == "relevance":
+            order_by = f"FIELD(p.id, {placeholders})"
+            order_params = list(search_ids)
+    elif search:
         escaped = escape_fulltext_query(search)
         where += " AND MATCH(p.title, p.content) AGAINST(%s IN BOOLEAN MODE)"
         params.append(escaped)
@@ -315,10 +461,9 @@ async def get_posts_with_details(
         where += " AND p.category_id = %s"
         params.append(category_id)
 
-    if blocked_user_ids:
-        placeholders = ", ".join(["%s"] * len(blocked_user_ids))
-        where += f" AND (p.author_id NOT IN ({placeholders}) OR p.author_id IS NULL)"
-        params.extend(blocked_user_ids)
+    if blocked_by is not None:
+        where += _not_blocked_clause("p.author_id")
+        params.append(blocked_by)
 
     if author_ids:
         placeholders = ", ".join(["%s"] * len(author_ids))
@@ -342,6 +487,15 @@ async def get_posts_with_details(
         join_params = [current_user_id]
     elif sort == "for_you":
         sort = "latest"
+        order_by = ALLOWED_SORT_OPTIONS["latest"]
+
+    # 키셋 커서: 직전 페이지 마지막 행 이후부터 조회 — 깊은 페이지도 1페이지와 같은 비용
+    cursor_columns = post_cursor_columns(sort)
+    if cursor is not None:
+        condition, cursor_params = keyset_condition([expr for expr, _ in cursor_columns], cursor)
+        where += f" AND {condition}"
+        params.extend(cursor_params)
+        offset = 0
 
     # 구독 watching 상태 JOIN (로그인 사용자만)
     watch_join = ""
@@ -355,7 +509,7 @@ async def get_posts_with_details(
         watch_select = ", IF(ps_watch.user_id IS NOT NULL, 1, 0) AS is_watching"
         watch_params = [current_user_id]
 
-    params.extend([limit, offset])
+    params.extend([*order_params, limit, offset])
 
     async with get_cursor() as cur:
         await cur.execute(
@@ -365,33 +519,16 @@ async def get_posts_with_details(
                     p.created_at, p.updated_at,
                     u.id AS author_user_id, u.nickname AS author_nickname,
                     u.profile_img AS author_profile_img, u.distro AS author_distro,
-                    COALESCE(likes.cnt, 0) AS likes_count,
-                    COALESCE(comments.cnt, 0) AS comments_count,
+                    p.likes_count, p.comments_count,
                     p.is_pinned, p.category_id, cat.name AS category_name,
-                    COALESCE(bk.cnt, 0) AS bookmarks_count,
+                    p.bookmarks_count,
                     (p.accepted_answer_id IS NOT NULL) AS is_solved,
-                    {hot_score_sql()} AS hot_score
+                    p.hot_score
                     {watch_select}
                     {upc_select}
                 FROM post p
                 LEFT JOIN user u ON p.author_id = u.id
                 LEFT JOIN category cat ON p.category_id = cat.id
-                LEFT JOIN (
-                    SELECT post_id, COUNT(*) AS cnt
-                    FROM post_like
-                    GROUP BY post_id
-                ) likes ON p.id = likes.post_id
-                LEFT JOIN (
-                    SELECT post_id, COUNT(*) AS cnt
-                    FROM comment
-                    WHERE deleted_at IS NULL
-                    GROUP BY post_id
-                ) comments ON p.id = comments.post_id
-                LEFT JOIN (
-                    SELECT post_id, COUNT(*) AS cnt
-                    FROM post_bookmark
-                    GROUP BY post_id
-                ) bk ON p.id = bk.post_id
                 {watch_join}
                 {upc_join}
                 WHERE {where}
@@ -425,6 +562,7 @@ async def get_posts_with_details(
                 "bookmarks_count": row["bookmarks_count"],
                 "is_solved": bool(row.get("is_solved", False)),
                 "is_watching": bool(row.get("is_watching", 0)),
+                "sort_key": [row[column] for _, column in cursor_columns],
             }
             for row in rows
         ]
@@ -452,9 +590,9 @@ async def get_post_with_details(post_id: int, current_user_id: int | None = None
                        p.accepted_answer_id,
                        u.id AS author_user_id, u.nickname AS author_nickname,
                        u.profile_img AS author_profile_img, u.distro AS author_distro,
-                       (SELECT COUNT(*) FROM post_like WHERE post_id = p.id) AS likes_count,
+                       p.likes_count,
                        p.is_pinned, p.category_id, cat.name AS category_name,
-                       (SELECT COUNT(*) FROM post_bookmark WHERE post_id = p.id) AS bookmarks_count
+                       p.bookmarks_count
                        {watch_select}
                 FROM post p
                 LEFT JOIN user u ON p.author_id = u.id
@@ -544,6 +682,121 @@ async def unpin_post(post_id: int) -> bool:
         return cur.rowcount > 0
 
 
+# ============ 비정규화 카운터 관련 함수 ============
+
+
+async def reconcile_post_counters(batch_size: int = 1000) -> int:
+    """likes_count/comments_count/bookmarks_count 컬럼의 드리프트를 원본 테이블 기준으로 복구합니다.
+
+    쓰기 경로에서 카운터를 증감하므로 평소에는 일치하지만, 직접 SQL 수정·시드 데이터·
+    부분 실패 등으로 어긋날 수 있어 주기적으로 실행합니다.
+    id 범위 단위로 나눠 처리하여 긴 락을 피합니다.
+
+    Returns:
+        카운터가 수정된 게시글 수.
+    """
+    async with get_cursor() as cur:
+        await cur.execute("SELECT COALESCE(MAX(id), 0) AS max_id FROM post")
+        row = await cur.fetchone()
+        max_id = row["max_id"] if row else 0
+
+    repaired = 0
+    for start in range(1, max_id + 1, batch_size):
+        end = start + batch_size - 1
+        async with transactional() as cur:
+            await cur.execute(
+                """
+                UPDATE post p
+                LEFT JOIN (
+                    SELECT post_id, COUNT(*) AS cnt
+                    FROM post_like
+                    WHERE post_id BETWEEN %s AND %s
+                    GROUP BY post_id
+                ) lk ON p.id = lk.post_id
+                LEFT JOIN (
+                    SELECT post_id, COUNT(*) AS cnt
+                    FROM comment
+                    WHERE post_id BETWEEN %s AND %s AND deleted_at IS NULL
+                    GROUP BY post_id
+                ) cm ON p.id = cm.post_id
+                LEFT JOIN (
+                    SELECT post_id, COUNT(*) AS cnt
+                    FROM post_bookmark
+                    WHERE post_id BETWEEN %s AND %s
+                    GROUP BY post_id
+                ) bk ON p.id = bk.post_id
+                SET p.likes_count = COALESCE(lk.cnt, 0),
+                    p.comments_count = COALESCE(cm.cnt, 0),
+                    p.bookmarks_count = COALESCE(bk.cnt, 0)
+                WHERE p.id BETWEEN %s AND %s
+                  AND (p.likes_count <> COALESCE(lk.cnt, 0)
+                       OR p.comments_count <> COALESCE(cm.cnt, 0)
+                       OR p.bookmarks_count <> COALESCE(bk.cnt, 0))
+                """,
+                (start, end, start, end, start, end, start, end),
+            )
+            if cur.rowcount:
+                repaired += cur.rowcount
+                # 카운터가 바뀐 구간은 저장된 hot_score도 함께 맞춤
+                await cur.execute(
+                    f"UPDATE post SET {HOT_SCORE_ASSIGNMENT} WHERE id BETWEEN %s AND %s AND deleted_at IS NULL",
+                    (start, end),
+                )
+
+    return repaired
+
+
+async def recompute_hot_scores(window_days: int, batch_size: int = 1000) -> int:
+    """감쇠 구간(window_days) 안의 게시글 hot_score 컬럼을 현재 시각 기준으로 재계산합니다.
+
+    좋아요/댓글/조회 쓰기는 즉시 갱신하지만 시간 감쇠는 쓰기 없이도 진행되므로 주기적으로 실행합니다.
+    구간 경계를 막 벗어난 게시글도 마지막으로 한 번 더 갱신되도록 하루 여유를 둡니다.
+    그보다 오래된 게시글은 점수가 0에 수렴하므로 다시 계산하지 않고 0으로 내립니다
+    (구간을 벗어날 때 남은 점수나 이후 조회 쓰기로 갱신된 점수가 그대로 남지 않도록).
+    id 범위(또는 LIMIT) 단위로 나눠 처리하여 긴 락을 피합니다.
+
+    Returns:
+        hot_score가 바뀐 게시글 수.
+    """
+    async with get_cursor() as cur:
+        await cur.execute(
+            "SELECT MIN(id) AS min_id, MAX(id) AS max_id FROM post WHERE created_at >= NOW() - INTERVAL %s DAY",
+            (window_days + 1,),
+        )
+        row = await cur.fetchone()
+    updated = 0
+    if row and row["min_id"] is not None:
+        for start in range(row["min_id"], row["max_id"] + 1, batch_size):
+            end = start + batch_size - 1
+            async with transactional() as cur:
+                await cur.execute(
+                    f"""
+                    UPDATE post SET {HOT_SCORE_ASSIGNMENT}
+                    WHERE id BETWEEN %s AND %s
+                      AND deleted_at IS NULL
+                      AND created_at >= NOW() - INTERVAL %s DAY
+                    """,
+                    (start, end, window_days + 1),
+                )
+                updated += cur.rowcount
+
+    return updated + await _zero_expired_hot_scores(window_days, batch_size)
+
+
+async def _zero_expired_hot_scores(window_days: int, batch_size: int) -> int:
+    """감쇠 구간(+1일)보다 오래된 게시글 중 hot_score가 남아 있는 행을 0으로 내립니다."""
+    zeroed = 0
+    while True:
+        async with transactional() as cur:
+            await cur.execute(
+                "UPDATE post SET hot_score = 0 WHERE hot_score > 0 AND created_at < NOW() - INTERVAL %s DAY LIMIT %s",
+                (window_days + 1, batch_size),
+            )
+            zeroed += cur.rowcount
+            if cur.rowcount < batch_size:
+                return zeroed
+
+
 # ============ 게시글 이미지 관련 함수 ============
 
 
@@ -570,38 +823,22 @@ async def get_post_images(post_id: int) -> list[dict]:
 
 async def get_related_posts(
     current_post_id: int,
-    category_id: int | None,
-    tag_ids: list[int],
     limit: int = 5,
-    blocked_user_ids: set[int] | None = None,
+    blocked_by: int | None = None,
 ) -> list[dict]:
-    """현재 게시글과 관련된 게시글을 태그/카테고리 기반으로 조회합니다."""
-    where = "p.deleted_at IS NULL AND p.id != %s"
-    params: list = [current_post_id]
+    """연관 게시글 색인(post_related)에 저장된 순위대로 연관 게시글을 조회합니다.
 
-    if blocked_user_ids:
-        placeholders = ", ".join(["%s"] * len(blocked_user_ids))
-        where += f" AND (p.author_id NOT IN ({placeholders}) OR p.author_id IS NULL)"
-        params.extend(blocked_user_ids)
-
-    if tag_ids:
-        tag_placeholders = ", ".join(["%s"] * len(tag_ids))
-        tag_join = f"LEFT JOIN post_tag pt ON p.id = pt.post_id AND pt.tag_id IN ({tag_placeholders})"
-        tag_select = "COUNT(pt.tag_id) AS matched_tags"
-        tag_params = list(tag_ids)
-    else:
-        tag_join = ""
-        tag_select = "0 AS matched_tags"
-        tag_params = []
+    순위 계산은 related_service.RelatedPostService가 미리 해 두므로 (post_id, position) PK 범위 조회 한 번입니다.
+    삭제된 게시글과 blocked_by가 차단한 작성자의 게시글은 읽을 때 제외합니다.
+    """
+    where = "r.post_id = %s AND p.deleted_at IS NULL"
+    params: list = [current_post_id]
 
-    if category_id is not None:
-        same_category = "CASE WHEN p.category_id = %s THEN 1 ELSE 0 END AS same_category"
-        cat_params = [category_id]
-    else:
-        same_category = "0 AS same_category"
-        cat_params = []
+    if blocked_by is not None:
+        where += _not_blocked_clause("p.author_id")
+        params.append(blocked_by)
 
-    params.extend([limit])
+    params.append(limit)
 
     async with get_cursor() as cur:
         await cur.execute(
@@ -612,39 +849,18 @@ async def get_related_posts(
                     p.created_at, p.updated_at,
                     u.id AS author_user_id, u.nickname AS author_nickname,
                     u.profile_img AS author_profile_img, u.distro AS author_distro,
-                    COALESCE(likes.cnt, 0) AS likes_count,
-                    COALESCE(comments.cnt, 0) AS comments_count,
+                    p.likes_count, p.comments_count,
                     p.is_pinned, p.category_id, cat.name AS category_name,
-                    COALESCE(bk.cnt, 0) AS bookmarks_count,
-                    {tag_select},
-                    {same_category},
-                    {hot_score_sql()} AS hot_score
-                FROM post p
+                    p.bookmarks_count
+                FROM post_related r
+                INNER JOIN post p ON p.id = r.related_post_id
                 LEFT JOIN user u ON p.author_id = u.id
                 LEFT JOIN category cat ON p.category_id = cat.id
-                {tag_join}
-                LEFT JOIN (
-                    SELECT post_id, COUNT(*) AS cnt
-                    FROM post_like
-                    GROUP BY post_id
-                ) likes ON p.id = likes.post_id
-                LEFT JOIN (
-                    SELECT post_id, COUNT(*) AS cnt
-                    FROM comment
-                    WHERE deleted_at IS NULL
-                    GROUP BY post_id
-                ) comments ON p.id = comments.post_id
-                LEFT JOIN (
-                    SELECT post_id, COUNT(*) AS cnt
-                    FROM post_bookmark
-                    GROUP BY post_id
-                ) bk ON p.id = bk.post_id
                 WHERE {where}
-                GROUP BY p.id
-                ORDER BY matched_tags DESC, same_category DESC, hot_score DESC
+                ORDER BY r.position
                 LIMIT %s
                 """,
-            [*cat_params, *tag_params, *params],
+            params,
         )
         rows = await cur.fetchall()
 
@@ -674,8 +890,6 @@ async def get_related_posts(
         ]
 
 
-# get_comments_with_author는 comment_models.py에서 정의됨 (상단 import 참조)
-# 하위 호환성을 위해 다시 내보내기
 __all__ = [
     "ALLOWED_POST_COLUMNS",
     "ALLOWED_SORT_OPTIONS",
@@ -683,17 +897,21 @@ __all__ = [
     "Post",
     "create_post",
     "delete_post",
+    "flush_post_views",
     "get_comment_for_accept_validation",
-    "get_comments_with_author",
     "get_post_by_id",
     "get_post_images",
     "get_post_with_details",
     "get_posts_with_details",
     "get_read_post_ids",
     "get_related_posts",
+    "get_search_documents",
     "get_total_posts_count",
+    "get_view_log_after",
+    "get_viewed_post_ids",
     "increment_view_count",
     "pin_post",
+    "reconcile_post_counters",
     "save_post_images",
     "set_accepted_answer",
     "unpin_post",
@@ -42,12 +42,15 @@ class PostSummary(BaseModel):
     tags: list[TagSummary] = []
     is_read: bool = False
     is_watching: bool = False
+    # 검색 시 일치 부분을 <mark>로 감싼 HTML 이스케이프된 본문 발췌 (검색 색인 사용 시)
+    snippet: str | None = None
 
 
 class PostListResult(BaseModel):
     """게시글 목록 조회 결과."""
 
     posts: list[PostSummary]
-    total_count: int
+    total_count: int | None
     has_more: bool
+    next_cursor: str | None = None
     effective_sort: str | None = None
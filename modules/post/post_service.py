@@ -1,21 +1,42 @@
 """post_service: 게시글 관련 비즈니스 로직을 처리하는 서비스."""
 
+import json
 import logging
+from typing import Any
 
+from fastapi.encoders import jsonable_encoder
+
+from core.config import settings
+from core.database.connection import gather_limited
+from core.search import query_index, queue_reindex, search_snippets
+from core.utils.count_strategy import count_cache, count_signature, resolve_total_count
 from core.utils.error_codes import ErrorCode
 from core.utils.exceptions import bad_request_error, forbidden_error, not_found_error, safe_notify
 from core.utils.formatters import format_datetime
 from core.utils.mention import extract_mentions
+from core.utils.pagination import decode_cursor, encode_cursor
+from core.utils.read_state import read_post_ids
+from core.utils.response_cache import (
+    POSTS_NAMESPACE,
+    cached_response,
+    invalidate_post_responses,
+    post_namespace,
+)
+from core.utils.view_counter import view_counter
 from modules.content import category_models, tag_models
 from modules.notification import models as notification_models
 from modules.notification.setting_models import get_muted_user_ids
 from modules.post import poll_models, post_models, subscription_models
 from modules.post.bookmark_models import get_bookmark
+from modules.post.comment_service import CommentService
+from modules.post.jobs import enqueue_affinity_event, enqueue_related_refresh
 from modules.post.like_models import get_like
+from modules.post.poll_tally import get_poll, poll_snapshots
 from modules.post.post_responses import PostListResult
 from modules.post.post_schemas import CreatePostRequest
+from modules.post.related_service import RelatedPostService
 from modules.user import follow_models
-from modules.user.block_models import get_blocked_user_ids
+from modules.user.block_models import get_cached_blocked_user_ids
 from modules.user.models import User, get_users_by_nicknames
 
 logger = logging.getLogger(__name__)
@@ -39,14 +60,84 @@ class PostService:
         tag: str | None = None,
         following: bool = False,
         solved: bool | None = None,
+        cursor: str | None = None,
+        timestamp: str = "",
+    ) -> PostListResult:
+        """게시글 목록 조회.
+
+        비로그인 요청은 정규화된 쿼리 파라미터를 키로 응답 캐시를 거칩니다.
+        following은 로그인 사용자에게만 적용되므로 비로그인 키에서 제외합니다.
+        """
+        if current_user is not None:
+            return await PostService._fetch_posts(
+                offset,
+                limit,
+                search=search,
+                sort=sort,
+                author_id=author_id,
+                category_id=category_id,
+                current_user=current_user,
+                tag=tag,
+                following=following,
+                solved=solved,
+                cursor=cursor,
+                timestamp=timestamp,
+            )
+
+        async def load() -> str:
+            result = await PostService._fetch_posts(
+                offset,
+                limit,
+                search=search,
+                sort=sort,
+                author_id=author_id,
+                category_id=category_id,
+                tag=tag,
+                solved=solved,
+                cursor=cursor,
+                timestamp=timestamp,
+            )
+            return result.model_dump_json()
+
+        signature = count_signature(
+            offset=offset,
+            limit=limit,
+            search=search,
+            sort=sort,
+            author_id=author_id,
+            category_id=category_id,
+            tag=tag,
+            solved=solved,
+            cursor=cursor,
+        )
+        raw = await cached_response((POSTS_NAMESPACE,), signature, load)
+        return PostListResult.model_validate_json(raw)
+
+    @staticmethod
+    async def _fetch_posts(
+        offset: int,
+        limit: int,
+        search: str | None = None,
+        sort: str = "latest",
+        author_id: int | None = None,
+        category_id: int | None = None,
+        current_user: User | None = None,
+        tag: str | None = None,
+        following: bool = False,
+        solved: bool | None = None,
+        cursor: str | None = None,
+        timestamp: str = "",
     ) -> PostListResult:
-        """게시글 목록 조회 및 가공."""
-        # 차단된 사용자 목록 조회
-        blocked_ids: set[int] | None = None
+        """게시글 목록 조회 및 가공.
+
+        cursor가 주어지면 offset 대신 키셋으로 이어서 조회합니다.
+        추천 피드 폴백으로 실제 정렬이 바뀔 수 있어 커서는 effective_sort 기준으로 디코딩합니다.
+        """
+        # 차단 필터: 차단 목록은 캐시에서 읽고, 차단한 사용자가 있을 때만 SQL에서 user_block 서브쿼리로 제외
+        blocked_ids: frozenset[int] = frozenset()
         if current_user:
-            blocked_ids = await get_blocked_user_ids(current_user.id)
-            if not blocked_ids:
-                blocked_ids = None
+            blocked_ids = await get_cached_blocked_user_ids(current_user.id)
+        blocked_by = current_user.id if current_user and blocked_ids else None
 
         # 팔로잉 피드 처리
         author_ids: set[int] | None = None
@@ -66,38 +157,69 @@ class PostService:
                 if not await user_has_scores(current_user.id):
                     effective_sort = "latest"
 
-        # 추천 피드: 다양성 필터 여유분 확보
-        fetch_limit = limit * 3 if effective_sort == "for_you" else limit
-
-        # 1. DB 조회
+        # 전문 검색: 색인이 관련도 순 ID를 찾고 목록/COUNT는 PK 조회로 처리 (색인이 없으면 MATCH ... AGAINST 폴백)
+        search_ids: list[int] | None = None
+        if search:
+            search_result = await query_index("post", search)
+            if search_result is not None:
+                search_ids = search_result.ids
+        if effective_sort == "relevance" and search_ids is None:
+            effective_sort = "latest"
+
+        # 관련도 순은 키셋 커서를 지원하지 않음 (offset 페이지네이션, next_cursor 없음)
+        cursor_values = None
+        if cursor is not None and effective_sort != "relevance":
+            arity = len(post_models.post_cursor_columns(effective_sort))
+            cursor_values = decode_cursor(cursor, effective_sort, arity, timestamp)
+
+        # 1. DB 조회 — limit+1개를 조회해 COUNT 없이도 다음 페이지 존재 여부를 판단
         posts_data = await post_models.get_posts_with_details(
             offset,
-            fetch_limit,
+            limit + 1,
             search=search,
             sort=effective_sort,
             author_id=author_id,
             category_id=category_id,
-            blocked_user_ids=blocked_ids,
+            blocked_by=blocked_by,
             tag=tag,
             author_ids=author_ids,
             current_user_id=current_user.id if current_user else None,
             solved=solved,
+            cursor=cursor_values,
+            search_ids=search_ids,
         )
-        total_count = await post_models.get_total_posts_count(
-            search=search,
-            author_id=author_id,
-            category_id=category_id,
-            blocked_user_ids=blocked_ids,
-            tag=tag,
-            author_ids=author_ids,
-            solved=solved,
+        has_more = len(posts_data) > limit
+
+        # total_count는 엔드포인트 전략(exact/cached/has_more)에 따라 계산 — 목록 쿼리와 같은 필터의 COUNT 중복 방지
+        # 색인 검색이면 COUNT와 필터는 상위 SEARCH_MAX_RESULTS개 ID 안에서만 적용되므로 total_count도 상한 이하
+        count_filters: dict[str, Any] = {
+            "search": search,
+            "author_id": author_id,
+            "category_id": category_id,
+            "blocked_by": blocked_by,
+            "tag": tag,
+            "author_ids": author_ids,
+            "solved": solved,
+            "search_ids": search_ids,
+        }
+        total_count = await resolve_total_count(
+            settings.COUNT_STRATEGY_POSTS,
+            "posts",
+            # 차단/차단 해제 직후 이전 COUNT를 쓰지 않도록 시그니처에는 차단 목록을 포함
+            count_signature(**count_filters, blocked_ids=blocked_ids),
+            lambda: post_models.get_total_posts_count(**count_filters),
         )
 
-        # 추천 피드 다양성 필터: 작성자당 최대 3개
+        posts_data = posts_data[:limit]
+        # 추천 피드 다양성 필터: 작성자당 최대 3개. 페이지가 잘렸으면 잘린 게시글부터 다음 페이지로 이어짐
         if effective_sort == "for_you":
-            posts_data = PostService._apply_diversity_cap(posts_data, limit)
+            capped = PostService._apply_diversity_cap(posts_data)
+            has_more = has_more or len(capped) < len(posts_data)
+            posts_data = capped
 
-        has_more = offset + limit < total_count
+        next_cursor = None
+        if has_more and posts_data and effective_sort != "relevance":
+            next_cursor = encode_cursor(effective_sort, posts_data[-1]["sort_key"])
 
         # 2. 데이터 가공 (날짜 포맷, 내용 요약)
         for post in posts_data:
@@ -114,9 +236,15 @@ class PostService:
         for post in posts_data:
             post["tags"] = posts_tags.get(post["post_id"], [])
 
+        # 검색어 하이라이트 스니펫 (색인 검색일 때만)
+        if search and search_ids is not None:
+            snippets = await search_snippets("post", post_ids, search)
+            for post in posts_data:
+                post["snippet"] = snippets.get(post["post_id"])
+
         # 읽음 상태 조회 (로그인 사용자만)
         if current_user:
-            read_ids = await post_models.get_read_post_ids(current_user.id, post_ids)
+            read_ids = await read_post_ids(current_user.id, post_ids)
             for post in posts_data:
                 post["is_read"] = post["post_id"] in read_ids
         else:
@@ -127,29 +255,30 @@ class PostService:
             posts=posts_data,  # type: ignore[arg-type]
             total_count=total_count,
             has_more=has_more,
+            next_cursor=next_cursor,
             effective_sort=effective_sort if effective_sort != sort else None,
         )
 
     @staticmethod
     def _apply_diversity_cap(
         posts: list[dict],
-        limit: int,
         max_per_author: int = 3,
     ) -> list[dict]:
-        """동일 작성자 게시글을 페이지당 최대 N개로 제한합니다."""
+        """동일 작성자 게시글을 페이지당 최대 N개로 제한합니다.
+
+        상한을 넘는 첫 게시글 앞에서 페이지를 끊습니다. 건너뛰고 뒤 게시글을 채우면 커서가 건너뛴 게시글을
+        지나가 다시 조회되지 않으므로, 잘린 게시글은 다음 페이지(마지막으로 남긴 게시글의 커서)의 첫 항목이 됩니다.
+        """
         author_count: dict[int | None, int] = {}
-        result: list[dict] = []
-        for post in posts:
+        for index, post in enumerate(posts):
             author_id = (post.get("author") or {}).get("user_id")
-            count = author_count.get(author_id, 0)
-            if author_id is not None and count >= max_per_author:
+            if author_id is None:
                 continue
-            if author_id is not None:
-                author_count[author_id] = count + 1
-            result.append(post)
-            if len(result) >= limit:
-                break
-        return result
+            count = author_count.get(author_id, 0)
+            if count >= max_per_author:
+                return posts[:index]
+            author_count[author_id] = count + 1
+        return posts
 
     @staticmethod
     async def get_post_detail(
@@ -158,7 +287,33 @@ class PostService:
         timestamp: str,
         comment_sort: str = "oldest",
     ) -> dict:
-        """게시글 상세 조회 및 조회수 증가 처리."""
+        """게시글 상세 조회.
+
+        비로그인 요청은 조회수 증가가 없어 응답이 (post_id, comment_sort)로 결정되므로 응답 캐시를 거칩니다.
+        """
+        if current_user is not None:
+            return await PostService._fetch_post_detail(post_id, current_user, timestamp, comment_sort)
+
+        async def load() -> str:
+            result = await PostService._fetch_post_detail(post_id, None, timestamp, comment_sort)
+            return json.dumps(jsonable_encoder(result), ensure_ascii=False)
+
+        raw = await cached_response((post_namespace(post_id),), comment_sort, load)
+        return json.loads(raw)
+
+    @staticmethod
+    async def _fetch_post_detail(
+        post_id: int,
+        current_user: User | None,
+        timestamp: str,
+        comment_sort: str = "oldest",
+    ) -> dict:
+        """게시글 상세 조회 및 조회수 증가 처리.
+
+        게시글 행은 존재 확인(404)과 채택 답변 ID를 제공하므로 먼저 단독으로 조회하고,
+        나머지는 서로 독립적이라 gather_limited()로 동시에 실행합니다
+        (요청당 POST_DETAIL_QUERY_CONCURRENCY개 연결까지).
+        """
         # 1. 게시글 존재 확인
         post_data = await post_models.get_post_with_details(
             post_id, current_user_id=current_user.id if current_user else None
@@ -166,34 +321,53 @@ class PostService:
         if not post_data:
             raise not_found_error("post", timestamp)
 
-        # 2. 조회수 증가 (로그인 사용자, 하루 1회)
-        if current_user and await post_models.increment_view_count(post_id, current_user.id):
-            post_data["views_count"] += 1
+        # 2. 독립 조회 동시 실행 — 조회 기록(direct 모드는 쓰기 트랜잭션)을 가장 먼저 시작
+        user_queries = (
+            [
+                view_counter.record_post_view(post_id, current_user.id),
+                get_like(post_id, current_user.id),
+                get_bookmark(post_id, current_user.id),
+                get_cached_blocked_user_ids(current_user.id),
+            ]
+            if current_user
+            else []
+        )
+        results = await gather_limited(
+            *user_queries,
+            post_models.get_post_images(post_id),
+            tag_models.get_post_tags(post_id),
+            get_poll(post_id, current_user_id=current_user.id if current_user else None),
+            CommentService.get_comment_page(
+                post_id,
+                comment_sort,
+                settings.COMMENT_PAGE_SIZE,
+                viewer_id=current_user.id if current_user else None,
+            ),
+            limit=settings.POST_DETAIL_QUERY_CONCURRENCY,
+        )
+        images, tags, poll, comment_page = results[len(user_queries) :]
 
-        # 3. 로그인 사용자 상태 플래그 + 차단 목록
-        blocked_ids: set[int] | None = None
+        # 3. 로그인 사용자 상태 플래그 + 조회수 + 차단 목록
         if current_user:
-            like = await get_like(post_id, current_user.id)
-            post_data["is_liked"] = like is not None
+            (view_counted, unflushed_views), like, bookmark, blocked_ids = results[: len(user_queries)]
 
-            bookmark = await get_bookmark(post_id, current_user.id)
-            post_data["is_bookmarked"] = bookmark is not None
+            # 조회수 증가 (로그인 사용자, 하루 1회) — 아직 flush되지 않은 조회도 응답에 반영
+            post_data["views_count"] += unflushed_views
+            if view_counted:
+                await enqueue_affinity_event(current_user.id, "view", post_id=post_id)
 
-            blocked_ids = await get_blocked_user_ids(current_user.id)
+            post_data["is_liked"] = like is not None
+            post_data["is_bookmarked"] = bookmark is not None
 
             # 게시글 작성자 차단 여부
             author_id = post_data.get("author", {}).get("user_id")
             post_data["is_blocked"] = bool(blocked_ids) and author_id in blocked_ids
-
-            if not blocked_ids:
-                blocked_ids = None
         else:
             post_data["is_liked"] = False
             post_data["is_bookmarked"] = False
             post_data["is_blocked"] = False
 
-        # 4. 다중 이미지 조회 (post_image 우선, 없으면 image_url 폴백)
-        images = await post_models.get_post_images(post_id)
+        # 4. 다중 이미지 (post_image 우선, 없으면 image_url 폴백)
         if images:
             post_data["image_urls"] = [img["image_url"] for img in images]
         elif post_data.get("image_url"):
@@ -201,35 +375,18 @@ class PostService:
         else:
             post_data["image_urls"] = []
 
-        # 태그 목록 조회
-        post_data["tags"] = await tag_models.get_post_tags(post_id)
-
-        # 투표 데이터 조회
-        post_data["poll"] = await poll_models.get_poll_by_post_id(
-            post_id, current_user_id=current_user.id if current_user else None
-        )
-
-        # 5. 댓글 목록 조회
-        comments_data = await post_models.get_comments_with_author(
-            post_id,
-            current_user_id=current_user.id if current_user else None,
-            blocked_user_ids=blocked_ids,
-            comment_sort=comment_sort,
-            accepted_answer_id=post_data.get("accepted_answer_id"),
-        )
+        post_data["tags"] = tags
+        post_data["poll"] = poll
 
-        # 6. 데이터 가공
+        # 5. 데이터 가공 — 댓글은 첫 페이지만 담고, 이후 페이지는 GET /v1/posts/{id}/comments로 이어서 조회
         post_data["created_at"] = format_datetime(post_data["created_at"])
         post_data["updated_at"] = format_datetime(post_data.get("updated_at"))
 
-        for comment in comments_data:
-            comment["created_at"] = format_datetime(comment["created_at"])
-            comment["updated_at"] = format_datetime(comment.get("updated_at"))
-            for reply in comment.get("replies", []):
-                reply["created_at"] = format_datetime(reply["created_at"])
-                reply["updated_at"] = format_datetime(reply.get("updated_at"))
-
-        return {"post": post_data, "comments": comments_data}
+        return {
+            "post": post_data,
+            "comments": comment_page["comments"],
+            "comments_pagination": comment_page["pagination"],
+        }
 
     @staticmethod
     async def create_post(
@@ -270,6 +427,13 @@ class PostService:
         if post_data.tags:
             tag_ids = await tag_models.get_or_create_tags(post_data.tags)
             await tag_models.save_post_tags(post.id, tag_ids)
+            await queue_reindex("tag", *tag_ids)
+
+        # 목록 total_count/비로그인 응답 캐시 무효화 — 작성 직후 목록에서 개수가 어긋나 보이지 않도록
+        count_cache.invalidate("posts")
+        await invalidate_post_responses()
+        await queue_reindex("post", post.id)
+        await enqueue_related_refresh(post.id)
 
         # 투표 생성
         if post_data.poll:
@@ -279,6 +443,8 @@ class PostService:
                 options=post_data.poll.options,
                 expires_at=post_data.poll.expires_at,
             )
+            # 작성 직후 상세 조회가 캐시해 둔 '투표 없음'을 지움
+            poll_snapshots.invalidate_post(post.id)
 
         # 평판 포인트 부여 (best-effort: 실패해도 게시글 생성은 성공)
         try:
@@ -385,6 +551,7 @@ class PostService:
         if tags is not None:
             tag_ids = await tag_models.get_or_create_tags(tags)
             await tag_models.save_post_tags(post_id, tag_ids)
+            await queue_reindex("tag", *tag_ids)
 
         # 5. DB 업데이트
         updated_post = await post_models.update_post(
@@ -395,6 +562,10 @@ class PostService:
             category_id=category_id,
         )
         assert updated_post is not None  # 게시글 존재는 위에서 검증됨
+        await invalidate_post_responses(post_id)
+        await queue_reindex("post", post_id)
+        if tags is not None or category_id is not None:
+            await enqueue_related_refresh(post_id)
 
         # 6. 새로 추가된 멘션 알림 — 닉네임 일괄 조회로 N+1 방지
         if content:
@@ -444,7 +615,20 @@ class PostService:
             raise forbidden_error("delete", timestamp, "게시글 작성자만 삭제할 수 있습니다.")
 
         # 3. DB 삭제
-        await post_models.delete_post(post_id)
+        deleted = await post_models.delete_post(post_id)
+        count_cache.invalidate("posts")
+        await invalidate_post_responses(post_id)
+        await queue_reindex("post", post_id)
+        await enqueue_related_refresh(post_id)
+
+        # 4. 배지 집계 카운터 되돌리기 (best-effort: 실패해도 삭제는 성공)
+        if deleted:
+            try:
+                from modules.reputation.service import ReputationService
+
+                await ReputationService.retract_counters(post.author_id, "post_created")
+            except Exception:
+                logger.warning("배지 카운터 회수 실패 (post_id=%d)", post_id, exc_info=True)
 
     @staticmethod
     async def get_related_posts(
@@ -454,7 +638,8 @@ class PostService:
     ) -> list[dict] | None:
         """현재 게시글과 관련된 게시글 목록을 조회합니다.
 
-        태그/카테고리 기반 관련도 정렬 후 반환합니다.
+        연관 게시글 색인(related_service)에 미리 계산된 순위를 읽습니다.
+        색인 도입 전 게시글이라 아직 계산되지 않았으면 이번 요청에서 계산합니다.
 
         Args:
             post_id: 기준 게시글 ID.
@@ -469,27 +654,20 @@ class PostService:
         if not post:
             return None
 
-        # 2. 태그 조회 → tag_ids 추출
-        tags = await tag_models.get_post_tags(post_id)
-        tag_ids = [t["id"] for t in tags]
-
-        # 3. 차단 사용자 조회 (로그인 시)
-        blocked_ids: set[int] | None = None
-        if current_user:
-            blocked_ids = await get_blocked_user_ids(current_user.id)
-            if not blocked_ids:
-                blocked_ids = None
-
-        # 4. 연관 게시글 조회
-        posts_data = await post_models.get_related_posts(
-            current_post_id=post_id,
-            category_id=post.category_id,
-            tag_ids=tag_ids,
-            limit=limit,
-            blocked_user_ids=blocked_ids,
-        )
+        # 2. 차단 사용자 조회 (로그인 시, 캐시) — 차단한 사용자가 있을 때만 SQL에서 제외
+        blocked_by: int | None = None
+        if current_user and await get_cached_blocked_user_ids(current_user.id):
+            blocked_by = current_user.id
+
+        # 3. 연관 게시글 색인 조회
+        posts_data = await post_models.get_related_posts(current_post_id=post_id, limit=limit, blocked_by=blocked_by)
+        if not posts_data:
+            await RelatedPostService.ensure_indexed(post_id)
+            posts_data = await post_models.get_related_posts(
+                current_post_id=post_id, limit=limit, blocked_by=blocked_by
+            )
 
-        # 5. 데이터 가공 (날짜 포맷, 내용 요약)
+        # 4. 데이터 가공 (날짜 포맷, 내용 요약)
         for p in posts_data:
             p["created_at"] = format_datetime(p["created_at"])
             p["updated_at"] = format_datetime(p.get("updated_at"))
@@ -497,7 +675,7 @@ class PostService:
             if len(content) > POST_PREVIEW_LENGTH:
                 p["content"] = content[:POST_PREVIEW_LENGTH] + "..."
 
-        # 6. 태그 벌크 조회
+        # 5. 태그 벌크 조회
         post_ids = [p["post_id"] for p in posts_data]
         posts_tags = await tag_models.get_posts_tags(post_ids)
         for p in posts_data:
@@ -512,6 +690,7 @@ class PostService:
         if not post:
             raise not_found_error("post", timestamp)
         await post_models.pin_post(post_id)
+        await invalidate_post_responses(post_id)
 
     @staticmethod
     async def unpin_post(post_id: int, timestamp: str) -> None:
@@ -520,3 +699,4 @@ class PostService:
         if not post:
             raise not_found_error("post", timestamp)
         await post_models.unpin_post(post_id)
+        await invalidate_post_responses(post_id)
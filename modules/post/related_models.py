@@ -0,0 +1,176 @@
+"""related_models: 연관 게시글 색인(post_related) 데이터 접근 함수 모듈.
+
+게시글마다 미리 계산한 연관 게시글 상위 K개를 (post_id, position) 순서로 저장합니다.
+계산은 related_service.RelatedPostService가 담당하고, 여기서는 후보 조회와 저장만 합니다.
+"""
+
+from core.database.connection import get_cursor, transactional
+from modules.post.related_scorer import RelatedCandidate
+
+
+async def get_related_features(post_ids: list[int]) -> dict[int, RelatedCandidate]:
+    """삭제되지 않은 게시글의 카테고리/태그/hot_score를 조회합니다."""
+    if not post_ids:
+        return {}
+    placeholders = ", ".join(["%s"] * len(post_ids))
+    async with get_cursor() as cur:
+        await cur.execute(
+            f"SELECT id, category_id, hot_score FROM post WHERE id IN ({placeholders}) AND deleted_at IS NULL",
+            post_ids,
+        )
+        posts = await cur.fetchall()
+        if not posts:
+            return {}
+        live_ids = [row["id"] for row in posts]
+        placeholders = ", ".join(["%s"] * len(live_ids))
+        await cur.execute(
+            f"SELECT post_id, tag_id FROM post_tag WHERE post_id IN ({placeholders})",
+            live_ids,
+        )
+        tag_rows = await cur.fetchall()
+
+    tags: dict[int, set[int]] = {}
+    for row in tag_rows:
+        tags.setdefault(row["post_id"], set()).add(row["tag_id"])
+    return {
+        row["id"]: RelatedCandidate(
+            post_id=row["id"],
+            category_id=row["category_id"],
+            tag_ids=frozenset(tags.get(row["id"], ())),
+            hot_score=float(row["hot_score"]),
+        )
+        for row in posts
+    }
+
+
+async def get_top_post_ids_by_tag(tag_ids: list[int], per_tag: int) -> dict[int, list[int]]:
+    """태그별로 hot_score 상위 per_tag개의 게시글 ID를 반환합니다 (후보 생성용 역색인 조회)."""
+    if not tag_ids:
+        return {}
+    placeholders = ", ".join(["%s"] * len(tag_ids))
+    async with get_cursor() as cur:
+        await cur.execute(
+            f"""
+                SELECT tag_id, post_id FROM (
+                    SELECT pt.tag_id, pt.post_id,
+                           ROW_NUMBER() OVER (PARTITION BY pt.tag_id ORDER BY p.hot_score DESC, p.id DESC) AS rn
+                    FROM post_tag pt
+                    INNER JOIN post p ON p.id = pt.post_id
+                    WHERE pt.tag_id IN ({placeholders}) AND p.deleted_at IS NULL
+                ) ranked
+                WHERE rn <= %s
+                """,
+            [*tag_ids, per_tag],
+        )
+        rows = await cur.fetchall()
+
+    pools: dict[int, list[int]] = {tag_id: [] for tag_id in tag_ids}
+    for row in rows:
+        pools[row["tag_id"]].append(row["post_id"])
+    return pools
+
+
+async def get_top_post_ids_by_category(category_ids: list[int], per_category: int) -> dict[int, list[int]]:
+    """카테고리별로 hot_score 상위 per_category개의 게시글 ID를 반환합니다."""
+    if not category_ids:
+        return {}
+    placeholders = ", ".join(["%s"] * len(category_ids))
+    async with get_cursor() as cur:
+        await cur.execute(
+            f"""
+                SELECT category_id, id FROM (
+                    SELECT category_id, id,
+                           ROW_NUMBER() OVER (PARTITION BY category_id ORDER BY hot_score DESC, id DESC) AS rn
+                    FROM post
+                    WHERE category_id IN ({placeholders}) AND deleted_at IS NULL
+                ) ranked
+                WHERE rn <= %s
+                """,
+            [*category_ids, per_category],
+        )
+        rows = await cur.fetchall()
+
+    pools: dict[int, list[int]] = {category_id: [] for category_id in category_ids}
+    for row in rows:
+        pools[row["category_id"]].append(row["id"])
+    return pools
+
+
+async def get_hot_post_ids(limit: int) -> list[int]:
+    """전체 게시글 중 hot_score 상위 limit개의 ID를 반환합니다 (빈자리 채우기 후보)."""
+    async with get_cursor() as cur:
+        await cur.execute(
+            "SELECT id FROM post WHERE deleted_at IS NULL ORDER BY hot_score DESC, id DESC LIMIT %s",
+            (limit,),
+        )
+        return [row["id"] for row in await cur.fetchall()]
+
+
+async def get_post_ids_after(after_id: int, limit: int) -> list[int]:
+    """삭제되지 않은 게시글 ID를 after_id 다음부터 limit개 반환합니다 (전체 재계산 순회용)."""
+    async with get_cursor() as cur:
+        await cur.execute(
+            "SELECT id FROM post WHERE id > %s AND deleted_at IS NULL ORDER BY id LIMIT %s",
+            (after_id, limit),
+        )
+        return [row["id"] for row in await cur.fetchall()]
+
+
+async def get_referencing_post_ids(post_id: int, limit: int) -> list[int]:
+    """post_id를 연관 게시글로 가진 게시글 ID를 반환합니다 (역방향 갱신용)."""
+    async with get_cursor() as cur:
+        await cur.execute(
+            "SELECT post_id FROM post_related WHERE related_post_id = %s ORDER BY post_id DESC LIMIT %s",
+            (post_id, limit),
+        )
+        return [row["post_id"] for row in await cur.fetchall()]
+
+
+async def get_related_post_ids(post_id: int) -> list[int]:
+    """post_id에 저장된 연관 게시글 ID를 순위 순으로 반환합니다."""
+    async with get_cursor() as cur:
+        await cur.execute(
+            "SELECT related_post_id FROM post_related WHERE post_id = %s ORDER BY position",
+            (post_id,),
+        )
+        return [row["related_post_id"] for row in await cur.fetchall()]
+
+
+async def has_related_index(post_id: int) -> bool:
+    """post_id의 연관 게시글이 한 번이라도 계산되었는지 반환합니다."""
+    async with get_cursor() as cur:
+        await cur.execute("SELECT 1 FROM post_related WHERE post_id = %s LIMIT 1", (post_id,))
+        return await cur.fetchone() is not None
+
+
+async def replace_related(related: dict[int, list[tuple[int, float]]]) -> None:
+    """게시글별 연관 게시글 목록을 한 트랜잭션으로 교체합니다.
+
+    Args:
+        related: {post_id: [(related_post_id, 태그 유사도), ...]} (순위 순). 빈 목록이면 기존 행만 삭제.
+    """
+    if not related:
+        return
+    post_ids = list(related)
+    placeholders = ", ".join(["%s"] * len(post_ids))
+    rows = [
+        (post_id, position, related_post_id, similarity)
+        for post_id, ranked in related.items()
+        for position, (related_post_id, similarity) in enumerate(ranked)
+    ]
+    async with transactional() as cur:
+        await cur.execute(f"DELETE FROM post_related WHERE post_id IN ({placeholders})", post_ids)
+        if rows:
+            await cur.executemany(
+                "INSERT INTO post_related (post_id, position, related_post_id, similarity) VALUES (%s, %s, %s, %s)",
+                rows,
+            )
+
+
+async def delete_related_of_deleted_posts() -> int:
+    """삭제된 게시글의 연관 게시글 행을 정리하고 삭제한 행 수를 반환합니다."""
+    async with transactional() as cur:
+        await cur.execute(
+            "DELETE r FROM post_related r INNER JOIN post p ON p.id = r.post_id WHERE p.deleted_at IS NOT NULL"
+        )
+        return cur.rowcount
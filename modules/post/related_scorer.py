@@ -0,0 +1,52 @@
+"""related_scorer: 연관 게시글 순위 계산 순수 로직.
+
+DB/HTTP 의존성 없음. 단위 테스트 가능.
+
+순위 키는 (태그 Jaccard 유사도, 같은 카테고리 여부, hot_score) 사전식 비교입니다.
+태그가 겹치는 게시글이 먼저, 그다음 같은 카테고리, 나머지는 인기순으로 빈자리를 채웁니다.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RelatedCandidate:
+    """연관 게시글 계산에 쓰는 게시글 특성."""
+
+    post_id: int
+    category_id: int | None
+    tag_ids: frozenset[int]
+    hot_score: float
+
+
+def jaccard(a: frozenset[int], b: frozenset[int]) -> float:
+    """두 태그 집합의 Jaccard 유사도 (교집합 크기 / 합집합 크기). 한쪽이라도 비어 있으면 0."""
+    if not a or not b:
+        return 0.0
+    intersection = len(a & b)
+    if not intersection:
+        return 0.0
+    return intersection / (len(a) + len(b) - intersection)
+
+
+def rank_related(
+    source: RelatedCandidate,
+    candidates: list[RelatedCandidate],
+    k: int,
+) -> list[tuple[int, float]]:
+    """source의 연관 게시글 상위 k개를 (post_id, 태그 유사도) 목록으로 반환합니다.
+
+    같은 게시글이 후보에 여러 번 있어도 한 번만 셉니다. 동점은 post_id 내림차순(최신 우선)으로 고정합니다.
+    """
+    seen: set[int] = {source.post_id}
+    scored: list[tuple[float, int, float, int]] = []
+    for candidate in candidates:
+        if candidate.post_id in seen:
+            continue
+        seen.add(candidate.post_id)
+        similarity = jaccard(source.tag_ids, candidate.tag_ids)
+        same_category = int(source.category_id is not None and candidate.category_id == source.category_id)
+        scored.append((similarity, same_category, candidate.hot_score, candidate.post_id))
+
+    scored.sort(reverse=True)
+    return [(post_id, similarity) for similarity, _, _, post_id in scored[:k]]
@@ -0,0 +1,141 @@
+"""related_service: 연관 게시글 색인 계산 서비스.
+
+GET /v1/posts/{id}/related가 요청마다 전체 게시글을 post_tag와 GROUP BY로 정렬하지 않도록,
+게시글별 연관 게시글 상위 RELATED_POSTS_INDEX_SIZE개를 post_related에 미리 저장합니다.
+
+- 후보: 게시글 태그별 hot_score 상위 RELATED_POSTS_CANDIDATES_PER_TAG개(post_tag 역색인)
+  + 같은 카테고리 상위 + 전체 상위 (태그가 없거나 겹치는 게시글이 부족할 때 빈자리 채우기)
+- 순위: related_scorer.rank_related (태그 Jaccard → 같은 카테고리 → hot_score)
+- 증분 갱신: 게시글 작성/태그·카테고리 변경/삭제 시 post.related_refresh 잡이
+  해당 게시글, 새 이웃, 그 게시글을 이웃으로 가진 게시글을 다시 계산
+- 전체 재계산: 내부 API(POST /v1/admin/related-posts/rebuild)가 hot_score 변화를 주기적으로 반영
+"""
+
+import logging
+import time
+
+from core.config import settings
+from modules.post import related_models
+from modules.post.related_scorer import RelatedCandidate, rank_related
+
+logger = logging.getLogger(__name__)
+
+# 전체 재계산 시 한 번에 계산/저장하는 게시글 수
+_REBUILD_CHUNK_SIZE = 500
+# 증분 갱신 시 역방향으로 함께 다시 계산하는 최대 게시글 수
+_MAX_REFERENCING_REFRESH = 100
+
+
+class _CandidatePool:
+    """후보 ID 풀과 게시글 특성 조회 결과를 한 번의 계산(증분 또는 전체 재계산) 동안 재사용합니다."""
+
+    def __init__(self) -> None:
+        self._by_tag: dict[int, list[int]] = {}
+        self._by_category: dict[int, list[int]] = {}
+        self._hot: list[int] | None = None
+        self._features: dict[int, RelatedCandidate] = {}
+
+    @staticmethod
+    def _fallback_size() -> int:
+        return settings.RELATED_POSTS_INDEX_SIZE * 2
+
+    def reset_features(self) -> None:
+        """게시글 특성 캐시를 비웁니다 (전체 재계산에서 청크마다 호출해 메모리를 제한)."""
+        self._features.clear()
+
+    async def features(self, post_ids: list[int]) -> dict[int, RelatedCandidate]:
+        """게시글 특성을 조회합니다 (삭제된 게시글은 결과에 없음)."""
+        missing = [post_id for post_id in post_ids if post_id not in self._features]
+        self._features.update(await related_models.get_related_features(missing))
+        return {post_id: self._features[post_id] for post_id in post_ids if post_id in self._features}
+
+    async def candidate_ids(self, sources: list[RelatedCandidate]) -> dict[int, list[int]]:
+        """원본 게시글별 후보 ID 목록을 반환합니다."""
+        tag_ids = sorted({tag_id for source in sources for tag_id in source.tag_ids} - self._by_tag.keys())
+        self._by_tag.update(
+            await related_models.get_top_post_ids_by_tag(tag_ids, settings.RELATED_POSTS_CANDIDATES_PER_TAG)
+        )
+        category_ids = sorted(
+            {source.category_id for source in sources if source.category_id is not None} - self._by_category.keys()
+        )
+        self._by_category.update(await related_models.get_top_post_ids_by_category(category_ids, self._fallback_size()))
+        if self._hot is None:
+            self._hot = await related_models.get_hot_post_ids(self._fallback_size())
+
+        candidates: dict[int, list[int]] = {}
+        for source in sources:
+            ids: list[int] = []
+            for tag_id in source.tag_ids:
+                ids.extend(self._by_tag.get(tag_id, ()))
+            if source.category_id is not None:
+                ids.extend(self._by_category.get(source.category_id, ()))
+            ids.extend(self._hot)
+            candidates[source.post_id] = ids
+        return candidates
+
+
+class RelatedPostService:
+    """연관 게시글 색인 계산/갱신 서비스."""
+
+    @staticmethod
+    async def _compute(post_ids: list[int], pool: _CandidatePool) -> int:
+        """게시글들의 연관 게시글을 계산해 저장하고 저장한 게시글 수를 반환합니다.
+
+        삭제되었거나 없는 게시글은 저장된 행을 지웁니다.
+        """
+        sources = await pool.features(post_ids)
+        candidate_ids = await pool.candidate_ids(list(sources.values()))
+        features = await pool.features(sorted({i for ids in candidate_ids.values() for i in ids}))
+
+        related: dict[int, list[tuple[int, float]]] = {post_id: [] for post_id in post_ids}
+        for post_id, source in sources.items():
+            candidates = [features[i] for i in candidate_ids[post_id] if i in features]
+            related[post_id] = rank_related(source, candidates, settings.RELATED_POSTS_INDEX_SIZE)
+        await related_models.replace_related(related)
+        return len(sources)
+
+    @staticmethod
+    async def refresh(post_id: int) -> int:
+        """게시글 변경(작성/태그·카테고리 변경/삭제) 후 영향을 받는 연관 게시글 목록을 다시 계산합니다.
+
+        해당 게시글, 새로 계산한 이웃(유사도가 대칭이므로 이 게시글이 이웃의 목록에 들어갈 수 있음),
+        이 게시글을 이웃으로 가진 게시글(순위가 바뀌었거나 삭제되어 빈자리가 생김)을 함께 계산합니다.
+        나머지 게시글의 목록은 전체 재계산에서 반영됩니다.
+
+        Returns:
+            다시 계산한 게시글 수.
+        """
+        pool = _CandidatePool()
+        referencing = await related_models.get_referencing_post_ids(post_id, _MAX_REFERENCING_REFRESH)
+        await RelatedPostService._compute([post_id], pool)
+        neighbours = await related_models.get_related_post_ids(post_id)
+        affected = sorted((set(neighbours) | set(referencing)) - {post_id})
+        if affected:
+            await RelatedPostService._compute(affected, pool)
+        return 1 + len(affected)
+
+    @staticmethod
+    async def ensure_indexed(post_id: int) -> None:
+        """연관 게시글이 아직 계산되지 않은 게시글이면 즉시 계산합니다 (색인 도입 전 게시글의 첫 조회)."""
+        if not await related_models.has_related_index(post_id):
+            await RelatedPostService._compute([post_id], _CandidatePool())
+
+    @staticmethod
+    async def rebuild_all() -> dict:
+        """모든 게시글의 연관 게시글을 다시 계산합니다 (CronJob 호출용).
+
+        Returns:
+            계산한 게시글 수, 정리한 삭제 게시글 행 수, 소요 시간.
+        """
+        started = time.monotonic()
+        pool = _CandidatePool()
+        indexed = 0
+        after_id = 0
+        while post_ids := await related_models.get_post_ids_after(after_id, _REBUILD_CHUNK_SIZE):
+            indexed += await RelatedPostService._compute(post_ids, pool)
+            pool.reset_features()
+            after_id = post_ids[-1]
+        removed = await related_models.delete_related_of_deleted_posts()
+        elapsed = round(time.monotonic() - started, 2)
+        logger.info("연관 게시글 전체 재계산: posts=%d removed_rows=%d (%.1fs)", indexed, removed, elapsed)
+        return {"posts_indexed": indexed, "deleted_rows_removed": removed, "elapsed_seconds": elapsed}
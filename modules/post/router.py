@@ -3,7 +3,7 @@
 게시글 CRUD, 이미지 업로드, 좋아요, 댓글 엔드포인트를 제공합니다.
 """
 
-from fastapi import APIRouter, Depends, File, Path, Query, Request, UploadFile, status
+from fastapi import APIRouter, Depends, File, Path, Query, Request, Response, UploadFile, status
 
 from core.dependencies.auth import get_optional_user, require_admin, require_verified_email
 from modules.post import (
@@ -29,24 +29,25 @@ post_router = APIRouter(prefix="/v1/posts", tags=["posts"])
 # ============ 게시글 라우터 ============
 
 
-@post_router.get("/", status_code=status.HTTP_200_OK)
+@post_router.get("/", status_code=status.HTTP_200_OK, response_model=None)
 async def get_posts(
     request: Request,
     offset: int = Query(0, ge=0, description="시작 위치 (0부터 시작)"),
     limit: int = Query(10, ge=1, le=100, description="조회할 게시글 수"),
     search: str | None = Query(None, max_length=100, description="검색어 (제목+내용)"),
-    sort: str = Query("latest", description="정렬: latest, likes, views, comments, hot"),
+    sort: str = Query("latest", description="정렬: latest, likes, views, comments, hot, relevance(검색 시)"),
     author_id: int | None = Query(None, ge=1, description="작성자 ID로 필터링"),
     category_id: int | None = Query(None, ge=1, description="카테고리 ID로 필터링"),
     tag: str | None = Query(default=None, description="태그 이름으로 필터링"),
     following: bool = Query(False, description="팔로우한 사용자의 게시글만 조회"),
     solved: bool | None = Query(None, description="해결 여부 필터링 (true: 해결됨, false: 미해결)"),
+    cursor: str | None = Query(None, max_length=512, description="이전 응답의 next_cursor (지정 시 offset 무시)"),
     current_user: User | None = Depends(get_optional_user),
-) -> dict:
+) -> dict | Response:
     """게시글 목록을 조회합니다.
 
     정렬 옵션에 따라 게시글을 페이지네이션하여 반환합니다.
-    검색어가 있으면 제목+내용을 FULLTEXT 검색합니다.
+    검색어가 있으면 제목+내용을 전문 검색하고, 각 항목에 하이라이트 스니펫을 포함합니다.
     author_id가 있으면 해당 작성자의 글만 필터링합니다.
     category_id가 있으면 해당 카테고리의 글만 필터링합니다.
 
@@ -55,11 +56,12 @@ async def get_posts(
         offset: 시작 위치 (0부터 시작).
         limit: 조회할 게시글 수 (1~100, 기본 10).
         search: 검색어 (제목+내용, 최대 100자).
-        sort: 정렬 옵션 (latest, likes, views, comments).
+        sort: 정렬 옵션 (latest, likes, views, comments, hot, relevance). relevance는 offset 페이지네이션만 지원.
         author_id: 작성자 ID로 필터링 (선택).
         category_id: 카테고리 ID로 필터링 (선택).
         tag: 태그명으로 필터링 (선택).
         following: True이면 팔로우한 사용자의 게시글만 조회 (로그인 필요, 비로그인 시 무시).
+        cursor: 이전 응답의 next_cursor. 지정하면 offset 대신 키셋으로 이어서 조회.
 
     Returns:
         게시글 목록과 페이지네이션 정보가 포함된 응답.
@@ -76,6 +78,7 @@ async def get_posts(
         tag=tag,
         following=following,
         solved=solved,
+        cursor=cursor,
     )
 
 
@@ -107,7 +110,7 @@ async def get_related_posts(
     )
 
 
-@post_router.get("/{post_id}", status_code=status.HTTP_200_OK)
+@post_router.get("/{post_id}", status_code=status.HTTP_200_OK, response_model=None)
 async def get_post(
     post_id: int,
     request: Request,
@@ -116,10 +119,11 @@ async def get_post(
         default="oldest",
         description="댓글 정렬: oldest(오래된순), latest(최신순), popular(인기순)",
     ),
-) -> dict:
+) -> dict | Response:
     """특정 게시글의 상세 정보를 조회합니다.
 
-    게시글 내용과 댓글 목록을 함께 반환합니다.
+    게시글 내용과 댓글 첫 페이지를 함께 반환합니다.
+    이후 댓글은 comments_pagination.next_cursor로 GET /{post_id}/comments를 호출해 이어서 조회합니다.
     로그인한 사용자의 경우 조회수가 증가합니다.
 
     Args:
@@ -325,6 +329,66 @@ async def unlike_post(
 # ============ 댓글 라우터 ============
 
 
+@post_router.get("/{post_id}/comments", status_code=status.HTTP_200_OK)
+async def get_comments(
+    post_id: int,
+    request: Request,
+    current_user: User | None = Depends(get_optional_user),
+    sort: str = Query("oldest", description="정렬: oldest(오래된순), latest(최신순), popular(인기순)"),
+    limit: int = Query(30, ge=1, le=100, description="조회할 루트 댓글 수"),
+    cursor: str | None = Query(None, max_length=512, description="이전 응답의 next_cursor"),
+) -> dict:
+    """게시글의 루트 댓글 목록을 조회합니다.
+
+    루트 댓글마다 대댓글 수와 가장 오래된 대댓글 몇 개를 함께 반환합니다.
+
+    Args:
+        post_id: 게시글 ID.
+        request: FastAPI Request 객체.
+        current_user: 현재 인증된 사용자 (선택적).
+        sort: 정렬 옵션 (oldest, latest, popular).
+        limit: 조회할 루트 댓글 수 (1~100).
+        cursor: 이전 응답의 next_cursor. 지정하면 이어서 조회.
+
+    Returns:
+        댓글 목록과 페이지네이션 정보가 포함된 응답.
+    """
+    if sort not in ALLOWED_COMMENT_SORT_OPTIONS:
+        sort = "oldest"
+
+    return await comment_controller.get_comments(post_id, request, current_user, sort, limit, cursor)
+
+
+@post_router.get("/{post_id}/comments/{comment_id}/replies", status_code=status.HTTP_200_OK)
+async def get_replies(
+    post_id: int,
+    comment_id: int,
+    request: Request,
+    current_user: User | None = Depends(get_optional_user),
+    sort: str = Query("oldest", description="정렬: oldest(오래된순), latest(최신순), popular(인기순)"),
+    limit: int = Query(30, ge=1, le=100, description="조회할 대댓글 수"),
+    cursor: str | None = Query(None, max_length=512, description="이전 응답의 next_cursor 또는 replies_cursor"),
+) -> dict:
+    """루트 댓글의 대댓글 목록을 조회합니다.
+
+    Args:
+        post_id: 게시글 ID.
+        comment_id: 루트 댓글 ID.
+        request: FastAPI Request 객체.
+        current_user: 현재 인증된 사용자 (선택적).
+        sort: 정렬 옵션 (oldest, latest, popular).
+        limit: 조회할 대댓글 수 (1~100).
+        cursor: 이전 응답의 next_cursor 또는 댓글 목록의 replies_cursor(oldest 정렬).
+
+    Returns:
+        대댓글 목록과 페이지네이션 정보가 포함된 응답.
+    """
+    if sort not in ALLOWED_COMMENT_SORT_OPTIONS:
+        sort = "oldest"
+
+    return await comment_controller.get_replies(post_id, comment_id, request, current_user, sort, limit, cursor)
+
+
 @post_router.post("/{post_id}/comments", status_code=status.HTTP_201_CREATED)
 async def create_comment(
     post_id: int,
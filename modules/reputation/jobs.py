@@ -0,0 +1,46 @@
+"""jobs: 평판 포인트 부여/회수 비동기 잡 핸들러.
+
+좋아요/댓글 등 쓰기 API는 응답 경로에서 평판 트랜잭션을 기다리지 않고 잡으로 적재합니다.
+잡은 재전달되거나 부여/회수 순서가 뒤바뀔 수 있으므로 두 핸들러 모두 원본 키의 이벤트 기록을
+트랜잭션 안에서 확인한 뒤 적용합니다 (원본당 유효한 부여는 최대 1건).
+"""
+
+from dataclasses import asdict
+from typing import Any
+
+from core.jobs import enqueue
+from core.jobs.registry import job_handler
+from modules.reputation.service import ReputationEvent, ReputationRevocation, ReputationService
+
+AWARD_JOB = "reputation.award"
+REVOKE_JOB = "reputation.revoke"
+
+
+def award_job(events: list[ReputationEvent]) -> tuple[str, dict[str, Any]]:
+    """평판 이벤트 부여 잡 (이름, payload)을 만듭니다. 다른 잡과 함께 enqueue_many로 적재할 때 사용."""
+    return AWARD_JOB, {"events": [asdict(event) for event in events]}
+
+
+async def enqueue_award(events: list[ReputationEvent]) -> None:
+    """평판 이벤트 부여 잡을 적재합니다 (한 잡 = 한 트랜잭션)."""
+    await enqueue(*award_job(events))
+
+
+async def enqueue_revoke(revocations: list[ReputationRevocation]) -> None:
+    """평판 이벤트 회수 잡을 적재합니다."""
+    await enqueue(REVOKE_JOB, {"revocations": [asdict(revocation) for revocation in revocations]})
+
+
+@job_handler(AWARD_JOB)
+async def handle_award(payload: dict[str, Any]) -> None:
+    """ReputationService.award_many 실행. 트랜잭션이 롤백되면 예외로 재시도됩니다.
+
+    이미 부여된 이벤트는 건너뛰므로 커밋 후 ack 전에 재전달되어도 포인트/카운터가 두 번 반영되지 않습니다.
+    """
+    await ReputationService.award_many([ReputationEvent(**event) for event in payload["events"]], idempotent=True)
+
+
+@job_handler(REVOKE_JOB)
+async def handle_revoke(payload: dict[str, Any]) -> None:
+    """ReputationService.revoke_many 실행. 유효한 부여가 없으면 아무 것도 하지 않으므로 재실행에 안전합니다."""
+    await ReputationService.revoke_many([ReputationRevocation(**revocation) for revocation in payload["revocations"]])
@@ -271,189 +271,10 @@ async def award_badge(user_id: int, badge_id: int) -> bool:
 
 
 # ---------------------------------------------------------------------------
-# 배지 체크용 집계 쿼리
+# 방문 연속일
 # ---------------------------------------------------------------------------
 
 
-async def count_user_posts(user_id: int) -> int:
-    """사용자가 작성한 게시글 수를 반환합니다 (소프트 삭제 제외)."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            "SELECT COUNT(*) AS cnt FROM post WHERE author_id = %s AND deleted_at IS NULL",
-            (user_id,),
-        )
-        row = await cur.fetchone()
-        return row["cnt"] if row else 0
-
-
-async def count_user_comments(user_id: int) -> int:
-    """사용자가 작성한 댓글 수를 반환합니다 (소프트 삭제 제외)."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            "SELECT COUNT(*) AS cnt FROM comment WHERE author_id = %s AND deleted_at IS NULL",
-            (user_id,),
-        )
-        row = await cur.fetchone()
-        return row["cnt"] if row else 0
-
-
-async def count_user_likes_given(user_id: int) -> int:
-    """사용자가 누른 좋아요 수를 반환합니다 (게시글 + 댓글 합산)."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            """
-            SELECT
-                (SELECT COUNT(*) FROM post_like WHERE user_id = %s)
-                + (SELECT COUNT(*) FROM comment_like WHERE user_id = %s)
-                AS cnt
-            """,
-            (user_id, user_id),
-        )
-        row = await cur.fetchone()
-        return row["cnt"] if row else 0
-
-
-async def count_user_bookmarks(user_id: int) -> int:
-    """사용자가 추가한 북마크 수를 반환합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            "SELECT COUNT(*) AS cnt FROM post_bookmark WHERE user_id = %s",
-            (user_id,),
-        )
-        row = await cur.fetchone()
-        return row["cnt"] if row else 0
-
-
-async def count_user_accepted_answers(user_id: int) -> int:
-    """사용자의 댓글이 채택된 답변 수를 반환합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            """
-            SELECT COUNT(*) AS cnt
-            FROM post p
-            JOIN comment c ON p.accepted_answer_id = c.id
-            WHERE c.author_id = %s
-              AND c.deleted_at IS NULL
-              AND p.deleted_at IS NULL
-            """,
-            (user_id,),
-        )
-        row = await cur.fetchone()
-        return row["cnt"] if row else 0
-
-
-async def count_user_wiki_edits(user_id: int) -> int:
-    """사용자의 위키 편집/생성 이벤트 수를 반환합니다 (양의 포인트 이벤트 기준)."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            """
-            SELECT COUNT(*) AS cnt
-            FROM reputation_event
-            WHERE user_id = %s
-              AND event_type IN ('wiki_created', 'wiki_edited')
-              AND points > 0
-            """,
-            (user_id,),
-        )
-        row = await cur.fetchone()
-        return row["cnt"] if row else 0
-
-
-async def count_user_package_reviews(user_id: int) -> int:
-    """사용자가 작성한 패키지 리뷰 수를 반환합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            "SELECT COUNT(*) AS cnt FROM package_review WHERE user_id = %s AND deleted_at IS NULL",
-            (user_id,),
-        )
-        row = await cur.fetchone()
-        return row["cnt"] if row else 0
-
-
-async def count_user_dm_sent(user_id: int) -> int:
-    """사용자가 전송한 DM 수를 반환합니다 (소프트 삭제 제외)."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            "SELECT COUNT(*) AS cnt FROM dm_message WHERE sender_id = %s AND deleted_at IS NULL",
-            (user_id,),
-        )
-        row = await cur.fetchone()
-        return row["cnt"] if row else 0
-
-
-async def count_user_followers(user_id: int) -> int:
-    """사용자의 팔로워 수를 반환합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            "SELECT COUNT(*) AS cnt FROM user_follow WHERE following_id = %s",
-            (user_id,),
-        )
-        row = await cur.fetchone()
-        return row["cnt"] if row else 0
-
-
-async def count_single_post_likes(post_id: int) -> int:
-    """특정 게시글의 좋아요 수를 반환합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            "SELECT COUNT(*) AS cnt FROM post_like WHERE post_id = %s",
-            (post_id,),
-        )
-        row = await cur.fetchone()
-        return row["cnt"] if row else 0
-
-
-async def count_single_comment_likes(comment_id: int) -> int:
-    """특정 댓글의 좋아요 수를 반환합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            "SELECT COUNT(*) AS cnt FROM comment_like WHERE comment_id = %s",
-            (comment_id,),
-        )
-        row = await cur.fetchone()
-        return row["cnt"] if row else 0
-
-
-async def get_post_views(post_id: int) -> int:
-    """특정 게시글의 조회수를 반환합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            "SELECT views FROM post WHERE id = %s",
-            (post_id,),
-        )
-        row = await cur.fetchone()
-        return row["views"] if row else 0
-
-
-async def count_user_post_views(user_id: int) -> int:
-    """사용자가 조회한 고유 게시글 수를 반환합니다."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            "SELECT COUNT(DISTINCT post_id) AS cnt FROM post_view_log WHERE user_id = %s",
-            (user_id,),
-        )
-        row = await cur.fetchone()
-        return row["cnt"] if row else 0
-
-
-# ---------------------------------------------------------------------------
-# 프로필 완성도 + 방문 연속일
-# ---------------------------------------------------------------------------
-
-
-async def is_profile_completed(user_id: int) -> bool:
-    """사용자의 프로필이 완성되었는지 확인합니다 (아바타 + 배포판 모두 설정 필요)."""
-    async with get_cursor() as cur:
-        await cur.execute(
-            "SELECT profile_img, distro FROM user WHERE id = %s",
-            (user_id,),
-        )
-        row = await cur.fetchone()
-        if not row:
-            return False
-        return bool(row["profile_img"]) and bool(row["distro"])
-
-
 async def record_daily_visit(user_id: int) -> bool:
     """오늘의 방문을 기록합니다. 이미 기록된 경우 False를 반환합니다."""
     today = date.today()
@@ -473,17 +294,22 @@ async def record_daily_visit(user_id: int) -> bool:
 async def get_consecutive_visit_days(user_id: int) -> int:
     """오늘 또는 어제부터 연속 방문 일수를 계산합니다."""
     async with get_cursor() as cur:
-        await cur.execute(
-            """
-            SELECT visit_date
-            FROM user_daily_visit
-            WHERE user_id = %s
-            ORDER BY visit_date DESC
-            LIMIT 365
-            """,
-            (user_id,),
-        )
-        rows = await cur.fetchall()
+        return await _consecutive_visit_days(cur, user_id)
+
+
+async def _consecutive_visit_days(cur, user_id: int) -> int:
+    """주어진 커서로 최근 방문 기록을 읽어 연속 방문 일수를 계산합니다."""
+    await cur.execute(
+        """
+        SELECT visit_date
+        FROM user_daily_visit
+        WHERE user_id = %s
+        ORDER BY visit_date DESC
+        LIMIT 365
+        """,
+        (user_id,),
+    )
+    rows = await cur.fetchall()
 
     if not rows:
         return 0
@@ -506,3 +332,250 @@ async def get_consecutive_visit_days(user_id: int) -> int:
         current -= timedelta(days=1)
 
     return streak
+
+
+# ---------------------------------------------------------------------------
+# 평판 파이프라인 (호출자의 트랜잭션 커서를 공유)
+# ---------------------------------------------------------------------------
+
+# user_badge_progress에 증분 카운터로 유지하는 trigger_type → 최초 시드용 집계 SQL.
+# 카운터 행이 없을 때 한 번만 실행하며, 이후에는 이벤트마다 ±1로 갱신합니다.
+COUNTER_TRIGGER_SEED_SQL: dict[str, str] = {
+    "post_count": "SELECT COUNT(*) AS cnt FROM post WHERE author_id = %(user_id)s AND deleted_at IS NULL",
+    "comment_count": "SELECT COUNT(*) AS cnt FROM comment WHERE author_id = %(user_id)s AND deleted_at IS NULL",
+    "like_given_count": (
+        "SELECT (SELECT COUNT(*) FROM post_like WHERE user_id = %(user_id)s)"
+        " + (SELECT COUNT(*) FROM comment_like WHERE user_id = %(user_id)s) AS cnt"
+    ),
+    "bookmark_count": "SELECT COUNT(*) AS cnt FROM post_bookmark WHERE user_id = %(user_id)s",
+    "accepted_answer_count": (
+        "SELECT COUNT(*) AS cnt FROM post p JOIN comment c ON p.accepted_answer_id = c.id"
+        " WHERE c.author_id = %(user_id)s AND c.deleted_at IS NULL AND p.deleted_at IS NULL"
+    ),
+    # 위키 편집은 별도 원본 테이블 대신 양의 포인트 이벤트 수를 기준으로 함
+    "wiki_edit_count": (
+        "SELECT COUNT(*) AS cnt FROM reputation_event WHERE user_id = %(user_id)s"
+        " AND event_type IN ('wiki_created', 'wiki_edited') AND points > 0"
+    ),
+    "package_review_count": (
+        "SELECT COUNT(*) AS cnt FROM package_review WHERE user_id = %(user_id)s AND deleted_at IS NULL"
+    ),
+    "dm_sent_count": "SELECT COUNT(*) AS cnt FROM dm_message WHERE sender_id = %(user_id)s AND deleted_at IS NULL",
+    "follower_count": "SELECT COUNT(*) AS cnt FROM user_follow WHERE following_id = %(user_id)s",
+    "post_view_count": "SELECT COUNT(DISTINCT post_id) AS cnt FROM post_view_log WHERE user_id = %(user_id)s",
+}
+
+
+async def insert_reputation_event_in_tx(
+    cur,
+    user_id: int,
+    event_type: str,
+    points: int,
+    source_user_id: int | None = None,
+    source_type: str | None = None,
+    source_id: int | None = None,
+) -> None:
+    """호출자의 트랜잭션 안에서 평판 이벤트를 삽입합니다."""
+    await cur.execute(
+        """
+        INSERT INTO reputation_event
+            (user_id, event_type, points, source_user_id, source_type, source_id)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        """,
+        (user_id, event_type, points, source_user_id, source_type, source_id),
+    )
+
+
+async def find_original_event_in_tx(
+    cur,
+    user_id: int,
+    event_type: str,
+    source_type: str,
+    source_id: int,
+    source_user_id: int | None = None,
+) -> dict | None:
+    """호출자의 트랜잭션 안에서 회수 대상 원본 이벤트(가장 최근 양의 포인트)를 조회합니다.
+
+    source_user_id가 None이면 유발 사용자를 구분하지 않습니다.
+    """
+    await cur.execute(
+        """
+        SELECT id, points, source_user_id
+        FROM reputation_event
+        WHERE user_id = %s
+          AND event_type = %s
+          AND source_type = %s
+          AND source_id = %s
+          AND (%s IS NULL OR source_user_id = %s)
+          AND points > 0
+        ORDER BY created_at DESC
+        LIMIT 1
+        """,
+        (user_id, event_type, source_type, source_id, source_user_id, source_user_id),
+    )
+    return await cur.fetchone()
+
+
+async def get_event_balance_in_tx(
+    cur,
+    user_id: int,
+    event_type: str,
+    source_type: str,
+    source_id: int,
+    source_user_id: int | None = None,
+) -> int:
+    """원본 키의 (양의 포인트 부여 수 - 회수 수)를 반환합니다. 1 이상이면 유효한 부여가 남아 있습니다.
+
+    source_user_id가 None이면 유발 사용자를 구분하지 않습니다.
+    """
+    await cur.execute(
+        """
+        SELECT COALESCE(SUM(SIGN(points)), 0) AS balance
+        FROM reputation_event
+        WHERE user_id = %s
+          AND event_type = %s
+          AND source_type = %s
+          AND source_id = %s
+          AND (%s IS NULL OR source_user_id = %s)
+        """,
+        (user_id, event_type, source_type, source_id, source_user_id, source_user_id),
+    )
+    row = await cur.fetchone()
+    return int(row["balance"]) if row else 0
+
+
+# 원본 행으로 현재 상태를 확인할 수 있는 토글형 이벤트 → 원본이 지금도 유효한지 확인하는 SQL.
+# 부여/회수 잡이 재전달되거나 순서가 뒤바뀌어도 최종 상태가 원본(좋아요 여부)과 일치하도록 합니다.
+SOURCE_ACTIVE_SQL: dict[str, str] = {
+    "post_liked": "SELECT 1 FROM post_like WHERE post_id = %(source_id)s AND user_id = %(source_user_id)s",
+    "post_like_given": "SELECT 1 FROM post_like WHERE post_id = %(source_id)s AND user_id = %(user_id)s",
+    "comment_liked": "SELECT 1 FROM comment_like WHERE comment_id = %(source_id)s AND user_id = %(source_user_id)s",
+    "comment_like_given": "SELECT 1 FROM comment_like WHERE comment_id = %(source_id)s AND user_id = %(user_id)s",
+}
+
+
+async def is_source_active_in_tx(
+    cur,
+    event_type: str,
+    user_id: int,
+    source_id: int,
+    source_user_id: int | None,
+) -> bool | None:
+    """이벤트의 원본(좋아요 등)이 지금도 유효한지 반환합니다. 확인할 수 없는 이벤트 타입이면 None."""
+    sql = SOURCE_ACTIVE_SQL.get(event_type)
+    if sql is None:
+        return None
+    await cur.execute(sql, {"user_id": user_id, "source_id": source_id, "source_user_id": source_user_id})
+    return await cur.fetchone() is not None
+
+
+async def lock_user_in_tx(cur, user_id: int) -> None:
+    """사용자 행을 잠가 같은 사용자의 평판 이벤트 처리를 직렬화합니다."""
+    await cur.execute("SELECT id FROM user WHERE id = %s FOR UPDATE", (user_id,))
+
+
+async def apply_reputation_delta_in_tx(cur, user_id: int, delta: int) -> dict | None:
+    """점수를 delta만큼 증감하고 갱신된 (reputation_score, trust_level)을 반환합니다.
+
+    delta가 0이면 UPDATE 없이 현재 값만 조회합니다. 사용자가 없으면 None.
+    """
+    if delta != 0:
+        await cur.execute(
+            "UPDATE user SET reputation_score = reputation_score + %s WHERE id = %s",
+            (delta, user_id),
+        )
+    await cur.execute(
+        "SELECT reputation_score, trust_level FROM user WHERE id = %s",
+        (user_id,),
+    )
+    return await cur.fetchone()
+
+
+async def update_user_trust_level_in_tx(cur, user_id: int, new_level: int) -> bool:
+    """호출자의 트랜잭션 안에서 신뢰 등급을 갱신합니다. 실제로 바뀐 경우 True."""
+    await cur.execute(
+        "UPDATE user SET trust_level = %s WHERE id = %s AND trust_level != %s",
+        (new_level, user_id, new_level),
+    )
+    return cur.rowcount > 0
+
+
+async def get_earned_badge_ids_in_tx(cur, user_id: int) -> set[int]:
+    """사용자가 이미 획득한 배지 ID 집합을 반환합니다."""
+    await cur.execute("SELECT badge_id FROM user_badge WHERE user_id = %s", (user_id,))
+    rows = await cur.fetchall()
+    return {row["badge_id"] for row in rows}
+
+
+async def award_badge_in_tx(cur, user_id: int, badge_id: int) -> bool:
+    """호출자의 트랜잭션 안에서 배지를 수여합니다. 이미 획득했으면 False.
+
+    INSERT IGNORE를 사용해 중복 키 예외로 트랜잭션이 중단되지 않도록 합니다.
+    """
+    await cur.execute(
+        "INSERT IGNORE INTO user_badge (user_id, badge_id) VALUES (%s, %s)",
+        (user_id, badge_id),
+    )
+    return cur.rowcount > 0
+
+
+async def bump_trigger_counter_in_tx(cur, user_id: int, trigger_type: str, delta: int) -> int:
+    """증분 카운터를 delta만큼 갱신하고 현재 값을 반환합니다.
+
+    카운터 행이 없으면 COUNTER_TRIGGER_SEED_SQL로 현재 값을 집계해 생성합니다.
+    원본 행(게시글/좋아요 등)은 호출 전에 이미 반영되어 있으므로 시드 시에는 delta를 더하지 않습니다.
+    """
+    await cur.execute(
+        "SELECT value FROM user_badge_progress WHERE user_id = %s AND trigger_type = %s",
+        (user_id, trigger_type),
+    )
+    row = await cur.fetchone()
+
+    if row is None:
+        await cur.execute(COUNTER_TRIGGER_SEED_SQL[trigger_type], {"user_id": user_id})
+        seed_row = await cur.fetchone()
+        value = int(seed_row["cnt"]) if seed_row else 0
+        # 동시 시드 경합 시 먼저 만들어진 행을 유지 (양쪽 모두 현재 상태를 집계했으므로)
+        await cur.execute(
+            "INSERT INTO user_badge_progress (user_id, trigger_type, value) VALUES (%s, %s, %s) "
+            "ON DUPLICATE KEY UPDATE value = value",
+            (user_id, trigger_type, value),
+        )
+        return value
+
+    value = max(int(row["value"]) + delta, 0)
+    if delta != 0:
+        await cur.execute(
+            "UPDATE user_badge_progress SET value = GREATEST(value + %s, 0) WHERE user_id = %s AND trigger_type = %s",
+            (delta, user_id, trigger_type),
+        )
+    return value
+
+
+async def get_trigger_value_in_tx(cur, trigger_type: str, user_id: int, source_id: int | None) -> int:
+    """카운터로 관리하지 않는 trigger_type의 현재 값을 조회합니다.
+
+    개별 게시글/댓글 트리거는 source_id 기준이며, 게시글 좋아요는 비정규화 컬럼을 사용합니다.
+    """
+    if trigger_type == "single_post_likes":
+        await cur.execute("SELECT likes_count AS value FROM post WHERE id = %s", (source_id,))
+    elif trigger_type == "single_post_views":
+        await cur.execute("SELECT views AS value FROM post WHERE id = %s", (source_id,))
+    elif trigger_type == "single_comment_likes":
+        await cur.execute("SELECT COUNT(*) AS value FROM comment_like WHERE comment_id = %s", (source_id,))
+    elif trigger_type == "reputation_score":
+        await cur.execute("SELECT reputation_score AS value FROM user WHERE id = %s", (user_id,))
+    elif trigger_type == "profile_completed":
+        # 아바타 + 배포판 모두 설정 시 1
+        await cur.execute(
+            "SELECT (profile_img IS NOT NULL AND profile_img != '' AND distro IS NOT NULL AND distro != '') AS value "
+            "FROM user WHERE id = %s",
+            (user_id,),
+        )
+    elif trigger_type == "consecutive_visit_days":
+        return await _consecutive_visit_days(cur, user_id)
+    else:
+        raise ValueError(f"Unknown trigger_type: {trigger_type}")
+
+    row = await cur.fetchone()
+    return int(row["value"] or 0) if row else 0
@@ -1,108 +1,316 @@
-"""평판 시스템 비즈니스 로직."""
+"""평판 시스템 비즈니스 로직.
+
+이벤트 1건(또는 award_many/revoke_many로 묶은 여러 건)의 작업 — 이벤트 기록, 점수 갱신,
+신뢰 등급 승급, 배지 트리거 평가와 수여 — 을 하나의 연결/트랜잭션에서 처리합니다.
+
+- 배지/신뢰 등급 정의는 정적 시드 데이터이므로 프로세스 메모리에 캐시
+- 사용자 단위 집계 트리거(post_count 등)는 user_badge_progress 증분 카운터로 유지
+- 알림은 커밋 이후 전송 (best-effort)
+"""
 
 import logging
-from collections.abc import Callable, Coroutine
+import time
+from dataclasses import dataclass
 
+from core.database.connection import transactional
 from modules.reputation import models as rep_models
 from modules.reputation.constants import EVENT_TO_BADGE_TRIGGERS
 
 logger = logging.getLogger(__name__)
 
-# trigger_type → 집계 함수 매핑 (source_id 불필요한 것들)
-_TRIGGER_COUNT_FUNCS: dict[str, Callable[..., Coroutine]] = {
-    "post_count": rep_models.count_user_posts,
-    "comment_count": rep_models.count_user_comments,
-    "like_given_count": rep_models.count_user_likes_given,
-    "bookmark_count": rep_models.count_user_bookmarks,
-    "accepted_answer_count": rep_models.count_user_accepted_answers,
-    "wiki_edit_count": rep_models.count_user_wiki_edits,
-    "package_review_count": rep_models.count_user_package_reviews,
-    "dm_sent_count": rep_models.count_user_dm_sent,
-    "follower_count": rep_models.count_user_followers,
-    "post_view_count": rep_models.count_user_post_views,
-    "badge_count": rep_models.get_user_badge_count,
-    "reputation_score": rep_models.get_user_reputation_score,
-}
+# 정의 캐시 TTL (초) — 시드 데이터 변경 시 재시작 없이도 반영되도록 주기적으로 다시 읽음
+_DEFINITION_CACHE_TTL_SEC = 300.0
 
 
-class ReputationService:
-    """평판 포인트 부여/회수, 배지 체크, 신뢰 등급 관리 서비스."""
+@dataclass(frozen=True)
+class ReputationEvent:
+    """부여할 평판 이벤트."""
 
-    @staticmethod
-    async def award_points(
-        user_id: int,
-        event_type: str,
-        points: int,
-        source_user_id: int | None = None,
-        source_type: str | None = None,
-        source_id: int | None = None,
-    ) -> None:
-        """평판 이벤트를 기록하고 점수를 갱신한 뒤 배지/신뢰 등급을 체크한다."""
-        await rep_models.insert_reputation_event(
-            user_id=user_id,
-            event_type=event_type,
-            points=points,
-            source_user_id=source_user_id,
-            source_type=source_type,
-            source_id=source_id,
-        )
+    user_id: int | None
+    event_type: str
+    points: int
+    source_user_id: int | None = None
+    source_type: str | None = None
+    source_id: int | None = None
 
-        if points != 0:
-            await rep_models.update_user_reputation(user_id, delta=points)
 
-        await ReputationService._check_trust_level(user_id)
-        await ReputationService._check_badges(user_id, event_type, source_type, source_id)
+@dataclass(frozen=True)
+class ReputationRevocation:
+    """회수할 평판 이벤트 (원본 이벤트 식별자)."""
 
-    @staticmethod
-    async def revoke_points(
+    user_id: int | None
+    event_type: str
+    source_type: str
+    source_id: int
+    # 같은 원본에 여러 사용자가 유발한 이벤트(post_liked 등)를 구분 — None이면 구분하지 않음
+    source_user_id: int | None = None
+
+
+class _DefinitionCache:
+    """badge_definition / trust_level_definition 프로세스 캐시."""
+
+    def __init__(self) -> None:
+        self._badges_by_trigger: dict[str, list[dict]] = {}
+        self._trust_levels: list[dict] = []
+        self._loaded_at: float | None = None
+
+    async def ensure_loaded(self) -> None:
+        """캐시가 비었거나 TTL이 지났으면 DB에서 다시 읽습니다."""
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < _DEFINITION_CACHE_TTL_SEC:
+            return
+        badges = await rep_models.get_all_badge_definitions()
+        levels = await rep_models.get_trust_level_definitions()
+
+        by_trigger: dict[str, list[dict]] = {}
+        for badge in badges:
+            by_trigger.setdefault(badge["trigger_type"], []).append(badge)
+        for defs in by_trigger.values():
+            defs.sort(key=lambda d: d["trigger_threshold"])
+
+        self._badges_by_trigger = by_trigger
+        self._trust_levels = sorted(levels, key=lambda d: d["level"])
+        self._loaded_at = time.monotonic()
+
+    def badges_for(self, trigger_type: str) -> list[dict]:
+        """trigger_type의 배지 정의 목록 (임계값 오름차순)."""
+        return self._badges_by_trigger.get(trigger_type, [])
+
+    def trust_level_for(self, reputation_score: int) -> int:
+        """점수에 적합한 신뢰 등급 (min_reputation 이하 중 최고 레벨)."""
+        level = 0
+        for definition in self._trust_levels:
+            if definition["min_reputation"] <= reputation_score:
+                level = definition["level"]
+        return level
+
+    def clear(self) -> None:
+        """캐시를 비웁니다 (테스트용)."""
+        self._badges_by_trigger = {}
+        self._trust_levels = []
+        self._loaded_at = None
+
+
+definition_cache = _DefinitionCache()
+
+
+class _ReputationPipeline:
+    """한 트랜잭션 커서 위에서 평판 이벤트를 처리하는 작업 단위."""
+
+    def __init__(self, cur, definitions: _DefinitionCache) -> None:
+        self.cur = cur
+        self.definitions = definitions
+        # 커밋 이후 전송할 알림 (user_id, notification_type)
+        self.notifications: list[tuple[int, str]] = []
+        self._earned: dict[int, set[int]] = {}
+
+    async def award(self, event: ReputationEvent, idempotent: bool = False) -> None:
+        """이벤트를 기록하고 점수/신뢰 등급/배지를 갱신합니다.
+
+        idempotent이면 같은 원본 키에 유효한 부여가 이미 있거나 원본이 사라진 경우 건너뜁니다 (잡 재전달/순서 보정).
+        """
+        assert event.user_id is not None
+        if (
+            idempotent
+            and event.source_type is not None
+            and event.source_id is not None
+            and not await self._should_apply(
+                event.user_id, event.event_type, event.source_type, event.source_id, event.source_user_id, award=True
+            )
+        ):
+            return
+        await rep_models.insert_reputation_event_in_tx(
+            self.cur,
+            user_id=event.user_id,
+            event_type=event.event_type,
+            points=event.points,
+            source_user_id=event.source_user_id,
+            source_type=event.source_type,
+            source_id=event.source_id,
+        )
+        await self._change_score(event.user_id, event.points)
+        await self.evaluate_badges(event.user_id, event.event_type, event.source_id, counter_delta=1)
+
+    async def revoke(self, revocation: ReputationRevocation) -> None:
+        """원본 이벤트를 찾아 음수 이벤트를 기록하고 점수/카운터를 되돌립니다 (배지는 유지).
+
+        유효한 부여가 없거나(이미 회수됨, 부여 잡이 아직 처리되지 않음) 원본이 다시 유효해졌으면 건너뜁니다.
+        """
+        assert revocation.user_id is not None
+        original = None
+        if await self._should_apply(
+            revocation.user_id,
+            revocation.event_type,
+            revocation.source_type,
+            revocation.source_id,
+            revocation.source_user_id,
+            award=False,
+        ):
+            original = await rep_models.find_original_event_in_tx(
+                self.cur,
+                revocation.user_id,
+                revocation.event_type,
+                revocation.source_type,
+                revocation.source_id,
+                revocation.source_user_id,
+            )
+        if not original:
+            # 재전달된 회수 잡이거나 부여 잡보다 먼저 처리된 경우 (원본 상태 확인으로 이후 부여도 건너뜀)
+            logger.info(
+                "회수할 유효한 원본 이벤트 없음: user_id=%s, event_type=%s, source=%s/%s",
+                revocation.user_id,
+                revocation.event_type,
+                revocation.source_type,
+                revocation.source_id,
+            )
+            return
+
+        negative_points = -original["points"]
+        await rep_models.insert_reputation_event_in_tx(
+            self.cur,
+            user_id=revocation.user_id,
+            event_type=revocation.event_type,
+            points=negative_points,
+            source_user_id=original.get("source_user_id"),
+            source_type=revocation.source_type,
+            source_id=revocation.source_id,
+        )
+        await self._change_score(revocation.user_id, negative_points)
+        await self.retract_counters(revocation.user_id, revocation.event_type)
+
+    async def _should_apply(
+        self,
         user_id: int,
         event_type: str,
         source_type: str,
         source_id: int,
+        source_user_id: int | None,
+        award: bool,
+    ) -> bool:
+        """원본 키당 유효한 부여가 최대 1건이 되도록 부여/회수 적용 여부를 판단합니다.
+
+        부여는 유효한 부여가 없을 때, 회수는 있을 때만 적용합니다. 원본 행으로 상태를 확인할 수 있는
+        이벤트(좋아요)는 원본이 부여면 존재, 회수면 부재일 때만 적용하므로 부여/회수 잡의 처리 순서가
+        뒤바뀌어도 최종 상태가 원본과 일치합니다. 사용자 행을 잠가 같은 잡의 동시 재실행을 직렬화합니다.
+        """
+        await rep_models.lock_user_in_tx(self.cur, user_id)
+        balance = await rep_models.get_event_balance_in_tx(
+            self.cur, user_id, event_type, source_type, source_id, source_user_id
+        )
+        if (balance > 0) == award:
+            return False
+        active = await rep_models.is_source_active_in_tx(self.cur, event_type, user_id, source_id, source_user_id)
+        return active is None or active == award
+
+    async def retract_counters(self, user_id: int, event_type: str) -> None:
+        """이벤트 타입에 연관된 증분 카운터를 1 줄입니다 (점수/배지는 유지)."""
+        for trigger_type in EVENT_TO_BADGE_TRIGGERS.get(event_type, []):
+            if trigger_type in rep_models.COUNTER_TRIGGER_SEED_SQL:
+                await rep_models.bump_trigger_counter_in_tx(self.cur, user_id, trigger_type, -1)
+
+    async def evaluate_badges(
+        self,
+        user_id: int,
+        event_type: str,
+        source_id: int | None,
+        counter_delta: int = 0,
     ) -> None:
-        """기존 이벤트를 찾아 포인트를 회수(음수 이벤트 삽입)한다."""
-        original = await rep_models.find_original_event(user_id, event_type, source_type, source_id)
-        if not original:
+        """이벤트에 연관된 배지 트리거를 평가하고 조건 충족 시 배지를 수여합니다.
+
+        Args:
+            user_id: 사용자 ID.
+            event_type: 이벤트 타입 (EVENT_TO_BADGE_TRIGGERS 키).
+            source_id: 개별 게시글/댓글 트리거의 대상 ID.
+            counter_delta: 증분 카운터에 반영할 값 (이벤트 부여 시 1, 재평가만 할 때 0).
+        """
+        for trigger_type in EVENT_TO_BADGE_TRIGGERS.get(event_type, []):
+            if trigger_type in rep_models.COUNTER_TRIGGER_SEED_SQL:
+                # 배지 정의가 없어도 카운터는 계속 유지
+                value = await rep_models.bump_trigger_counter_in_tx(self.cur, user_id, trigger_type, counter_delta)
+            else:
+                value = None
+
+            badge_defs = self.definitions.badges_for(trigger_type)
+            if not badge_defs:
+                continue
+
+            if value is None:
+                value = await self._trigger_value(user_id, trigger_type, source_id)
+
+            for badge_def in badge_defs:
+                if value < badge_def["trigger_threshold"]:
+                    break
+                await self._grant_badge(user_id, badge_def, trigger_type)
+
+    async def _trigger_value(self, user_id: int, trigger_type: str, source_id: int | None) -> int:
+        """카운터가 아닌 trigger_type의 현재 값을 계산합니다."""
+        if trigger_type == "badge_count":
+            return len(await self._earned_badges(user_id))
+
+        if trigger_type in ("single_post_likes", "single_post_views", "single_comment_likes") and source_id is None:
             logger.warning(
-                "회수할 원본 이벤트 없음: user_id=%s, event_type=%s, source=%s/%s",
+                "per-object trigger '%s' 호출 시 source_id 누락 (user_id=%s)",
+                trigger_type,
                 user_id,
-                event_type,
-                source_type,
-                source_id,
             )
-            return
+            return 0
 
-        negative_points = -original["points"]
+        try:
+            return await rep_models.get_trigger_value_in_tx(self.cur, trigger_type, user_id, source_id)
+        except ValueError:
+            logger.warning("알 수 없는 trigger_type: %s", trigger_type)
+            return 0
 
-        await rep_models.insert_reputation_event(
-            user_id=user_id,
-            event_type=event_type,
-            points=negative_points,
-            source_user_id=original.get("source_user_id"),
-            source_type=source_type,
-            source_id=source_id,
-        )
+    async def _earned_badges(self, user_id: int) -> set[int]:
+        """획득 배지 ID 집합 (사용자별로 트랜잭션당 한 번만 조회)."""
+        earned = self._earned.get(user_id)
+        if earned is None:
+            earned = await rep_models.get_earned_badge_ids_in_tx(self.cur, user_id)
+            self._earned[user_id] = earned
+        return earned
+
+    async def _grant_badge(self, user_id: int, badge_def: dict, trigger_type: str) -> None:
+        """배지를 수여하고 보너스 포인트, Completionist 배지, 알림을 처리합니다."""
+        earned = await self._earned_badges(user_id)
+        if badge_def["id"] in earned:
+            return
+        awarded = await rep_models.award_badge_in_tx(self.cur, user_id, badge_def["id"])
+        earned.add(badge_def["id"])
+        if not awarded:
+            return
 
-        await rep_models.update_user_reputation(user_id, delta=negative_points)
-        await ReputationService._check_trust_level(user_id)
+        logger.info("배지 수여: user_id=%s, badge='%s'", user_id, badge_def["name"])
+
+        # 배지에 추가 포인트가 있으면 점수 반영
+        if badge_def["points_awarded"] > 0:
+            await rep_models.insert_reputation_event_in_tx(
+                self.cur,
+                user_id=user_id,
+                event_type="badge_earned",
+                points=badge_def["points_awarded"],
+                source_type="badge",
+                source_id=badge_def["id"],
+            )
+            await self._change_score(user_id, badge_def["points_awarded"])
 
-    @staticmethod
-    async def record_daily_visit(user_id: int) -> None:
-        """일일 방문을 기록하고, 신규 방문인 경우 배지를 체크한다."""
-        is_new = await rep_models.record_daily_visit(user_id)
-        if is_new:
-            await ReputationService._check_badges(user_id, "daily_visit", None, None)
+        # Completionist 배지 체크 (badge_count 트리거의 재귀 방지)
+        if trigger_type != "badge_count":
+            for comp_def in self.definitions.badges_for("badge_count"):
+                if len(earned) < comp_def["trigger_threshold"]:
+                    break
+                await self._grant_badge(user_id, comp_def, "badge_count")
 
-    @staticmethod
-    async def _check_trust_level(user_id: int) -> None:
-        """현재 점수에 맞는 신뢰 등급으로 승급시키고 알림을 전송한다."""
-        score = await rep_models.get_user_reputation_score(user_id)
-        current_level = await rep_models.get_user_trust_level(user_id)
-        appropriate_level = await rep_models.get_appropriate_trust_level(score)
+        self.notifications.append((user_id, "badge_earned"))
 
-        # 승급만 허용 (강등은 하지 않음)
+    async def _change_score(self, user_id: int, delta: int) -> None:
+        """점수를 갱신하고 적합한 신뢰 등급으로 승급시킵니다 (강등은 하지 않음)."""
+        row = await rep_models.apply_reputation_delta_in_tx(self.cur, user_id, delta)
+        if not row:
+            return
+
+        current_level = row["trust_level"]
+        appropriate_level = self.definitions.trust_level_for(row["reputation_score"])
         if appropriate_level > current_level:
-            changed = await rep_models.update_user_trust_level(user_id, appropriate_level)
+            changed = await rep_models.update_user_trust_level_in_tx(self.cur, user_id, appropriate_level)
             if changed:
                 logger.info(
                     "신뢰 등급 승급: user_id=%s, %s → %s",
@@ -110,142 +318,113 @@ class ReputationService:
                     current_level,
                     appropriate_level,
                 )
-                # safe_notify에 "level_up" 타입이 아직 없으므로 try/except 처리 (Task 5에서 추가 예정)
-                try:
-                    from core.utils.exceptions import safe_notify
-
-                    await safe_notify(
-                        user_id=user_id,
-                        notification_type="level_up",  # type: ignore[arg-type]
-                        actor_id=user_id,
-                        actor_nickname="",
-                    )
-                except Exception:
-                    logger.debug("신뢰 등급 알림 전송 실패 (아직 미지원 타입)", exc_info=True)
+                self.notifications.append((user_id, "level_up"))
+
+
+async def _send_notifications(notifications: list[tuple[int, str]]) -> None:
+    """커밋 이후 배지/신뢰 등급 알림을 전송합니다 (best-effort)."""
+    if not notifications:
+        return
+    from core.utils.exceptions import safe_notify
+
+    for user_id, notification_type in notifications:
+        # safe_notify에 "badge_earned"/"level_up" 타입이 아직 없으므로 try/except 처리
+        try:
+            await safe_notify(
+                user_id=user_id,
+                notification_type=notification_type,  # type: ignore[arg-type]
+                actor_id=user_id,
+                actor_nickname="",
+            )
+        except Exception:
+            logger.debug("평판 알림 전송 실패 (아직 미지원 타입): %s", notification_type, exc_info=True)
+
+
+class ReputationService:
+    """평판 포인트 부여/회수, 배지 체크, 신뢰 등급 관리 서비스."""
 
     @staticmethod
-    async def _check_badges(
+    async def award_points(
         user_id: int,
         event_type: str,
-        source_type: str | None,
-        source_id: int | None,
+        points: int,
+        source_user_id: int | None = None,
+        source_type: str | None = None,
+        source_id: int | None = None,
     ) -> None:
-        """이벤트에 연관된 배지 트리거를 확인하고 조건 충족 시 배지를 수여한다."""
-        trigger_types = EVENT_TO_BADGE_TRIGGERS.get(event_type, [])
-        if not trigger_types:
-            return
-
-        for trigger_type in trigger_types:
-            badge_defs = await rep_models.get_badge_definitions_by_trigger(trigger_type)
-            if not badge_defs:
-                continue
+        """평판 이벤트를 기록하고 점수를 갱신한 뒤 배지/신뢰 등급을 체크한다."""
+        await ReputationService.award_many(
+            [ReputationEvent(user_id, event_type, points, source_user_id, source_type, source_id)]
+        )
 
-            current_value = await ReputationService._get_trigger_value(user_id, trigger_type, source_type, source_id)
+    @staticmethod
+    async def award_many(events: list[ReputationEvent], idempotent: bool = False) -> None:
+        """여러 평판 이벤트를 한 트랜잭션에서 부여한다 (예: 좋아요 받은 사람 + 누른 사람).
+
+        user_id가 None인 이벤트(탈퇴한 작성자 등)는 건너뛰고,
+        락 순서를 일정하게 유지하기 위해 user_id 순으로 처리한다.
+        idempotent이면 원본 키(user_id, event_type, source_type, source_id, source_user_id)에 유효한 부여가
+        이미 있는 이벤트를 건너뛴다 (원본당 한 번만 부여하는 잡 재전달용, 위키 편집처럼 반복되는 이벤트에는 쓰지 않음).
+        """
+        targets = sorted((e for e in events if e.user_id is not None), key=lambda e: e.user_id or 0)
+        if not targets:
+            return
 
-            for badge_def in badge_defs:
-                if current_value >= badge_def["trigger_threshold"]:
-                    awarded = await rep_models.award_badge(user_id, badge_def["id"])
-                    if awarded:
-                        logger.info(
-                            "배지 수여: user_id=%s, badge='%s'",
-                            user_id,
-                            badge_def["name"],
-                        )
-
-                        # 배지에 추가 포인트가 있으면 점수 반영
-                        if badge_def["points_awarded"] > 0:
-                            await rep_models.insert_reputation_event(
-                                user_id=user_id,
-                                event_type="badge_earned",
-                                points=badge_def["points_awarded"],
-                                source_type="badge",
-                                source_id=badge_def["id"],
-                            )
-                            await rep_models.update_user_reputation(user_id, delta=badge_def["points_awarded"])
-                            await ReputationService._check_trust_level(user_id)
-
-                        # Completionist 배지 체크 (badge_count 트리거의 재귀 방지)
-                        if trigger_type != "badge_count":
-                            completionist_defs = await rep_models.get_badge_definitions_by_trigger("badge_count")
-                            badge_count = await rep_models.get_user_badge_count(user_id)
-                            for comp_def in completionist_defs:
-                                if badge_count >= comp_def["trigger_threshold"]:
-                                    comp_awarded = await rep_models.award_badge(user_id, comp_def["id"])
-                                    if comp_awarded:
-                                        logger.info(
-                                            "Completionist 배지 수여: user_id=%s",
-                                            user_id,
-                                        )
-                                        if comp_def["points_awarded"] > 0:
-                                            await rep_models.insert_reputation_event(
-                                                user_id=user_id,
-                                                event_type="badge_earned",
-                                                points=comp_def["points_awarded"],
-                                                source_type="badge",
-                                                source_id=comp_def["id"],
-                                            )
-                                            await rep_models.update_user_reputation(
-                                                user_id,
-                                                delta=comp_def["points_awarded"],
-                                            )
-                                            await ReputationService._check_trust_level(user_id)
-
-                        # 배지 획득 알림 (아직 미지원 타입이므로 try/except)
-                        try:
-                            from core.utils.exceptions import safe_notify
-
-                            await safe_notify(
-                                user_id=user_id,
-                                notification_type="badge_earned",  # type: ignore[arg-type]
-                                actor_id=user_id,
-                                actor_nickname="",
-                            )
-                        except Exception:
-                            logger.debug(
-                                "배지 획득 알림 전송 실패 (아직 미지원 타입)",
-                                exc_info=True,
-                            )
+        await definition_cache.ensure_loaded()
+        async with transactional() as cur:
+            pipeline = _ReputationPipeline(cur, definition_cache)
+            for event in targets:
+                await pipeline.award(event, idempotent=idempotent)
+        await _send_notifications(pipeline.notifications)
 
     @staticmethod
-    async def _get_trigger_value(
+    async def revoke_points(
         user_id: int,
-        trigger_type: str,
-        source_type: str | None,
-        source_id: int | None,
-    ) -> int:
-        """trigger_type에 해당하는 현재 값을 조회한다."""
-        # 개별 게시글/댓글 기반 트리거 — source_id 필요
-        if trigger_type == "single_post_likes" and source_id is not None:
-            return await rep_models.count_single_post_likes(source_id)
-
-        if trigger_type == "single_post_views" and source_id is not None:
-            return await rep_models.get_post_views(source_id)
+        event_type: str,
+        source_type: str,
+        source_id: int,
+    ) -> None:
+        """기존 이벤트를 찾아 포인트를 회수(음수 이벤트 삽입)한다."""
+        await ReputationService.revoke_many([ReputationRevocation(user_id, event_type, source_type, source_id)])
 
-        if trigger_type == "single_comment_likes" and source_id is not None:
-            return await rep_models.count_single_comment_likes(source_id)
+    @staticmethod
+    async def revoke_many(revocations: list[ReputationRevocation]) -> None:
+        """여러 평판 이벤트를 한 트랜잭션에서 회수한다."""
+        targets = sorted((r for r in revocations if r.user_id is not None), key=lambda r: r.user_id or 0)
+        if not targets:
+            return
 
-        # 프로필 완성 여부 (bool → 0/1)
-        if trigger_type == "profile_completed":
-            completed = await rep_models.is_profile_completed(user_id)
-            return 1 if completed else 0
+        await definition_cache.ensure_loaded()
+        async with transactional() as cur:
+            pipeline = _ReputationPipeline(cur, definition_cache)
+            for revocation in targets:
+                await pipeline.revoke(revocation)
+        await _send_notifications(pipeline.notifications)
 
-        # 연속 방문일
-        if trigger_type == "consecutive_visit_days":
-            return await rep_models.get_consecutive_visit_days(user_id)
+    @staticmethod
+    async def retract_counters(user_id: int | None, event_type: str) -> None:
+        """콘텐츠가 삭제되면 생성 이벤트로 늘린 집계 카운터(post_count 등)를 되돌립니다.
 
-        # per-object 트리거에 source_id가 없으면 경고
-        if trigger_type in ("single_post_likes", "single_post_views", "single_comment_likes"):
-            logger.warning(
-                "per-object trigger '%s' 호출 시 source_id 누락 (user_id=%s)",
-                trigger_type,
-                user_id,
-            )
-            return 0
+        원본 행의 soft delete가 커밋된 뒤 호출해야 합니다 (카운터 행이 없으면 삭제가 반영된 집계로 시드).
+        포인트와 이미 획득한 배지는 유지합니다.
+        """
+        if user_id is None:
+            return
+        async with transactional() as cur:
+            await _ReputationPipeline(cur, definition_cache).retract_counters(user_id, event_type)
 
-        # 나머지 — user_id 기반 집계 함수
-        func = _TRIGGER_COUNT_FUNCS.get(trigger_type)
-        if func is not None:
-            return await func(user_id)
+    @staticmethod
+    async def evaluate_badges(user_id: int, event_type: str, source_id: int | None = None) -> None:
+        """카운터를 바꾸지 않고 이벤트 타입에 연관된 배지 조건만 다시 평가한다 (방문 기록/백필용)."""
+        await definition_cache.ensure_loaded()
+        async with transactional() as cur:
+            pipeline = _ReputationPipeline(cur, definition_cache)
+            await pipeline.evaluate_badges(user_id, event_type, source_id)
+        await _send_notifications(pipeline.notifications)
 
-        logger.warning("알 수 없는 trigger_type: %s", trigger_type)
-        return 0
+    @staticmethod
+    async def record_daily_visit(user_id: int) -> None:
+        """일일 방문을 기록하고, 신규 방문인 경우 배지를 체크한다."""
+        is_new = await rep_models.record_daily_visit(user_id)
+        if is_new:
+            await ReputationService.evaluate_badges(user_id, "daily_visit")
@@ -3,82 +3,155 @@
 from fastapi import Request
 
 from core.dependencies.request_context import get_request_timestamp
+from core.utils.pagination import build_pagination, decode_cursor
 from modules.user import activity_models
 from modules.user.models import User
 from schemas.common import create_response
 
 
-async def get_my_posts(current_user: User, request: Request, offset: int = 0, limit: int = 10) -> dict:
+async def get_my_posts(
+    current_user: User,
+    request: Request,
+    offset: int = 0,
+    limit: int = 10,
+    cursor: str | None = None,
+) -> dict:
     """내가 쓴 글 목록을 조회합니다."""
     timestamp = get_request_timestamp(request)
+    columns = activity_models.MY_POSTS_CURSOR_COLUMNS
+    cursor_values = decode_cursor(cursor, "my_posts", len(columns), timestamp) if cursor else None
 
-    posts, total_count = await activity_models.get_my_posts(current_user.id, offset, limit)
+    posts, total_count, last_key = await activity_models.get_my_posts(
+        current_user.id, offset, limit, cursor=cursor_values
+    )
     # soft delete된 게시글은 모델 레이어에서 자동 제외 — 활동 내역에도 삭제된 글은 노출하지 않음
-    has_more = offset + limit < total_count
+    pagination = build_pagination(
+        "my_posts",
+        total_count=total_count,
+        offset=offset,
+        limit=limit,
+        page_size=len(posts),
+        last_key=last_key,
+        cursor_mode=cursor_values is not None,
+    )
 
     return create_response(
         "MY_POSTS_LOADED",
         "내가 쓴 글 목록을 조회했습니다.",
         data={
             "posts": posts,
-            "pagination": {"total_count": total_count, "has_more": has_more},
+            "pagination": pagination,
         },
         timestamp=timestamp,
     )
 
 
-async def get_my_comments(current_user: User, request: Request, offset: int = 0, limit: int = 10) -> dict:
+async def get_my_comments(
+    current_user: User,
+    request: Request,
+    offset: int = 0,
+    limit: int = 10,
+    cursor: str | None = None,
+) -> dict:
     """내가 쓴 댓글 목록을 조회합니다."""
     timestamp = get_request_timestamp(request)
+    columns = activity_models.MY_COMMENTS_CURSOR_COLUMNS
+    cursor_values = decode_cursor(cursor, "my_comments", len(columns), timestamp) if cursor else None
 
-    comments, total_count = await activity_models.get_my_comments(current_user.id, offset, limit)
+    comments, total_count, last_key = await activity_models.get_my_comments(
+        current_user.id, offset, limit, cursor=cursor_values
+    )
     # 댓글이 달린 게시글이 삭제되어도 댓글 자체는 표시 — 모델에서 JOIN 방식으로 결정
-    has_more = offset + limit < total_count
+    pagination = build_pagination(
+        "my_comments",
+        total_count=total_count,
+        offset=offset,
+        limit=limit,
+        page_size=len(comments),
+        last_key=last_key,
+        cursor_mode=cursor_values is not None,
+    )
 
     return create_response(
         "MY_COMMENTS_LOADED",
         "내가 쓴 댓글 목록을 조회했습니다.",
         data={
             "comments": comments,
-            "pagination": {"total_count": total_count, "has_more": has_more},
+            "pagination": pagination,
         },
         timestamp=timestamp,
     )
 
 
-async def get_my_likes(current_user: User, request: Request, offset: int = 0, limit: int = 10) -> dict:
+async def get_my_likes(
+    current_user: User,
+    request: Request,
+    offset: int = 0,
+    limit: int = 10,
+    cursor: str | None = None,
+) -> dict:
     """좋아요한 글 목록을 조회합니다."""
     timestamp = get_request_timestamp(request)
+    columns = activity_models.MY_LIKES_CURSOR_COLUMNS
+    cursor_values = decode_cursor(cursor, "my_likes", len(columns), timestamp) if cursor else None
 
-    posts, total_count = await activity_models.get_my_likes(current_user.id, offset, limit)
+    posts, total_count, last_key = await activity_models.get_my_likes(
+        current_user.id, offset, limit, cursor=cursor_values
+    )
     # 좋아요한 게시글이 삭제된 경우 목록에서 자동 제외 — 모델에서 soft delete 조건 적용
-    has_more = offset + limit < total_count
+    pagination = build_pagination(
+        "my_likes",
+        total_count=total_count,
+        offset=offset,
+        limit=limit,
+        page_size=len(posts),
+        last_key=last_key,
+        cursor_mode=cursor_values is not None,
+    )
 
     return create_response(
         "MY_LIKES_LOADED",
         "좋아요한 글 목록을 조회했습니다.",
         data={
             "posts": posts,
-            "pagination": {"total_count": total_count, "has_more": has_more},
+            "pagination": pagination,
         },
         timestamp=timestamp,
     )
 
 
-async def get_my_bookmarks(current_user: User, request: Request, offset: int = 0, limit: int = 10) -> dict:
+async def get_my_bookmarks(
+    current_user: User,
+    request: Request,
+    offset: int = 0,
+    limit: int = 10,
+    cursor: str | None = None,
+) -> dict:
     """북마크한 글 목록을 조회합니다."""
     timestamp = get_request_timestamp(request)
+    columns = activity_models.MY_BOOKMARKS_CURSOR_COLUMNS
+    cursor_values = decode_cursor(cursor, "my_bookmarks", len(columns), timestamp) if cursor else None
 
-    posts, total_count = await activity_models.get_my_bookmarks(current_user.id, offset, limit)
+    posts, total_count, last_key = await activity_models.get_my_bookmarks(
+        current_user.id, offset, limit, cursor=cursor_values
+    )
     # 북마크한 게시글이 삭제된 경우 목록에서 자동 제외 — 모델에서 soft delete 조건 적용
-    has_more = offset + limit < total_count
+    pagination = build_pagination(
+        "my_bookmarks",
+        total_count=total_count,
+        offset=offset,
+        limit=limit,
+        page_size=len(posts),
+        last_key=last_key,
+        cursor_mode=cursor_values is not None,
+    )
 
     return create_response(
         "MY_BOOKMARKS_LOADED",
         "북마크한 글 목록을 조회했습니다.",
         data={
             "posts": posts,
-            "pagination": {"total_count": total_count, "has_more": has_more},
+            "pagination": pagination,
         },
         timestamp=timestamp,
     )
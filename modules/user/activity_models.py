@@ -2,11 +2,35 @@
 
 from core.database.connection import get_cursor
 from core.utils.formatters import format_datetime
+from core.utils.pagination import keyset_condition
 from schemas.common import build_author_dict
 
+# 목록별 키셋 커서 구성 컬럼 (ORDER BY와 동일 순서, 모두 DESC)
+MY_POSTS_CURSOR_COLUMNS = ("p.created_at", "p.id")
+MY_COMMENTS_CURSOR_COLUMNS = ("c.created_at", "c.id")
+MY_LIKES_CURSOR_COLUMNS = ("pl.created_at", "pl.id")
+MY_BOOKMARKS_CURSOR_COLUMNS = ("pb.created_at", "pb.id")
+
+
+def _keyset_clause(columns: tuple[str, ...], cursor: list | None) -> tuple[str, list]:
+    """cursor가 있으면 WHERE에 덧붙일 키셋 조건과 파라미터를, 없으면 빈 조건을 반환합니다."""
+    if cursor is None:
+        return "", []
+    condition, params = keyset_condition(columns, cursor)
+    return f"AND {condition}", params
+
+
+async def get_my_posts(
+    user_id: int,
+    offset: int = 0,
+    limit: int = 10,
+    cursor: list | None = None,
+) -> tuple[list[dict], int, list | None]:
+    """내가 쓴 글 목록을 반환합니다. cursor가 주어지면 offset 대신 키셋으로 이어서 조회합니다."""
+    keyset, keyset_params = _keyset_clause(MY_POSTS_CURSOR_COLUMNS, cursor)
+    if cursor is not None:
+        offset = 0
 
-async def get_my_posts(user_id: int, offset: int = 0, limit: int = 10) -> tuple[list[dict], int]:
-    """내가 쓴 글 목록을 반환합니다."""
     async with get_cursor() as cur:
         await cur.execute(
             "SELECT COUNT(*) AS cnt FROM post WHERE author_id = %s AND deleted_at IS NULL",
@@ -15,22 +39,20 @@ async def get_my_posts(user_id: int, offset: int = 0, limit: int = 10) -> tuple[
         total_count = (await cur.fetchone())["cnt"]
 
         await cur.execute(
-            """
+            f"""
                 SELECT p.id AS post_id, p.title, p.content, p.image_url,
                        p.views AS views_count,
                        p.created_at, p.updated_at,
                        u.id AS author_user_id, u.nickname AS author_nickname,
                        u.profile_img AS author_profile_img, u.distro AS author_distro,
-                       (SELECT COUNT(*) FROM post_like WHERE post_id = p.id) AS likes_count,
-                       (SELECT COUNT(*) FROM comment
-                        WHERE post_id = p.id AND deleted_at IS NULL) AS comments_count
+                       p.likes_count, p.comments_count
                 FROM post p
                 LEFT JOIN user u ON p.author_id = u.id
-                WHERE p.author_id = %s AND p.deleted_at IS NULL
-                ORDER BY p.created_at DESC
+                WHERE p.author_id = %s AND p.deleted_at IS NULL {keyset}
+                ORDER BY p.created_at DESC, p.id DESC
                 LIMIT %s OFFSET %s
                 """,
-            (user_id, limit, offset),
+            (user_id, *keyset_params, limit, offset),
         )
         rows = await cur.fetchall()
 
@@ -56,11 +78,21 @@ async def get_my_posts(user_id: int, offset: int = 0, limit: int = 10) -> tuple[
             }
         )
 
-    return posts, total_count
+    last_key = [rows[-1]["created_at"], rows[-1]["post_id"]] if rows else None
+    return posts, total_count, last_key
+
 
+async def get_my_comments(
+    user_id: int,
+    offset: int = 0,
+    limit: int = 10,
+    cursor: list | None = None,
+) -> tuple[list[dict], int, list | None]:
+    """내가 쓴 댓글 목록을 반환합니다. cursor가 주어지면 offset 대신 키셋으로 이어서 조회합니다."""
+    keyset, keyset_params = _keyset_clause(MY_COMMENTS_CURSOR_COLUMNS, cursor)
+    if cursor is not None:
+        offset = 0
 
-async def get_my_comments(user_id: int, offset: int = 0, limit: int = 10) -> tuple[list[dict], int]:
-    """내가 쓴 댓글 목록을 반환합니다."""
     async with get_cursor() as cur:
         await cur.execute(
             "SELECT COUNT(*) AS cnt FROM comment WHERE author_id = %s AND deleted_at IS NULL",
@@ -69,16 +101,16 @@ async def get_my_comments(user_id: int, offset: int = 0, limit: int = 10) -> tup
         total_count = (await cur.fetchone())["cnt"]
 
         await cur.execute(
-            """
+            f"""
                 SELECT c.id AS comment_id, c.content, c.created_at, c.post_id,
                        p.title AS post_title
                 FROM comment c
                 LEFT JOIN post p ON c.post_id = p.id AND p.deleted_at IS NULL
-                WHERE c.author_id = %s AND c.deleted_at IS NULL
-                ORDER BY c.created_at DESC
+                WHERE c.author_id = %s AND c.deleted_at IS NULL {keyset}
+                ORDER BY c.created_at DESC, c.id DESC
                 LIMIT %s OFFSET %s
                 """,
-            (user_id, limit, offset),
+            (user_id, *keyset_params, limit, offset),
         )
         rows = await cur.fetchall()
 
@@ -94,11 +126,21 @@ async def get_my_comments(user_id: int, offset: int = 0, limit: int = 10) -> tup
             }
         )
 
-    return comments, total_count
+    last_key = [rows[-1]["created_at"], rows[-1]["comment_id"]] if rows else None
+    return comments, total_count, last_key
 
 
-async def get_my_likes(user_id: int, offset: int = 0, limit: int = 10) -> tuple[list[dict], int]:
-    """좋아요한 글 목록을 반환합니다."""
+async def get_my_likes(
+    user_id: int,
+    offset: int = 0,
+    limit: int = 10,
+    cursor: list | None = None,
+) -> tuple[list[dict], int, list | None]:
+    """좋아요한 글 목록을 반환합니다. cursor가 주어지면 offset 대신 키셋으로 이어서 조회합니다."""
+    keyset, keyset_params = _keyset_clause(MY_LIKES_CURSOR_COLUMNS, cursor)
+    if cursor is not None:
+        offset = 0
+
     async with get_cursor() as cur:
         await cur.execute(
             """
@@ -111,23 +153,22 @@ async def get_my_likes(user_id: int, offset: int = 0, limit: int = 10) -> tuple[
         total_count = (await cur.fetchone())["cnt"]
 
         await cur.execute(
-            """
+            f"""
                 SELECT p.id AS post_id, p.title, p.content, p.image_url,
                        p.views AS views_count,
                        p.created_at, p.updated_at,
                        u.id AS author_user_id, u.nickname AS author_nickname,
                        u.profile_img AS author_profile_img, u.distro AS author_distro,
-                       (SELECT COUNT(*) FROM post_like WHERE post_id = p.id) AS likes_count,
-                       (SELECT COUNT(*) FROM comment
-                        WHERE post_id = p.id AND deleted_at IS NULL) AS comments_count
+                       p.likes_count, p.comments_count,
+                       pl.id AS like_id, pl.created_at AS liked_at
                 FROM post_like pl
                 JOIN post p ON pl.post_id = p.id
                 LEFT JOIN user u ON p.author_id = u.id
-                WHERE pl.user_id = %s AND p.deleted_at IS NULL
-                ORDER BY pl.created_at DESC
+                WHERE pl.user_id = %s AND p.deleted_at IS NULL {keyset}
+                ORDER BY pl.created_at DESC, pl.id DESC
                 LIMIT %s OFFSET %s
                 """,
-            (user_id, limit, offset),
+            (user_id, *keyset_params, limit, offset),
         )
         rows = await cur.fetchall()
 
@@ -153,11 +194,21 @@ async def get_my_likes(user_id: int, offset: int = 0, limit: int = 10) -> tuple[
             }
         )
 
-    return posts, total_count
+    last_key = [rows[-1]["liked_at"], rows[-1]["like_id"]] if rows else None
+    return posts, total_count, last_key
 
 
-async def get_my_bookmarks(user_id: int, offset: int = 0, limit: int = 10) -> tuple[list[dict], int]:
-    """북마크한 글 목록을 반환합니다."""
+async def get_my_bookmarks(
+    user_id: int,
+    offset: int = 0,
+    limit: int = 10,
+    cursor: list | None = None,
+) -> tuple[list[dict], int, list | None]:
+    """북마크한 글 목록을 반환합니다. cursor가 주어지면 offset 대신 키셋으로 이어서 조회합니다."""
+    keyset, keyset_params = _keyset_clause(MY_BOOKMARKS_CURSOR_COLUMNS, cursor)
+    if cursor is not None:
+        offset = 0
+
     async with get_cursor() as cur:
         await cur.execute(
             """
@@ -170,23 +221,22 @@ async def get_my_bookmarks(user_id: int, offset: int = 0, limit: int = 10) -> tu
         total_count = (await cur.fetchone())["cnt"]
 
         await cur.execute(
-            """
+            f"""
                 SELECT p.id AS post_id, p.title, p.content, p.image_url,
                        p.views AS views_count,
                        p.created_at, p.updated_at,
                        u.id AS author_user_id, u.nickname AS author_nickname,
                        u.profile_img AS author_profile_img, u.distro AS author_distro,
-                       (SELECT COUNT(*) FROM post_like WHERE post_id = p.id) AS likes_count,
-                       (SELECT COUNT(*) FROM comment
-                        WHERE post_id = p.id AND deleted_at IS NULL) AS comments_count
+                       p.likes_count, p.comments_count,
+                       pb.id AS bookmark_id, pb.created_at AS bookmarked_at
                 FROM post_bookmark pb
                 JOIN post p ON pb.post_id = p.id
                 LEFT JOIN user u ON p.author_id = u.id
-                WHERE pb.user_id = %s AND p.deleted_at IS NULL
-                ORDER BY pb.created_at DESC
+                WHERE pb.user_id = %s AND p.deleted_at IS NULL {keyset}
+                ORDER BY pb.created_at DESC, pb.id DESC
                 LIMIT %s OFFSET %s
                 """,
-            (user_id, limit, offset),
+            (user_id, *keyset_params, limit, offset),
         )
         rows = await cur.fetchall()
 
@@ -212,4 +262,5 @@ async def get_my_bookmarks(user_id: int, offset: int = 0, limit: int = 10) -> tu
             }
         )
 
-    return posts, total_count
+    last_key = [rows[-1]["bookmarked_at"], rows[-1]["bookmark_id"]] if rows else None
+    return posts, total_count, last_key
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from core.database.connection import get_cursor, transactional
+from core.utils.block_cache import get_cached_blocked_ids, invalidate_blocked_ids
+from core.utils.response_cache import invalidate, viewer_namespace
 
 
 @dataclass
@@ -40,7 +42,9 @@ async def add_block(blocker_id: int, blocked_id: int) -> Block:
                 f"차단 삽입 직후 조회 실패: block_id={block_id}, blocker_id={blocker_id}, blocked_id={blocked_id}"
             )
 
-        return Block(**row)
+    await invalidate_blocked_ids(blocker_id)
+    await invalidate(viewer_namespace(blocker_id))
+    return Block(**row)
 
 
 async def remove_block(blocker_id: int, blocked_id: int) -> bool:
@@ -50,11 +54,16 @@ async def remove_block(blocker_id: int, blocked_id: int) -> bool:
             "DELETE FROM user_block WHERE blocker_id = %s AND blocked_id = %s",
             (blocker_id, blocked_id),
         )
-        return cur.rowcount > 0
+        removed = cur.rowcount > 0
+
+    if removed:
+        await invalidate_blocked_ids(blocker_id)
+        await invalidate(viewer_namespace(blocker_id))
+    return removed
 
 
 async def get_blocked_user_ids(blocker_id: int) -> set[int]:
-    """차단한 사용자 ID 집합을 반환합니다."""
+    """차단한 사용자 ID 집합을 DB에서 직접 조회합니다 (쪽지 발송처럼 차단 관계를 강제하는 경로용)."""
     async with get_cursor() as cur:
         await cur.execute(
             "SELECT blocked_id FROM user_block WHERE blocker_id = %s",
@@ -64,6 +73,11 @@ async def get_blocked_user_ids(blocker_id: int) -> set[int]:
         return {row["blocked_id"] for row in rows}
 
 
+async def get_cached_blocked_user_ids(blocker_id: int) -> frozenset[int]:
+    """차단한 사용자 ID 집합을 캐시(core/utils/block_cache.py)를 거쳐 반환합니다 (목록/상세 필터용)."""
+    return await get_cached_blocked_ids(blocker_id, get_blocked_user_ids)
+
+
 async def get_my_blocks(blocker_id: int, offset: int = 0, limit: int = 10) -> tuple[list[dict], int]:
     """차단 목록을 페이지네이션하여 반환합니다."""
     async with get_cursor() as cur:
@@ -3,6 +3,8 @@
 from fastapi import Request
 
 from core.dependencies.request_context import get_request_timestamp
+from core.utils.pagination import decode_cursor
+from modules.user.follow_models import FOLLOW_CURSOR_COLUMNS
 from modules.user.follow_service import FollowService
 from modules.user.models import User
 from schemas.common import create_response
@@ -66,15 +68,18 @@ async def get_user_following(
     request: Request,
     offset: int = 0,
     limit: int = 10,
+    cursor: str | None = None,
 ) -> dict:
     """특정 사용자의 팔로잉 목록을 조회합니다."""
     timestamp = get_request_timestamp(request)
+    cursor_values = decode_cursor(cursor, "following", len(FOLLOW_CURSOR_COLUMNS), timestamp) if cursor else None
 
     # 타인의 팔로잉 목록도 공개 — 프로필 페이지에서 소셜 그래프 탐색 지원
     data = await FollowService.get_following(
         user_id=user_id,
         offset=offset,
         limit=limit,
+        cursor=cursor_values,
     )
 
     return create_response(
@@ -90,15 +95,18 @@ async def get_user_followers(
     request: Request,
     offset: int = 0,
     limit: int = 10,
+    cursor: str | None = None,
 ) -> dict:
     """특정 사용자의 팔로워 목록을 조회합니다."""
     timestamp = get_request_timestamp(request)
+    cursor_values = decode_cursor(cursor, "followers", len(FOLLOW_CURSOR_COLUMNS), timestamp) if cursor else None
 
     # 타인의 팔로워 목록도 공개 — 팔로우 관계는 소셜 기능의 핵심 정보
     data = await FollowService.get_followers(
         user_id=user_id,
         offset=offset,
         limit=limit,
+        cursor=cursor_values,
     )
 
     return create_response(
@@ -114,15 +122,18 @@ async def get_my_following(
     request: Request,
     offset: int = 0,
     limit: int = 10,
+    cursor: str | None = None,
 ) -> dict:
     """팔로잉 목록을 조회합니다."""
     timestamp = get_request_timestamp(request)
+    cursor_values = decode_cursor(cursor, "following", len(FOLLOW_CURSOR_COLUMNS), timestamp) if cursor else None
 
     # get_user_following과 동일 서비스 메서드 재사용 — current_user.id를 명시적으로 전달
     data = await FollowService.get_following(
         user_id=current_user.id,
         offset=offset,
         limit=limit,
+        cursor=cursor_values,
     )
 
     return create_response(
@@ -138,15 +149,18 @@ async def get_my_followers(
     request: Request,
     offset: int = 0,
     limit: int = 10,
+    cursor: str | None = None,
 ) -> dict:
     """팔로워 목록을 조회합니다."""
     timestamp = get_request_timestamp(request)
+    cursor_values = decode_cursor(cursor, "followers", len(FOLLOW_CURSOR_COLUMNS), timestamp) if cursor else None
 
     # 나를 팔로우한 사람 목록 — 알림 후 확인 흐름에서 주로 사용
     data = await FollowService.get_followers(
         user_id=current_user.id,
         offset=offset,
         limit=limit,
+        cursor=cursor_values,
     )
 
     return create_response(
@@ -4,6 +4,10 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from core.database.connection import get_cursor, transactional
+from core.utils.pagination import keyset_condition
+
+# 팔로잉/팔로워 목록 키셋 커서 구성 컬럼 (ORDER BY와 동일 순서, 모두 DESC)
+FOLLOW_CURSOR_COLUMNS = ("uf.created_at", "uf.id")
 
 
 @dataclass
@@ -104,8 +108,20 @@ async def get_follow_counts(user_id: int) -> dict:
     return {"followers_count": followers, "following_count": following}
 
 
-async def get_my_following(user_id: int, offset: int = 0, limit: int = 10) -> tuple[list[dict], int]:
-    """팔로잉 목록을 조회합니다."""
+async def get_my_following(
+    user_id: int,
+    offset: int = 0,
+    limit: int = 10,
+    cursor: list | None = None,
+) -> tuple[list[dict], int, list | None]:
+    """팔로잉 목록을 조회합니다 cursor가 주어지면 offset 대신 키셋으로 이어서 조회합니다."""
+    keyset = ""
+    keyset_params: list = []
+    if cursor is not None:
+        condition, keyset_params = keyset_condition(FOLLOW_CURSOR_COLUMNS, cursor)
+        keyset = f"AND {condition}"
+        offset = 0
+
     async with get_cursor() as cur:
         await cur.execute(
             "SELECT COUNT(*) AS cnt FROM user_follow WHERE follower_id = %s",
@@ -114,24 +130,37 @@ async def get_my_following(user_id: int, offset: int = 0, limit: int = 10) -> tu
         total_count = (await cur.fetchone())["cnt"]
 
         await cur.execute(
-            """
+            f"""
                 SELECT uf.id AS follow_id, uf.following_id AS user_id,
                        u.nickname, u.profile_img, uf.created_at
                 FROM user_follow uf
                 JOIN user u ON uf.following_id = u.id
-                WHERE uf.follower_id = %s AND u.deleted_at IS NULL
-                ORDER BY uf.created_at DESC
+                WHERE uf.follower_id = %s AND u.deleted_at IS NULL {keyset}
+                ORDER BY uf.created_at DESC, uf.id DESC
                 LIMIT %s OFFSET %s
                 """,
-            (user_id, limit, offset),
+            (user_id, *keyset_params, limit, offset),
         )
         rows = await cur.fetchall()
 
-    return [dict(r) for r in rows], total_count
+    last_key = [rows[-1]["created_at"], rows[-1]["follow_id"]] if rows else None
+    return [dict(r) for r in rows], total_count, last_key
+
 
+async def get_my_followers(
+    user_id: int,
+    offset: int = 0,
+    limit: int = 10,
+    cursor: list | None = None,
+) -> tuple[list[dict], int, list | None]:
+    """팔로워 목록을 조회합니다 cursor가 주어지면 offset 대신 키셋으로 이어서 조회합니다."""
+    keyset = ""
+    keyset_params: list = []
+    if cursor is not None:
+        condition, keyset_params = keyset_condition(FOLLOW_CURSOR_COLUMNS, cursor)
+        keyset = f"AND {condition}"
+        offset = 0
 
-async def get_my_followers(user_id: int, offset: int = 0, limit: int = 10) -> tuple[list[dict], int]:
-    """팔로워 목록을 조회합니다."""
     async with get_cursor() as cur:
         await cur.execute(
             "SELECT COUNT(*) AS cnt FROM user_follow WHERE following_id = %s",
@@ -140,17 +169,18 @@ async def get_my_followers(user_id: int, offset: int = 0, limit: int = 10) -> tu
         total_count = (await cur.fetchone())["cnt"]
 
         await cur.execute(
-            """
+            f"""
                 SELECT uf.id AS follow_id, uf.follower_id AS user_id,
                        u.nickname, u.profile_img, uf.created_at
                 FROM user_follow uf
                 JOIN user u ON uf.follower_id = u.id
-                WHERE uf.following_id = %s AND u.deleted_at IS NULL
-                ORDER BY uf.created_at DESC
+                WHERE uf.following_id = %s AND u.deleted_at IS NULL {keyset}
+                ORDER BY uf.created_at DESC, uf.id DESC
                 LIMIT %s OFFSET %s
                 """,
-            (user_id, limit, offset),
+            (user_id, *keyset_params, limit, offset),
         )
         rows = await cur.fetchall()
 
-    return [dict(r) for r in rows], total_count
+    last_key = [rows[-1]["created_at"], rows[-1]["follow_id"]] if rows else None
+    return [dict(r) for r in rows], total_count, last_key
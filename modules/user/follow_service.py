@@ -10,6 +10,8 @@ from core.utils.exceptions import (
     safe_notify,
 )
 from core.utils.formatters import format_datetime
+from core.utils.pagination import build_pagination
+from core.utils.response_cache import invalidate, user_namespace, viewer_namespace
 from modules.user import follow_models
 from modules.user.models import get_user_by_id
 
@@ -51,6 +53,13 @@ class FollowService:
             await follow_models.add_follow(user_id, target_id)
         except IntegrityError:
             raise conflict_error(ErrorCode.ALREADY_FOLLOWING, timestamp, "이미 팔로우한 사용자입니다.") from None
+        # 두 사용자의 팔로우 수, 팔로우 피드/팔로우 여부 응답의 조건부 GET 버전
+        await invalidate(user_namespace(user_id), user_namespace(target_id), viewer_namespace(user_id))
+
+        # 추천 피드 작성자 친화도 갱신
+        from modules.post.jobs import enqueue_affinity_event
+
+        await enqueue_affinity_event(user_id, "follow", author_id=target_id)
 
         # 팔로우 알림 (자기 자신 제외는 정의상 보장됨)
         await safe_notify(
@@ -79,12 +88,18 @@ class FollowService:
         removed = await follow_models.remove_follow(user_id, target_id)
         if not removed:
             raise not_found_error("follow", timestamp)
+        await invalidate(user_namespace(user_id), user_namespace(target_id), viewer_namespace(user_id))
+
+        from modules.post.jobs import enqueue_affinity_event
+
+        await enqueue_affinity_event(user_id, "unfollow", author_id=target_id)
 
     @staticmethod
     async def get_following(
         user_id: int,
         offset: int = 0,
         limit: int = 10,
+        cursor: list | None = None,
     ) -> dict:
         """팔로잉 목록을 조회합니다.
 
@@ -92,19 +107,28 @@ class FollowService:
             user_id: 조회할 사용자 ID.
             offset: 페이지네이션 오프셋.
             limit: 페이지네이션 제한.
+            cursor: 디코딩된 키셋 커서 값. 지정하면 offset은 무시.
 
         Returns:
             팔로잉 목록과 페이지네이션 정보.
         """
-        following, total_count = await follow_models.get_my_following(user_id, offset, limit)
-        has_more = offset + limit < total_count
+        following, total_count, last_key = await follow_models.get_my_following(user_id, offset, limit, cursor=cursor)
+        pagination = build_pagination(
+            "following",
+            total_count=total_count,
+            offset=offset,
+            limit=limit,
+            page_size=len(following),
+            last_key=last_key,
+            cursor_mode=cursor is not None,
+        )
 
         for item in following:
             item["created_at"] = format_datetime(item["created_at"])
 
         return {
             "following": following,
-            "pagination": {"total_count": total_count, "has_more": has_more},
+            "pagination": pagination,
         }
 
     @staticmethod
@@ -112,6 +136,7 @@ class FollowService:
         user_id: int,
         offset: int = 0,
         limit: int = 10,
+        cursor: list | None = None,
     ) -> dict:
         """팔로워 목록을 조회합니다.
 
@@ -119,17 +144,26 @@ class FollowService:
             user_id: 조회할 사용자 ID.
             offset: 페이지네이션 오프셋.
             limit: 페이지네이션 제한.
+            cursor: 디코딩된 키셋 커서 값. 지정하면 offset은 무시.
 
         Returns:
             팔로워 목록과 페이지네이션 정보.
         """
-        followers, total_count = await follow_models.get_my_followers(user_id, offset, limit)
-        has_more = offset + limit < total_count
+        followers, total_count, last_key = await follow_models.get_my_followers(user_id, offset, limit, cursor=cursor)
+        pagination = build_pagination(
+            "followers",
+            total_count=total_count,
+            offset=offset,
+            limit=limit,
+            page_size=len(followers),
+            last_key=last_key,
+            cursor_mode=cursor is not None,
+        )
 
         for item in followers:
             item["created_at"] = format_datetime(item["created_at"])
 
         return {
             "followers": followers,
-            "pagination": {"total_count": total_count, "has_more": has_more},
+            "pagination": pagination,
         }
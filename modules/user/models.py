@@ -10,6 +10,7 @@ from datetime import UTC, datetime
 
 from core.database.connection import get_cursor, transactional
 from core.utils.pagination import escape_like
+from core.utils.principal_cache import invalidate_user
 
 
 def generate_temp_nickname() -> str:
@@ -154,29 +155,28 @@ async def get_users_by_nicknames(nicknames: list[str]) -> dict[str, "User"]:
     return {row["nickname"]: _row_to_user(row) for row in rows}
 
 
-async def search_users_by_nickname(query: str, exclude_user_ids: set[int], limit: int = 10) -> list[dict]:
-    """닉네임 접두어로 사용자 검색. 제외 ID set으로 자기 자신/차단 사용자 필터링."""
+async def search_users_by_nickname(
+    query: str,
+    exclude_user_id: int,
+    limit: int = 10,
+    blocked_by: int | None = None,
+) -> list[dict]:
+    """닉네임 접두어로 사용자 검색. 자기 자신(exclude_user_id)과 blocked_by가 차단한 사용자는 제외.
+
+    차단 목록은 NOT IN 파라미터로 펼치지 않고 user_block 유니크 인덱스를 타는 서브쿼리로 거릅니다.
+    """
     if not query or not query.strip():
         return []
 
     query = query.strip()
     async with get_cursor() as cur:
-        if exclude_user_ids:
-            placeholders = ",".join(["%s"] * len(exclude_user_ids))
-            sql = (
-                f"SELECT id, nickname, profile_img FROM user "
-                f"WHERE nickname LIKE %s AND deleted_at IS NULL "
-                f"AND id NOT IN ({placeholders}) "
-                f"ORDER BY nickname LIMIT %s"
-            )
-            params = [f"{escape_like(query)}%", *exclude_user_ids, limit]
-        else:
-            sql = (
-                "SELECT id, nickname, profile_img FROM user "
-                "WHERE nickname LIKE %s AND deleted_at IS NULL "
-                "ORDER BY nickname LIMIT %s"
-            )
-            params = [f"{escape_like(query)}%", limit]
+        sql = "SELECT id, nickname, profile_img FROM user WHERE nickname LIKE %s AND deleted_at IS NULL AND id != %s "
+        params: list = [f"{escape_like(query)}%", exclude_user_id]
+        if blocked_by is not None:
+            sql += "AND NOT EXISTS (SELECT 1 FROM user_block ub WHERE ub.blocker_id = %s AND ub.blocked_id = user.id) "
+            params.append(blocked_by)
+        sql += "ORDER BY nickname LIMIT %s"
+        params.append(limit)
 
         await cur.execute(sql, params)
         rows = await cur.fetchall()
@@ -201,10 +201,9 @@ async def get_user_stats(user_id: int) -> dict:
             SELECT
                 (SELECT COUNT(*) FROM post WHERE author_id = %s AND deleted_at IS NULL) AS posts_count,
                 (SELECT COUNT(*) FROM comment WHERE author_id = %s AND deleted_at IS NULL) AS comments_count,
-                (SELECT COUNT(*)
-                 FROM post_like pl
-                 JOIN post p ON pl.post_id = p.id
-                 WHERE p.author_id = %s AND p.deleted_at IS NULL) AS likes_received_count
+                (SELECT CAST(COALESCE(SUM(likes_count), 0) AS UNSIGNED)
+                 FROM post
+                 WHERE author_id = %s AND deleted_at IS NULL) AS likes_received_count
             """,
             (user_id, user_id, user_id),
         )
@@ -307,7 +306,9 @@ async def update_user(
             (user_id,),
         )
         row = await cur.fetchone()
-        return _row_to_user(row) if row else None
+
+    await invalidate_user(user_id)
+    return _row_to_user(row) if row else None
 
 
 async def update_password(user_id: int, new_password: str) -> User | None:
@@ -326,7 +327,9 @@ async def update_password(user_id: int, new_password: str) -> User | None:
             (user_id,),
         )
         row = await cur.fetchone()
-        return _row_to_user(row) if row else None
+
+    await invalidate_user(user_id)
+    return _row_to_user(row) if row else None
 
 
 def _generate_anonymized_user_data() -> tuple[str, str]:
@@ -372,13 +375,17 @@ async def _disconnect_and_anonymize_user(cur, user_id: int, *, set_deleted_at: b
 async def withdraw_user(user_id: int) -> User | None:
     """회원 탈퇴를 처리합니다. 소프트 삭제를 수행하며, 재가입을 위해 이메일과 닉네임을 익명화합니다."""
     async with transactional() as cur:
-        return await _disconnect_and_anonymize_user(cur, user_id, set_deleted_at=True)
+        user = await _disconnect_and_anonymize_user(cur, user_id, set_deleted_at=True)
+    await invalidate_user(user_id)
+    return user
 
 
 async def cleanup_deleted_user(user_id: int) -> User | None:
     """이미 탈퇴 처리되었으나 정보가 남아있는 사용자(Zombie)를 완전 익명화합니다."""
     async with transactional() as cur:
-        return await _disconnect_and_anonymize_user(cur, user_id, set_deleted_at=False)
+        user = await _disconnect_and_anonymize_user(cur, user_id, set_deleted_at=False)
+    await invalidate_user(user_id)
+    return user
 
 
 async def update_nickname_set(user_id: int, nickname: str) -> User | None:
@@ -392,7 +399,9 @@ async def update_nickname_set(user_id: int, nickname: str) -> User | None:
             return None
         await cur.execute(f"SELECT {USER_SELECT_FIELDS} FROM user WHERE id = %s", (user_id,))
         row = await cur.fetchone()
-        return _row_to_user(row) if row else None
+
+    await invalidate_user(user_id)
+    return _row_to_user(row) if row else None
 
 
 async def add_social_user(
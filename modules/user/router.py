@@ -11,6 +11,7 @@ from fastapi import (
     HTTPException,
     Query,
     Request,
+    Response,
     UploadFile,
     status,
 )
@@ -122,6 +123,7 @@ async def get_my_posts(
     request: Request,
     offset: int = Query(0, ge=0, description="시작 위치"),
     limit: int = Query(10, ge=1, le=100, description="조회 수"),
+    cursor: str | None = Query(None, max_length=512, description="이전 응답의 next_cursor"),
     current_user: User = Depends(get_current_user),
 ) -> dict:
     """내가 쓴 글 목록을 조회합니다.
@@ -130,12 +132,13 @@ async def get_my_posts(
         request: FastAPI Request 객체.
         offset: 시작 위치 (0부터 시작).
         limit: 조회할 게시글 수.
+        cursor: 이전 응답의 next_cursor. 지정하면 offset 대신 키셋으로 이어서 조회.
         current_user: 현재 인증된 사용자.
 
     Returns:
         내가 쓴 글 목록과 페이지네이션 정보가 포함된 응답.
     """
-    return await activity_controller.get_my_posts(current_user, request, offset, limit)
+    return await activity_controller.get_my_posts(current_user, request, offset, limit, cursor)
 
 
 @user_router.get("/me/comments", status_code=status.HTTP_200_OK)
@@ -143,6 +146,7 @@ async def get_my_comments(
     request: Request,
     offset: int = Query(0, ge=0, description="시작 위치"),
     limit: int = Query(10, ge=1, le=100, description="조회 수"),
+    cursor: str | None = Query(None, max_length=512, description="이전 응답의 next_cursor"),
     current_user: User = Depends(get_current_user),
 ) -> dict:
     """내가 쓴 댓글 목록을 조회합니다.
@@ -151,12 +155,13 @@ async def get_my_comments(
         request: FastAPI Request 객체.
         offset: 시작 위치 (0부터 시작).
         limit: 조회할 댓글 수.
+        cursor: 이전 응답의 next_cursor. 지정하면 offset 대신 키셋으로 이어서 조회.
         current_user: 현재 인증된 사용자.
 
     Returns:
         내가 쓴 댓글 목록과 페이지네이션 정보가 포함된 응답.
     """
-    return await activity_controller.get_my_comments(current_user, request, offset, limit)
+    return await activity_controller.get_my_comments(current_user, request, offset, limit, cursor)
 
 
 @user_router.get("/me/likes", status_code=status.HTTP_200_OK)
@@ -164,6 +169,7 @@ async def get_my_likes(
     request: Request,
     offset: int = Query(0, ge=0, description="시작 위치"),
     limit: int = Query(10, ge=1, le=100, description="조회 수"),
+    cursor: str | None = Query(None, max_length=512, description="이전 응답의 next_cursor"),
     current_user: User = Depends(get_current_user),
 ) -> dict:
     """좋아요한 글 목록을 조회합니다.
@@ -172,12 +178,13 @@ async def get_my_likes(
         request: FastAPI Request 객체.
         offset: 시작 위치 (0부터 시작).
         limit: 조회할 게시글 수.
+        cursor: 이전 응답의 next_cursor. 지정하면 offset 대신 키셋으로 이어서 조회.
         current_user: 현재 인증된 사용자.
 
     Returns:
         좋아요한 글 목록과 페이지네이션 정보가 포함된 응답.
     """
-    return await activity_controller.get_my_likes(current_user, request, offset, limit)
+    return await activity_controller.get_my_likes(current_user, request, offset, limit, cursor)
 
 
 @user_router.get("/me/bookmarks", status_code=status.HTTP_200_OK)
@@ -185,10 +192,11 @@ async def get_my_bookmarks(
     request: Request,
     offset: int = Query(0, ge=0, description="시작 위치"),
     limit: int = Query(10, ge=1, le=100, description="조회 수"),
+    cursor: str | None = Query(None, max_length=512, description="이전 응답의 next_cursor"),
     current_user: User = Depends(get_current_user),
 ) -> dict:
     """북마크한 글 목록을 조회합니다."""
-    return await activity_controller.get_my_bookmarks(current_user, request, offset, limit)
+    return await activity_controller.get_my_bookmarks(current_user, request, offset, limit, cursor)
 
 
 @user_router.get("/me/blocks", status_code=status.HTTP_200_OK)
@@ -207,10 +215,11 @@ async def get_my_following(
     request: Request,
     offset: int = Query(0, ge=0, description="시작 위치"),
     limit: int = Query(10, ge=1, le=100, description="조회 수"),
+    cursor: str | None = Query(None, max_length=512, description="이전 응답의 next_cursor"),
     current_user: User = Depends(get_current_user),
 ) -> dict:
     """팔로잉 목록을 조회합니다."""
-    return await follow_controller.get_my_following(current_user, request, offset, limit)
+    return await follow_controller.get_my_following(current_user, request, offset, limit, cursor)
 
 
 @user_router.get("/me/followers", status_code=status.HTTP_200_OK)
@@ -218,10 +227,11 @@ async def get_my_followers(
     request: Request,
     offset: int = Query(0, ge=0, description="시작 위치"),
     limit: int = Query(10, ge=1, le=100, description="조회 수"),
+    cursor: str | None = Query(None, max_length=512, description="이전 응답의 next_cursor"),
     current_user: User = Depends(get_current_user),
 ) -> dict:
     """팔로워 목록을 조회합니다."""
-    return await follow_controller.get_my_followers(current_user, request, offset, limit)
+    return await follow_controller.get_my_followers(current_user, request, offset, limit, cursor)
 
 
 @user_router.get("/search", status_code=status.HTTP_200_OK)
@@ -235,12 +245,12 @@ async def search_users(
     return await user_controller.search_users(q=q, limit=limit, current_user=current_user, request=request)
 
 
-@user_router.get("/{user_id}", status_code=status.HTTP_200_OK)
+@user_router.get("/{user_id}", status_code=status.HTTP_200_OK, response_model=None)
 async def get_user(
     user_id: int,
     request: Request,
     current_user: User | None = Depends(get_optional_user),
-) -> dict:
+) -> dict | Response:
     """특정 사용자의 정보를 조회합니다.
 
     인증 상태에 따라 다른 수준의 정보를 반환합니다.
@@ -371,9 +381,10 @@ async def get_user_following(
     request: Request,
     offset: int = 0,
     limit: int = 10,
+    cursor: str | None = None,
 ) -> dict:
     """특정 사용자의 팔로잉 목록을 조회합니다."""
-    return await follow_controller.get_user_following(user_id, request, offset, limit)
+    return await follow_controller.get_user_following(user_id, request, offset, limit, cursor)
 
 
 @user_router.get("/{user_id}/followers", status_code=status.HTTP_200_OK)
@@ -382,9 +393,10 @@ async def get_user_followers(
     request: Request,
     offset: int = 0,
     limit: int = 10,
+    cursor: str | None = None,
 ) -> dict:
     """특정 사용자의 팔로워 목록을 조회합니다."""
-    return await follow_controller.get_user_followers(user_id, request, offset, limit)
+    return await follow_controller.get_user_followers(user_id, request, offset, limit, cursor)
 
 
 @user_router.post("/{user_id}/follow", status_code=status.HTTP_201_CREATED)
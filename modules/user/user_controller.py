@@ -5,9 +5,12 @@
 
 import logging
 
-from fastapi import HTTPException, Request, UploadFile, status
+from fastapi import HTTPException, Request, Response, UploadFile, status
+from fastapi.responses import JSONResponse
 
 from core.dependencies.request_context import get_request_timestamp
+from core.utils.conditional_get import compute_etag, is_not_modified, not_modified_response, with_etag
+from core.utils.response_cache import user_namespace, viewer_namespace
 from core.utils.upload import save_file
 from modules.user import block_models, follow_models
 from modules.user import models as user_models
@@ -44,20 +47,26 @@ async def search_users(q: str, limit: int, current_user, request) -> dict:
     # 클라이언트가 비정상적인 limit을 보내도 1~20 범위로 강제 — DM 수신자 선택 등 소규모 UI에 적합
     limit = min(max(limit, 1), 20)
 
-    blocked_ids = await block_models.get_blocked_user_ids(current_user.id)
     # 차단한 사용자와 자기 자신은 검색 결과에서 제외 — 차단 관계가 검색에도 반영되어야 함
-    exclude_ids = blocked_ids | {current_user.id}
-
-    results = await user_models.search_users_by_nickname(query=q.strip(), exclude_user_ids=exclude_ids, limit=limit)
+    # 차단 목록은 캐시에서 읽고, 차단한 사용자가 있을 때만 SQL 서브쿼리로 제외
+    blocked_ids = await block_models.get_cached_blocked_user_ids(current_user.id)
+
+    results = await user_models.search_users_by_nickname(
+        query=q.strip(),
+        exclude_user_id=current_user.id,
+        limit=limit,
+        blocked_by=current_user.id if blocked_ids else None,
+    )
 
     return {"data": results, "request_timestamp": get_request_timestamp(request)}
 
 
-async def get_user(user_id: int, request: Request) -> dict:
+async def get_user(user_id: int, request: Request) -> dict | JSONResponse | Response:
     """사용자 ID를 사용하여 사용자를 조회합니다.
 
     참고: get_user는 인증 없이 접근 가능한 공개 프로필 조회(혹은 존재 확인) 용도로 추정되나,
     실제 요구사항에 따라 UserService를 통해 조회합니다.
+    If-None-Match가 사용자 버전(프로필 수정/팔로우/탈퇴 시 증가)으로 만든 ETag와 같으면 조회 없이 304를 반환합니다.
     """
     timestamp = get_request_timestamp(request)
 
@@ -72,6 +81,10 @@ async def get_user(user_id: int, request: Request) -> dict:
             },
         )
 
+    etag = await compute_etag((user_namespace(user_id),))
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified_response(etag)
+
     # Service Layer 호출
     # Service는 실패 시 예외를 발생시킴
     user = await UserService.get_user_by_id(user_id, timestamp)
@@ -87,12 +100,13 @@ async def get_user(user_id: int, request: Request) -> dict:
     follow_counts = await follow_models.get_follow_counts(user_id)
     profile.update(follow_counts)
 
-    return create_response(
+    body = create_response(
         "QUERY_SUCCESS",
         "유저 조회에 성공했습니다.",
         data={"user": profile},
         timestamp=timestamp,
     )
+    return with_etag(body, etag)
 
 
 async def create_user(user_data: CreateUserRequest, profile_image: UploadFile | None, request: Request) -> dict:
@@ -144,10 +158,17 @@ async def get_my_info(current_user: User, request: Request) -> dict:
     )
 
 
-async def get_user_info(user_id: int, current_user: User, request: Request) -> dict:
-    """사용자 ID를 사용하여 다른 사용자 정보를 조회합니다."""
+async def get_user_info(user_id: int, current_user: User, request: Request) -> dict | JSONResponse | Response:
+    """사용자 ID를 사용하여 다른 사용자 정보를 조회합니다.
+
+    팔로우 여부가 로그인 사용자별로 다르므로 ETag는 로그인 사용자 네임스페이스 버전까지 포함합니다.
+    """
     timestamp = get_request_timestamp(request)
 
+    etag = await compute_etag((user_namespace(user_id), viewer_namespace(current_user.id)), str(current_user.id))
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified_response(etag, private=True)
+
     # Service Layer 호출
     user = await UserService.get_user_by_id(user_id, timestamp)
 
@@ -159,12 +180,13 @@ async def get_user_info(user_id: int, current_user: User, request: Request) -> d
     # 로그인한 사용자 기준의 팔로우 여부를 포함 — 공개 조회(get_user)와의 차이점
     profile["is_following"] = await follow_models.is_following(current_user.id, user_id)
 
-    return create_response(
+    body = create_response(
         "QUERY_SUCCESS",
         "유저 조회에 성공했습니다.",
         data={"user": profile},
         timestamp=timestamp,
     )
+    return with_etag(body, etag, private=True)
 
 
 async def update_user(update_data: UpdateUserRequest, current_user: User, request: Request) -> dict:
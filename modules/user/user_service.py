@@ -12,6 +12,7 @@ from core.utils.exceptions import (
     not_found_error,
 )
 from core.utils.password import hash_password, verify_password
+from core.utils.response_cache import invalidate, user_namespace
 from core.utils.temp_password import generate_temp_password
 from modules.auth import verification_models
 from modules.user import models as user_models
@@ -124,6 +125,9 @@ class UserService:
         if not updated_user:
             return await UserService.get_user_by_id(user_id, timestamp)
 
+        # 프로필 조회 ETag 무효화
+        await invalidate(user_namespace(user_id))
+
         # 평판 이벤트 기록 — 배지 트리거 전용, 포인트 0 (best-effort)
         try:
             from modules.reputation.service import ReputationService
@@ -187,6 +191,7 @@ class UserService:
         # 3. 탈퇴 처리 (익명화 등은 모델의 withdraw_user 위임)
         # models.withdraw_user는 트랜잭션 내에서 연결 끊기, 리프레시 토큰 삭제, 익명화를 수행함
         await user_models.withdraw_user(user_id)
+        await invalidate(user_namespace(user_id))
 
     @staticmethod
     def _mask_email(email: str) -> str:
@@ -1,10 +1,14 @@
 """wiki_controller: 위키 페이지 관련 컨트롤러."""
 
-from fastapi import HTTPException, Request, status
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
 
 from core.database.connection import transactional
 from core.dependencies.request_context import get_request_timestamp
+from core.search import queue_reindex
+from core.utils.conditional_get import compute_etag, is_not_modified, not_modified_response, with_etag
 from core.utils.pagination import validate_pagination
+from core.utils.response_cache import invalidate, wiki_namespace
 from modules.user.models import User
 from modules.wiki.diff_engine import compute_diff
 from modules.wiki.models import (
@@ -79,19 +83,28 @@ async def get_wiki_popular_tags(request: Request, limit: int = 10) -> dict:
 async def get_wiki_page(
     slug: str,
     request: Request,
-) -> dict:
-    """위키 페이지 상세 정보를 조회합니다."""
+) -> dict | JSONResponse | Response:
+    """위키 페이지 상세 정보를 조회합니다.
+
+    If-None-Match가 페이지 버전(수정/롤백/삭제 시 증가)으로 만든 ETag와 같으면 본문 조회 없이 304를 반환합니다.
+    """
     timestamp = get_request_timestamp(request)
 
+    etag = await compute_etag((wiki_namespace(slug),))
+    if etag is not None and is_not_modified(request, etag):
+        await WikiService.record_view(slug)
+        return not_modified_response(etag)
+
     # slug는 URL-friendly 식별자 — ID 대신 사용해 북마크 가능한 고정 URL 유지
     result = await WikiService.get_wiki_page(slug, timestamp)
 
-    return create_response(
+    body = create_response(
         "WIKI_PAGE_RETRIEVED",
         "위키 페이지 조회에 성공했습니다.",
         data={"wiki_page": result},
         timestamp=timestamp,
     )
+    return with_etag(body, etag)
 
 
 async def create_wiki_page(
@@ -371,6 +384,8 @@ async def rollback_revision(
             edit_summary=f"리비전 {revision_number}(으)로 롤백",
             editor_id=current_user.id,
         )
+    await queue_reindex("wiki", page_id)
+    await invalidate(wiki_namespace(slug))
 
     return create_response(
         "WIKI_REVISION_ROLLED_BACK",
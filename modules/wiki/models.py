@@ -8,6 +8,8 @@ ALLOWED_SORT_OPTIONS = {
     "latest": "wp.created_at DESC",
     "views": "wp.views_count DESC, wp.created_at DESC",
     "updated": "COALESCE(wp.updated_at, wp.created_at) DESC",
+    # 검색 색인 관련도 순 — search_ids가 주어지면 FIELD()로 색인 순위를 따르고, 없으면 최신순
+    "relevance": "wp.created_at DESC",
 }
 
 
@@ -62,6 +64,14 @@ async def get_wiki_page_by_slug(slug: str) -> dict | None:
         }
 
 
+async def get_wiki_page_id_by_slug(slug: str) -> int | None:
+    """슬러그로 위키 페이지 ID만 조회합니다 (slug 유니크 인덱스)."""
+    async with get_cursor() as cur:
+        await cur.execute("SELECT id FROM wiki_page WHERE slug = %s AND deleted_at IS NULL", (slug,))
+        row = await cur.fetchone()
+        return row["id"] if row else None
+
+
 async def slug_exists(slug: str, exclude_id: int | None = None) -> bool:
     """슬러그 중복 여부를 확인합니다."""
     async with get_cursor() as cur:
@@ -84,8 +94,12 @@ async def get_wiki_pages(
     sort: str = "latest",
     search: str | None = None,
     tag: str | None = None,
+    search_ids: list[int] | None = None,
 ) -> list[dict]:
-    """위키 페이지 목록을 조회합니다."""
+    """위키 페이지 목록을 조회합니다.
+
+    search_ids(검색 색인이 관련도 순으로 찾은 ID)가 주어지면 search 대신 PK 목록으로 제한합니다.
+    """
     sort_clause = ALLOWED_SORT_OPTIONS.get(sort, ALLOWED_SORT_OPTIONS["latest"])
 
     joins = "LEFT JOIN user u ON wp.author_id = u.id"
@@ -97,11 +111,21 @@ async def get_wiki_pages(
         where += " AND t.name = %s"
         params.append(tag)
 
-    if search:
+    order_params: list = []
+    if search_ids is not None:
+        if not search_ids:
+            return []
+        placeholders = ", ".join(["%s"] * len(search_ids))
+        where += f" AND wp.id IN ({placeholders})"
+        params.extend(search_ids)
+        if sort == "relevance":
+            sort_clause = f"FIELD(wp.id, {placeholders})"
+            order_params = list(search_ids)
+    elif search:
         where += " AND MATCH(wp.title, wp.content) AGAINST(%s IN BOOLEAN MODE)"
         params.append(escape_fulltext_query(search))
 
-    params.extend([limit, offset])
+    params.extend([*order_params, limit, offset])
 
     async with get_cursor() as cur:
         await cur.execute(
@@ -138,8 +162,12 @@ async def get_wiki_pages(
         ]
 
 
-async def get_wiki_pages_count(search: str | None = None, tag: str | None = None) -> int:
-    """위키 페이지 총 개수를 반환합니다."""
+async def get_wiki_pages_count(
+    search: str | None = None,
+    tag: str | None = None,
+    search_ids: list[int] | None = None,
+) -> int:
+    """위키 페이지 총 개수를 반환합니다. search_ids가 주어지면 search 대신 PK 목록으로 제한합니다."""
     joins = ""
     where = "wp.deleted_at IS NULL"
     params: list = []
@@ -149,7 +177,13 @@ async def get_wiki_pages_count(search: str | None = None, tag: str | None = None
         where += " AND t.name = %s"
         params.append(tag)
 
-    if search:
+    if search_ids is not None:
+        if not search_ids:
+            return 0
+        placeholders = ", ".join(["%s"] * len(search_ids))
+        where += f" AND wp.id IN ({placeholders})"
+        params.extend(search_ids)
+    elif search:
         where += " AND MATCH(wp.title, wp.content) AGAINST(%s IN BOOLEAN MODE)"
         params.append(escape_fulltext_query(search))
 
@@ -162,6 +196,29 @@ async def get_wiki_pages_count(search: str | None = None, tag: str | None = None
         return row["cnt"] if row else 0
 
 
+async def get_search_documents(ids: list[int] | None = None, after_id: int = 0, limit: int = 500) -> list[dict]:
+    """검색 색인용 (id, title, body) 행을 반환합니다. 삭제된 페이지는 제외합니다.
+
+    ids가 주어지면 해당 페이지만, 아니면 after_id 이후를 id 순으로 limit개 반환합니다 (전체 재색인).
+    """
+    async with get_cursor() as cur:
+        if ids is not None:
+            if not ids:
+                return []
+            placeholders = ", ".join(["%s"] * len(ids))
+            await cur.execute(
+                f"SELECT id, title, content AS body FROM wiki_page WHERE id IN ({placeholders}) AND deleted_at IS NULL",
+                ids,
+            )
+        else:
+            await cur.execute(
+                "SELECT id, title, content AS body FROM wiki_page"
+                " WHERE id > %s AND deleted_at IS NULL ORDER BY id LIMIT %s",
+                (after_id, limit),
+            )
+        return list(await cur.fetchall())
+
+
 async def update_wiki_page(
     wiki_page_id: int,
     editor_id: int,
@@ -208,6 +265,25 @@ async def increment_views(wiki_page_id: int) -> None:
         )
 
 
+async def add_views(deltas: dict[int, int]) -> None:
+    """여러 위키 페이지의 조회수를 한 번의 UPDATE로 증가시킵니다 (view_counter flush용).
+
+    Args:
+        deltas: 위키 페이지 ID별 증가량.
+    """
+    if not deltas:
+        return
+    page_ids = sorted(deltas)
+    cases = " ".join(["WHEN %s THEN %s"] * len(page_ids))
+    id_placeholders = ", ".join(["%s"] * len(page_ids))
+    async with transactional() as cur:
+        await cur.execute(
+            f"UPDATE wiki_page SET views_count = views_count + CASE id {cases} END "
+            f"WHERE id IN ({id_placeholders}) AND deleted_at IS NULL",
+            [*(value for page_id in page_ids for value in (page_id, deltas[page_id])), *page_ids],
+        )
+
+
 async def save_wiki_page_tags(wiki_page_id: int, tag_ids: list[int]) -> None:
     """위키 페이지의 태그를 교체합니다."""
     async with transactional() as cur:
@@ -1,6 +1,6 @@
 """wiki_router: 위키 페이지 관련 라우터 모듈."""
 
-from fastapi import APIRouter, Depends, Path, Query, Request, status
+from fastapi import APIRouter, Depends, Path, Query, Request, Response, status
 
 from core.dependencies.auth import get_optional_user, require_verified_email
 from modules.user.models import User
@@ -16,7 +16,7 @@ async def get_wiki_pages(
     request: Request,
     offset: int = Query(0, ge=0, description="시작 위치 (0부터 시작)"),
     limit: int = Query(10, ge=1, le=100, description="조회할 위키 페이지 수"),
-    sort: str = Query("latest", description="정렬: latest, views, updated"),
+    sort: str = Query("latest", description="정렬: latest, views, updated, relevance(검색 시)"),
     search: str | None = Query(None, max_length=100, description="검색어 (제목/본문)"),
     tag: str | None = Query(None, description="태그 이름 필터"),
     _current_user: User | None = Depends(get_optional_user),
@@ -122,12 +122,12 @@ async def rollback_wiki(
     return await wiki_controller.rollback_revision(request, slug, revision_number, current_user)
 
 
-@wiki_router.get("/{slug}", status_code=status.HTTP_200_OK)
+@wiki_router.get("/{slug}", status_code=status.HTTP_200_OK, response_model=None)
 async def get_wiki_page(
     request: Request,
     slug: str = Path(description="위키 페이지 슬러그"),
     _current_user: User | None = Depends(get_optional_user),
-) -> dict:
+) -> dict | Response:
     """위키 페이지 상세 정보를 조회합니다.
 
     Args:
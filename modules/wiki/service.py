@@ -3,7 +3,10 @@
 import logging
 
 from core.database.connection import transactional
+from core.search import query_index, queue_reindex, search_snippets
 from core.utils.exceptions import bad_request_error, conflict_error, forbidden_error, not_found_error
+from core.utils.response_cache import invalidate, wiki_namespace
+from core.utils.view_counter import view_counter
 from modules.content import tag_models
 from modules.wiki import models as wiki_models
 from modules.wiki.revision_models import create_revision as create_rev
@@ -29,23 +32,32 @@ class WikiService:
         Args:
             offset: 시작 위치.
             limit: 조회할 개수.
-            sort: 정렬 옵션.
+            sort: 정렬 옵션 (relevance는 검색 색인 관련도 순, 색인 미사용 시 최신순).
             search: 검색어.
             tag: 태그 이름 필터.
 
         Returns:
             위키 페이지 목록과 페이지네이션 정보.
         """
+        # 전문 검색: 색인이 관련도 순 ID를 찾으면 MATCH ... AGAINST 대신 PK 목록으로 제한
+        search_ids: list[int] | None = None
+        if search:
+            search_result = await query_index("wiki", search)
+            if search_result is not None:
+                search_ids = search_result.ids
+
         wiki_pages = await wiki_models.get_wiki_pages(
             offset=offset,
             limit=limit,
             sort=sort,
             search=search,
             tag=tag,
+            search_ids=search_ids,
         )
         total_count = await wiki_models.get_wiki_pages_count(
             search=search,
             tag=tag,
+            search_ids=search_ids,
         )
         has_more = offset + limit < total_count
 
@@ -55,6 +67,12 @@ class WikiService:
         for page in wiki_pages:
             page["tags"] = tags_map.get(page["wiki_page_id"], [])
 
+        # 검색어 하이라이트 스니펫 (색인 검색일 때만)
+        if search and search_ids is not None:
+            snippets = await search_snippets("wiki", page_ids, search)
+            for page in wiki_pages:
+                page["snippet"] = snippets.get(page["wiki_page_id"])
+
         return {
             "wiki_pages": wiki_pages,
             "pagination": {
@@ -80,15 +98,21 @@ class WikiService:
         if not page:
             raise not_found_error("wiki_page", timestamp)
 
-        # 조회수 증가
-        await wiki_models.increment_views(page["wiki_page_id"])
-        page["views_count"] += 1
+        # 조회수 증가 — 버퍼 모드에서는 아직 flush되지 않은 조회도 응답에 반영
+        page["views_count"] += await view_counter.record_wiki_view(page["wiki_page_id"])
 
         # 태그 조회
         page["tags"] = await wiki_models.get_wiki_page_tags(page["wiki_page_id"])
 
         return page
 
+    @staticmethod
+    async def record_view(slug: str) -> None:
+        """본문 없이 응답한 조회(304)의 조회수를 기록합니다."""
+        wiki_page_id = await wiki_models.get_wiki_page_id_by_slug(slug)
+        if wiki_page_id is not None:
+            await view_counter.record_wiki_view(wiki_page_id)
+
     @staticmethod
     async def create_wiki_page(
         user_id: int,
@@ -146,6 +170,11 @@ class WikiService:
             if normalized:
                 tag_ids = await tag_models.get_or_create_tags(normalized)
                 await wiki_models.save_wiki_page_tags(wiki_page_id, tag_ids)
+                await queue_reindex("tag", *tag_ids)
+
+        await queue_reindex("wiki", wiki_page_id)
+        # 삭제 후 같은 슬러그로 다시 만든 페이지가 이전 ETag와 일치하지 않도록
+        await invalidate(wiki_namespace(data.slug))
 
         # 평판 포인트 부여 (best-effort)
         try:
@@ -242,9 +271,13 @@ class WikiService:
             if normalized:
                 tag_ids = await tag_models.get_or_create_tags(normalized)
                 await wiki_models.save_wiki_page_tags(wiki_page_id, tag_ids)
+                await queue_reindex("tag", *tag_ids)
             else:
                 await wiki_models.save_wiki_page_tags(wiki_page_id, [])
 
+        await queue_reindex("wiki", wiki_page_id)
+        await invalidate(wiki_namespace(slug))
+
         # 수정된 페이지 최종 조회 (트랜잭션 커밋 후)
         updated = await wiki_models.get_wiki_page_by_slug(slug)
         assert updated is not None
@@ -295,3 +328,5 @@ class WikiService:
             )
 
         await wiki_models.delete_wiki_page(page["wiki_page_id"])
+        await queue_reindex("wiki", page["wiki_page_id"])
+        await invalidate(wiki_namespace(slug))
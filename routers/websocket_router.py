@@ -19,6 +19,8 @@ router = APIRouter()
 # 인메모리 연결 저장소 (로컬 개발 전용)
 # user_id → set[WebSocket]
 _connections: dict[int, set[WebSocket]] = {}
+# 토픽 → set[WebSocket] (예: poll:{poll_id})
+_topics: dict[str, set[WebSocket]] = {}
 
 _AUTH_TIMEOUT_SEC = 10
 
@@ -36,6 +38,19 @@ async def local_push_to_user(user_id: int, event: dict) -> None:
     websockets -= stale
 
 
+async def local_push_to_topic(topic: str, event: dict) -> None:
+    """로컬 개발용: 토픽을 구독한 인메모리 연결에 메시지 전송."""
+    websockets = _topics.get(topic, set())
+    data = json.dumps(event, ensure_ascii=False)
+    stale = set()
+    for ws in list(websockets):
+        try:
+            await ws.send_text(data)
+        except Exception:
+            stale.add(ws)
+    websockets -= stale
+
+
 @router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """로컬 개발용 WebSocket 엔드포인트."""
@@ -73,16 +88,24 @@ async def websocket_endpoint(websocket: WebSocket):
         await websocket.send_text(json.dumps({"type": "auth_ok", "user_id": user_id}))
         logger.info("로컬 WebSocket 연결: user_id=%d", user_id)
 
-        # 메시지 루프 (ping/pong)
+        # 메시지 루프 (ping/pong, 토픽 구독)
         while True:
             raw = await websocket.receive_text()
             msg = json.loads(raw)
             if msg.get("type") == "ping":
                 await websocket.send_text(json.dumps({"type": "pong"}))
+            elif msg.get("type") == "subscribe" and isinstance(msg.get("topic"), str):
+                _topics.setdefault(msg["topic"], set()).add(websocket)
+            elif msg.get("type") == "unsubscribe" and isinstance(msg.get("topic"), str):
+                _topics.get(msg["topic"], set()).discard(websocket)
 
     except WebSocketDisconnect:
         logger.info("로컬 WebSocket 해제: user_id=%s", user_id)
     finally:
+        for topic in [topic for topic, websockets in _topics.items() if websocket in websockets]:
+            _topics[topic].discard(websocket)
+            if not _topics[topic]:
+                del _topics[topic]
         if user_id and user_id in _connections:
             _connections[user_id].discard(websocket)
             if not _connections[user_id]:
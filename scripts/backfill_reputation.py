@@ -187,6 +187,10 @@ async def evaluate_badges() -> None:
     """모든 사용자에 대해 배지 조건을 평가합니다."""
     from modules.reputation.service import ReputationService
 
+    # 백필로 원본 집계가 바뀌었으므로 증분 카운터를 비워 평가 시 다시 시드되도록 함
+    async with transactional() as cur:
+        await cur.execute("DELETE FROM user_badge_progress")
+
     async with get_cursor() as cur:
         await cur.execute("SELECT id FROM user WHERE deleted_at IS NULL")
         users = await cur.fetchall()
@@ -205,7 +209,7 @@ async def evaluate_badges() -> None:
 
     for i, u in enumerate(users):
         for event_type in badge_event_types:
-            await ReputationService._check_badges(u["id"], event_type, None, None)
+            await ReputationService.evaluate_badges(u["id"], event_type)
         if (i + 1) % 100 == 0:
             logger.info("  %d/%d 사용자 배지 평가 완료", i + 1, len(users))
 
@@ -0,0 +1,114 @@
+"""추천 피드 점수 계산 벤치마크: 사용자별 계산(affinity_scorer) vs 배치 엔진(affinity_batch).
+
+DB 없이 합성 신호로 만든 친화도 가중치/후보 게시글로 두 경로의 점수 계산 시간을 비교하고 결과가 같은지 검증합니다.
+가중치 조회/점수 저장 쿼리 수 차이(사용자당 → 청크당)는 포함하지 않습니다.
+
+사용법: cd 2-cho-community-be && uv run --extra k8s python scripts/benchmark_feed_scoring.py --users 2000 --posts 3000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from modules.post.affinity_batch import prepare_candidates, rank_users_batch
+from modules.post.affinity_models import AffinityWeights, UserSignals
+from modules.post.affinity_scorer import profile_from_weights, rank_candidates, weights_from_signals
+
+MAX_SCORES_PER_USER = 200
+CHUNK_SIZE = 200
+
+
+def _counts(rng: random.Random, keys: int, size: int) -> dict[int, int]:
+    return {rng.randint(1, keys): rng.randint(1, 5) for _ in range(rng.randint(0, size))}
+
+
+def make_candidates(rng: random.Random, posts: int, tags: int, categories: int, authors: int) -> list[dict]:
+    """get_candidate_posts_meta()와 같은 형태의 합성 후보 게시글."""
+    return [
+        {
+            "post_id": post_id,
+            "category_id": rng.choice([None, *range(1, categories + 1)]),
+            "author_id": rng.choice([None, *range(1, authors + 1)]),
+            "hot_score": rng.random() * 5,
+            "tag_ids": rng.sample(range(1, tags + 1), rng.randint(0, 5)),
+        }
+        for post_id in range(1, posts + 1)
+    ]
+
+
+def make_weights(
+    rng: random.Random, users: int, tags: int, categories: int, authors: int
+) -> dict[int, AffinityWeights]:
+    """합성 사용자 신호로 만든 친화도 가중치 (get_affinity_weights()와 같은 형태)."""
+    return {
+        user_id: weights_from_signals(
+            UserSignals(
+                liked_tag_counts=_counts(rng, tags, 20),
+                bookmarked_tag_counts=_counts(rng, tags, 10),
+                commented_tag_counts=_counts(rng, tags, 10),
+                viewed_category_counts=_counts(rng, categories, 6),
+                followed_author_ids={rng.randint(1, authors) for _ in range(rng.randint(0, 15))},
+                liked_author_counts=_counts(rng, authors, 20),
+                bookmarked_author_counts=_counts(rng, authors, 10),
+            )
+        )
+        for user_id in range(1, users + 1)
+    }
+
+
+def run_reference(user_ids: list[int], weights: dict[int, AffinityWeights], candidates: list[dict]) -> dict:
+    return {
+        user_id: rank_candidates(user_id, profile_from_weights(weights[user_id]), candidates, MAX_SCORES_PER_USER)
+        for user_id in user_ids
+    }
+
+
+def run_batch(user_ids: list[int], weights: dict[int, AffinityWeights], candidates: list[dict]) -> dict:
+    matrix = prepare_candidates(candidates)
+    result: dict = {}
+    for i in range(0, len(user_ids), CHUNK_SIZE):
+        result.update(rank_users_batch(user_ids[i : i + CHUNK_SIZE], weights, matrix, MAX_SCORES_PER_USER))
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--posts", type=int, default=3000)
+    parser.add_argument("--tags", type=int, default=300)
+    parser.add_argument("--categories", type=int, default=8)
+    parser.add_argument("--authors", type=int, default=1500)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    candidates = make_candidates(rng, args.posts, args.tags, args.categories, args.authors)
+    weights = make_weights(rng, args.users, args.tags, args.categories, args.authors)
+    user_ids = list(weights)
+
+    started = time.perf_counter()
+    reference = run_reference(user_ids, weights, candidates)
+    reference_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = run_batch(user_ids, weights, candidates)
+    batch_s = time.perf_counter() - started
+
+    mismatched = [user_id for user_id in user_ids if reference[user_id] != batch[user_id]]
+    rows = sum(len(r) for r in reference.values())
+
+    print(f"사용자 {args.users:,}명 x 후보 {args.posts:,}개 (저장 행 {rows:,})")
+    print(f"  사용자별 계산 : {reference_s:8.2f}s ({reference_s / args.users * 1000:.2f} ms/user)")
+    print(f"  배치 엔진     : {batch_s:8.2f}s ({batch_s / args.users * 1000:.2f} ms/user)")
+    print(f"  속도 향상     : {reference_s / batch_s:8.1f}x")
+    print(f"  결과 불일치   : {len(mismatched)}명")
+    if mismatched:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""미들웨어 스택 벤치마크: BaseHTTPMiddleware 스택(이전) vs 순수 ASGI 스택(현재)의 초당 요청 수.
+
+빈 JSON을 돌려주는 엔드포인트 하나에 main.py와 같은 순서로 다섯 미들웨어(요청 ID, 보안 헤더, 타이밍,
+Rate Limit, 본문 크기 제한)를 쌓고, httpx ASGITransport로 서버/네트워크 없이 같은 요청을 반복해 보냅니다.
+이전 스택은 같은 동작을 BaseHTTPMiddleware.dispatch로 구현한 사본이며, 두 스택의 응답 헤더가 같은지도 검증합니다.
+측정값은 미들웨어 오버헤드만이며, 실제 서버의 HTTP 파싱/네트워크 비용은 포함하지 않습니다.
+
+사용법: cd 2-cho-community-be && DEBUG=true uv run python scripts/benchmark_middleware.py --requests 5000
+"""
+
+import argparse
+import asyncio
+import re
+import sys
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.config import settings
+from core.logging_config import request_id_var
+from core.middleware import (
+    BodyLimitMiddleware,
+    RateLimitMiddleware,
+    RequestIdMiddleware,
+    SecurityHeadersMiddleware,
+    TimingMiddleware,
+)
+from core.middleware.rate_limiter import RATE_LIMIT_CONFIG
+
+# ---- 이전 구현 (BaseHTTPMiddleware) ---------------------------------------
+
+# 이전 Rate Limit 미들웨어의 경로 정규화 (숫자 세그먼트 → {id})
+_PATH_PARAM_RE = re.compile(r"/\d+(?=/|$)")
+
+
+class LegacyRequestId(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        rid = request.headers.get("x-request-id") or str(uuid.uuid4())
+        request.state.request_id = rid
+        token = request_id_var.set(rid)
+        try:
+            response = await call_next(request)
+            response.headers["X-Request-ID"] = rid
+            return response
+        finally:
+            request_id_var.reset(token)
+
+
+class LegacySecurityHeaders(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
+        return response
+
+
+class LegacyTiming(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        request.state.request_time = datetime.now(UTC)
+        return await call_next(request)
+
+
+class LegacyRateLimit(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        # 벤치마크 엔드포인트(GET, 설정 없음)가 지나는 경로만 재현
+        if request.method == "GET":
+            normalized = _PATH_PARAM_RE.sub("/{id}", request.url.path)
+            if f"GET:{normalized}" not in RATE_LIMIT_CONFIG:
+                return await call_next(request)
+        raise NotImplementedError
+
+
+class LegacyBodyLimit(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        content_length = request.headers.get("content-length")
+        if content_length and int(content_length) > 10 * 1024 * 1024:
+            raise NotImplementedError
+        return await call_next(request)
+
+
+# ---- 벤치마크 ---------------------------------------------------------------
+
+
+def build_app(legacy: bool) -> FastAPI:
+    """main.py와 같은 추가 순서로 미들웨어를 쌓은 앱을 만듭니다."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    if legacy:
+        for middleware in (LegacyRequestId, LegacySecurityHeaders, LegacyTiming, LegacyRateLimit, LegacyBodyLimit):
+            app.add_middleware(middleware)
+    else:
+        app.add_middleware(RequestIdMiddleware)
+        app.add_middleware(SecurityHeadersMiddleware, https_only=False)
+        app.add_middleware(TimingMiddleware)
+        app.add_middleware(RateLimitMiddleware)
+        app.add_middleware(BodyLimitMiddleware)
+    return app
+
+
+async def run(app: FastAPI, requests: int, concurrency: int) -> tuple[float, httpx.Response]:
+    """requests개 요청을 concurrency개 작업자로 보내고 (초당 요청 수, 마지막 응답)을 반환합니다."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        last = await client.get("/ping")  # 워밍업
+        remaining = requests
+
+        async def worker() -> None:
+            nonlocal remaining, last
+            while remaining > 0:
+                remaining -= 1
+                last = await client.get("/ping")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return requests / elapsed, last
+
+
+async def main(requests: int, concurrency: int, rounds: int) -> None:
+    # TESTING이면 RateLimitMiddleware가 즉시 통과하므로 실제 판정 경로를 타도록 끔
+    settings.TESTING = False
+    results: dict[str, list[float]] = {"BaseHTTPMiddleware": [], "순수 ASGI": []}
+    responses: dict[str, httpx.Response] = {}
+    for _ in range(rounds):
+        for name, legacy in (("BaseHTTPMiddleware", True), ("순수 ASGI", False)):
+            rps, responses[name] = await run(build_app(legacy), requests, concurrency)
+            results[name].append(rps)
+
+    legacy_headers, asgi_headers = (
+        {k: v for k, v in r.headers.items() if k != "x-request-id"} for r in responses.values()
+    )
+    assert legacy_headers == asgi_headers, (legacy_headers, asgi_headers)
+
+    print(f"요청 {requests}개 x {rounds}회, 동시성 {concurrency} (최고값 기준)")
+    best = {name: max(values) for name, values in results.items()}
+    for name, rps in best.items():
+        print(f"  {name:<20} {rps:>10,.0f} req/s")
+    print(f"  향상: {best['순수 ASGI'] / best['BaseHTTPMiddleware']:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.rounds))
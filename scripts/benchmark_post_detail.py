@@ -0,0 +1,131 @@
+"""게시글 상세 조립 벤치마크: 순차 조회(동시성 1) vs 독립 조회 동시 실행(POST_DETAIL_QUERY_CONCURRENCY).
+
+DB 없이 PostService._fetch_post_detail()이 호출하는 모델 함수를 고정 지연(쿼리 왕복 + 연결 획득)을
+흉내 내는 가짜 함수로 바꿔, 같은 조립 코드를 동시성 예산만 바꿔 실행합니다.
+두 경로의 응답이 같은지도 검증합니다. 실제 쿼리 실행 시간 편차와 풀 경합은 포함하지 않습니다.
+
+사용법: cd 2-cho-community-be && DEBUG=true uv run python scripts/benchmark_post_detail.py --latency-ms 2 --requests 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.config import settings
+from modules.content import tag_models
+from modules.post import comment_models, comment_service, poll_models, post_models, post_service
+from modules.post.post_service import PostService
+from modules.user.models import User
+
+CREATED_AT = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def install_fakes(latency_s: float) -> None:
+    """상세 조립에 쓰이는 모델 함수를 latency_s만큼 대기 후 고정 값을 돌려주는 함수로 교체합니다."""
+
+    def fake(value):
+        async def query(*args, **kwargs):
+            await asyncio.sleep(latency_s)
+            return value() if callable(value) else value
+
+        return query
+
+    def post_row() -> dict:
+        return {
+            "post_id": 1,
+            "title": "벤치마크",
+            "content": "본문",
+            "image_url": None,
+            "views_count": 10,
+            "created_at": CREATED_AT,
+            "updated_at": None,
+            "author": {"user_id": 2, "nickname": "author"},
+            "accepted_answer_id": None,
+        }
+
+    def comment(i: int, parent_id: int | None) -> dict:
+        return {
+            "comment_id": i,
+            "content": f"댓글 {i}",
+            "created_at": CREATED_AT,
+            "updated_at": None,
+            "author": {"user_id": 3, "nickname": "commenter"},
+            "parent_id": parent_id,
+            "is_deleted": False,
+            "likes_count": i % 4,
+            "replies_count": 2 if parent_id is None else 0,
+            "is_liked": False,
+            "is_accepted": False,
+            "sort_key": [CREATED_AT, i],
+        }
+
+    def root_comments() -> list[dict]:
+        return [comment(i, None) for i in range(1, 31, 3)]
+
+    def reply_previews() -> dict[int, list[dict]]:
+        return {i: [comment(i + 1, i), comment(i + 2, i)] for i in range(1, 31, 3)}
+
+    post_models.get_post_with_details = fake(post_row)  # type: ignore[assignment]
+    post_models.increment_view_count = fake(False)  # type: ignore[assignment]
+    post_models.get_post_images = fake([{"image_url": "/a.png"}])  # type: ignore[assignment]
+    tag_models.get_post_tags = fake([{"id": 1, "name": "linux"}])  # type: ignore[assignment]
+    poll_models.get_poll_snapshot = fake(None)  # type: ignore[assignment]
+    comment_models.get_root_comments = fake(root_comments)  # type: ignore[assignment]
+    comment_models.get_reply_previews = fake(reply_previews)  # type: ignore[assignment]
+    post_service.get_like = fake(None)  # type: ignore[assignment]
+    post_service.get_bookmark = fake(None)  # type: ignore[assignment]
+    post_service.get_cached_blocked_user_ids = fake(frozenset)  # type: ignore[assignment]
+    comment_service.get_liked_comment_ids = fake({1, 4})  # type: ignore[assignment]
+
+
+async def measure(concurrency: int, user: User | None, requests: int) -> tuple[list[float], dict]:
+    settings.POST_DETAIL_QUERY_CONCURRENCY = concurrency
+    timings: list[float] = []
+    result: dict = {}
+    for _ in range(requests):
+        started = time.perf_counter()
+        result = await PostService._fetch_post_detail(1, user, "")
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings, result
+
+
+def summarize(label: str, timings: list[float]) -> str:
+    p99 = statistics.quantiles(timings, n=100)[98]
+    return f"  {label:<22}: 평균 {statistics.mean(timings):6.2f} ms | p99 {p99:6.2f} ms"
+
+
+async def run(args: argparse.Namespace) -> bool:
+    install_fakes(args.latency_ms / 1000)
+    user = User(id=7, email="bench@example.com", password=None, nickname="bench")
+    identical = True
+    for label, current_user in (("비로그인", None), ("로그인", user)):
+        sequential, expected = await measure(1, current_user, args.requests)
+        concurrent, actual = await measure(args.concurrency, current_user, args.requests)
+        identical = identical and expected == actual
+        speedup = statistics.mean(sequential) / statistics.mean(concurrent)
+        print(f"{label} (쿼리 지연 {args.latency_ms} ms, 요청 {args.requests}회)")
+        print(summarize("순차 (동시성 1)", sequential))
+        print(summarize(f"동시 (동시성 {args.concurrency})", concurrent))
+        print(f"  속도 향상              : {speedup:6.1f}x")
+    print(f"응답 일치: {'예' if identical else '아니오'}")
+    return identical
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=settings.POST_DETAIL_QUERY_CONCURRENCY)
+    args = parser.parse_args()
+    if not asyncio.run(run(args)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""인메모리 Rate Limiter 벤치마크: 타임스탬프 리스트(이전) vs GCRA + LRU(현재)의 처리량과 메모리.
+
+세 가지 트래픽으로 두 구현의 초당 판정 수와 tracemalloc 기준 상태 메모리를 비교합니다.
+- 고정 키: keys개 키를 번갈아 한도(기본 100회/분) 안에서 요청 — 키마다 윈도우가 가득 찬 정상 상태
+- 스캐닝: 요청마다 새 키 (max_tracked_ips를 넘겨 제거가 계속 일어나는 상태)
+- 메모리: keys개 키가 각각 한도만큼 요청한 뒤의 상태 크기
+이전 구현은 기존 MemoryRateLimiter(defaultdict(list) + 전역 asyncio.Lock + 10% 배치 제거)의 사본입니다.
+
+사용법: cd 2-cho-community-be && DEBUG=true uv run python scripts/benchmark_rate_limiter.py --keys 10000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.middleware.rate_limiter_memory import MemoryRateLimiter
+
+# ---- 이전 구현 ---------------------------------------------------------------
+
+
+class LegacyMemoryRateLimiter:
+    def __init__(self, max_tracked_ips: int):
+        self._requests: dict[str, list] = defaultdict(list)
+        self._lock = asyncio.Lock()
+        self.max_tracked_ips = max_tracked_ips
+
+    async def is_rate_limited(self, ip: str, max_requests: int, window_seconds: int) -> tuple[bool, int]:
+        async with self._lock:
+            if len(self._requests) >= self.max_tracked_ips:
+                eviction_count = max(1, self.max_tracked_ips // 10)
+                sorted_ips = sorted(self._requests.items(), key=lambda item: max(item[1]) if item[1] else datetime.min)
+                for ip_to_remove, _ in sorted_ips[:eviction_count]:
+                    del self._requests[ip_to_remove]
+
+            now = datetime.now()
+            window_start = now - timedelta(seconds=window_seconds)
+            self._requests[ip] = [req_time for req_time in self._requests[ip] if req_time > window_start]
+            current_count = len(self._requests[ip])
+            if current_count >= max_requests:
+                return True, 0
+            self._requests[ip].append(now)
+            return False, max_requests - current_count - 1
+
+
+# ---- 벤치마크 ---------------------------------------------------------------
+
+
+def _limiters(max_ips: int) -> dict[str, LegacyMemoryRateLimiter | MemoryRateLimiter]:
+    return {"타임스탬프 리스트": LegacyMemoryRateLimiter(max_ips), "GCRA + LRU": MemoryRateLimiter(max_ips)}
+
+
+async def _drive(limiter, keys: list[str], limit: int) -> float:
+    """keys 순서대로 판정하고 초당 판정 수를 반환합니다."""
+    started = time.perf_counter()
+    for key in keys:
+        await limiter.is_rate_limited(key, limit, 60)
+    return len(keys) / (time.perf_counter() - started)
+
+
+async def fixed_keys(keys: int, limit: int, requests: int) -> dict[str, float]:
+    results = {}
+    # 이전 구현은 추적 수가 상한에 닿으면 기존 키 요청에도 제거를 실행하므로 여유를 둠
+    for name, limiter in _limiters(keys * 2).items():
+        # 워밍업: 키마다 윈도우를 한도까지 채움
+        await _drive(limiter, [f"10.0.{i // 256}.{i % 256}:GET:/v1/posts" for i in range(keys)] * limit, limit)
+        order = [f"10.0.{i % keys // 256}.{i % keys % 256}:GET:/v1/posts" for i in range(requests)]
+        results[name] = await _drive(limiter, order, limit)
+    return results
+
+
+async def scanning(keys: int, limit: int, requests: int) -> dict[str, float]:
+    results = {}
+    for name, limiter in _limiters(keys).items():
+        results[name] = await _drive(limiter, [f"scan-{i}:POST:/v1/auth/session" for i in range(requests)], limit)
+    return results
+
+
+async def memory(keys: int, limit: int) -> dict[str, int]:
+    results = {}
+    for name in _limiters(keys):
+        tracemalloc.start()
+        limiter = _limiters(keys * 2)[name]
+        await _drive(limiter, [f"10.1.{i // 256}.{i % 256}:GET:/v1/posts" for i in range(keys)] * limit, limit)
+        results[name] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del limiter
+    return results
+
+
+async def main(keys: int, limit: int, requests: int) -> None:
+    print(f"키 {keys:,}개, 한도 {limit}회/60초, 측정 요청 {requests:,}개")
+    print("\n[고정 키] 초당 판정 수")
+    for name, rps in (await fixed_keys(keys, limit, requests)).items():
+        print(f"  {name:<16} {rps:>12,.0f}/s")
+    print("\n[스캐닝] 초당 판정 수 (요청마다 새 키)")
+    for name, rps in (await scanning(keys, limit, requests)).items():
+        print(f"  {name:<16} {rps:>12,.0f}/s")
+    print("\n[메모리] 키마다 한도만큼 요청한 뒤 상태 크기")
+    for name, size in (await memory(keys, limit)).items():
+        print(f"  {name:<16} {size / 1024 / 1024:>10,.1f} MiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=10000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=100000)
+    args = parser.parse_args()
+    asyncio.run(main(args.keys, args.limit, args.requests))
@@ -0,0 +1,95 @@
+"""정적 파일 사전 압축 스크립트.
+
+디렉터리의 텍스트 형식 파일(js/css/svg/json 등) 옆에 최고 압축률의 .br/.gz 형제 파일을 만듭니다.
+PrecompressedStaticFiles(core/utils/static_files.py)가 Accept-Encoding에 맞춰 이 파일을 그대로 보내므로
+요청마다 압축하지 않습니다. 이미지처럼 이미 압축된 형식과 압축해도 줄지 않는 파일은 건너뜁니다.
+형제 파일이 원본보다 새로우면 다시 만들지 않으므로 빌드마다 실행해도 됩니다.
+
+사용법: cd 2-cho-community-be && uv run python scripts/precompress_static.py [assets ...] [--min-size 256]
+"""
+
+import argparse
+import gzip
+import logging
+import mimetypes
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.utils.content_encoding import brotli, is_compressible
+from core.utils.static_files import PRECOMPRESSED_SUFFIXES
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    # mtime=0: 같은 입력이면 같은 출력 (이미지 레이어 재현성)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def precompress(directory: Path, min_size: int) -> dict[str, int]:
+    """directory 아래 압축 대상 파일의 형제 파일을 만듭니다.
+
+    Returns:
+        새로 만든 형제 파일 수, 건너뛴 파일 수, 절약한 바이트 (gzip 기준).
+    """
+    encodings = [e for e in PRECOMPRESSED_SUFFIXES if e != "br" or brotli is not None]
+    if brotli is None:
+        logger.warning("brotli 모듈이 없어 .gz만 만듭니다 (k8s extra 설치 시 .br도 생성).")
+    suffixes = tuple(PRECOMPRESSED_SUFFIXES.values())
+    stats = {"written": 0, "skipped": 0, "saved_bytes": 0}
+
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file() or path.name.endswith(suffixes):
+            continue
+        media_type = mimetypes.guess_type(path.name)[0]
+        original = path.stat()
+        if media_type is None or not is_compressible(media_type) or original.st_size < min_size:
+            stats["skipped"] += 1
+            continue
+        data = path.read_bytes()
+        for encoding in encodings:
+            target = path.with_name(path.name + PRECOMPRESSED_SUFFIXES[encoding])
+            if target.exists() and target.stat().st_mtime >= original.st_mtime:
+                continue
+            compressed = _compress(data, encoding)
+            if len(compressed) >= len(data):
+                # 줄지 않으면 원본을 보내도록 형제 파일을 남기지 않음
+                target.unlink(missing_ok=True)
+                continue
+            target.write_bytes(compressed)
+            # 원본과 같은 mtime — 원본이 바뀌면 형제 파일이 오래된 것으로 판별됨
+            os.utime(target, (original.st_atime, original.st_mtime))
+            stats["written"] += 1
+            if encoding == "gzip":
+                stats["saved_bytes"] += len(data) - len(compressed)
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directories", nargs="*", default=["assets"])
+    parser.add_argument("--min-size", type=int, default=256, help="압축할 최소 파일 크기 (바이트)")
+    args = parser.parse_args()
+
+    for directory in map(Path, args.directories):
+        if not directory.is_dir():
+            logger.warning("디렉터리가 없습니다: %s", directory)
+            continue
+        stats = precompress(directory, args.min_size)
+        logger.info(
+            "%s: 형제 파일 %d개 생성, %d개 건너뜀, gzip 절약 %d바이트",
+            directory,
+            stats["written"],
+            stats["skipped"],
+            stats["saved_bytes"],
+        )
+
+
+if __name__ == "__main__":
+    main()
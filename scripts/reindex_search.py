@@ -0,0 +1,46 @@
+"""검색 색인 전체 재색인 스크립트.
+
+SEARCH_INDEX_PATH의 로컬 색인을 원본 테이블(post/wiki_page/tag/package) 기준으로 다시 만듭니다.
+실행 중인 API 프로세스가 같은 파일을 쓰고 있어도 안전합니다 (임시 테이블에 만든 뒤 한 트랜잭션으로 교체).
+배포 전 색인을 미리 만들어 두거나(이미지/볼륨 워밍), 색인 손상·변경 로그 누락을 복구할 때 사용합니다.
+
+사용법: cd 2-cho-community-be && uv run python scripts/reindex_search.py [--kind post|wiki|tag|package]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.database.connection import close_db, init_db
+from core.search import SEARCH_KINDS, get_search_index, search_syncer
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+async def main(kind: str | None) -> None:
+    index = get_search_index()
+    if index is None:
+        logger.error("SEARCH_BACKEND=mysql에서는 재색인할 색인이 없습니다.")
+        sys.exit(1)
+    kinds = SEARCH_KINDS if kind is None else tuple(k for k in SEARCH_KINDS if k == kind)
+
+    await init_db()
+    try:
+        counts = await search_syncer.rebuild(index, kinds)
+        # 재색인 시작 이후의 변경까지 반영
+        await search_syncer.sync(index)
+    finally:
+        await close_db()
+    for name, count in counts.items():
+        logger.info("  %s: %d건", name, count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--kind", choices=SEARCH_KINDS, default=None)
+    asyncio.run(main(parser.parse_args().kind))
@@ -3,6 +3,8 @@
 import pytest
 from httpx import AsyncClient
 
+from tests.conftest import create_test_post, create_verified_user
+
 INTERNAL_KEY = "test-internal-key-12345"
 
 
@@ -55,6 +57,136 @@ async def test_feed_recompute_with_internal_key(
     assert res.json()["status"] == "success"
 
 
+@pytest.mark.asyncio
+async def test_hot_score_recompute_applies_decay(
+    client: AsyncClient,
+    fake,
+    monkeypatch,
+):
+    """hot_score 재계산은 감쇠 구간 안 게시글의 저장 점수를 현재 시각 기준으로 낮춘다."""
+    # Arrange
+    from core.config import settings
+    from core.database.connection import get_connection
+
+    monkeypatch.setattr(settings, "INTERNAL_API_KEY", INTERNAL_KEY)
+    user = await create_verified_user(client, fake)
+    post_id = (await create_test_post(client, user["headers"]))["post_id"]
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.execute(
+            "UPDATE post SET views = 10, hot_score = 100, created_at = NOW() - INTERVAL 2 DAY WHERE id = %s",
+            (post_id,),
+        )
+
+    # Act
+    res = await client.post(
+        "/v1/admin/hot-scores/recompute",
+        headers={"X-Internal-Key": INTERNAL_KEY},
+    )
+
+    # Assert
+    assert res.status_code == 200
+    assert res.json()["data"]["posts_updated"] >= 1
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.execute("SELECT hot_score FROM post WHERE id = %s", (post_id,))
+        (hot_score,) = await cur.fetchone()
+    assert 0 < hot_score < 1
+
+
+@pytest.mark.asyncio
+async def test_hot_score_recompute_zeroes_posts_outside_window(
+    client: AsyncClient,
+    fake,
+    monkeypatch,
+):
+    """감쇠 구간을 벗어난 게시글에 남은 hot_score는 재계산 시 0으로 내린다."""
+    # Arrange
+    from core.config import settings
+    from core.database.connection import get_connection
+
+    monkeypatch.setattr(settings, "INTERNAL_API_KEY", INTERNAL_KEY)
+    user = await create_verified_user(client, fake)
+    post_id = (await create_test_post(client, user["headers"]))["post_id"]
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.execute(
+            "UPDATE post SET hot_score = 100, created_at = NOW() - INTERVAL %s DAY WHERE id = %s",
+            (settings.HOT_SCORE_WINDOW_DAYS + 2, post_id),
+        )
+
+    # Act
+    res = await client.post(
+        "/v1/admin/hot-scores/recompute",
+        headers={"X-Internal-Key": INTERNAL_KEY},
+    )
+
+    # Assert
+    assert res.status_code == 200
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.execute("SELECT hot_score FROM post WHERE id = %s", (post_id,))
+        (hot_score,) = await cur.fetchone()
+    assert hot_score == 0
+
+
+@pytest.mark.asyncio
+async def test_feed_recompute_shard_resumes_from_checkpoint(
+    client: AsyncClient,
+    fake,
+    monkeypatch,
+):
+    """미완료 체크포인트가 있는 샤드는 마지막 처리 위치 이후부터 재개하고, 끝나면 완료로 표시한다."""
+    # Arrange
+    from core.config import settings
+    from core.database.connection import get_connection
+
+    monkeypatch.setattr(settings, "INTERNAL_API_KEY", INTERNAL_KEY)
+    user = await create_verified_user(client, fake)
+    await create_test_post(client, user["headers"])
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.execute(
+            "INSERT INTO feed_recompute_checkpoint (shard_count, shard_index, run_started_at, last_user_id) "
+            "VALUES (2, 1, NOW(), 1000000)"
+        )
+
+    # Act
+    res = await client.post(
+        "/v1/admin/feed/recompute",
+        params={"shard": 1, "shards": 2},
+        headers={"X-Internal-Key": INTERNAL_KEY},
+    )
+
+    # Assert
+    assert res.status_code == 200
+    data = res.json()["data"]
+    assert data["shard_index"] == 1
+    assert data["shard_count"] == 2
+    assert data["resumed_after_user_id"] == 1000000
+    assert data["users_processed"] == 0
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.execute(
+            "SELECT completed_at FROM feed_recompute_checkpoint WHERE shard_count = 2 AND shard_index = 1"
+        )
+        (completed_at,) = await cur.fetchone()
+    assert completed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_feed_recompute_rejects_shard_out_of_range(client: AsyncClient, monkeypatch):
+    """shard가 shards 이상이면 400을 반환한다."""
+    # Arrange
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "INTERNAL_API_KEY", INTERNAL_KEY)
+
+    # Act
+    res = await client.post(
+        "/v1/admin/feed/recompute",
+        params={"shard": 2, "shards": 2},
+        headers={"X-Internal-Key": INTERNAL_KEY},
+    )
+
+    # Assert
+    assert res.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_token_cleanup_with_internal_key(
     client: AsyncClient,
@@ -148,6 +148,37 @@ async def test_suspended_user_api_returns_403(
     assert res.json()["detail"]["error"] == "account_suspended"
 
 
+@pytest.mark.asyncio
+async def test_suspend_invalidates_cached_principal(
+    client: AsyncClient,
+    admin,
+    regular_user,
+    monkeypatch,
+):
+    """사용자 캐시가 켜져 있어도 관리자 정지 직후 기존 토큰 요청은 403을 반환한다."""
+    # Arrange — 캐시 활성화 후 인증 요청으로 캐시를 채움
+    from core.utils.principal_cache import principal_cache
+
+    monkeypatch.setattr(principal_cache, "ttl_seconds", 60)
+    principal_cache.clear()
+    res = await client.get("/v1/auth/me", headers=regular_user["headers"])
+    assert res.status_code == 200
+    assert principal_cache.get(regular_user["user_id"]) is not None
+
+    # Act
+    await client.post(
+        f"/v1/admin/users/{regular_user['user_id']}/suspend",
+        json={"duration_days": 7, "reason": "스팸 게시글 반복 작성"},
+        headers=admin["headers"],
+    )
+    res = await client.get("/v1/auth/me", headers=regular_user["headers"])
+
+    # Assert
+    assert res.status_code == 403
+    assert res.json()["detail"]["error"] == "account_suspended"
+    principal_cache.clear()
+
+
 @pytest.mark.asyncio
 async def test_suspended_user_login_returns_403(
     client: AsyncClient,
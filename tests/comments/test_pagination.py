@@ -0,0 +1,157 @@
+"""Comments 도메인 — 댓글 스레드 페이지네이션 테스트."""
+
+import pytest
+from httpx import AsyncClient
+
+from tests.conftest import create_test_comment, create_test_post, create_verified_user
+
+# ---------------------------------------------------------------------------
+# 루트 댓글 목록
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort", ["oldest", "latest", "popular"])
+async def test_comment_pages_cover_all_roots_without_duplicates(client: AsyncClient, fake, sort):
+    """커서로 이어서 조회하면 모든 루트 댓글이 중복 없이 정렬 순서대로 반환된다."""
+    # Arrange
+    user = await create_verified_user(client, fake)
+    post = await create_test_post(client, user["headers"])
+    post_id = post["post_id"]
+    created = [
+        (await create_test_comment(client, user["headers"], post_id, content=f"댓글 {i}"))["comment_id"]
+        for i in range(5)
+    ]
+    # popular 정렬 확인용 — 마지막 댓글에 좋아요
+    like_res = await client.post(f"/v1/posts/{post_id}/comments/{created[-1]}/like", headers=user["headers"])
+    assert like_res.status_code == 201
+
+    # Act
+    seen: list[int] = []
+    cursor = None
+    for _ in range(5):
+        params = {"sort": sort, "limit": 2, **({"cursor": cursor} if cursor else {})}
+        res = await client.get(f"/v1/posts/{post_id}/comments", params=params, headers=user["headers"])
+        assert res.status_code == 200
+        data = res.json()["data"]
+        seen.extend(c["comment_id"] for c in data["comments"])
+        cursor = data["pagination"]["next_cursor"]
+        if not data["pagination"]["has_more"]:
+            break
+
+    # Assert
+    assert cursor is None
+    if sort == "oldest":
+        assert seen == created
+    elif sort == "latest":
+        assert seen == created[::-1]
+    else:
+        assert seen[0] == created[-1]
+        assert sorted(seen) == sorted(created)
+
+
+@pytest.mark.asyncio
+async def test_comment_cursor_from_other_sort_returns_400(client: AsyncClient, fake):
+    """다른 정렬에서 발급된 커서로 조회하면 400을 반환한다."""
+    # Arrange
+    user = await create_verified_user(client, fake)
+    post = await create_test_post(client, user["headers"])
+    post_id = post["post_id"]
+    for _ in range(2):
+        await create_test_comment(client, user["headers"], post_id)
+    first = await client.get(f"/v1/posts/{post_id}/comments", params={"limit": 1})
+    cursor = first.json()["data"]["pagination"]["next_cursor"]
+
+    # Act
+    res = await client.get(f"/v1/posts/{post_id}/comments", params={"sort": "latest", "cursor": cursor})
+
+    # Assert
+    assert res.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_comments_of_missing_post_returns_404(client: AsyncClient):
+    """존재하지 않는 게시글의 댓글 목록은 404를 반환한다."""
+    res = await client.get("/v1/posts/999999/comments")
+
+    assert res.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# 대댓글 미리보기 / 대댓글 목록
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_reply_preview_and_replies_endpoint(client: AsyncClient, fake):
+    """루트 댓글은 대댓글 수와 미리보기를 담고, replies_cursor로 나머지 대댓글을 이어서 조회한다."""
+    # Arrange
+    user = await create_verified_user(client, fake)
+    post = await create_test_post(client, user["headers"])
+    post_id = post["post_id"]
+    parent_id = (await create_test_comment(client, user["headers"], post_id))["comment_id"]
+    reply_ids = [
+        (await create_test_comment(client, user["headers"], post_id, content=f"대댓글 {i}", parent_id=parent_id))[
+            "comment_id"
+        ]
+        for i in range(5)
+    ]
+
+    # Act
+    detail = await client.get(f"/v1/posts/{post_id}", headers=user["headers"])
+    root = next(c for c in detail.json()["data"]["comments"] if c["comment_id"] == parent_id)
+    res = await client.get(
+        f"/v1/posts/{post_id}/comments/{parent_id}/replies",
+        params={"cursor": root["replies_cursor"]},
+        headers=user["headers"],
+    )
+
+    # Assert
+    assert root["replies_count"] == 5
+    assert root["has_more_replies"] is True
+    preview_ids = [r["comment_id"] for r in root["replies"]]
+    assert preview_ids == reply_ids[: len(preview_ids)]
+    assert res.status_code == 200
+    rest = [r["comment_id"] for r in res.json()["data"]["replies"]]
+    assert preview_ids + rest == reply_ids
+
+
+@pytest.mark.asyncio
+async def test_replies_of_reply_returns_404(client: AsyncClient, fake):
+    """대댓글 ID로 대댓글 목록을 조회하면 404를 반환한다."""
+    # Arrange
+    user = await create_verified_user(client, fake)
+    post = await create_test_post(client, user["headers"])
+    post_id = post["post_id"]
+    parent_id = (await create_test_comment(client, user["headers"], post_id))["comment_id"]
+    reply = await create_test_comment(client, user["headers"], post_id, parent_id=parent_id)
+
+    # Act
+    res = await client.get(f"/v1/posts/{post_id}/comments/{reply['comment_id']}/replies")
+
+    # Assert
+    assert res.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_deleted_reply_decrements_replies_count(client: AsyncClient, fake):
+    """대댓글을 삭제하면 부모 댓글의 replies_count가 줄고, 대댓글이 모두 지워진 삭제 댓글은 숨겨진다."""
+    # Arrange
+    user = await create_verified_user(client, fake)
+    post = await create_test_post(client, user["headers"])
+    post_id = post["post_id"]
+    parent_id = (await create_test_comment(client, user["headers"], post_id))["comment_id"]
+    reply = await create_test_comment(client, user["headers"], post_id, parent_id=parent_id)
+    await client.delete(f"/v1/posts/{post_id}/comments/{parent_id}", headers=user["headers"])
+
+    before = await client.get(f"/v1/posts/{post_id}/comments")
+    root = next(c for c in before.json()["data"]["comments"] if c["comment_id"] == parent_id)
+    assert root["is_deleted"] is True
+    assert root["replies_count"] == 1
+
+    # Act
+    await client.delete(f"/v1/posts/{post_id}/comments/{reply['comment_id']}", headers=user["headers"])
+    after = await client.get(f"/v1/posts/{post_id}/comments")
+
+    # Assert
+    assert parent_id not in [c["comment_id"] for c in after.json()["data"]["comments"]]
@@ -1,9 +1,17 @@
 import os
 import sys
+import tempfile
+from typing import Any
 
 # 테스트 환경 변수 설정 — 이중 게이트: TESTING + DEBUG 모두 필요
 os.environ["TESTING"] = "true"
 os.environ["DEBUG"] = "true"
+# 테스트는 user 행을 SQL로 직접 수정하므로(정지/인증/권한) 프로세스 사용자 캐시를 끔
+os.environ.setdefault("PRINCIPAL_CACHE_TTL_SECONDS", "0")
+# 검색 색인은 테스트 프로세스 전용 임시 파일에 만듦
+os.environ.setdefault(
+    "SEARCH_INDEX_PATH", os.path.join(tempfile.gettempdir(), f"search-index-test-{os.getpid()}.sqlite3")
+)
 
 import aiomysql
 import pytest
@@ -12,7 +20,18 @@ from faker import Faker
 from httpx import ASGITransport, AsyncClient
 
 from core.database.connection import close_db, get_connection, init_db
+from core.jobs import get_job_queue
+from core.jobs.worker import drain
+from core.search import get_search_index, search_syncer
+from core.utils.block_cache import block_cache
+from core.utils.count_strategy import count_cache
+from core.utils.read_state import read_state
+from core.utils.response_cache import response_cache
+from core.utils.view_counter import view_counter
 from main import app
+from modules.post.feed_service import clear_candidate_cache
+from modules.post.poll_tally import poll_pusher, poll_snapshots
+from modules.reputation.service import definition_cache
 
 # ---------------------------------------------------------------------------
 # 데이터 초기화
@@ -20,10 +39,12 @@ from main import app
 
 
 async def clear_all_data() -> None:
-    """테스트용 헬퍼: 36개 테이블 전체 TRUNCATE + 시드 데이터 재삽입."""
+    """테스트용 헬퍼: 40개 테이블 전체 TRUNCATE + 시드 데이터 재삽입."""
     async with get_connection() as conn, conn.cursor(aiomysql.DictCursor) as cur:
         await cur.execute("SET FOREIGN_KEY_CHECKS = 0")
         # 평판 시스템 테이블 (자식 우선)
+        await cur.execute("TRUNCATE TABLE job_dead_letter")
+        await cur.execute("TRUNCATE TABLE user_badge_progress")
         await cur.execute("TRUNCATE TABLE user_badge")
         await cur.execute("TRUNCATE TABLE reputation_event")
         await cur.execute("TRUNCATE TABLE user_daily_visit")
@@ -33,6 +54,11 @@ async def clear_all_data() -> None:
         await cur.execute("TRUNCATE TABLE wiki_page")
         await cur.execute("TRUNCATE TABLE package_review")
         await cur.execute("TRUNCATE TABLE package")
+        await cur.execute("TRUNCATE TABLE feed_recompute_checkpoint")
+        await cur.execute("TRUNCATE TABLE search_outbox")
+        await cur.execute("TRUNCATE TABLE post_related")
+        await cur.execute("TRUNCATE TABLE user_affinity_weight")
+        await cur.execute("TRUNCATE TABLE affinity_event_applied")
         await cur.execute("TRUNCATE TABLE user_post_score")
         await cur.execute("TRUNCATE TABLE dm_message")
         await cur.execute("TRUNCATE TABLE dm_conversation")
@@ -136,15 +162,45 @@ async def db():
     await init_db()
     try:
         await clear_all_data()
+        count_cache.clear()
+        block_cache.clear()
+        read_state.clear()
+        poll_snapshots.clear()
+        response_cache.clear()
+        view_counter.clear()
+        definition_cache.clear()
+        clear_candidate_cache()
+        get_job_queue().clear()  # type: ignore[attr-defined]  # 테스트는 memory 백엔드
+        search_index = get_search_index()
+        if search_index is not None:
+            await search_index.clear()
         yield
     finally:
+        await poll_pusher.close()
         await close_db()
 
 
+class DrainingTransport(ASGITransport):
+    """응답마다 적재된 잡을 모두 처리하고 조회수 버퍼와 검색 색인 변경을 반영하는 ASGITransport.
+
+    테스트에서는 lifespan(in-process 워커, 조회수 flush/검색 색인 동기화 태스크)이 실행되지 않으므로,
+    요청 직후 큐와 버퍼를 비워 알림/평판/조회수/검색 같은 후속 처리를 다음 요청 전에 결정적으로 반영한다.
+    """
+
+    async def handle_async_request(self, request):
+        response = await super().handle_async_request(request)
+        await drain(get_job_queue())
+        await view_counter.flush()
+        search_index = get_search_index()
+        if search_index is not None:
+            await search_syncer.sync(search_index)
+        return response
+
+
 @pytest_asyncio.fixture
 async def client(db):
     """API 테스트를 위한 Async Client."""
-    transport = ASGITransport(app=app)
+    transport = DrainingTransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
@@ -154,6 +210,70 @@ def fake():
     return Faker("ko_KR")
 
 
+class FakeRedis:
+    """캐시/읽음 상태 단위 테스트용 인메모리 Redis (MGET/SET/SETBIT과 INCR·EXPIRE·EXISTS·GETBIT·SETBIT·SET 파이프라인)."""
+
+    def __init__(self):
+        self.data: dict[str, Any] = {}
+        self.bits: dict[str, set[int]] = {}
+
+    async def mget(self, *keys):
+        return [self.data.get(k) for k in keys]
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def setbit(self, key, offset, value):
+        self.bits.setdefault(key, set()).add(offset)
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    """명령을 모았다가 execute()에서 순서대로 실행합니다."""
+
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.ops: list = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def incr(self, key):
+        def run():
+            self.redis.data[key] = str(int(self.redis.data.get(key, 0)) + 1)
+            return int(self.redis.data[key])
+
+        self.ops.append(run)
+
+    def expire(self, key, seconds):
+        self.ops.append(lambda: key in self.redis.data)
+
+    def exists(self, key):
+        self.ops.append(lambda: int(key in self.redis.data))
+
+    def getbit(self, key, offset):
+        self.ops.append(lambda: int(offset in self.redis.bits.get(key, ())))
+
+    def setbit(self, key, offset, value):
+        self.ops.append(lambda: self.redis.bits.setdefault(key, set()).add(offset))
+
+    def set(self, key, value):
+        self.ops.append(lambda: self.redis.data.__setitem__(key, value))
+
+    async def execute(self):
+        return [op() for op in self.ops]
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
 # ---------------------------------------------------------------------------
 # 페이로드 생성 헬퍼
 # ---------------------------------------------------------------------------
@@ -209,7 +329,7 @@ async def create_verified_user(client: AsyncClient, fake: Faker, **overrides) ->
     headers = {"Authorization": f"Bearer {access_token}"}
 
     # Bearer Token이 설정된 새 클라이언트 생성
-    transport = ASGITransport(app=app)
+    transport = DrainingTransport(app=app)
     auth_client = AsyncClient(
         transport=transport,
         base_url="http://test",
@@ -312,7 +432,7 @@ async def authorized_user(client, user_payload):
     user_info = login_data["data"]["user"]
 
     # Bearer Token이 설정된 새 클라이언트 생성
-    transport = ASGITransport(app=app)
+    transport = DrainingTransport(app=app)
     auth_client = AsyncClient(
         transport=transport,
         base_url="http://test",
@@ -359,7 +479,7 @@ async def unverified_user(client, second_user_payload):
     user_info = login_data["data"]["user"]
 
     # Bearer Token이 설정된 새 클라이언트 생성
-    transport = ASGITransport(app=app)
+    transport = DrainingTransport(app=app)
     auth_client = AsyncClient(
         transport=transport,
         base_url="http://test",
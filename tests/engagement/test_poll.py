@@ -571,3 +571,28 @@ async def test_change_vote_preserves_total_votes(client: AsyncClient, fake):
     opt_map = {opt["option_id"]: opt["vote_count"] for opt in poll["options"]}
     assert opt_map[option_0] == 1
     assert opt_map[option_1] == 1
+
+
+@pytest.mark.asyncio
+async def test_vote_counters_follow_cancel_and_same_option_change(client: AsyncClient, fake):
+    """같은 옵션으로 변경하면 수가 그대로이고, 취소하면 선택지 투표 수가 줄어든다."""
+    # Arrange
+    user = await create_verified_user(client, fake)
+    post_data = await _create_post_with_poll(client, user["headers"])
+    post_id = post_data["post_id"]
+    option_0 = await _get_poll_option_id(client, user["headers"], post_id, index=0)
+    await client.post(f"/v1/posts/{post_id}/poll/vote", json={"option_id": option_0}, headers=user["headers"])
+
+    # Act
+    same = await client.put(f"/v1/posts/{post_id}/poll/vote", json={"option_id": option_0}, headers=user["headers"])
+    after_same = (await client.get(f"/v1/posts/{post_id}", headers=user["headers"])).json()["data"]["post"]["poll"]
+    await client.request("DELETE", f"/v1/posts/{post_id}/poll/vote", headers=user["headers"])
+    after_cancel = (await client.get(f"/v1/posts/{post_id}", headers=user["headers"])).json()["data"]["post"]["poll"]
+
+    # Assert
+    assert same.status_code == 200
+    assert after_same["total_votes"] == 1
+    assert after_same["my_vote"] == option_0
+    assert after_cancel["total_votes"] == 0
+    assert after_cancel["my_vote"] is None
+    assert all(opt["vote_count"] == 0 for opt in after_cancel["options"])
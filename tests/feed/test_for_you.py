@@ -7,6 +7,8 @@ user_post_score가 없으면 latest로 폴백하는 동작이 주요 테스트 
 import pytest
 
 from core.database.connection import get_connection
+from modules.post.affinity_scorer import SIGNAL_WEIGHTS
+from modules.post.jobs import affinity_event_job, handle_affinity_event
 from tests.conftest import create_test_post, create_verified_user
 
 
@@ -108,3 +110,94 @@ async def test_for_you_with_scores_uses_score_ordering(client, fake):
     idx_high = post_ids.index(post_high["post_id"])
     idx_low = post_ids.index(post_low["post_id"])
     assert idx_high < idx_low
+
+
+@pytest.mark.asyncio
+async def test_like_updates_affinity_and_reranks_immediately(client, fake):
+    """좋아요 직후 배치 없이 친화도 가중치와 추천 점수가 갱신된다."""
+    author = await create_verified_user(client, fake)
+    reader = await create_verified_user(client, fake)
+    liked = await create_test_post(client, author["headers"], title="좋아요할 게시글")
+    other = await create_test_post(client, author["headers"], title="같은 작성자의 다른 게시글")
+
+    res = await client.post(f"/v1/posts/{liked['post_id']}/likes", headers=reader["headers"])
+    assert res.status_code == 201
+
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.execute(
+            "SELECT weight FROM user_affinity_weight WHERE user_id = %s AND kind = 'author' AND key_id = %s",
+            (reader["user_id"], author["user_id"]),
+        )
+        assert (await cur.fetchone())[0] > 0
+        await cur.execute("SELECT post_id FROM user_post_score WHERE user_id = %s", (reader["user_id"],))
+        scored_ids = {row[0] for row in await cur.fetchall()}
+    assert {liked["post_id"], other["post_id"]} <= scored_ids
+
+
+@pytest.mark.asyncio
+async def test_unfollow_subtracts_only_follow_affinity(client, fake):
+    """언팔로우는 팔로우 몫만 빼고, 같은 작성자 글에 누른 좋아요의 작성자 가중치는 유지한다."""
+    author = await create_verified_user(client, fake)
+    reader = await create_verified_user(client, fake)
+    post = await create_test_post(client, author["headers"])
+
+    assert (await client.post(f"/v1/posts/{post['post_id']}/likes", headers=reader["headers"])).status_code == 201
+    assert (await client.post(f"/v1/users/{author['user_id']}/follow", headers=reader["headers"])).status_code == 201
+    assert (await client.delete(f"/v1/users/{author['user_id']}/follow", headers=reader["headers"])).status_code == 200
+
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.execute(
+            "SELECT weight FROM user_affinity_weight WHERE user_id = %s AND kind = 'author' AND key_id = %s",
+            (reader["user_id"], author["user_id"]),
+        )
+        weight = (await cur.fetchone())[0]
+    assert weight == pytest.approx(SIGNAL_WEIGHTS["liked_author"], rel=0.01)
+
+
+@pytest.mark.asyncio
+async def test_redelivered_affinity_event_is_applied_once(client, fake):
+    """같은 event_id의 잡이 재전달되어도 친화도 가중치는 한 번만 반영된다."""
+    author = await create_verified_user(client, fake)
+    reader = await create_verified_user(client, fake)
+    post = await create_test_post(client, author["headers"])
+    assert (await client.post(f"/v1/posts/{post['post_id']}/likes", headers=reader["headers"])).status_code == 201
+
+    _, payload = affinity_event_job(reader["user_id"], "bookmark", post_id=post["post_id"])
+    await handle_affinity_event(payload)
+    await handle_affinity_event(payload)
+
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.execute(
+            "SELECT weight FROM user_affinity_weight WHERE user_id = %s AND kind = 'author' AND key_id = %s",
+            (reader["user_id"], author["user_id"]),
+        )
+        weight = (await cur.fetchone())[0]
+    expected = SIGNAL_WEIGHTS["liked_author"] + SIGNAL_WEIGHTS["bookmarked_author"]
+    assert weight == pytest.approx(expected, rel=0.01)
+
+
+@pytest.mark.asyncio
+async def test_for_you_diversity_cap_carries_capped_posts_to_next_page(client, fake):
+    """작성자당 상한으로 잘린 게시글은 버려지지 않고 다음 페이지(next_cursor)에서 이어서 나온다."""
+    author = await create_verified_user(client, fake)
+    reader = await create_verified_user(client, fake)
+    posts = [await create_test_post(client, author["headers"], title=f"같은 작성자 {i}") for i in range(5)]
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.executemany(
+            "INSERT INTO user_post_score (user_id, post_id, combined_score) VALUES (%s, %s, %s)",
+            [(reader["user_id"], post["post_id"], 100.0 - i) for i, post in enumerate(posts)],
+        )
+    params = {"sort": "for_you", "author_id": author["user_id"], "limit": 10}
+
+    res = await client.get("/v1/posts/", params=params, headers=reader["headers"])
+    first = res.json()["data"]
+    res = await client.get(
+        "/v1/posts/", params={**params, "cursor": first["pagination"]["next_cursor"]}, headers=reader["headers"]
+    )
+    second = res.json()["data"]
+
+    expected = [post["post_id"] for post in posts]
+    assert [p["post_id"] for p in first["posts"]] == expected[:3]
+    assert first["pagination"]["has_more"] is True
+    assert [p["post_id"] for p in second["posts"]] == expected[3:]
+    assert second["pagination"]["next_cursor"] is None
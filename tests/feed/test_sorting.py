@@ -130,6 +130,28 @@ async def test_sort_by_hot(client, fake):
     assert len(data["posts"]) > 0
 
 
+@pytest.mark.asyncio
+async def test_sort_by_hot_reflects_like_immediately(client, fake):
+    """hot 정렬: 좋아요 직후 저장된 hot_score가 갱신되어 오래된 인기글이 새 글보다 먼저 반환된다."""
+    user1 = await create_verified_user(client, fake)
+    user2 = await create_verified_user(client, fake)
+
+    post_liked = await create_test_post(client, user1["headers"], title="먼저 쓴 인기글")
+    post_new = await create_test_post(client, user1["headers"], title="나중에 쓴 글")
+
+    like_res = await client.post(
+        f"/v1/posts/{post_liked['post_id']}/likes",
+        headers=user2["headers"],
+    )
+    assert like_res.status_code == 201
+
+    res = await client.get("/v1/posts/", params={"sort": "hot"})
+    assert res.status_code == 200
+
+    post_ids = [p["post_id"] for p in res.json()["data"]["posts"]]
+    assert post_ids.index(post_liked["post_id"]) < post_ids.index(post_new["post_id"])
+
+
 @pytest.mark.asyncio
 async def test_invalid_sort_falls_back_to_latest(client, fake):
     """유효하지 않은 정렬 옵션은 latest로 폴백한다."""
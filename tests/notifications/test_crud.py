@@ -156,6 +156,30 @@ async def test_list_notifications_with_pagination(client, two_users_with_post):
     assert len(data2["notifications"]) >= 1
 
 
+@pytest.mark.asyncio
+async def test_list_notifications_with_cursor(client, two_users_with_post):
+    """next_cursor로 이어서 조회하면 중복 없이 다음 알림을 반환한다."""
+    # Arrange
+    author = two_users_with_post["author"]
+    other = two_users_with_post["other"]
+    post_id = two_users_with_post["post"]["post_id"]
+    for i in range(3):
+        await create_test_comment(client, other["headers"], post_id, content=f"커서 테스트 댓글 {i}")
+
+    # Act
+    res1 = await client.get("/v1/notifications/?limit=2", headers=author["headers"])
+    cursor = res1.json()["data"]["pagination"]["next_cursor"]
+    res2 = await client.get("/v1/notifications/", params={"limit": 2, "cursor": cursor}, headers=author["headers"])
+
+    # Assert
+    assert cursor is not None
+    assert res2.status_code == 200
+    first_ids = {n["notification_id"] for n in res1.json()["data"]["notifications"]}
+    second_ids = {n["notification_id"] for n in res2.json()["data"]["notifications"]}
+    assert len(second_ids) >= 1
+    assert first_ids.isdisjoint(second_ids)
+
+
 # ==========================================
 # 삭제
 # ==========================================
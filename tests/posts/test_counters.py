@@ -0,0 +1,155 @@
+"""Posts 도메인 — 비정규화 카운터(likes_count/comments_count/bookmarks_count) 테스트."""
+
+import pytest
+from httpx import AsyncClient
+
+from core.database.connection import get_connection
+from tests.conftest import create_test_comment, create_test_post, create_verified_user
+
+INTERNAL_KEY = "test-internal-key-12345"
+
+
+async def _find_post(client: AsyncClient, post_id: int) -> dict:
+    """목록 응답에서 특정 게시글을 찾는다."""
+    res = await client.get("/v1/posts/", params={"limit": 50})
+    assert res.status_code == 200
+    return next(p for p in res.json()["data"]["posts"] if p["post_id"] == post_id)
+
+
+# ---------------------------------------------------------------------------
+# 쓰기 경로 증감
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_like_and_unlike_update_likes_count(client: AsyncClient, fake):
+    """좋아요/취소 시 목록의 likes_count가 즉시 반영된다."""
+    # Arrange
+    author = await create_verified_user(client, fake)
+    liker = await create_verified_user(client, fake)
+    post = await create_test_post(client, author["headers"])
+    post_id = post["post_id"]
+
+    # Act & Assert — 좋아요
+    res = await client.post(f"/v1/posts/{post_id}/likes", headers=liker["headers"])
+    assert res.status_code == 201
+    assert res.json()["data"]["likes_count"] == 1
+    assert (await _find_post(client, post_id))["likes_count"] == 1
+
+    # Act & Assert — 취소
+    res = await client.delete(f"/v1/posts/{post_id}/likes", headers=liker["headers"])
+    assert res.status_code == 200
+    assert res.json()["data"]["likes_count"] == 0
+    assert (await _find_post(client, post_id))["likes_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_comment_create_and_delete_update_comments_count(client: AsyncClient, fake):
+    """댓글 작성/삭제 시 comments_count가 증감한다."""
+    # Arrange
+    user = await create_verified_user(client, fake)
+    post = await create_test_post(client, user["headers"])
+    post_id = post["post_id"]
+
+    # Act
+    comment = await create_test_comment(client, user["headers"], post_id)
+    await create_test_comment(client, user["headers"], post_id)
+    assert (await _find_post(client, post_id))["comments_count"] == 2
+
+    res = await client.delete(
+        f"/v1/posts/{post_id}/comments/{comment['comment_id']}",
+        headers=user["headers"],
+    )
+
+    # Assert
+    assert res.status_code == 200
+    assert (await _find_post(client, post_id))["comments_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bookmark_updates_bookmarks_count(client: AsyncClient, fake):
+    """북마크 추가/해제 시 bookmarks_count가 증감한다."""
+    # Arrange
+    author = await create_verified_user(client, fake)
+    other = await create_verified_user(client, fake)
+    post = await create_test_post(client, author["headers"])
+    post_id = post["post_id"]
+
+    # Act & Assert
+    await client.post(f"/v1/posts/{post_id}/bookmark", headers=other["headers"])
+    assert (await _find_post(client, post_id))["bookmarks_count"] == 1
+
+    await client.delete(f"/v1/posts/{post_id}/bookmark", headers=other["headers"])
+    assert (await _find_post(client, post_id))["bookmarks_count"] == 0
+
+
+# ---------------------------------------------------------------------------
+# 드리프트 복구
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_reconcile_repairs_counter_drift(client: AsyncClient, fake, monkeypatch):
+    """reconcile 엔드포인트가 어긋난 카운터를 원본 테이블 기준으로 복구한다."""
+    # Arrange
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "INTERNAL_API_KEY", INTERNAL_KEY)
+    author = await create_verified_user(client, fake)
+    liker = await create_verified_user(client, fake)
+    post = await create_test_post(client, author["headers"])
+    post_id = post["post_id"]
+    await client.post(f"/v1/posts/{post_id}/likes", headers=liker["headers"])
+
+    # 카운터를 강제로 어긋나게 만듦
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.execute(
+            "UPDATE post SET likes_count = 42, comments_count = 7 WHERE id = %s",
+            (post_id,),
+        )
+
+    # Act
+    res = await client.post(
+        "/v1/admin/reconcile/post-counters",
+        headers={"X-Internal-Key": INTERNAL_KEY},
+    )
+
+    # Assert
+    assert res.status_code == 200
+    assert res.json()["data"]["posts_repaired"] == 1
+    target = await _find_post(client, post_id)
+    assert target["likes_count"] == 1
+    assert target["comments_count"] == 0
+
+
+# ---------------------------------------------------------------------------
+# 조회수 write-behind
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_buffered_views_flush_once_per_user_per_day(client: AsyncClient, fake, monkeypatch):
+    """버퍼링된 조회는 flush 시 사용자당 하루 1회만 반영되고, 중복 제거 상태를 잃어도 두 번 세지 않는다."""
+    # Arrange
+    from core.config import settings
+    from core.utils.view_counter import view_counter
+
+    monkeypatch.setattr(settings, "VIEW_COUNTER_BACKEND", "memory")
+    author = await create_verified_user(client, fake)
+    viewer = await create_verified_user(client, fake)
+    post_id = (await create_test_post(client, author["headers"]))["post_id"]
+
+    # Act — 같은 사용자가 두 번 조회, 중간에 프로세스 재시작처럼 중복 제거 상태를 비움
+    first = await client.get(f"/v1/posts/{post_id}", headers=viewer["headers"])
+    view_counter.clear()
+    await client.get(f"/v1/posts/{post_id}", headers=viewer["headers"])
+
+    # Assert
+    assert first.json()["data"]["post"]["views_count"] == 1
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.execute("SELECT views FROM post WHERE id = %s", (post_id,))
+        (views,) = await cur.fetchone()
+        await cur.execute("SELECT COUNT(*) FROM post_view_log WHERE post_id = %s", (post_id,))
+        (log_rows,) = await cur.fetchone()
+    assert views == 1
+    assert log_rows == 1
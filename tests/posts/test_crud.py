@@ -3,6 +3,7 @@
 import pytest
 from httpx import AsyncClient
 
+from core.utils import conditional_get
 from tests.conftest import create_test_post, create_verified_user
 
 # ---------------------------------------------------------------------------
@@ -194,3 +195,32 @@ async def test_delete_other_user_post_returns_403(client: AsyncClient, fake):
     res = await client.delete(f"/v1/posts/{post_id}", headers=user2["headers"])
 
     assert res.status_code == 403
+
+
+# ---------------------------------------------------------------------------
+# 조건부 GET (ETag)
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_post_detail_etag_returns_304_until_updated(client: AsyncClient, fake, monkeypatch):
+    """같은 ETag로 다시 조회하면 304, 게시글이 수정되면 새 ETag와 200을 반환한다."""
+    # Arrange — 단일 프로세스 테스트에서는 로컬 버전을 공유 버전처럼 사용
+    monkeypatch.setattr(conditional_get, "_versions_are_shared", lambda: True)
+    user = await create_verified_user(client, fake)
+    post = await create_test_post(client, user["headers"])
+    post_id = post["post_id"]
+    first = await client.get(f"/v1/posts/{post_id}")
+    etag = first.headers["etag"]
+
+    # Act
+    revalidated = await client.get(f"/v1/posts/{post_id}", headers={"If-None-Match": etag})
+    await client.patch(f"/v1/posts/{post_id}", json={"title": "수정된 제목입니다"}, headers=user["headers"])
+    after_update = await client.get(f"/v1/posts/{post_id}", headers={"If-None-Match": etag})
+
+    # Assert
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert after_update.status_code == 200
+    assert after_update.headers["etag"] != etag
+    assert after_update.json()["data"]["post"]["title"] == "수정된 제목입니다"
@@ -109,6 +109,20 @@ async def test_list_posts_search_by_content(client: AsyncClient, fake):
     assert len(posts) >= 1
 
 
+@pytest.mark.asyncio
+async def test_list_posts_search_relevance_with_snippet(client: AsyncClient, fake):
+    """sort=relevance는 제목 일치를 앞에 두고, 각 항목에 검색어를 강조한 스니펫을 포함한다."""
+    user = await create_verified_user(client, fake)
+    body_match = await create_test_post(client, user["headers"], title="배포판 후기", content="리눅스커널 빌드 후기")
+    title_match = await create_test_post(client, user["headers"], title="리눅스커널 튜닝", content="sysctl 설정 정리")
+
+    res = await client.get("/v1/posts/", params={"search": "눅스커널", "sort": "relevance"})
+    assert res.status_code == 200
+    posts = res.json()["data"]["posts"]
+    assert [p["post_id"] for p in posts] == [title_match["post_id"], body_match["post_id"]]
+    assert "<mark>눅스커널</mark>" in posts[1]["snippet"]
+
+
 @pytest.mark.asyncio
 async def test_list_posts_search_special_characters(client: AsyncClient, fake):
     """특수문자가 포함된 검색어로도 에러 없이 조회된다."""
@@ -173,6 +187,97 @@ async def test_list_posts_sort_invalid_falls_back_to_latest(client: AsyncClient,
     assert res.status_code == 200
 
 
+# ---------------------------------------------------------------------------
+# 커서(키셋) 페이지네이션
+# ---------------------------------------------------------------------------
+
+
+async def _collect_pages(client: AsyncClient, params: dict) -> list[int]:
+    """next_cursor를 따라가며 모든 페이지의 post_id를 수집한다."""
+    res = await client.get("/v1/posts/", params=params)
+    assert res.status_code == 200
+    data = res.json()["data"]
+    post_ids = [p["post_id"] for p in data["posts"]]
+    while data["pagination"]["next_cursor"]:
+        res = await client.get("/v1/posts/", params={**params, "cursor": data["pagination"]["next_cursor"]})
+        assert res.status_code == 200
+        data = res.json()["data"]
+        post_ids.extend(p["post_id"] for p in data["posts"])
+    return post_ids
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort", ["latest", "likes", "views", "comments", "hot"])
+async def test_list_posts_cursor_matches_offset_order(client: AsyncClient, fake, sort):
+    """next_cursor를 따라간 결과가 offset 단건 조회와 같은 순서·중복 없이 전체를 반환한다."""
+    # Arrange — 같은 초에 생성되어 created_at이 같은 게시글도 id로 구분되어야 함
+    user = await create_verified_user(client, fake)
+    for i in range(5):
+        await create_test_post(client, user["headers"], title=f"커서 테스트 {i}")
+    params = {"author_id": user["user_id"], "sort": sort, "limit": 2}
+
+    # Act
+    cursor_ids = await _collect_pages(client, params)
+    res = await client.get("/v1/posts/", params={**params, "limit": 10})
+
+    # Assert
+    assert cursor_ids == [p["post_id"] for p in res.json()["data"]["posts"]]
+    assert len(set(cursor_ids)) == 5
+
+
+@pytest.mark.asyncio
+async def test_list_posts_cursor_last_page_has_no_next_cursor(client: AsyncClient, fake):
+    """마지막 페이지에서는 has_more=False, next_cursor=None을 반환한다."""
+    user = await create_verified_user(client, fake)
+    for _ in range(2):
+        await create_test_post(client, user["headers"])
+
+    res = await client.get("/v1/posts/", params={"author_id": user["user_id"], "limit": 5})
+
+    pagination = res.json()["data"]["pagination"]
+    assert pagination["has_more"] is False
+    assert pagination["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_posts_invalid_cursor_returns_400(client: AsyncClient, fake):
+    """변조되었거나 다른 정렬에서 발급된 커서는 400을 반환한다."""
+    user = await create_verified_user(client, fake)
+    for _ in range(3):
+        await create_test_post(client, user["headers"])
+    res = await client.get("/v1/posts/", params={"author_id": user["user_id"], "limit": 1, "sort": "likes"})
+    likes_cursor = res.json()["data"]["pagination"]["next_cursor"]
+
+    res_garbage = await client.get("/v1/posts/", params={"cursor": "not-a-cursor"})
+    res_mismatch = await client.get("/v1/posts/", params={"cursor": likes_cursor, "sort": "latest"})
+
+    assert res_garbage.status_code == 400
+    assert res_mismatch.status_code == 400
+    assert res_mismatch.json()["detail"]["error"] == "invalid_cursor"
+
+
+@pytest.mark.asyncio
+async def test_list_posts_has_more_strategy_skips_total_count(client: AsyncClient, fake, monkeypatch):
+    """COUNT_STRATEGY_POSTS=has_more면 total_count 없이 limit+1 조회로 has_more를 판단한다."""
+    # Arrange
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "COUNT_STRATEGY_POSTS", "has_more")
+    user = await create_verified_user(client, fake)
+    for _ in range(3):
+        await create_test_post(client, user["headers"])
+    params = {"author_id": user["user_id"], "limit": 2}
+
+    # Act
+    first = (await client.get("/v1/posts/", params=params)).json()["data"]["pagination"]
+    last = (await client.get("/v1/posts/", params={**params, "offset": 2})).json()["data"]["pagination"]
+
+    # Assert
+    assert first["total_count"] is None
+    assert first["has_more"] is True
+    assert last["has_more"] is False
+
+
 # ---------------------------------------------------------------------------
 # 차단 사용자 필터
 # ---------------------------------------------------------------------------
@@ -197,3 +302,25 @@ async def test_list_posts_excludes_blocked_users(client: AsyncClient, fake):
     assert res.status_code == 200
     post_ids = [p["post_id"] for p in res.json()["data"]["posts"]]
     assert blocked_post_id not in post_ids
+
+
+@pytest.mark.asyncio
+async def test_list_posts_block_changes_apply_despite_cached_block_list(client: AsyncClient, fake):
+    """차단 목록이 캐시된 뒤에도 차단/차단 해제 직후 목록과 total_count에 반영된다."""
+    user1 = await create_verified_user(client, fake)
+    user2 = await create_verified_user(client, fake)
+    post = await create_test_post(client, user2["headers"], title="캐시 차단 게시글")
+
+    # 차단 전 조회로 빈 차단 목록과 COUNT를 캐시
+    res = await client.get("/v1/posts/", headers=user1["headers"])
+    assert post["post_id"] in [p["post_id"] for p in res.json()["data"]["posts"]]
+
+    await client.post(f"/v1/users/{user2['user_id']}/block", headers=user1["headers"])
+    res = await client.get("/v1/posts/", headers=user1["headers"])
+    data = res.json()["data"]
+    assert post["post_id"] not in [p["post_id"] for p in data["posts"]]
+    assert data["pagination"]["total_count"] == 0
+
+    await client.delete(f"/v1/users/{user2['user_id']}/block", headers=user1["headers"])
+    res = await client.get("/v1/posts/", headers=user1["headers"])
+    assert post["post_id"] in [p["post_id"] for p in res.json()["data"]["posts"]]
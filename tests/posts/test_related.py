@@ -122,3 +122,31 @@ async def test_related_posts_excludes_self(client: AsyncClient, fake):
 
     post_ids = [p["post_id"] for p in res.json()["data"]["posts"]]
     assert base["post_id"] not in post_ids
+
+
+# ---------------------------------------------------------------------------
+# 연관 게시글 색인 갱신
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_related_posts_refresh_on_tag_change_and_delete(client: AsyncClient, fake):
+    """태그를 바꾸거나 게시글을 삭제하면 미리 계산된 연관 목록이 갱신된다."""
+    user = await create_verified_user(client, fake)
+
+    base = await create_test_post(client, user["headers"], title="색인 기준 게시글", tags=["kernel"])
+    other = await create_test_post(client, user["headers"], title="색인 다른 게시글", tags=["desktop"])
+    related = await create_test_post(client, user["headers"], title="색인 관련 게시글", tags=["kernel"])
+
+    res = await client.get(f"/v1/posts/{base['post_id']}/related?limit=1")
+    assert [p["post_id"] for p in res.json()["data"]["posts"]] == [related["post_id"]]
+
+    # other가 기준 게시글과 같은 태그 두 개를 갖게 되면 유사도가 더 높아 1순위가 됨
+    await client.patch(f"/v1/posts/{base['post_id']}", json={"tags": ["kernel", "desktop"]}, headers=user["headers"])
+    await client.patch(f"/v1/posts/{other['post_id']}", json={"tags": ["kernel", "desktop"]}, headers=user["headers"])
+    res = await client.get(f"/v1/posts/{base['post_id']}/related?limit=1")
+    assert [p["post_id"] for p in res.json()["data"]["posts"]] == [other["post_id"]]
+
+    await client.delete(f"/v1/posts/{other['post_id']}", headers=user["headers"])
+    res = await client.get(f"/v1/posts/{base['post_id']}/related?limit=1")
+    assert [p["post_id"] for p in res.json()["data"]["posts"]] == [related["post_id"]]
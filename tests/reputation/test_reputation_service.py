@@ -3,8 +3,10 @@
 import pytest
 from httpx import AsyncClient
 
+from core.database.connection import get_connection
 from modules.reputation import models as rep_models
-from modules.reputation.service import ReputationService
+from modules.reputation.jobs import award_job, handle_award
+from modules.reputation.service import ReputationEvent, ReputationRevocation, ReputationService, _DefinitionCache
 from tests.conftest import create_test_post, create_verified_user
 
 # ---------------------------------------------------------------------------
@@ -262,3 +264,172 @@ async def test_award_points_creates_event_record(client: AsyncClient, fake):
     history = await rep_models.get_reputation_history(user_id)
     event_types = [e["event_type"] for e in history]
     assert "wiki_created" in event_types
+
+
+# ---------------------------------------------------------------------------
+# 파이프라인: 묶음 처리 / 증분 카운터 / 정의 캐시
+# ---------------------------------------------------------------------------
+
+
+async def _progress_value(user_id: int, trigger_type: str) -> int | None:
+    """user_badge_progress 카운터 값을 조회한다 (행이 없으면 None)."""
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.execute(
+            "SELECT value FROM user_badge_progress WHERE user_id = %s AND trigger_type = %s",
+            (user_id, trigger_type),
+        )
+        row = await cur.fetchone()
+        return row[0] if row else None
+
+
+@pytest.mark.asyncio
+async def test_like_post_awards_author_and_liker(client: AsyncClient, fake):
+    """게시글 좋아요 시 작성자(+10)와 누른 사람(+1, First Like 보너스 +2)이 한 번에 반영된다."""
+    # Arrange
+    author = await create_verified_user(client, fake)
+    liker = await create_verified_user(client, fake)
+    post = await create_test_post(client, author["headers"])
+    author_score_before = await rep_models.get_user_reputation_score(author["user_id"])
+
+    # Act
+    res = await client.post(f"/v1/posts/{post['post_id']}/likes", headers=liker["headers"])
+
+    # Assert
+    assert res.status_code == 201
+    assert await rep_models.get_user_reputation_score(author["user_id"]) == author_score_before + 10
+    assert await rep_models.get_user_reputation_score(liker["user_id"]) == 1 + 2
+    badge_names = [b["name"] for b in await rep_models.get_user_badges(liker["user_id"])]
+    assert "First Like" in badge_names
+
+
+@pytest.mark.asyncio
+async def test_like_toggle_keeps_like_given_counter_consistent(client: AsyncClient, fake):
+    """좋아요/취소를 반복해도 like_given_count 카운터는 실제 좋아요 수와 같다."""
+    # Arrange
+    author = await create_verified_user(client, fake)
+    liker = await create_verified_user(client, fake)
+    post = await create_test_post(client, author["headers"])
+    url = f"/v1/posts/{post['post_id']}/likes"
+
+    # Act
+    for _ in range(3):
+        await client.post(url, headers=liker["headers"])
+        await client.delete(url, headers=liker["headers"])
+    await client.post(url, headers=liker["headers"])
+
+    # Assert
+    assert await _progress_value(liker["user_id"], "like_given_count") == 1
+
+
+@pytest.mark.asyncio
+async def test_create_delete_post_keeps_post_counter_consistent(client: AsyncClient, fake):
+    """게시글 작성/삭제를 반복해도 post_count 카운터는 삭제되지 않은 게시글 수와 같다."""
+    # Arrange
+    user = await create_verified_user(client, fake)
+    await create_test_post(client, user["headers"])
+
+    # Act
+    for _ in range(3):
+        post = await create_test_post(client, user["headers"])
+        res = await client.delete(f"/v1/posts/{post['post_id']}", headers=user["headers"])
+        assert res.status_code == 200
+
+    # Assert
+    assert await _progress_value(user["user_id"], "post_count") == 1
+
+
+@pytest.mark.asyncio
+async def test_counter_seeded_from_existing_rows(client: AsyncClient, fake):
+    """카운터 행이 없으면 첫 이벤트 시 원본 테이블 집계로 시드된다."""
+    # Arrange — 게시글 2개 작성 후 카운터 행 삭제 (마이그레이션 직후 상태)
+    user = await create_verified_user(client, fake)
+    await create_test_post(client, user["headers"])
+    await create_test_post(client, user["headers"])
+    async with get_connection() as conn, conn.cursor() as cur:
+        await cur.execute("DELETE FROM user_badge_progress WHERE user_id = %s", (user["user_id"],))
+
+    # Act
+    await ReputationService.evaluate_badges(user["user_id"], "post_created")
+
+    # Assert
+    assert await _progress_value(user["user_id"], "post_count") == 2
+
+
+@pytest.mark.asyncio
+async def test_award_job_redelivery_applies_once(client: AsyncClient, fake):
+    """같은 부여 잡이 다시 전달되어도 포인트와 카운터는 한 번만 반영된다."""
+    # Arrange — 좋아요 API가 부여 잡을 한 번 처리한 상태
+    author = await create_verified_user(client, fake)
+    liker = await create_verified_user(client, fake)
+    post = await create_test_post(client, author["headers"])
+    await client.post(f"/v1/posts/{post['post_id']}/likes", headers=liker["headers"])
+    author_score = await rep_models.get_user_reputation_score(author["user_id"])
+    payload = award_job(
+        [
+            ReputationEvent(author["user_id"], "post_liked", 10, liker["user_id"], "post", post["post_id"]),
+            ReputationEvent(liker["user_id"], "post_like_given", 1, None, "post", post["post_id"]),
+        ]
+    )[1]
+
+    # Act
+    await handle_award(payload)
+
+    # Assert
+    assert await rep_models.get_user_reputation_score(author["user_id"]) == author_score
+    assert await _progress_value(liker["user_id"], "like_given_count") == 1
+
+
+@pytest.mark.asyncio
+async def test_revoke_processed_before_award_cancels_it(client: AsyncClient, fake):
+    """좋아요 취소의 회수 잡이 부여 잡보다 먼저 처리되면, 뒤늦은 부여는 원본이 없어 건너뛴다."""
+    # Arrange — 좋아요 후 취소까지 끝났지만 평판 잡은 아직 처리되지 않은 상태
+    author = await create_verified_user(client, fake)
+    liker = await create_verified_user(client, fake)
+    post = await create_test_post(client, author["headers"])
+    author_score = await rep_models.get_user_reputation_score(author["user_id"])
+
+    # Act
+    await ReputationService.revoke_many(
+        [ReputationRevocation(author["user_id"], "post_liked", "post", post["post_id"], liker["user_id"])]
+    )
+    await handle_award(
+        award_job([ReputationEvent(author["user_id"], "post_liked", 10, liker["user_id"], "post", post["post_id"])])[1]
+    )
+
+    # Assert
+    assert await rep_models.get_user_reputation_score(author["user_id"]) == author_score
+
+
+@pytest.mark.asyncio
+async def test_award_many_skips_missing_user(client: AsyncClient, fake):
+    """user_id가 None인 이벤트(탈퇴한 작성자 등)는 건너뛴다."""
+    # Arrange
+    user = await create_verified_user(client, fake)
+
+    # Act
+    await ReputationService.award_many(
+        [
+            ReputationEvent(user_id=None, event_type="post_liked", points=10, source_type="post", source_id=1),
+            ReputationEvent(
+                user_id=user["user_id"], event_type="post_liked", points=10, source_type="post", source_id=1
+            ),
+        ]
+    )
+
+    # Assert
+    assert await rep_models.get_user_reputation_score(user["user_id"]) == 10
+
+
+def test_definition_cache_trust_level_for():
+    """캐시된 신뢰 등급 정의로 점수에 맞는 최고 레벨을 계산한다."""
+    cache = _DefinitionCache()
+    cache._trust_levels = [
+        {"level": 0, "min_reputation": 0},
+        {"level": 1, "min_reputation": 50},
+        {"level": 2, "min_reputation": 200},
+    ]
+
+    assert cache.trust_level_for(0) == 0
+    assert cache.trust_level_for(50) == 1
+    assert cache.trust_level_for(199) == 1
+    assert cache.trust_level_for(5000) == 2
@@ -3,8 +3,6 @@
 DB 없이 인메모리 Rate Limiter의 핵심 동작을 검증한다.
 """
 
-from datetime import datetime, timedelta
-
 import pytest
 
 from core.middleware.rate_limiter import is_valid_ip
@@ -67,17 +65,41 @@ async def test_resets_after_window():
     for _ in range(max_requests):
         await limiter.is_rate_limited("10.0.0.2", max_requests, window)
 
-    # Act — 윈도우 경과 시뮬레이션: 기존 타임스탬프를 과거로 변경
-    past = datetime.now() - timedelta(seconds=window + 1)
-    limiter._requests["10.0.0.2"] = [past, past]
+    # Act — 윈도우 경과 시뮬레이션: 시계를 윈도우만큼 앞으로 이동
+    now = limiter._clock()
+    limiter._clock = lambda: now + window + 1
 
     limited, remaining = await limiter.is_rate_limited("10.0.0.2", max_requests, window)
 
-    # Assert — 윈도우 경과 후 다시 허용
+    # Assert — 윈도우 경과 후 한도가 모두 회복되어 다시 허용
     assert limited is False
     assert remaining == 1
 
 
+@pytest.mark.asyncio
+async def test_tokens_refill_gradually_with_retry_after():
+    """차단 시 다음 토큰이 생기는 시각을 재시도 시간으로 알려주고, 그만큼 지나면 한 번 더 허용한다."""
+    # Arrange — 60초에 3회: 20초마다 토큰 하나
+    limiter = MemoryRateLimiter(max_tracked_ips=100)
+    now = limiter._clock()
+    limiter._clock = lambda: now
+    for _ in range(3):
+        await limiter.check("10.0.0.3", 3, 60)
+
+    # Act
+    blocked = await limiter.check("10.0.0.3", 3, 60)
+    limiter._clock = lambda: now + 20
+    refilled = await limiter.check("10.0.0.3", 3, 60)
+    again = await limiter.check("10.0.0.3", 3, 60)
+
+    # Assert
+    assert blocked.limited is True
+    assert blocked.retry_after == 20
+    assert refilled.limited is False
+    assert refilled.remaining == 0
+    assert again.limited is True
+
+
 # ---------------------------------------------------------------------------
 # 키 독립성
 # ---------------------------------------------------------------------------
@@ -110,24 +132,26 @@ async def test_different_keys_independent():
 
 @pytest.mark.asyncio
 async def test_memory_protection_max_ips():
-    """max_tracked_ips 초과 시 오래된 IP가 배치 제거되어야 한다."""
+    """max_tracked_ips에 도달하면 가장 오래 사용하지 않은 키 하나만 제거되어야 한다 (LRU)."""
     # Arrange — 작은 제한으로 빠른 테스트
     max_ips = 50
     limiter = MemoryRateLimiter(max_tracked_ips=max_ips)
 
-    # max_ips만큼 IP 등록
+    # max_ips만큼 IP 등록 후 첫 IP를 다시 사용
     for i in range(max_ips):
         await limiter.is_rate_limited(f"10.0.0.{i}", 100, 60)
-
-    assert len(limiter._requests) == max_ips
-
-    # Act — 추가 요청으로 제거 트리거
-    await limiter.is_rate_limited("99.99.99.99", 100, 60)
-
-    # Assert — 10% (5개) 제거 후 새 IP 추가 → max_ips - 5 + 1 = 46
-    eviction_count = max(1, max_ips // 10)
-    expected = max_ips - eviction_count + 1
-    assert len(limiter._requests) == expected
+    await limiter.is_rate_limited("10.0.0.0", 100, 60)
+
+    # Act — 스캐닝 트래픽: 새 키 10개
+    for i in range(10):
+        await limiter.is_rate_limited(f"99.99.99.{i}", 100, 60)
+
+    # Assert — 추적 키 수는 그대로, 최근 사용한 10.0.0.0은 유지, 10.0.0.1~10은 제거
+    assert len(limiter._tat) == max_ips
+    assert limiter.evictions == 10
+    assert "10.0.0.0" in limiter._tat
+    assert "10.0.0.10" not in limiter._tat
+    assert "10.0.0.11" in limiter._tat
 
 
 # ---------------------------------------------------------------------------
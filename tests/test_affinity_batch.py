@@ -0,0 +1,111 @@
+# tests/test_affinity_batch.py
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from modules.post import affinity_batch
+from modules.post.affinity_batch import prepare_candidates, rank_users_batch
+from modules.post.affinity_models import AffinityWeights, UserSignals
+from modules.post.affinity_scorer import post_event_deltas, profile_from_weights, rank_candidates, weights_from_signals
+
+
+def _counts(rng: random.Random, keys: int, size: int) -> dict[int, int]:
+    return {rng.randint(1, keys): rng.randint(1, 5) for _ in range(rng.randint(0, size))}
+
+
+def _candidates(rng: random.Random, posts: int) -> list[dict]:
+    return [
+        {
+            "post_id": post_id,
+            "category_id": rng.choice([None, 1, 2, 3]),
+            "author_id": rng.choice([None, *range(1, 30)]),
+            "hot_score": rng.random() * 5,
+            "tag_ids": rng.sample(range(1, 40), rng.randint(0, 4)),
+        }
+        for post_id in range(1, posts + 1)
+    ]
+
+
+def _weights(rng: random.Random) -> AffinityWeights:
+    return weights_from_signals(
+        UserSignals(
+            liked_tag_counts=_counts(rng, 50, 8),
+            bookmarked_tag_counts=_counts(rng, 50, 4),
+            commented_tag_counts=_counts(rng, 50, 4),
+            viewed_category_counts=_counts(rng, 4, 3),
+            followed_author_ids={rng.randint(1, 35) for _ in range(rng.randint(0, 4))},
+            liked_author_counts=_counts(rng, 35, 6),
+            bookmarked_author_counts=_counts(rng, 35, 3),
+        )
+    )
+
+
+def _reference(user_id: int, weights: AffinityWeights, candidates: list[dict], limit: int) -> list[dict]:
+    return rank_candidates(user_id, profile_from_weights(weights), candidates, limit)
+
+
+@pytest.mark.parametrize("limit", [5, 200])
+def test_batch_matches_reference_scorer(limit):
+    """배치 엔진 결과가 사용자별 기준 구현과 정확히 같다 (자기 게시글 제외, 상위 limit 포함)."""
+    rng = random.Random(limit)
+    candidates = _candidates(rng, 150)
+    weights = {user_id: _weights(rng) for user_id in range(1, 41)}
+
+    result = rank_users_batch(list(weights), weights, prepare_candidates(candidates), limit)
+
+    for user_id, user_weights in weights.items():
+        assert result[user_id] == _reference(user_id, user_weights, candidates, limit)
+
+
+def test_batch_handles_empty_weights_and_candidates():
+    """가중치가 없거나 모두 0인 사용자는 빈 결과, 후보가 없으면 모든 사용자가 빈 결과."""
+    rng = random.Random(0)
+    candidates = _candidates(rng, 20)
+    weights = {1: AffinityWeights(), 2: _weights(rng), 3: AffinityWeights(tags={1: 0.0, 2: 0.0})}
+
+    result = rank_users_batch([1, 2, 3, 4], weights, prepare_candidates(candidates), 10)
+    assert result[1] == result[3] == result[4] == []
+    assert result[2] == _reference(2, weights[2], candidates, 10)
+
+    assert rank_users_batch([1, 2], weights, prepare_candidates([]), 10) == {1: [], 2: []}
+
+
+def test_batch_excludes_own_posts():
+    """자기 게시글은 친화도가 높아도 결과에 포함하지 않는다."""
+    candidates = [
+        {"post_id": 1, "category_id": 1, "author_id": 7, "hot_score": 1.0, "tag_ids": [1]},
+        {"post_id": 2, "category_id": 1, "author_id": 8, "hot_score": 1.0, "tag_ids": [1]},
+    ]
+    weights = {7: AffinityWeights(tags={1: 9.0}, authors={7: 2.5, 8: 2.5})}
+
+    result = rank_users_batch([7], weights, prepare_candidates(candidates), 10)
+
+    assert [row["post_id"] for row in result[7]] == [2]
+
+
+def test_worker_functions_match_batch(monkeypatch):
+    """프로세스 풀 워커 함수는 init_worker()로 준비한 후보 행렬로 같은 결과를 낸다."""
+    rng = random.Random(1)
+    candidates = _candidates(rng, 60)
+    weights = {user_id: _weights(rng) for user_id in range(1, 11)}
+    monkeypatch.setattr(affinity_batch, "_worker_candidates", None)
+
+    with pytest.raises(RuntimeError):
+        affinity_batch.rank_users_in_worker([1], weights, 10)
+
+    affinity_batch.init_worker(candidates)
+    assert affinity_batch.rank_users_in_worker(list(weights), weights, 10) == rank_users_batch(
+        list(weights), weights, prepare_candidates(candidates), 10
+    )
+
+
+def test_post_event_deltas():
+    """게시글 이벤트는 태그마다, 카테고리/작성자는 값이 있을 때만 증감을 만들고 취소는 음수다."""
+    post = {"category_id": None, "author_id": 5, "tag_ids": [1, 2]}
+
+    assert post_event_deltas("like", post) == [("tag", 1, 3.0), ("tag", 2, 3.0), ("author", 5, 0.8)]
+    assert post_event_deltas("unbookmark", post) == [("tag", 1, -3.0), ("tag", 2, -3.0), ("author", 5, -0.8)]
+    assert post_event_deltas("view", post) == []
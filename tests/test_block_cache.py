@@ -0,0 +1,78 @@
+# tests/test_block_cache.py
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.utils import block_cache as bc
+from core.utils.block_cache import BlockCache, get_cached_blocked_ids, invalidate_blocked_ids
+
+
+@pytest.fixture(autouse=True)
+def _local_cache(monkeypatch):
+    cache = BlockCache(max_entries=2)
+    monkeypatch.setattr(bc, "block_cache", cache)
+    monkeypatch.setattr(bc.settings, "BLOCK_CACHE_BACKEND", "local")
+    monkeypatch.setattr(bc.settings, "BLOCK_CACHE_TTL_SECONDS", 60)
+    monkeypatch.setattr(bc.settings, "BLOCK_CACHE_L1_TTL_SECONDS", 5)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_blocked_ids_are_loaded_once_until_invalidated():
+    """같은 사용자는 무효화 전까지 DB를 한 번만 조회하고, 빈 집합도 캐시한다."""
+    loader = AsyncMock(side_effect=[set(), {7}])
+
+    assert await get_cached_blocked_ids(1, loader) == frozenset()
+    assert await get_cached_blocked_ids(1, loader) == frozenset()
+    assert loader.await_count == 1
+
+    await invalidate_blocked_ids(1)
+    assert await get_cached_blocked_ids(1, loader) == frozenset({7})
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_load_skips_stale_set(_local_cache):
+    """조회 중 무효화가 일어나면 읽어 온 (오래된) 집합을 캐시하지 않는다."""
+
+    async def loader(user_id: int) -> set[int]:
+        await invalidate_blocked_ids(user_id)
+        return {3}
+
+    await get_cached_blocked_ids(1, loader)
+
+    assert _local_cache.lookup("1", ("1",)) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_redis_l2_shared_across_workers_and_versioned(monkeypatch, fake_redis):
+    """redis 모드: 다른 워커는 L2 집합을 쓰고, 무효화로 공유 버전이 오르면 L2 값도 미스가 된다."""
+    monkeypatch.setattr(bc.settings, "BLOCK_CACHE_BACKEND", "redis")
+    redis = fake_redis
+    loader = AsyncMock(side_effect=[{2, 3}, {2}])
+
+    with patch("core.utils.redis_client.get_redis", new=AsyncMock(return_value=redis)):
+        assert await get_cached_blocked_ids(1, loader) == frozenset({2, 3})
+
+        # 다른 워커: L1이 비어 있어도 L2에서 적중
+        monkeypatch.setattr(bc, "block_cache", BlockCache())
+        assert await get_cached_blocked_ids(1, loader) == frozenset({2, 3})
+        assert loader.await_count == 1
+
+        await invalidate_blocked_ids(1)
+        monkeypatch.setattr(bc, "block_cache", BlockCache())
+        assert await get_cached_blocked_ids(1, loader) == frozenset({2})
+        assert redis.data["blocks:1"] == "1|2"
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_loader(monkeypatch):
+    """Redis 조회/무효화 실패는 예외를 전파하지 않고 DB 조회로 폴백한다."""
+    monkeypatch.setattr(bc.settings, "BLOCK_CACHE_BACKEND", "redis")
+    loader = AsyncMock(return_value={5})
+
+    with patch("core.utils.redis_client.get_redis", new=AsyncMock(side_effect=ConnectionError("down"))):
+        assert await get_cached_blocked_ids(1, loader) == frozenset({5})
+        await invalidate_blocked_ids(1)
+
+    assert loader.await_count == 1
@@ -0,0 +1,219 @@
+# tests/test_compression.py
+import gzip
+import os
+import zlib
+
+import httpx
+import pytest
+
+from core.middleware.compression import CompressionMiddleware
+from core.utils import content_encoding
+from core.utils.content_encoding import is_compressible, select_encoding
+from core.utils.static_files import PrecompressedStaticFiles
+
+
+def _app(body: bytes, content_type: str = "application/json", chunks: int = 1, status: int = 200, headers=()):
+    """body를 chunks개로 나눠 보내는 ASGI 앱."""
+
+    async def app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", content_type.encode()), (b"content-length", str(len(body)).encode())]
+                + [(k.encode(), v.encode()) for k, v in headers],
+            }
+        )
+        size = -(-len(body) // chunks) if body else 0
+        for i in range(chunks):
+            part = body[i * size : (i + 1) * size]
+            await send({"type": "http.response.body", "body": part, "more_body": i < chunks - 1})
+
+    return app
+
+
+async def _call(app, accept_encoding: str | None = "gzip"):
+    headers = [] if accept_encoding is None else [(b"accept-encoding", accept_encoding.encode())]
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": headers}
+    messages: list[dict] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start = messages[0]
+    response_headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], response_headers, body, messages
+
+
+@pytest.mark.parametrize(
+    ("header", "available", "expected"),
+    [
+        (None, ("br", "gzip"), None),
+        ("gzip, deflate, br", ("br", "gzip"), "br"),
+        ("gzip, deflate, br", ("gzip",), "gzip"),
+        ("br;q=0.5, gzip", ("br", "gzip"), "gzip"),
+        ("br;q=0, gzip;q=0", ("br", "gzip"), None),
+        ("*", ("gzip",), "gzip"),
+        ("identity", ("br", "gzip"), None),
+    ],
+)
+def test_select_encoding_follows_q_values(header, available, expected):
+    """q 값이 높은 인코딩을 고르고, 같으면 서버 선호 순서(br > gzip), q=0은 거부한다."""
+    assert select_encoding(header, available) == expected
+
+
+def test_incompressible_types_are_skipped():
+    """이미지/압축 파일은 건너뛰고 JSON/SVG는 압축 대상이다."""
+    assert is_compressible("application/json")
+    assert is_compressible("image/svg+xml")
+    assert not is_compressible("image/webp")
+    assert not is_compressible("application/zip")
+    assert not is_compressible("")
+
+
+@pytest.mark.asyncio
+async def test_large_json_is_gzipped_with_length_and_vary():
+    """최소 크기 이상의 JSON은 gzip으로 압축하고 Content-Length/Vary를 맞춘다."""
+    body = b'{"posts": [' + b'{"content": "preview text"},' * 200 + b"{}]}"
+    app = CompressionMiddleware(_app(body, headers=[("vary", "Authorization"), ("etag", '"v1"')]), minimum_size=512)
+
+    status, headers, compressed, _ = await _call(app, "gzip, deflate")
+
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert headers["content-length"] == str(len(compressed))
+    assert headers["vary"] == "Authorization, Accept-Encoding"
+    assert headers["etag"] == 'W/"v1"'
+    assert gzip.decompress(compressed) == body
+    assert len(compressed) < len(body)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("body", "content_type", "accept", "status"),
+    [
+        (b"{}", "application/json", "gzip", 200),
+        (b"x" * 4096, "image/png", "gzip", 200),
+        (b"x" * 4096, "application/json", None, 200),
+        (b"x" * 4096, "application/json", "identity", 200),
+        (b"", "application/json", "gzip", 304),
+    ],
+)
+async def test_passthrough_when_not_worth_compressing(body, content_type, accept, status):
+    """작은 응답, 이미지, 협상 실패, 304는 그대로 전송한다."""
+    app = CompressionMiddleware(_app(body, content_type, status=status), minimum_size=512)
+
+    _, headers, sent, _ = await _call(app, accept)
+
+    assert "content-encoding" not in headers
+    assert sent == body
+
+
+@pytest.mark.asyncio
+async def test_already_encoded_response_is_untouched():
+    """Content-Encoding이 이미 있는 응답(사전 압축 정적 파일)은 다시 압축하지 않는다."""
+    body = gzip.compress(b"a" * 4096)
+    app = CompressionMiddleware(_app(body, "text/css", headers=[("content-encoding", "gzip")]), minimum_size=16)
+
+    _, headers, sent, _ = await _call(app, "gzip")
+
+    assert headers["content-encoding"] == "gzip"
+    assert sent == body
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_is_compressed_per_chunk():
+    """스트리밍 응답은 Content-Length 없이 청크마다 압축해 보내고 마지막 청크에서 스트림을 닫는다."""
+    body = b"line of markdown\n" * 500
+    app = CompressionMiddleware(_app(body, "text/markdown", chunks=4), minimum_size=512)
+
+    _, headers, compressed, messages = await _call(app, "gzip")
+
+    assert "content-length" not in headers
+    assert len(messages) == 5
+    assert messages[-1]["more_body"] is False
+    assert zlib.decompress(compressed, 31) == body
+
+
+@pytest.mark.asyncio
+async def test_brotli_preferred_when_available():
+    """brotli 모듈이 있으면 br을 gzip보다 우선한다."""
+    brotli = pytest.importorskip("brotli")
+    body = b"x" * 4096
+    app = CompressionMiddleware(_app(body, "application/json"), minimum_size=512)
+
+    _, headers, compressed, _ = await _call(app, "gzip, br")
+
+    assert headers["content-encoding"] == "br"
+    assert brotli.decompress(compressed) == body
+
+
+@pytest.mark.asyncio
+async def test_gzip_only_without_brotli_module(monkeypatch):
+    """brotli 모듈이 없으면 br만 수락하는 클라이언트에는 압축하지 않는다."""
+    monkeypatch.setattr(content_encoding, "brotli", None)
+    app = CompressionMiddleware(_app(b"x" * 4096), minimum_size=512)
+
+    _, headers, _, _ = await _call(app, "br")
+
+    assert "content-encoding" not in headers
+
+
+# ---------------------------------------------------------------------------
+# 사전 압축 정적 파일
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / "app.js").write_bytes(b"console.log('hi');" * 100)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress((tmp_path / "app.js").read_bytes()))
+    (tmp_path / "photo.png").write_bytes(b"\x89PNG" + b"\x00" * 100)
+    return tmp_path
+
+
+async def _get(directory, path: str, **headers):
+    app = PrecompressedStaticFiles(directory=str(directory), max_age=31536000)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(path, headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_static_serves_gz_sibling_with_immutable_cache(static_dir):
+    """gzip을 수락하면 .gz 형제 파일을 원본 Content-Type과 함께 보내고 immutable 캐시 헤더를 붙인다."""
+    res = await _get(static_dir, "/app.js", **{"Accept-Encoding": "gzip"})
+
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "gzip"
+    assert res.headers["content-type"].startswith("text/javascript")
+    assert res.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert res.headers["vary"] == "Accept-Encoding"
+    assert res.content == (static_dir / "app.js").read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_static_falls_back_to_original(static_dir):
+    """br만 수락하거나 형제 파일이 원본보다 오래되었으면 원본을 보낸다."""
+    br_only = await _get(static_dir, "/app.js", **{"Accept-Encoding": "br"})
+    stat = (static_dir / "app.js").stat()
+    os.utime(static_dir / "app.js.gz", (stat.st_atime, stat.st_mtime - 10))
+    stale = await _get(static_dir, "/app.js", **{"Accept-Encoding": "gzip"})
+
+    for res in (br_only, stale):
+        assert res.status_code == 200
+        assert "content-encoding" not in res.headers
+        assert res.content == (static_dir / "app.js").read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_static_image_has_cache_but_no_vary(static_dir):
+    """이미지는 형제 파일을 찾지 않고 Vary 없이 캐시 헤더만 붙인다."""
+    image = await _get(static_dir, "/photo.png", **{"Accept-Encoding": "gzip"})
+
+    assert image.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert "vary" not in image.headers
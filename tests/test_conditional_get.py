@@ -0,0 +1,128 @@
+# tests/test_conditional_get.py
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from starlette.requests import Request
+
+from core.utils import conditional_get as cg
+from core.utils import response_cache as rc
+from core.utils.conditional_get import compute_etag, is_not_modified, not_modified_response, with_etag
+from core.utils.response_cache import ResponseCache, invalidate
+
+_versions_are_shared = cg._versions_are_shared
+
+
+@pytest.fixture(autouse=True)
+def _local_versions(monkeypatch):
+    # 단일 프로세스 테스트에서는 로컬 버전을 공유 버전처럼 사용
+    monkeypatch.setattr(rc, "response_cache", ResponseCache())
+    monkeypatch.setattr(rc.settings, "RESPONSE_CACHE_BACKEND", "local")
+    monkeypatch.setattr(cg, "_versions_are_shared", lambda: True)
+    monkeypatch.setattr(cg.settings, "ETAG_ENABLED", True)
+    monkeypatch.setattr(cg.settings, "ETAG_MAX_STALE_SECONDS", 60)
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+@pytest.mark.asyncio
+async def test_etag_is_stable_until_namespace_is_invalidated():
+    """버전이 그대로면 같은 ETag, invalidate() 후에는 다른 ETag를 만든다."""
+    first = await compute_etag(("post:1",), "oldest")
+    second = await compute_etag(("post:1",), "oldest")
+    await invalidate("post:1")
+    third = await compute_etag(("post:1",), "oldest")
+
+    assert first is not None and first.startswith('W/"')
+    assert first == second
+    assert third != first
+
+
+@pytest.mark.asyncio
+async def test_etag_differs_by_signature_and_unrelated_bump_keeps_it():
+    """표현(signature)이 다르면 ETag가 다르고, 다른 네임스페이스의 무효화는 영향을 주지 않는다."""
+    base = await compute_etag(("post:1",), "oldest")
+    other_sort = await compute_etag(("post:1",), "latest")
+    await invalidate("post:2")
+
+    assert other_sort != base
+    assert await compute_etag(("post:1",), "oldest") == base
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_with_time_window():
+    """ETAG_MAX_STALE_SECONDS 구간이 바뀌면 무효화 없이도 ETag가 바뀐다."""
+    with patch("core.utils.conditional_get.time.time", side_effect=[10.0, 59.0, 61.0]):
+        first = await compute_etag(("wiki:a",))
+        same_window = await compute_etag(("wiki:a",))
+        next_window = await compute_etag(("wiki:a",))
+
+    assert first == same_window
+    assert next_window != first
+
+
+@pytest.mark.asyncio
+async def test_etag_disabled_or_versions_unknown_returns_none(monkeypatch):
+    """ETAG_ENABLED=false, 응답 캐시 off, Redis 오류에서는 ETag를 만들지 않는다."""
+    monkeypatch.setattr(cg.settings, "ETAG_ENABLED", False)
+    assert await compute_etag(("post:1",)) is None
+
+    monkeypatch.setattr(cg.settings, "ETAG_ENABLED", True)
+    monkeypatch.setattr(rc.settings, "RESPONSE_CACHE_BACKEND", "off")
+    assert await compute_etag(("post:1",)) is None
+
+    monkeypatch.setattr(rc.settings, "RESPONSE_CACHE_BACKEND", "redis")
+    with patch("core.utils.redis_client.get_redis", new=AsyncMock(side_effect=ConnectionError("down"))):
+        assert await compute_etag(("post:1",)) is None
+
+
+@pytest.mark.asyncio
+async def test_etag_only_with_shared_versions(monkeypatch):
+    """local 버전은 다른 파드의 쓰기를 모르므로 ETag를 만들지 않고, redis 모드는 공유 버전으로 만든다."""
+    monkeypatch.setattr(cg, "_versions_are_shared", _versions_are_shared)
+    assert await compute_etag(("package:5",)) is None
+
+    monkeypatch.setattr(rc.settings, "RESPONSE_CACHE_BACKEND", "redis")
+    redis = AsyncMock()
+    redis.mget.return_value = ["3"]
+    with patch("core.utils.redis_client.get_redis", new=AsyncMock(return_value=redis)):
+        assert await compute_etag(("package:5",)) is not None
+
+    redis.mget.assert_awaited_with("resp:ver:package:5")
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ('W/"abc"', True),
+        ('"abc"', True),
+        ('W/"zzz", W/"abc"', True),
+        ("*", True),
+        ('W/"zzz"', False),
+    ],
+)
+def test_if_none_match_uses_weak_comparison(header, expected):
+    """If-None-Match는 약한 비교, 쉼표 목록, *를 지원한다."""
+    assert is_not_modified(_request(header), 'W/"abc"') is expected
+
+
+def test_without_etag_never_not_modified():
+    """ETag가 없으면 If-None-Match: *라도 304가 아니다."""
+    assert is_not_modified(_request("*"), None) is False
+
+
+def test_responses_carry_validator_headers():
+    """304와 200 응답 모두 ETag/Cache-Control/Vary를 담고, 로그인 응답은 private이다."""
+    not_modified = not_modified_response('W/"abc"', private=True)
+    full = with_etag({"data": {"id": 1}}, 'W/"abc"')
+
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
+    assert not_modified.headers["cache-control"] == "private, no-cache"
+    assert full.headers["etag"] == 'W/"abc"'
+    assert full.headers["cache-control"] == "no-cache"
+    assert full.headers["vary"] == "Authorization"
+    assert with_etag({"data": 1}, None) == {"data": 1}
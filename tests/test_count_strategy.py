@@ -0,0 +1,94 @@
+# tests/test_count_strategy.py
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.utils.count_strategy import CountCache, count_cache, count_signature, resolve_total_count
+
+
+@pytest.fixture(autouse=True)
+def _clear_count_cache():
+    count_cache.clear()
+    yield
+    count_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_exact_strategy_counts_every_time():
+    """exact 전략은 매 호출 COUNT를 실행한다."""
+    count_fn = AsyncMock(return_value=7)
+
+    first = await resolve_total_count("exact", "posts", "sig", count_fn)
+    second = await resolve_total_count("exact", "posts", "sig", count_fn)
+
+    assert first == second == 7
+    assert count_fn.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_strategy_reuses_value_within_ttl():
+    """cached 전략은 같은 시그니처의 COUNT를 TTL 동안 재사용한다."""
+    count_fn = AsyncMock(side_effect=[3, 4])
+
+    first = await resolve_total_count("cached", "posts", "sig", count_fn)
+    second = await resolve_total_count("cached", "posts", "sig", count_fn)
+
+    assert first == second == 3
+    assert count_fn.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_strategy_expires_after_ttl():
+    """TTL이 지나면 다시 COUNT를 실행한다."""
+    count_fn = AsyncMock(side_effect=[3, 4])
+
+    with patch("core.utils.count_strategy.time.monotonic", side_effect=[0.0, 1000.0, 1000.0]):
+        first = await resolve_total_count("cached", "posts", "sig", count_fn)
+        second = await resolve_total_count("cached", "posts", "sig", count_fn)
+
+    assert (first, second) == (3, 4)
+
+
+@pytest.mark.asyncio
+async def test_invalidate_bumps_scope_generation():
+    """invalidate 후에는 같은 시그니처라도 COUNT를 다시 실행한다."""
+    count_fn = AsyncMock(side_effect=[3, 4])
+
+    await resolve_total_count("cached", "posts", "sig", count_fn)
+    count_cache.invalidate("posts")
+    second = await resolve_total_count("cached", "posts", "sig", count_fn)
+
+    assert second == 4
+
+
+@pytest.mark.asyncio
+async def test_has_more_strategy_skips_count():
+    """has_more 전략은 COUNT를 실행하지 않고 None을 반환한다."""
+    count_fn = AsyncMock(return_value=7)
+
+    total = await resolve_total_count("has_more", "posts", "sig", count_fn)
+
+    assert total is None
+    count_fn.assert_not_awaited()
+
+
+def test_count_cache_evicts_least_recently_used():
+    """상한 초과 시 가장 오래 사용되지 않은 항목부터 제거한다."""
+    cache = CountCache(max_entries=2)
+    cache.set("s", "a", 1, 60)
+    cache.set("s", "b", 2, 60)
+    cache.get("s", "a")  # a를 최근 사용으로 갱신
+
+    cache.set("s", "c", 3, 60)
+
+    assert cache.get("s", "a") == 1
+    assert cache.get("s", "b") is None
+    assert cache.get("s", "c") == 3
+
+
+def test_count_signature_is_order_independent_for_sets():
+    """set 필터는 원소 순서와 무관하게 같은 시그니처를 만든다."""
+    assert count_signature(blocked_user_ids={3, 1, 2}, tag=None) == count_signature(
+        tag=None, blocked_user_ids={2, 3, 1}
+    )
+    assert count_signature(tag="a") != count_signature(tag="b")
@@ -0,0 +1,61 @@
+# tests/test_feed_checkpoint.py
+from unittest.mock import AsyncMock
+
+import pytest
+
+from modules.post import feed_service
+from modules.post.feed_service import FeedService
+
+
+@pytest.fixture
+def checkpoint(monkeypatch):
+    advance = AsyncMock()
+    complete = AsyncMock()
+    monkeypatch.setattr(feed_service.affinity_models, "advance_recompute_checkpoint", advance)
+    monkeypatch.setattr(feed_service.affinity_models, "complete_recompute_checkpoint", complete)
+    return advance, complete
+
+
+def _process(failing: set[int]):
+    async def process(chunk: list[int]) -> int | None:
+        return None if chunk[0] in failing else len(chunk)
+
+    return process
+
+
+@pytest.mark.asyncio
+async def test_all_chunks_succeed_completes_checkpoint(checkpoint):
+    """모든 청크가 성공하면 묶음마다 전진하고 체크포인트를 완료한다."""
+    advance, complete = checkpoint
+
+    processed, completed = await FeedService._run_chunks(0, 1, [[1, 2], [3, 4], [5]], _process(set()), parallelism=2)
+
+    assert (processed, completed) == (5, True)
+    assert [c.args for c in advance.await_args_list] == [(1, 0, 4, 4), (1, 0, 5, 1)]
+    complete.assert_awaited_once_with(1, 0)
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_stops_without_completing(checkpoint):
+    """실패한 청크 앞까지만 전진하고, 이후 묶음은 처리하지 않으며 체크포인트를 완료하지 않는다."""
+    advance, complete = checkpoint
+    chunks = [[1, 2], [3, 4], [5, 6], [7, 8]]
+
+    processed, completed = await FeedService._run_chunks(0, 1, chunks, _process({3}), parallelism=2)
+
+    assert (processed, completed) == (2, False)
+    # 실패한 청크(3, 4) 뒤의 같은 묶음/다음 묶음 사용자는 체크포인트에 포함되지 않음
+    assert [c.args for c in advance.await_args_list] == [(1, 0, 2, 2)]
+    complete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_first_chunk_failure_does_not_advance(checkpoint):
+    """묶음의 첫 청크가 실패하면 체크포인트를 전혀 움직이지 않는다."""
+    advance, complete = checkpoint
+
+    processed, completed = await FeedService._run_chunks(1, 2, [[1], [3]], _process({1}), parallelism=1)
+
+    assert (processed, completed) == (0, False)
+    advance.assert_not_awaited()
+    complete.assert_not_awaited()
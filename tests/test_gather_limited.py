@@ -0,0 +1,43 @@
+# tests/test_gather_limited.py
+import asyncio
+
+import pytest
+
+from core.database.connection import gather_limited
+
+
+@pytest.mark.asyncio
+async def test_results_keep_order_and_respect_limit():
+    """결과는 인자 순서를 따르고, 동시에 실행되는 조회 수는 limit을 넘지 않는다."""
+    running = 0
+    peak = 0
+
+    async def query(value: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (5 - value))
+        running -= 1
+        return value
+
+    assert await gather_limited(*(query(i) for i in range(5)), limit=2) == [0, 1, 2, 3, 4]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_pending_queries():
+    """하나가 실패하면 첫 예외를 그대로 전파하고 아직 끝나지 않은 조회는 취소한다."""
+    finished: list[str] = []
+
+    async def slow() -> None:
+        await asyncio.sleep(1)
+        finished.append("slow")
+
+    async def failing() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await gather_limited(slow(), failing(), limit=4)
+    await asyncio.sleep(0)
+
+    assert finished == []
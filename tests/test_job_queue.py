@@ -0,0 +1,148 @@
+# tests/test_job_queue.py
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core.jobs import enqueue_many
+from core.jobs.queue_base import Job, backoff_seconds
+from core.jobs.queue_memory import MemoryJobQueue
+from core.jobs.registry import _handlers, job_handler
+from core.jobs.worker import drain, process_job
+
+
+@pytest.fixture
+def queue():
+    return MemoryJobQueue()
+
+
+@pytest.fixture
+def handler_calls():
+    calls: list[dict] = []
+
+    @job_handler("test.record")
+    async def record(payload: dict) -> None:
+        calls.append(payload)
+
+    @job_handler("test.fail")
+    async def fail(payload: dict) -> None:
+        raise RuntimeError("boom")
+
+    yield calls
+    _handlers.pop("test.record", None)
+    _handlers.pop("test.fail", None)
+
+
+def test_backoff_is_exponential_and_capped():
+    """재시도 지연은 base * 2^(n-1)로 늘어나고 상한에서 멈춘다."""
+    assert backoff_seconds(1, 2.0) == 2.0
+    assert backoff_seconds(3, 2.0) == 8.0
+    assert backoff_seconds(20, 2.0) == 300.0
+
+
+def test_job_json_round_trip():
+    """직렬화 후 복원해도 id/attempts가 유지된다."""
+    job = Job(name="test.record", payload={"post_id": 1, "nickname": "펭귄"}, attempts=2)
+    assert Job.from_json(job.to_json()) == job
+
+
+@pytest.mark.asyncio
+async def test_drain_runs_enqueued_jobs_in_order(queue, handler_calls):
+    """적재한 잡을 FIFO 순서로 실행한다."""
+    await queue.enqueue(Job(name="test.record", payload={"n": 1}), Job(name="test.record", payload={"n": 2}))
+
+    processed = await drain(queue)
+
+    assert processed == 2
+    assert handler_calls == [{"n": 1}, {"n": 2}]
+    assert await queue.pending_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried_with_backoff(queue, handler_calls, monkeypatch):
+    """핸들러가 실패하면 attempts를 올려 백오프 후 재시도되도록 예약한다."""
+    monkeypatch.setattr("core.jobs.worker.settings.JOB_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr("core.jobs.worker.settings.JOB_RETRY_BASE_SECONDS", 2.0)
+    queue.retry = AsyncMock()
+
+    ok = await process_job(queue, Job(name="test.fail", payload={}, attempts=1))
+
+    assert ok is False
+    retried, delay = queue.retry.await_args.args
+    assert retried.attempts == 2
+    assert delay == 4.0
+
+
+@pytest.mark.asyncio
+async def test_exhausted_job_goes_to_dead_letter(queue, handler_calls, monkeypatch):
+    """최대 시도 횟수에 도달하면 재시도하지 않고 dead-letter로 이관한다."""
+    monkeypatch.setattr("core.jobs.worker.settings.JOB_MAX_ATTEMPTS", 3)
+    queue.retry = AsyncMock()
+
+    with patch("core.jobs.worker.record_dead_letter", new_callable=AsyncMock) as mock_record:
+        await process_job(queue, Job(name="test.fail", payload={"x": 1}, attempts=2))
+
+    queue.retry.assert_not_awaited()
+    dead_job, error = mock_record.await_args.args
+    assert dead_job.attempts == 3
+    assert "boom" in error
+
+
+@pytest.mark.asyncio
+async def test_unknown_job_goes_to_dead_letter(queue):
+    """등록되지 않은 잡 이름은 재시도 없이 dead-letter로 이관한다."""
+    with patch("core.jobs.worker.record_dead_letter", new_callable=AsyncMock) as mock_record:
+        ok = await process_job(queue, Job(name="test.missing", payload={}))
+
+    assert ok is False
+    mock_record.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_failure_falls_back_to_inline(handler_calls):
+    """큐 적재가 실패하면 핸들러를 인라인으로 실행해 부수효과를 잃지 않는다."""
+    broken = MagicMock()
+    broken.enqueue = AsyncMock(side_effect=ConnectionError("down"))
+
+    with patch("core.jobs.get_job_queue", return_value=broken):
+        await enqueue_many([("test.record", {"n": 1}), ("test.fail", {})])
+
+    assert handler_calls == [{"n": 1}]
+
+
+@pytest.mark.asyncio
+async def test_redis_queue_enqueue_uses_single_lpush():
+    """여러 잡을 LPUSH 한 번으로 적재한다."""
+    pytest.importorskip("redis", reason="redis는 K8s optional dependency")
+    from core.jobs.queue_redis import READY_KEY, RedisJobQueue
+
+    mock_redis = MagicMock()
+    mock_redis.lpush = AsyncMock()
+    with patch("core.jobs.queue_redis.get_redis", new=AsyncMock(return_value=mock_redis)):
+        queue = RedisJobQueue(redis_url="redis://localhost:6379", visibility_timeout=60)
+        await queue.enqueue(Job(name="a", payload={}), Job(name="b", payload={}))
+
+    key, *values = mock_redis.lpush.await_args.args
+    assert key == READY_KEY
+    assert [json.loads(v)["name"] for v in values] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_redis_queue_reserve_and_ack_releases_lease():
+    """reserve한 잡을 ack하면 같은 원본 문자열로 임대를 해제한다."""
+    pytest.importorskip("redis", reason="redis는 K8s optional dependency")
+    from core.jobs.queue_redis import LEASES_KEY, RedisJobQueue
+
+    job = Job(name="a", payload={"n": 1})
+    raw = job.to_json()
+    mock_redis = MagicMock()
+    mock_redis.zrem = AsyncMock()
+    mock_redis.register_script.side_effect = [AsyncMock(return_value=raw), AsyncMock(return_value=0)]
+
+    with patch("core.jobs.queue_redis.get_redis", new=AsyncMock(return_value=mock_redis)):
+        queue = RedisJobQueue(redis_url="redis://localhost:6379", visibility_timeout=60)
+        reserved = await queue.reserve(timeout=0)
+        assert reserved == job
+        await queue.ack(job)
+
+    mock_redis.zrem.assert_awaited_once_with(LEASES_KEY, raw)
@@ -0,0 +1,147 @@
+# tests/test_middleware.py
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+from core.dependencies.request_context import get_request_timestamp
+from core.logging_config import request_id_var
+from core.middleware import (
+    BodyLimitMiddleware,
+    RateLimitMiddleware,
+    RequestIdMiddleware,
+    SecurityHeadersMiddleware,
+    TimingMiddleware,
+)
+from core.middleware import rate_limiter as rl
+from core.middleware.rate_limiter_memory import MemoryRateLimiter
+
+
+def _build_app(max_body_size: int = 64, https_only: bool = False) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping(request: Request):
+        return {
+            "request_id": request.state.request_id,
+            "log_request_id": request_id_var.get(),
+            "timestamp": get_request_timestamp(request),
+            "has_request_time": hasattr(request.state, "request_time"),
+        }
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return {"size": len(await request.body())}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk{i}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(RequestIdMiddleware)
+    app.add_middleware(SecurityHeadersMiddleware, https_only=https_only)
+    app.add_middleware(TimingMiddleware)
+    app.add_middleware(RateLimitMiddleware)
+    app.add_middleware(BodyLimitMiddleware, max_body_size=max_body_size)
+    return app
+
+
+async def _client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_request_state_and_headers():
+    """요청 ID/요청 시각이 request.state와 로그 컨텍스트에 설정되고, 응답에 ID와 보안 헤더가 붙는다."""
+    async with await _client(_build_app()) as client:
+        given = await client.get("/ping", headers={"X-Request-ID": "abc-123"})
+        generated = await client.get("/ping")
+
+    body = given.json()
+    assert body["request_id"] == body["log_request_id"] == "abc-123"
+    assert body["has_request_time"] is True
+    assert given.headers["x-request-id"] == "abc-123"
+    assert given.headers["x-content-type-options"] == "nosniff"
+    assert given.headers["x-frame-options"] == "DENY"
+    assert "strict-transport-security" not in given.headers
+    assert generated.headers["x-request-id"] == generated.json()["request_id"]
+    assert request_id_var.get() == "-"
+
+
+@pytest.mark.asyncio
+async def test_hsts_only_when_https_only():
+    """https_only면 HSTS 헤더를 추가한다."""
+    async with await _client(_build_app(https_only=True)) as client:
+        res = await client.get("/ping")
+
+    assert res.headers["strict-transport-security"] == "max-age=31536000; includeSubDomains"
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_passes_through():
+    """스트리밍 응답도 헤더가 붙은 채 본문이 그대로 전달된다."""
+    async with await _client(_build_app()) as client:
+        res = await client.get("/stream")
+
+    assert res.text == "chunk0\nchunk1\nchunk2\n"
+    assert "x-request-id" in res.headers
+
+
+@pytest.mark.asyncio
+async def test_body_limit_by_content_length():
+    """Content-Length가 제한을 넘으면 413, 이내면 통과한다."""
+    async with await _client(_build_app(max_body_size=64)) as client:
+        small = await client.post("/echo", content=b"x" * 64)
+        large = await client.post("/echo", content=b"x" * 65)
+
+    assert small.json() == {"size": 64}
+    assert large.status_code == 413
+    assert large.json()["detail"]["code"] == "PAYLOAD_TOO_LARGE"
+
+
+@pytest.mark.asyncio
+async def test_body_limit_on_chunked_body():
+    """Content-Length 없는 chunked 본문도 읽는 도중 제한을 넘으면 413을 반환하고 나머지는 읽지 않는다."""
+    consumed = 0
+
+    async def body(chunks: int):
+        nonlocal consumed
+        for _ in range(chunks):
+            consumed += 1
+            yield b"x" * 32
+
+    async with await _client(_build_app(max_body_size=64)) as client:
+        ok = await client.post("/echo", content=body(2))
+        consumed = 0
+        too_large = await client.post("/echo", content=body(10))
+
+    assert ok.json() == {"size": 64}
+    assert too_large.status_code == 413
+    assert too_large.json()["detail"]["code"] == "PAYLOAD_TOO_LARGE"
+    # 제한을 넘은 뒤로는 더 읽지 않음
+    assert consumed < 10
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_headers_and_429(monkeypatch):
+    """설정된 엔드포인트는 남은 횟수 헤더를 붙이고, 초과하면 429를 반환한다. 설정 없는 GET은 제외한다."""
+    monkeypatch.setattr(rl.settings, "TESTING", False)
+    monkeypatch.setattr(rl, "_rate_limiter", MemoryRateLimiter(max_tracked_ips=100))
+    monkeypatch.setitem(rl.RATE_LIMIT_CONFIG, "POST:/echo", {"max_requests": 2, "window_seconds": 60})
+
+    async with await _client(_build_app()) as client:
+        first = await client.post("/echo", content=b"x")
+        await client.post("/echo", content=b"x")
+        limited = await client.post("/echo", content=b"x")
+        unlimited_get = await client.get("/ping")
+
+    assert first.headers["x-ratelimit-limit"] == "2"
+    assert first.headers["x-ratelimit-remaining"] == "1"
+    assert limited.status_code == 429
+    # 60초에 2회 → 30초 뒤 다음 토큰
+    assert limited.headers["retry-after"] == "30"
+    assert limited.json()["error"] == "too_many_requests"
+    assert "x-ratelimit-limit" not in unlimited_get.headers
@@ -0,0 +1,59 @@
+# tests/test_pagination.py
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from core.utils.pagination import build_pagination, decode_cursor, encode_cursor, keyset_condition
+
+
+def test_cursor_roundtrip_preserves_values():
+    """커서 인코딩/디코딩 왕복 시 정렬 키 값이 보존된다 (datetime은 MySQL 비교 가능한 문자열로)."""
+    cursor = encode_cursor("likes", [1, 42, datetime(2026, 1, 2, 3, 4, 5), 7])
+
+    values = decode_cursor(cursor, "likes", 4, "ts")
+
+    assert values == [1, 42, "2026-01-02 03:04:05", 7]
+
+
+@pytest.mark.parametrize(
+    ("cursor", "scope", "arity"),
+    [
+        ("not-a-cursor", "latest", 3),
+        (encode_cursor("likes", [1, 2, "2026-01-01 00:00:00", 3]), "latest", 3),
+        (encode_cursor("latest", [1, "2026-01-01 00:00:00"]), "latest", 3),
+        (encode_cursor("latest", [1, {"x": 1}, 3]), "latest", 3),
+    ],
+)
+def test_decode_cursor_rejects_invalid(cursor, scope, arity):
+    """변조·정렬 불일치·길이 불일치 커서는 400 invalid_cursor."""
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor, scope, arity, "ts")
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail["error"] == "invalid_cursor"
+
+
+def test_keyset_condition_expands_row_comparison():
+    """(a, b, c) < (x, y, z)를 인덱스 친화적인 OR 전개식으로 생성한다."""
+    sql, params = keyset_condition(["a", "b", "c"], [1, 2, 3])
+
+    assert sql == "((a < %s) OR (a = %s AND b < %s) OR (a = %s AND b = %s AND c < %s))"
+    assert params == [1, 1, 2, 1, 2, 3]
+
+
+def test_keyset_condition_ascending():
+    """descending=False면 > 비교를 사용한다."""
+    sql, _ = keyset_condition(["m.created_at", "m.id"], ["2026-01-01", 5], descending=False)
+
+    assert sql == "((m.created_at > %s) OR (m.created_at = %s AND m.id > %s))"
+
+
+def test_build_pagination_cursor_mode_uses_page_size():
+    """커서 모드는 total_count 대신 페이지가 가득 찼는지로 has_more를 판단한다."""
+    full = build_pagination("n", total_count=0, offset=0, limit=2, page_size=2, last_key=[1, 2], cursor_mode=True)
+    partial = build_pagination("n", total_count=0, offset=0, limit=2, page_size=1, last_key=[1, 2], cursor_mode=True)
+
+    assert full["has_more"] is True
+    assert decode_cursor(full["next_cursor"], "n", 2, "ts") == [1, 2]
+    assert partial == {"total_count": 0, "has_more": False, "next_cursor": None}
@@ -0,0 +1,123 @@
+# tests/test_poll_tally.py
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from modules.post import poll_tally as pt
+from modules.post.poll_tally import PollSnapshotCache, PollUpdatePusher, get_poll, get_poll_snapshot
+
+
+def _snapshot(counts: list[int], expires_at: datetime | None = None) -> dict:
+    options = [
+        {"option_id": 10 + i, "option_text": f"옵션 {i}", "sort_order": i, "vote_count": count}
+        for i, count in enumerate(counts)
+    ]
+    return {
+        "poll_id": 3,
+        "question": "좋아하는 언어?",
+        "expires_at": expires_at,
+        "options": options,
+        "total_votes": sum(counts),
+    }
+
+
+@pytest.fixture(autouse=True)
+def _cache(monkeypatch):
+    cache = PollSnapshotCache(max_entries=2)
+    monkeypatch.setattr(pt, "poll_snapshots", cache)
+    monkeypatch.setattr(pt.settings, "POLL_SNAPSHOT_TTL_SECONDS", 60)
+    monkeypatch.setattr(pt.settings, "POLL_PUSH_INTERVAL_SECONDS", 0.05)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_loaded_once_including_missing_poll():
+    """투표가 있는 게시글과 없는 게시글 모두 무효화 전까지 한 번만 조회한다."""
+    loader = AsyncMock(side_effect=lambda post_id: _snapshot([1, 2]) if post_id == 1 else None)
+
+    with patch("modules.post.poll_models.get_poll_snapshot", new=loader):
+        for _ in range(3):
+            assert (await get_poll_snapshot(1))["total_votes"] == 3
+            assert await get_poll_snapshot(2) is None
+
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_load_skips_stale_snapshot(_cache):
+    """조회 중 무효화가 일어나면 읽어 온 (오래된) 스냅샷을 캐시하지 않는다."""
+
+    async def loader(post_id: int) -> dict:
+        _cache.invalidate_post(post_id)
+        return _snapshot([1])
+
+    with patch("modules.post.poll_models.get_poll_snapshot", new=loader):
+        await get_poll_snapshot(1)
+
+    assert _cache.lookup("1", ("1",)) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_get_poll_adds_user_vote_and_expiry_without_mutating_cache(_cache):
+    """응답에는 my_vote/is_expired가 붙고, 응답을 수정해도 캐시된 스냅샷은 바뀌지 않는다."""
+    past = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=1)
+    snapshot = _snapshot([2, 0], expires_at=past)
+
+    with (
+        patch("modules.post.poll_models.get_poll_snapshot", new=AsyncMock(return_value=snapshot)),
+        patch("modules.post.poll_models.get_user_vote", new=AsyncMock(return_value=10)) as user_vote,
+    ):
+        poll = await get_poll(1, current_user_id=7)
+        anonymous = await get_poll(1)
+
+    assert poll is not None and anonymous is not None
+    assert poll["my_vote"] == 10
+    assert poll["is_expired"] is True
+    assert anonymous["my_vote"] is None
+    user_vote.assert_awaited_once_with(3, 7)
+    poll["options"][0]["vote_count"] = 99
+    assert _cache.lookup("1", ("1",))[1]["options"][0]["vote_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_pusher_coalesces_changes_within_interval():
+    """첫 변경은 바로 푸시하고, 간격 안의 나머지 변경은 한 번의 푸시로 합친다."""
+    pusher = PollUpdatePusher()
+    counts = iter([[1, 0], [3, 1]])
+    loader = AsyncMock(side_effect=lambda post_id: _snapshot(next(counts)))
+    push = AsyncMock()
+
+    with (
+        patch("modules.post.poll_models.get_poll_snapshot", new=loader),
+        patch("modules.post.poll_tally.push_to_topic", new=push),
+    ):
+        for _ in range(5):
+            pusher.notify(1)
+            await asyncio.sleep(0)
+        while pusher.pending:
+            await asyncio.sleep(0.01)
+
+    assert push.await_count == 2
+    topic, event = push.await_args.args
+    assert topic == "poll:3"
+    assert event["type"] == "poll_updated"
+    assert event["total_votes"] == 4
+    assert event["options"] == [{"option_id": 10, "vote_count": 3}, {"option_id": 11, "vote_count": 1}]
+
+
+@pytest.mark.asyncio
+async def test_pusher_close_cancels_pending_cycles():
+    """close()는 진행 중인 푸시 주기를 취소한다."""
+    pusher = PollUpdatePusher()
+
+    with (
+        patch("modules.post.poll_models.get_poll_snapshot", new=AsyncMock(return_value=_snapshot([1]))),
+        patch("modules.post.poll_tally.push_to_topic", new=AsyncMock()),
+    ):
+        pusher.notify(1)
+        await asyncio.sleep(0)
+        await pusher.close()
+
+    assert pusher.pending == 0
@@ -0,0 +1,145 @@
+# tests/test_principal_cache.py
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.utils import principal_cache as pc
+from core.utils.principal_cache import PrincipalCache, get_cached_user, invalidate_user
+from modules.user.models import User
+
+
+def _user(user_id: int = 1, nickname: str = "tux") -> User:
+    return User(id=user_id, email=f"{nickname}@example.com", password=None, nickname=nickname)
+
+
+@pytest.fixture(autouse=True)
+def _enabled_cache(monkeypatch):
+    cache = PrincipalCache(ttl_seconds=60, max_entries=2)
+    monkeypatch.setattr(pc, "principal_cache", cache)
+    return cache
+
+
+def test_cache_expires_after_ttl(_enabled_cache):
+    """TTL이 지난 항목은 반환하지 않는다."""
+    with patch("core.utils.principal_cache.time.monotonic", side_effect=[0.0, 30.0, 100.0]):
+        _enabled_cache.set(1, _user())
+        assert _enabled_cache.get(1) is not None
+        assert _enabled_cache.get(1) is None
+
+
+def test_cache_evicts_least_recently_used(_enabled_cache):
+    """상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거한다."""
+    _enabled_cache.set(1, _user(1))
+    _enabled_cache.set(2, _user(2))
+    _enabled_cache.get(1)
+    _enabled_cache.set(3, _user(3))
+
+    assert _enabled_cache.get(2) is None
+    assert _enabled_cache.get(1) is not None
+
+
+def test_zero_ttl_disables_cache():
+    """TTL 0이면 저장하지 않는다."""
+    cache = PrincipalCache(ttl_seconds=0, max_entries=10)
+    cache.set(1, _user())
+    assert cache.get(1) is None
+
+
+@pytest.mark.asyncio
+async def test_get_cached_user_loads_once():
+    """캐시 적중 시 loader를 다시 호출하지 않는다."""
+    loader = AsyncMock(return_value=_user())
+
+    first = await get_cached_user(1, loader)
+    second = await get_cached_user(1, loader)
+
+    assert first == second
+    assert loader.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_cached_user_does_not_cache_missing_user():
+    """존재하지 않는 사용자(None)는 캐시하지 않는다."""
+    loader = AsyncMock(return_value=None)
+
+    await get_cached_user(1, loader)
+    await get_cached_user(1, loader)
+
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_load_skips_stale_set(_enabled_cache):
+    """조회 중 무효화가 일어나면 읽어 온 (오래된) 값을 캐시하지 않는다."""
+
+    async def loader(user_id: int) -> User:
+        _enabled_cache.invalidate(user_id)
+        return _user(user_id)
+
+    await get_cached_user(1, loader)
+
+    assert _enabled_cache.get(1) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user_local_mode_does_not_publish(_enabled_cache, monkeypatch):
+    """local 모드에서는 로컬 캐시만 제거하고 Redis를 사용하지 않는다."""
+    monkeypatch.setattr(pc.settings, "PRINCIPAL_CACHE_INVALIDATION", "local")
+    _enabled_cache.set(1, _user())
+
+    with patch("core.utils.redis_client.get_redis", new_callable=AsyncMock) as mock_get_redis:
+        await invalidate_user(1)
+
+    assert _enabled_cache.get(1) is None
+    mock_get_redis.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user_redis_mode_publishes(_enabled_cache, monkeypatch):
+    """redis 모드에서는 무효화 채널에 user_id를 발행한다."""
+    monkeypatch.setattr(pc.settings, "PRINCIPAL_CACHE_INVALIDATION", "redis")
+    redis = SimpleNamespace(publish=AsyncMock())
+
+    with patch("core.utils.redis_client.get_redis", new=AsyncMock(return_value=redis)):
+        await invalidate_user(7)
+
+    redis.publish.assert_awaited_once_with(pc.INVALIDATION_CHANNEL, "7")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user_swallows_publish_error(monkeypatch):
+    """Redis 발행 실패는 예외를 전파하지 않는다 (best-effort)."""
+    monkeypatch.setattr(pc.settings, "PRINCIPAL_CACHE_INVALIDATION", "redis")
+
+    with patch("core.utils.redis_client.get_redis", new=AsyncMock(side_effect=ConnectionError("down"))):
+        await invalidate_user(7)
+
+
+def test_invalidation_message_removes_entry(_enabled_cache):
+    """다른 워커에서 받은 무효화 메시지를 로컬 캐시에 반영하고, 잘못된 메시지는 무시한다."""
+    _enabled_cache.set(3, _user(3))
+
+    pc._handle_invalidation_message("not-a-number")
+    assert _enabled_cache.get(3) is not None
+
+    pc._handle_invalidation_message("3")
+    assert _enabled_cache.get(3) is None
+
+
+@pytest.mark.asyncio
+async def test_validate_token_memoizes_per_request():
+    """한 요청에서 인증 의존성을 여러 번 해석해도 토큰 검증/조회는 한 번만 수행한다."""
+    from core.dependencies import auth
+
+    request = SimpleNamespace(headers={"Authorization": "Bearer tok"}, state=SimpleNamespace())
+
+    with (
+        patch.object(auth, "decode_access_token", return_value={"sub": "1"}) as mock_decode,
+        patch.object(auth.user_models, "get_user_by_id", new=AsyncMock(return_value=_user())),
+    ):
+        first = await auth.get_current_user(request)  # type: ignore[arg-type]
+        second = await auth.get_optional_user(request)  # type: ignore[arg-type]
+
+    assert first is second
+    assert mock_decode.call_count == 1
@@ -0,0 +1,141 @@
+# tests/test_rate_limit_registry.py
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+
+from core.middleware import RateLimitMiddleware
+from core.middleware import rate_limiter as rl
+from core.middleware.rate_limit_registry import RateLimitRegistry, RouteLimit
+from core.middleware.rate_limiter_memory import MemoryRateLimiter
+from core.utils.jwt_utils import create_access_token
+
+CONFIG = {
+    "/v1/posts": {"max_requests": 10, "window_seconds": 60, "key": "user"},
+    "POST:/v1/posts/{id}/bookmark": {"max_requests": 30, "window_seconds": 60},
+    "GET:/v1/users/search": {"max_requests": 30, "window_seconds": 60},
+}
+DEFAULT = {"max_requests": 100, "window_seconds": 60}
+
+
+def _app() -> FastAPI:
+    posts = APIRouter(prefix="/v1/posts")
+    users = APIRouter(prefix="/v1/users")
+    wiki = APIRouter(prefix="/v1/wiki")
+
+    @posts.post("/")
+    async def create_post():
+        return {}
+
+    @posts.get("/{post_id}")
+    async def get_post(post_id: int):
+        return {}
+
+    @posts.post("/{post_id}/bookmark")
+    async def bookmark(post_id: int):
+        return {}
+
+    @users.get("/search")
+    async def search():
+        return {}
+
+    @users.get("/{user_id}")
+    async def get_user(user_id: int):
+        return {}
+
+    @wiki.put("/{slug}")
+    async def update_wiki(slug: str):
+        return {}
+
+    app = FastAPI()
+    for router in (posts, users, wiki):
+        app.include_router(router)
+    return app
+
+
+@pytest.fixture
+def registry() -> RateLimitRegistry:
+    return RateLimitRegistry(_app().routes, CONFIG, DEFAULT)
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "template", "limit"),
+    [
+        # 끝 슬래시 유무와 무관하게 "/v1/posts" 설정이 POST /v1/posts/에 적용
+        ("POST", "/v1/posts", "/v1/posts/", RouteLimit(10, 60, per_user=True)),
+        ("POST", "/v1/posts/", "/v1/posts/", RouteLimit(10, 60, per_user=True)),
+        ("POST", "/v1/posts/42/bookmark", "/v1/posts/{post_id}/bookmark", RouteLimit(30, 60)),
+        # 고정 세그먼트가 파라미터보다 우선
+        ("GET", "/v1/users/search", "/v1/users/search", RouteLimit(30, 60)),
+        # 설정 없는 GET은 템플릿만 매칭하고 제한하지 않음
+        ("GET", "/v1/users/7", "/v1/users/{user_id}", None),
+        ("GET", "/v1/posts/42", "/v1/posts/{post_id}", None),
+        # 숫자가 아닌 파라미터(slug)도 하나의 템플릿으로 합산, 설정 없는 비GET은 기본 한도
+        ("PUT", "/v1/wiki/linux-kernel", "/v1/wiki/{slug}", RouteLimit(100, 60)),
+    ],
+)
+def test_resolve_matches_route_template(registry, method, path, template, limit):
+    """요청 경로를 라우트 템플릿에 매칭하고 시작 시 결정한 한도를 돌려준다."""
+    assert registry.resolve(method, path) == (template, limit)
+
+
+@pytest.mark.parametrize(
+    ("method", "path"),
+    [("POST", "/v1/unknown"), ("DELETE", "/v1/posts/42"), ("PUT", "/v1/wiki/a/b"), ("PUT", "/v1/wiki//")],
+)
+def test_resolve_returns_none_without_route(registry, method, path):
+    """경로나 메서드가 맞는 라우트가 없으면 None."""
+    assert registry.resolve(method, path) is None
+
+
+@pytest.mark.asyncio
+async def test_per_user_limit_uses_token_subject(monkeypatch):
+    """사용자 기준 한도는 같은 IP라도 사용자별로 합산하고, 토큰이 없거나 무효면 IP로 합산한다."""
+    monkeypatch.setattr(rl.settings, "TESTING", False)
+    monkeypatch.setattr(rl, "_rate_limiter", MemoryRateLimiter(max_tracked_ips=100))
+    monkeypatch.setattr(
+        rl, "RATE_LIMIT_CONFIG", {"/v1/posts": {"max_requests": 1, "window_seconds": 60, "key": "user"}}
+    )
+    app = _app()
+    app.add_middleware(RateLimitMiddleware)
+
+    def auth(user_id: int) -> dict[str, str]:
+        return {"Authorization": f"Bearer {create_access_token(user_id)}"}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        alice = [await client.post("/v1/posts/", headers=auth(1)) for _ in range(2)]
+        bob = await client.post("/v1/posts/", headers=auth(2))
+        anonymous = [await client.post("/v1/posts/") for _ in range(2)]
+        forged = await client.post("/v1/posts/", headers={"Authorization": "Bearer not-a-jwt"})
+
+    assert [r.status_code for r in alice] == [200, 429]
+    assert bob.status_code == 200
+    assert [r.status_code for r in anonymous] == [200, 429]
+    # 무효 토큰은 IP 버킷을 공유하므로 이미 소진됨
+    assert forged.status_code == 429
+    assert app.state.rate_limit_registry.resolve("POST", "/v1/posts/").limit.max_requests == 1
+
+
+def test_warns_on_config_without_route(caplog):
+    """라우트와 매칭되지 않는 설정 키는 시작 시 경고한다 (GET에는 경로만 있는 키가 적용되지 않음)."""
+    config = {**CONFIG, "/v1/users/search": {"max_requests": 5, "window_seconds": 60}}
+
+    RateLimitRegistry(_app().routes, config, DEFAULT)
+
+    assert "/v1/users/search" in caplog.text
+    assert "bookmark" not in caplog.text
+
+
+def test_mounted_sub_application_routes_are_prefixed():
+    """Mount된 하위 앱의 라우트는 마운트 경로를 붙인 템플릿으로 매칭한다."""
+    sub = FastAPI()
+
+    @sub.post("/items/{item_id}")
+    async def create_item(item_id: int):
+        return {}
+
+    app = FastAPI()
+    app.mount("/sub", sub)
+
+    registry = RateLimitRegistry(app.routes, {}, DEFAULT)
+
+    assert registry.resolve("POST", "/sub/items/3") == ("/sub/items/{item_id}", RouteLimit(100, 60))
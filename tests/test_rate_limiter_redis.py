@@ -1,74 +1,79 @@
 # tests/test_rate_limiter_redis.py
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 pytest.importorskip("redis", reason="redis는 K8s optional dependency")
 
+from core.middleware.rate_limiter_redis import RedisRateLimiter
+
+
+def _limiter(*results, side_effect=None, **kwargs) -> tuple[RedisRateLimiter, AsyncMock]:
+    """스크립트 호출이 results를 차례로 반환하는 RedisRateLimiter."""
+    script = AsyncMock(side_effect=side_effect or list(results))
+    mock_redis = MagicMock()
+    mock_redis.register_script.return_value = script
+    limiter = RedisRateLimiter(redis_url="redis://localhost:6379", **kwargs)
+    limiter._redis = mock_redis
+    return limiter, script
+
 
 @pytest.mark.asyncio
 async def test_redis_rate_limiter_allows_under_limit():
-    """제한 이하 요청은 허용"""
-    mock_redis = AsyncMock()
-    mock_redis.incr.return_value = 3
-    mock_redis.expire.return_value = True
+    """허용되면 스크립트가 돌려준 남은 토큰 수를 보고한다."""
+    limiter, script = _limiter([1, 2, 0])
 
-    with patch("core.middleware.rate_limiter_redis.get_redis", return_value=mock_redis):
-        from core.middleware.rate_limiter_redis import RedisRateLimiter
+    is_limited, remaining = await limiter.is_rate_limited("127.0.0.1:POST:/v1/auth/session", 5, 60)
 
-        limiter = RedisRateLimiter(redis_url="redis://localhost:6379")
-        limiter._redis = mock_redis
-
-        is_limited, remaining = await limiter.is_rate_limited("127.0.0.1:POST:/v1/auth/session", 5, 60)
-        assert is_limited is False
-        assert remaining == 2  # 5 - 3
+    assert is_limited is False
+    assert remaining == 2
+    script.assert_awaited_once_with(keys=["rate:127.0.0.1:POST:/v1/auth/session"], args=[60000, 5, 1])
 
 
 @pytest.mark.asyncio
-async def test_redis_rate_limiter_blocks_over_limit():
-    """제한 초과 요청은 차단"""
-    mock_redis = AsyncMock()
-    mock_redis.incr.return_value = 6
-
-    with patch("core.middleware.rate_limiter_redis.get_redis", return_value=mock_redis):
-        from core.middleware.rate_limiter_redis import RedisRateLimiter
+async def test_redis_rate_limiter_blocks_with_retry_after():
+    """토큰이 없으면 차단하고 재시도 시간을 초 단위로 올림한다."""
+    limiter, _ = _limiter([0, 0, 11500])
 
-        limiter = RedisRateLimiter(redis_url="redis://localhost:6379")
-        limiter._redis = mock_redis
+    decision = await limiter.check("127.0.0.1:POST:/v1/auth/session", 5, 60)
 
-        is_limited, remaining = await limiter.is_rate_limited("127.0.0.1:POST:/v1/auth/session", 5, 60)
-        assert is_limited is True
-        assert remaining == 0
+    assert decision.limited is True
+    assert decision.remaining == 0
+    assert decision.retry_after == 12
 
 
 @pytest.mark.asyncio
 async def test_redis_rate_limiter_fail_open():
     """Redis 장애 시 요청 허용 (fail-open)"""
-    mock_redis = AsyncMock()
-    mock_redis.incr.side_effect = ConnectionError("Redis down")
+    limiter, _ = _limiter(side_effect=ConnectionError("Redis down"))
 
-    with patch("core.middleware.rate_limiter_redis.get_redis", return_value=mock_redis):
-        from core.middleware.rate_limiter_redis import RedisRateLimiter
+    is_limited, remaining = await limiter.is_rate_limited("127.0.0.1:POST:/v1/auth/session", 5, 60)
 
-        limiter = RedisRateLimiter(redis_url="redis://localhost:6379")
-        limiter._redis = mock_redis
-
-        is_limited, remaining = await limiter.is_rate_limited("127.0.0.1:POST:/v1/auth/session", 5, 60)
-        assert is_limited is False
-        assert remaining == 5
+    assert is_limited is False
+    assert remaining == 5
 
 
 @pytest.mark.asyncio
-async def test_redis_rate_limiter_sets_expire_on_first_request():
-    """첫 요청(count=1)에서 EXPIRE 설정"""
-    mock_redis = AsyncMock()
-    mock_redis.incr.return_value = 1
+async def test_prefetch_serves_local_tokens_with_one_redis_call():
+    """넉넉한 한도는 토큰을 한 번에 가져와 다음 요청들을 Redis 호출 없이 처리한다."""
+    limiter, script = _limiter([10, 90, 0], [1, 89, 0], prefetch_tokens=10, prefetch_min_limit=100)
+
+    decisions = [await limiter.check("1.2.3.4:GET:/v1/dms", 100, 60) for _ in range(11)]
+
+    assert script.await_count == 2
+    assert script.await_args_list[0].kwargs["args"] == [60000, 100, 10]
+    assert [d.remaining for d in decisions[:10]] == list(range(99, 89, -1))
+    assert decisions[10].remaining == 89
+    assert not any(d.limited for d in decisions)
 
-    with patch("core.middleware.rate_limiter_redis.get_redis", return_value=mock_redis):
-        from core.middleware.rate_limiter_redis import RedisRateLimiter
 
-        limiter = RedisRateLimiter(redis_url="redis://localhost:6379")
-        limiter._redis = mock_redis
+@pytest.mark.asyncio
+async def test_prefetch_skipped_for_strict_limits():
+    """최소 한도 미만의 엄격한 한도는 요청마다 토큰 하나만 가져온다."""
+    limiter, script = _limiter([1, 4, 0], [1, 3, 0], prefetch_tokens=10, prefetch_min_limit=100)
+
+    await limiter.check("1.2.3.4:POST:/v1/auth/session", 5, 60)
+    await limiter.check("1.2.3.4:POST:/v1/auth/session", 5, 60)
 
-        await limiter.is_rate_limited("127.0.0.1:POST:/v1/auth/session", 5, 60)
-        mock_redis.expire.assert_called_once()
+    assert script.await_count == 2
+    assert script.await_args_list[1].kwargs["args"] == [60000, 5, 1]
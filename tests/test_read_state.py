@@ -0,0 +1,139 @@
+# tests/test_read_state.py
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.utils import read_state as rs
+from core.utils.read_state import ReadBitmap, ReadStateStore, mark_post_read, read_post_ids, rebuild_read_state
+
+
+@pytest.fixture(autouse=True)
+def _memory_store(monkeypatch):
+    store = ReadStateStore(max_users=2)
+    monkeypatch.setattr(rs, "read_state", store)
+    monkeypatch.setattr(rs.settings, "READ_STATE_BACKEND", "memory")
+    monkeypatch.setattr(rs.settings, "READ_STATE_TTL_SECONDS", 60)
+    return store
+
+
+def test_bitmap_spans_blocks():
+    """블록 경계를 넘는 post_id도 각각 표시되고, 표시하지 않은 ID는 포함되지 않는다."""
+    bitmap = ReadBitmap()
+    bitmap.update([0, 1023, 1024, 5000])
+
+    assert all(post_id in bitmap for post_id in (0, 1023, 1024, 5000))
+    assert 1 not in bitmap
+    assert 4999 not in bitmap
+    assert sorted(bitmap.blocks) == [0, 1, 4]
+
+
+@pytest.mark.asyncio
+async def test_memory_loads_once_and_merges_marks():
+    """memory 모드: 첫 조회에서 한 번 적재하고, 이후 조회 기록은 DB 재조회 없이 반영된다."""
+    loader = AsyncMock(return_value={1, 3})
+
+    with patch("modules.post.post_models.get_viewed_post_ids", new=loader):
+        assert await read_post_ids(7, [1, 2, 3]) == {1, 3}
+        await mark_post_read(7, 2)
+        assert await read_post_ids(7, [1, 2, 3, 4]) == {1, 2, 3}
+
+    assert loader.await_count == 1
+    loader.assert_awaited_with(7, within_seconds=None)
+
+
+@pytest.mark.asyncio
+async def test_memory_refresh_after_ttl_reads_recent_rows_only():
+    """TTL이 지나면 마지막 적재 이후 기간(여유분 포함)만 다시 읽어 합친다."""
+    loader = AsyncMock(side_effect=[{1}, {2}])
+
+    with (
+        patch("modules.post.post_models.get_viewed_post_ids", new=loader),
+        patch("core.utils.read_state.time.monotonic", side_effect=[0.0, 100.0]),
+    ):
+        assert await read_post_ids(7, [1, 2]) == {1}
+        assert await read_post_ids(7, [1, 2]) == {1, 2}
+
+    loader.assert_awaited_with(7, within_seconds=100 + rs._REFRESH_OVERLAP_SECONDS)
+
+
+def test_store_evicts_least_recently_used(_memory_store):
+    """LRU 상한을 넘으면 가장 오래 쓰지 않은 사용자를 버린다."""
+    _memory_store.bitmap(1)
+    _memory_store.bitmap(2)
+    _memory_store.get(1)
+    _memory_store.bitmap(3)
+
+    assert _memory_store.user_ids() == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_db_backend_delegates_to_view_log(monkeypatch, _memory_store):
+    """db 모드: 저장소를 쓰지 않고 post_view_log 조회 결과를 그대로 반환한다."""
+    monkeypatch.setattr(rs.settings, "READ_STATE_BACKEND", "db")
+    loader = AsyncMock(return_value={2})
+
+    with patch("modules.post.post_models.get_read_post_ids", new=loader):
+        await mark_post_read(7, 1)
+        assert await read_post_ids(7, [1, 2]) == {2}
+
+    assert _memory_store.user_ids() == []
+
+
+@pytest.mark.asyncio
+async def test_redis_loads_once_then_uses_bits(monkeypatch, fake_redis):
+    """redis 모드: 적재 표시가 없을 때만 DB에서 적재하고, 이후에는 SETBIT된 비트로 답한다."""
+    monkeypatch.setattr(rs.settings, "READ_STATE_BACKEND", "redis")
+    redis = fake_redis
+    loader = AsyncMock(return_value={1, 2048})
+
+    with (
+        patch("core.utils.redis_client.get_redis", new=AsyncMock(return_value=redis)),
+        patch("modules.post.post_models.get_viewed_post_ids", new=loader),
+    ):
+        assert await read_post_ids(7, [1, 2, 2048]) == {1, 2048}
+        await mark_post_read(7, 2)
+        assert await read_post_ids(7, [1, 2, 3, 2048]) == {1, 2, 2048}
+
+    assert loader.await_count == 1
+    assert redis.data == {"read:7:loaded": 1}
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_view_log(monkeypatch):
+    """Redis 오류는 예외를 전파하지 않고 post_view_log 조회로 폴백한다."""
+    monkeypatch.setattr(rs.settings, "READ_STATE_BACKEND", "redis")
+    fallback = AsyncMock(return_value={1})
+
+    with (
+        patch("core.utils.redis_client.get_redis", new=AsyncMock(side_effect=ConnectionError("down"))),
+        patch("modules.post.post_models.get_read_post_ids", new=fallback),
+    ):
+        await mark_post_read(7, 1)
+        assert await read_post_ids(7, [1, 2]) == {1}
+
+
+@pytest.mark.asyncio
+async def test_redis_rebuild_replays_view_log(monkeypatch, fake_redis):
+    """redis 재구성: post_view_log를 id 순으로 끝까지 읽어 사용자별 비트와 적재 표시를 남긴다."""
+    monkeypatch.setattr(rs.settings, "READ_STATE_BACKEND", "redis")
+    monkeypatch.setattr(rs, "_REBUILD_CHUNK_SIZE", 2)
+    redis = fake_redis
+    rows = [
+        {"id": 1, "user_id": 7, "post_id": 1},
+        {"id": 2, "user_id": 8, "post_id": 1},
+        {"id": 5, "user_id": 7, "post_id": 1500},
+    ]
+
+    async def view_log_after(after_id, limit):
+        return [row for row in rows if row["id"] > after_id][:limit]
+
+    with (
+        patch("core.utils.redis_client.get_redis", new=AsyncMock(return_value=redis)),
+        patch("modules.post.post_models.get_view_log_after", new=view_log_after),
+    ):
+        result = await rebuild_read_state()
+
+    assert result["view_log_rows"] == 3
+    assert result["users"] == 2
+    assert redis.bits == {"read:7:0": {1}, "read:8:0": {1}, "read:7:1": {476}}
+    assert set(redis.data) == {"read:7:loaded", "read:8:loaded"}
@@ -0,0 +1,37 @@
+# tests/test_related_scorer.py
+from modules.post.related_scorer import RelatedCandidate, jaccard, rank_related
+
+
+def _post(post_id: int, tags: set[int], category_id: int | None = None, hot: float = 0.0) -> RelatedCandidate:
+    return RelatedCandidate(post_id=post_id, category_id=category_id, tag_ids=frozenset(tags), hot_score=hot)
+
+
+def test_jaccard_similarity():
+    """교집합 / 합집합이며, 한쪽이 비어 있으면 0이다."""
+    assert jaccard(frozenset({1, 2}), frozenset({2, 3})) == 1 / 3
+    assert jaccard(frozenset({1}), frozenset({1})) == 1.0
+    assert jaccard(frozenset(), frozenset({1})) == 0.0
+
+
+def test_rank_orders_by_similarity_then_category_then_hot():
+    """태그 유사도가 높은 순, 같으면 같은 카테고리, 그다음 hot_score 순으로 정렬한다."""
+    source = _post(1, {1, 2}, category_id=5)
+    candidates = [
+        _post(2, {1}, category_id=9, hot=10.0),  # 1/2
+        _post(3, {1, 2}, category_id=9),  # 1.0
+        _post(4, set(), category_id=5, hot=1.0),  # 같은 카테고리
+        _post(5, set(), category_id=9, hot=50.0),  # 인기만 높음
+        _post(6, {1}, category_id=5, hot=0.0),  # 1/2 + 같은 카테고리
+    ]
+
+    assert [post_id for post_id, _ in rank_related(source, candidates, 10)] == [3, 6, 2, 4, 5]
+
+
+def test_rank_skips_self_and_duplicates_and_limits():
+    """자기 자신과 중복 후보는 제외하고 상위 k개만 반환한다."""
+    source = _post(1, {1})
+    candidates = [_post(1, {1}), _post(2, {1}), _post(2, {1}), _post(3, {1}), _post(4, set())]
+
+    ranked = rank_related(source, candidates, 2)
+
+    assert ranked == [(3, 1.0), (2, 1.0)]
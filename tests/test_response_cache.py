@@ -0,0 +1,122 @@
+# tests/test_response_cache.py
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.utils import response_cache as rc
+from core.utils.response_cache import ResponseCache, cached_response, invalidate, invalidate_post_responses
+
+
+@pytest.fixture(autouse=True)
+def _local_cache(monkeypatch):
+    cache = ResponseCache(max_entries=2)
+    monkeypatch.setattr(rc, "response_cache", cache)
+    monkeypatch.setattr(rc.settings, "RESPONSE_CACHE_BACKEND", "local")
+    monkeypatch.setattr(rc.settings, "RESPONSE_CACHE_TTL_SECONDS", 30)
+    monkeypatch.setattr(rc.settings, "RESPONSE_CACHE_L1_TTL_SECONDS", 2)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_cached_response_loads_once():
+    """같은 네임스페이스/시그니처는 loader를 한 번만 호출한다."""
+    loader = AsyncMock(return_value='{"a":1}')
+
+    assert await cached_response(("posts",), "sig", loader) == '{"a":1}'
+    assert await cached_response(("posts",), "sig", loader) == '{"a":1}'
+    assert loader.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_bumps_only_matching_namespace():
+    """무효화한 네임스페이스의 항목만 미스가 된다."""
+    loader = AsyncMock(return_value="{}")
+    await cached_response(("posts",), "list", loader)
+    await cached_response(("post:1",), "oldest", loader)
+
+    await invalidate_post_responses()
+    await cached_response(("posts",), "list", loader)
+    await cached_response(("post:1",), "oldest", loader)
+    assert loader.await_count == 3
+
+    await invalidate_post_responses(1)
+    await cached_response(("post:1",), "oldest", loader)
+    assert loader.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_load_skips_stale_set(_local_cache):
+    """조회 중 무효화가 일어나면 읽어 온 (오래된) 응답을 캐시하지 않는다."""
+
+    async def loader() -> str:
+        await invalidate("posts")
+        return "stale"
+
+    await cached_response(("posts",), "sig", loader)
+
+    assert _local_cache.lookup("posts:sig", ("posts",)) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_off_backend_bypasses_cache(monkeypatch):
+    """off 모드에서는 매번 loader를 호출한다."""
+    monkeypatch.setattr(rc.settings, "RESPONSE_CACHE_BACKEND", "off")
+    loader = AsyncMock(return_value="{}")
+
+    await cached_response(("posts",), "sig", loader)
+    await cached_response(("posts",), "sig", loader)
+
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_l2_shared_across_workers_and_versioned(monkeypatch, fake_redis):
+    """redis 모드: 다른 워커(L1 비어 있음)는 L2 값을 쓰고, 공유 버전이 오르면 L2 값도 미스가 된다."""
+    monkeypatch.setattr(rc.settings, "RESPONSE_CACHE_BACKEND", "redis")
+    redis = fake_redis
+    loader = AsyncMock(side_effect=["v1", "v2"])
+
+    with patch("core.utils.redis_client.get_redis", new=AsyncMock(return_value=redis)):
+        assert await cached_response(("posts",), "sig", loader) == "v1"
+
+        # 다른 워커: L1이 비어 있어도 L2에서 적중
+        monkeypatch.setattr(rc, "response_cache", ResponseCache())
+        assert await cached_response(("posts",), "sig", loader) == "v1"
+        assert loader.await_count == 1
+
+        # 또 다른 워커의 쓰기: 공유 버전만 INCR → L1이 없는 워커는 새 응답을 만듦
+        redis.data["resp:ver:posts"] = "1"
+        monkeypatch.setattr(rc, "response_cache", ResponseCache())
+        assert await cached_response(("posts",), "sig", loader) == "v2"
+        assert redis.data["resp:posts:sig"] == "1|v2"
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_loader(monkeypatch):
+    """Redis 조회/무효화 실패는 예외를 전파하지 않고 DB 조회로 폴백한다."""
+    monkeypatch.setattr(rc.settings, "RESPONSE_CACHE_BACKEND", "redis")
+    loader = AsyncMock(return_value="{}")
+
+    with patch("core.utils.redis_client.get_redis", new=AsyncMock(side_effect=ConnectionError("down"))):
+        assert await cached_response(("posts",), "sig", loader) == "{}"
+        await invalidate("posts")
+
+    assert loader.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_anonymous_post_list_is_served_from_cache(monkeypatch):
+    """비로그인 목록은 같은 파라미터면 DB 조회 없이 캐시 응답을 돌려준다."""
+    from modules.post.post_responses import PostListResult
+    from modules.post.post_service import PostService
+
+    fetch = AsyncMock(return_value=PostListResult(posts=[], total_count=0, has_more=False))
+    monkeypatch.setattr(PostService, "_fetch_posts", fetch)
+
+    first = await PostService.get_posts(0, 10, sort="hot", tag="linux")
+    second = await PostService.get_posts(0, 10, sort="hot", tag="linux")
+    await PostService.get_posts(0, 10, sort="hot", tag="linux", current_user=SimpleNamespace(id=1))  # type: ignore[arg-type]
+
+    assert first == second
+    assert fetch.await_count == 2
@@ -0,0 +1,99 @@
+# tests/test_search_index.py
+import pytest
+
+import core.search as search_module
+from core.search import SearchDocument, query_index
+from core.search.analyzer import analyze, build_match_query, highlight
+from core.search.sqlite_index import SqliteSearchIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = SqliteSearchIndex(str(tmp_path / "search.sqlite3"))
+    yield idx
+    idx.close()
+
+
+def test_hangul_is_indexed_as_bigrams():
+    """한글은 겹치는 2-gram, 영문은 소문자 단어로 토큰화하고 검색어는 단어별 구로 묶는다."""
+    assert analyze("Linux 리눅스 설치") == "linux 리눅 눅스 설치"
+    assert build_match_query("리눅스 lin") == '"리눅 눅스" AND "lin"*'
+    assert build_match_query("%_'\"") is None
+
+
+def test_highlight_escapes_html_and_marks_matches():
+    """스니펫은 본문을 HTML 이스케이프하고 검색어만 <mark>로 감싼다."""
+    assert highlight("<b>리눅스</b> 커널", "리눅스") == "&lt;b&gt;<mark>리눅스</mark>&lt;/b&gt; 커널"
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_title_matches_first(index):
+    """제목 일치가 본문 일치보다 앞에 오고, 부분 문자열과 접두어도 찾는다."""
+    await index.apply(
+        {
+            "post": (
+                [
+                    SearchDocument(1, "우분투 설치", "리눅스 배포판 설치 가이드"),
+                    SearchDocument(2, "리눅스 커널 빌드", "커널 컴파일"),
+                    SearchDocument(3, "잡담", "아무 말"),
+                ],
+                [],
+            )
+        }
+    )
+
+    result = await index.search("post", "리눅스", limit=10)
+    assert result.ids == [2, 1]
+    assert (await index.search("post", "리눅스", limit=1)).ids == [2]
+    assert (await index.search("post", "눅스", limit=10)).ids == [2, 1]
+    assert (await index.search("post", "커널 빌드", limit=10)).ids == [2]
+
+    snippets = await index.snippets("post", [1], "리눅스")
+    assert snippets[1].startswith("<mark>리눅스</mark>")
+
+
+@pytest.mark.asyncio
+async def test_apply_deletes_and_advances_watermark_only_when_expected(index):
+    """삭제된 문서는 검색에서 빠지고, 워터마크는 기대 값이 맞을 때만 올라간다 (CAS)."""
+    await index.apply({"wiki": ([SearchDocument(1, "vim 설정", "")], [])}, (0, 5))
+    assert (await index.watermark())[0] == 5
+
+    assert await index.apply({"wiki": ([], [1])}, (0, 9)) is False
+    assert (await index.watermark())[0] == 5
+    assert (await index.search("wiki", "vim", limit=10)).ids == []
+
+
+@pytest.mark.asyncio
+async def test_rebuild_swaps_index_and_rewinds_watermark(index):
+    """재색인은 임시 테이블을 교체하고, 재색인 중 진행된 워터마크를 시작 시점으로 되돌린다."""
+    await index.apply({"tag": ([SearchDocument(1, "old", "")], [])}, (0, 10))
+    assert not await index.is_ready("tag")
+
+    await index.begin_rebuild("tag")
+    await index.add_to_rebuild("tag", [SearchDocument(2, "python", "파이썬 언어")])
+    assert (await index.search("tag", "old", limit=10)).ids == [1]  # 교체 전에는 이전 색인으로 검색
+    await index.finish_rebuild("tag", watermark=7)
+
+    assert await index.is_ready("tag")
+    assert (await index.search("tag", "old", limit=10)).ids == []
+    assert (await index.search("tag", "파이썬", limit=10)).ids == [2]
+    assert (await index.watermark())[0] == 7
+    assert (await index.stats())["tag"] == 1
+
+
+@pytest.mark.asyncio
+async def test_query_index_falls_back_until_index_is_ready(monkeypatch, index):
+    """mysql 백엔드이거나 색인이 준비되지 않았으면 None을 반환해 MySQL 검색으로 폴백한다."""
+    monkeypatch.setattr(search_module, "_index", None)
+    monkeypatch.setattr(search_module.settings, "SEARCH_BACKEND", "mysql")
+    assert await query_index("post", "리눅스") is None
+
+    monkeypatch.setattr(search_module, "_index", index)
+    await index.apply({"post": ([SearchDocument(1, "리눅스", "")], [])})
+    assert await query_index("post", "리눅스") is None
+
+    await index.begin_rebuild("post")
+    await index.add_to_rebuild("post", [SearchDocument(1, "리눅스", "")])
+    await index.finish_rebuild("post", watermark=0)
+    result = await query_index("post", "리눅스")
+    assert result is not None and result.ids == [1]
@@ -0,0 +1,74 @@
+# tests/test_versioned_cache.py
+from unittest.mock import patch
+
+import pytest
+
+from core.utils.versioned_cache import VersionedCache
+
+
+class _Cache(VersionedCache[str | None]):
+    settings_prefix = "TEST_CACHE"
+
+    def backend(self) -> str:
+        return "local"
+
+    def ttl(self) -> float:
+        return 30
+
+
+@pytest.fixture
+def cache():
+    return _Cache(max_entries=2)
+
+
+def test_l1_expires_and_evicts(cache):
+    """TTL이 지났거나 LRU 상한을 넘은 항목은 반환하지 않는다."""
+    with patch("core.utils.versioned_cache.time.monotonic", side_effect=[0.0, 10.0, 40.0]):
+        cache.store("k", ("ns",), "v", 30, stamp=0)
+        assert cache.lookup("k", ("ns",)) == (True, "v")
+        assert cache.lookup("k", ("ns",)) == (False, None)
+
+    cache.store("a", ("ns",), "1", 30, stamp=0)
+    cache.store("b", ("ns",), "2", 30, stamp=0)
+    cache.lookup("a", ("ns",))
+    cache.store("c", ("ns",), "3", 30, stamp=0)
+    assert cache.lookup("b", ("ns",)) == (False, None)
+    assert cache.lookup("a", ("ns",)) == (True, "1")
+
+
+def test_bump_invalidates_only_matching_namespace(cache):
+    """무효화한 네임스페이스에 의존하는 항목만 미스가 되고, 무효화 전에 시작한 조회는 저장하지 않는다."""
+    cache.store("a", ("x",), "1", 30, stamp=0)
+    cache.store("b", ("y",), "2", 30, stamp=0)
+
+    cache.bump(("x",))
+
+    assert cache.lookup("a", ("x",)) == (False, None)
+    assert cache.lookup("b", ("y",)) == (True, "2")
+    cache.store("a", ("x",), "stale", 30, stamp=0)
+    assert cache.lookup("a", ("x",)) == (False, None)
+
+
+def test_evicted_versions_do_not_revive_stale_entries(cache):
+    """로컬 버전 표가 상한을 넘어 제거되어도, 그 무효화 이전에 저장한 항목은 다시 적중하지 않는다."""
+    cache.store("a", ("x",), "1", 30, stamp=0)
+    cache.bump(("x",))
+    cache.bump(("y",))
+    cache.bump(("z",))  # x의 버전이 제거됨
+
+    assert cache.versions(("x",)) == (0,)
+    assert cache.lookup("a", ("x",)) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_caches_none_values(cache):
+    """None도 값으로 캐시한다 (예: 투표가 없는 게시글)."""
+    calls = 0
+
+    async def loader() -> None:
+        nonlocal calls
+        calls += 1
+
+    assert await cache.get_or_load("k", ("ns",), loader) is None
+    assert await cache.get_or_load("k", ("ns",), loader) is None
+    assert calls == 1
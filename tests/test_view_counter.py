@@ -0,0 +1,107 @@
+# tests/test_view_counter.py
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.utils import view_counter as vc
+from core.utils.view_counter import ViewCounter
+
+
+@pytest.fixture(autouse=True)
+def _memory_backend(monkeypatch):
+    monkeypatch.setattr(vc.settings, "VIEW_COUNTER_BACKEND", "memory")
+    monkeypatch.setattr(vc.settings, "VIEW_COUNTER_MAX_PENDING", 3)
+
+
+@pytest.mark.asyncio
+async def test_post_views_are_deduplicated_per_user_per_day():
+    """같은 사용자의 같은 게시글 조회는 하루 1회만 버퍼링하고, 미반영 조회 수를 함께 돌려준다."""
+    counter = ViewCounter()
+
+    assert await counter.record_post_view(1, 10) == (True, 1)
+    assert await counter.record_post_view(1, 10) == (False, 1)
+    assert await counter.record_post_view(1, 11) == (True, 2)
+    assert counter.snapshot().pending_post_views == 2
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_batches_and_resets_buffer():
+    """flush는 게시글 조회 목록과 위키 증가량을 한 번씩 반영하고 버퍼를 비운다."""
+    counter = ViewCounter()
+    await counter.record_post_view(1, 10)
+    await counter.record_post_view(2, 10)
+    await counter.record_wiki_view(5)
+    await counter.record_wiki_view(5)
+
+    flush_posts = AsyncMock(return_value={1: 1, 2: 1})
+    add_views = AsyncMock()
+    with (
+        patch("modules.post.post_models.flush_post_views", new=flush_posts),
+        patch("modules.wiki.models.add_views", new=add_views),
+    ):
+        assert await counter.flush() == 4
+
+    assert [(user_id, post_id) for user_id, post_id, _ in flush_posts.await_args.args[0]] == [(10, 1), (10, 2)]
+    add_views.assert_awaited_once_with({5: 2})
+    stats = counter.snapshot()
+    assert stats.pending_post_views == stats.pending_wiki_views == 0
+    assert stats.flushed_post_views_total == 2
+    assert stats.flushed_wiki_views_total == 2
+    assert await counter.record_post_view(1, 11) == (True, 1)
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_requeues_views():
+    """DB 쓰기가 실패하면 꺼낸 조회를 버퍼에 되돌려 다음 flush에서 다시 시도한다."""
+    counter = ViewCounter()
+    await counter.record_post_view(1, 10)
+    await counter.record_wiki_view(5)
+
+    with patch("modules.post.post_models.flush_post_views", new=AsyncMock(side_effect=ConnectionError("down"))):
+        assert await counter.flush() == 0
+
+    stats = counter.snapshot()
+    assert stats.flush_failures_total == 1
+    assert stats.pending_post_views == 1
+    assert stats.pending_wiki_views == 1
+    assert await counter.record_post_view(1, 11) == (True, 2)
+
+
+@pytest.mark.asyncio
+async def test_buffer_limit_signals_early_flush():
+    """버퍼가 VIEW_COUNTER_MAX_PENDING에 도달하면 flush 태스크를 깨운다."""
+    counter = ViewCounter()
+    await counter.record_post_view(1, 10)
+    await counter.record_post_view(2, 10)
+    assert not counter.full.is_set()
+
+    await counter.record_wiki_view(5)
+    assert counter.full.is_set()
+
+
+@pytest.mark.asyncio
+async def test_direct_backend_writes_immediately(monkeypatch):
+    """direct 모드는 버퍼 없이 조회마다 기존 쓰기를 실행한다."""
+    monkeypatch.setattr(vc.settings, "VIEW_COUNTER_BACKEND", "direct")
+    counter = ViewCounter()
+
+    with (
+        patch("modules.post.post_models.increment_view_count", new=AsyncMock(return_value=False)),
+        patch("modules.wiki.models.increment_views", new=AsyncMock()) as increment_views,
+    ):
+        assert await counter.record_post_view(1, 10) == (False, 0)
+        assert await counter.record_wiki_view(5) == 1
+
+    increment_views.assert_awaited_once_with(5)
+    assert counter.snapshot().pending_post_views == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_dedupe_falls_back_to_local_set(monkeypatch):
+    """redis 모드에서 Redis가 실패하면 로컬 집합으로 중복 제거한다."""
+    monkeypatch.setattr(vc.settings, "VIEW_COUNTER_BACKEND", "redis")
+    counter = ViewCounter()
+
+    with patch("core.utils.redis_client.get_redis", new=AsyncMock(side_effect=ConnectionError("down"))):
+        assert (await counter.record_post_view(1, 10))[0] is True
+        assert (await counter.record_post_view(1, 10))[0] is False
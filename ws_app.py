@@ -1,10 +1,15 @@
-"""K8s WebSocket 서버 — Redis pub/sub 기반 실시간 알림"""
+"""K8s WebSocket 서버 — Redis pub/sub 기반 실시간 알림
+
+연결마다 사용자 채널(notify:{user_id})을 구독하고, 클라이언트의 subscribe/unsubscribe 메시지로
+공개 토픽 채널(topic:{토픽}, 예: 투표 결과 poll:{poll_id})을 같은 pub/sub 연결에 추가/제거합니다.
+"""
 
 import asyncio
 import contextlib
 import json
 import logging
 import os
+import re
 import uuid
 from contextlib import asynccontextmanager
 
@@ -17,6 +22,8 @@ logger = logging.getLogger(__name__)
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 AUTH_TIMEOUT = 5  # 인증 타임아웃 (초)
+MAX_TOPICS_PER_CONNECTION = 20
+_TOPIC_PATTERN = re.compile(r"^poll:\d+$")
 
 _redis: aioredis.Redis | None = None
 
@@ -72,10 +79,8 @@ async def _unregister_connection(conn_id: str, user_id: int | None):
         logger.exception("Redis 연결 해제 실패")
 
 
-async def _listen_notifications(ws: WebSocket, user_id: int):
-    """Redis SUBSCRIBE → WebSocket push"""
-    pubsub = _get_redis().pubsub()
-    await pubsub.subscribe(f"notify:{user_id}")
+async def _listen_notifications(ws: WebSocket, pubsub):
+    """Redis SUBSCRIBE → WebSocket push (사용자 채널 + 구독한 토픽 채널)"""
     try:
         async for message in pubsub.listen():
             if message["type"] == "message":
@@ -83,17 +88,32 @@ async def _listen_notifications(ws: WebSocket, user_id: int):
     except (WebSocketDisconnect, Exception):
         pass
     finally:
-        await pubsub.unsubscribe(f"notify:{user_id}")
+        await pubsub.unsubscribe()
         await pubsub.close()
 
 
-async def _handle_message(ws: WebSocket, data: dict, conn_id: str, user_id: int):
+async def _handle_message(ws: WebSocket, data: dict, conn_id: str, user_id: int, pubsub=None, topics=None):
     """클라이언트 메시지 처리"""
     msg_type = data.get("type")
 
     if msg_type == "ping":
         await ws.send_json({"type": "pong"})
 
+    elif msg_type in ("subscribe", "unsubscribe") and pubsub is not None and topics is not None:
+        topic = data.get("topic")
+        if not isinstance(topic, str) or not _TOPIC_PATTERN.match(topic):
+            await ws.send_json({"type": "error", "message": "invalid topic"})
+        elif msg_type == "unsubscribe":
+            if topic in topics:
+                topics.discard(topic)
+                await pubsub.unsubscribe(f"topic:{topic}")
+        elif topic not in topics:
+            if len(topics) >= MAX_TOPICS_PER_CONNECTION:
+                await ws.send_json({"type": "error", "message": "too many topics"})
+                return
+            topics.add(topic)
+            await pubsub.subscribe(f"topic:{topic}")
+
     elif msg_type in ("typing_start", "typing_stop"):
         recipient_id = data.get("recipient_id")
         if recipient_id:
@@ -152,13 +172,16 @@ async def websocket_endpoint(ws: WebSocket):
         await _register_connection(conn_id, user_id)
         await ws.send_json({"type": "auth_ok", "user_id": user_id})
 
-        # 알림 리스너 백그라운드 태스크
-        listener_task = asyncio.create_task(_listen_notifications(ws, user_id))
+        # 알림 리스너 백그라운드 태스크 (토픽 구독은 메시지 루프에서 같은 pubsub에 추가)
+        pubsub = _get_redis().pubsub()
+        await pubsub.subscribe(f"notify:{user_id}")
+        topics: set[str] = set()
+        listener_task = asyncio.create_task(_listen_notifications(ws, pubsub))
 
         # 메시지 루프
         while True:
             data = await ws.receive_json()
-            await _handle_message(ws, data, conn_id, user_id)
+            await _handle_message(ws, data, conn_id, user_id, pubsub, topics)
 
     except WebSocketDisconnect:
         pass